@@ -14,20 +14,68 @@ environment variable.
 """
 
 import base64
+import functools
+import hashlib
+import hmac
+import json
 import logging
 import os
-from typing import Any, Dict, TYPE_CHECKING
+import threading
+import uuid
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Set, Tuple, TYPE_CHECKING
 
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
+from flow.utils.metrics import get_counter
+
 logger = logging.getLogger(__name__)
 
+field_decryptions = get_counter(
+    "db_field_decryptions_total",
+    "Encrypted fields decrypted after a read, by field (lazily, on first access)",
+)
+encrypted_value_reads = get_counter(
+    "db_encrypted_value_reads_total",
+    "Sensitive field values read, by stored format (pf1, pf2, legacy, plaintext)",
+)
+
 # Type checking imports (only used for type hints, not at runtime)
 if TYPE_CHECKING:
     from supabase import Client
 
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+# Encrypted field values are stored as a cipher prefix + token, e.g. "pf2:..."
+# (see FieldCipher). Cipher used for new values: aes-gcm (default) or fernet;
+# values written with either are always readable.
+FIELD_CIPHER = os.getenv("FIELD_CIPHER", "aes-gcm").lower()
+# Legacy values are base64 of a Fernet token. Every Fernet token starts with
+# "gAAAAA" (version byte 0x80, then a timestamp), which base64-encodes to this.
+LEGACY_CIPHERTEXT_PREFIX = "Z0FBQUFB"
+
+# First byte of the encrypted payload says how the plaintext was compressed
+_CODEC_NONE = b"\x00"
+_CODEC_ZLIB = b"\x01"
+_CODEC_ZSTD = b"\x02"
+
+# Compression for encrypted fields: zstd (falls back to zlib if zstandard isn't
+# installed), zlib, or none. Values shorter than FIELD_COMPRESSION_MIN_BYTES
+# (emails, URLs) are stored uncompressed.
+FIELD_COMPRESSION = os.getenv("FIELD_COMPRESSION", "zstd").lower()
+FIELD_COMPRESSION_MIN_BYTES = int(os.getenv("FIELD_COMPRESSION_MIN_BYTES", "256"))
+
 # Fields that should be encrypted (sensitive data)
 ENCRYPTED_FIELDS = {
     "email",
@@ -84,6 +132,18 @@ def get_encryption_key() -> bytes:
             f'Generate a strong key with: python -c "import secrets; print(secrets.token_urlsafe(64))"'
         )
 
+    return _derive_fernet_key(encryption_key_str)
+
+
+@functools.lru_cache(maxsize=4)
+def _derive_fernet_key(encryption_key_str: str) -> bytes:
+    """
+    Derive the Fernet key from ENCRYPTION_KEY (cached per key).
+
+    **Simple Explanation:**
+    PBKDF2 with 100,000 iterations is deliberately slow, so it runs once per
+    key instead of on every encrypt/decrypt call.
+    """
     # Derive a 32-byte key from the user's key using PBKDF2
     salt = b"pailflow_salt_2025"  # Fixed salt - in production, consider making this configurable
     kdf = PBKDF2HMAC(
@@ -107,89 +167,408 @@ def get_fernet() -> Fernet:
     return Fernet(key)
 
 
-def encrypt_field(value: str | None) -> str | None:
+def _compress_plaintext(data: bytes) -> bytes:
+    """
+    Compress a plaintext before encryption and tag it with its codec.
+
+    **Simple Explanation:**
+    Transcripts and summaries compress well, and compression has to happen
+    before encryption (ciphertext doesn't compress). The first byte says which
+    codec was used, so values written with any setting can be read back.
+
+    Args:
+        data: UTF-8 plaintext
+
+    Returns:
+        Codec byte followed by the (possibly compressed) plaintext
+    """
+    if len(data) >= FIELD_COMPRESSION_MIN_BYTES:
+        if FIELD_COMPRESSION == "zstd" and ZSTD_AVAILABLE:
+            compressed = _CODEC_ZSTD + zstandard.ZstdCompressor(level=3).compress(data)
+        elif FIELD_COMPRESSION in ("zstd", "zlib"):
+            compressed = _CODEC_ZLIB + zlib.compress(data, 6)
+        else:
+            compressed = None
+        # Keep the plaintext when compression doesn't help (e.g. short or random text)
+        if compressed is not None and len(compressed) < len(data) + 1:
+            return compressed
+    return _CODEC_NONE + data
+
+
+def _decompress_plaintext(payload: bytes) -> bytes:
+    """
+    Undo _compress_plaintext.
+
+    Args:
+        payload: Decrypted payload (codec byte + data)
+
+    Returns:
+        UTF-8 plaintext
+
+    Raises:
+        ValueError: If the codec is unknown or zstandard isn't installed
+    """
+    codec, data = payload[:1], payload[1:]
+    if codec == _CODEC_NONE:
+        return data
+    if codec == _CODEC_ZLIB:
+        return zlib.decompress(data)
+    if codec == _CODEC_ZSTD:
+        if not ZSTD_AVAILABLE:
+            raise ValueError(
+                "Field was compressed with zstd but zstandard is not installed. "
+                "Install with: pip install zstandard"
+            )
+        return zstandard.ZstdDecompressor().decompress(data)
+    raise ValueError(f"Unknown field compression codec: {codec!r}")
+
+
+class FieldCipher(ABC):
+    """
+    Cipher for encrypted field values.
+
+    **Simple Explanation:**
+    Every value a cipher encrypts is stored with the cipher's prefix in front,
+    so it is always decrypted by the cipher that wrote it, whatever
+    FIELD_CIPHER is set to now.
+
+    Associated data (see field_associated_data) is authenticated but not
+    stored: a value only decrypts for the table, column and row it was
+    written for, so ciphertext copied to another row or column is rejected.
+
+    Attributes:
+        name: FIELD_CIPHER setting for this cipher (e.g. "aes-gcm")
+        prefix: Prefix of stored values (four characters, e.g. "pf2:")
+    """
+
+    name: str = ""
+    prefix: str = ""
+
+    @abstractmethod
+    def encrypt(self, payload: bytes, associated_data: bytes) -> str:
+        """Encrypt a payload. Returns the token stored after the prefix."""
+
+    @abstractmethod
+    def decrypt(self, token: str, associated_data: bytes) -> bytes:
+        """Decrypt a token (without the prefix). Raises if it was tampered with."""
+
+
+class FernetCipher(FieldCipher):
+    """Fernet (AES-128-CBC + HMAC-SHA256). It has no associated data, so that is ignored."""
+
+    name = "fernet"
+    prefix = "pf1:"
+
+    def encrypt(self, payload: bytes, associated_data: bytes) -> str:
+        return get_fernet().encrypt(payload).decode()
+
+    def decrypt(self, token: str, associated_data: bytes) -> bytes:
+        return get_fernet().decrypt(token.encode())
+
+
+class AesGcmCipher(FieldCipher):
+    """
+    AES-256-GCM with a random 96-bit nonce, in one AEAD pass.
+
+    The token is URL-safe base64 of nonce + ciphertext + 16-byte tag: 28 bytes
+    of overhead, against 57 bytes plus block padding for Fernet.
+    """
+
+    name = "aes-gcm"
+    prefix = "pf2:"
+
+    def encrypt(self, payload: bytes, associated_data: bytes) -> str:
+        nonce = os.urandom(12)
+        ciphertext = _get_aes_gcm().encrypt(nonce, payload, associated_data)
+        return base64.urlsafe_b64encode(nonce + ciphertext).decode()
+
+    def decrypt(self, token: str, associated_data: bytes) -> bytes:
+        data = base64.urlsafe_b64decode(token.encode())
+        return _get_aes_gcm().decrypt(data[:12], data[12:], associated_data)
+
+
+def _get_aes_gcm() -> AESGCM:
+    """Get the AES-GCM instance for the current ENCRYPTION_KEY."""
+    return _aes_gcm_for_key(get_encryption_key())
+
+
+@functools.lru_cache(maxsize=4)
+def _aes_gcm_for_key(fernet_key: bytes) -> AESGCM:
+    """Derive a separate AES-256 key from the PBKDF2 output (cached per key)."""
+    key = HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=None,
+        info=b"pailflow-field-aes-gcm",
+    ).derive(base64.urlsafe_b64decode(fernet_key))
+    return AESGCM(key)
+
+
+# Ciphers by stored value prefix
+FIELD_CIPHERS: Dict[str, FieldCipher] = {
+    cipher.prefix: cipher for cipher in (FernetCipher(), AesGcmCipher())
+}
+
+
+def get_field_cipher() -> FieldCipher:
+    """
+    Get the cipher used for new values (FIELD_CIPHER).
+
+    Raises:
+        ValueError: If FIELD_CIPHER isn't the name of a cipher
+    """
+    for cipher in FIELD_CIPHERS.values():
+        if cipher.name == FIELD_CIPHER:
+            return cipher
+    raise ValueError(
+        f"Unknown FIELD_CIPHER: {FIELD_CIPHER}. "
+        f"Use one of: {', '.join(c.name for c in FIELD_CIPHERS.values())}"
+    )
+
+
+def field_associated_data(table: str | None, column: str, row_id: Any) -> bytes:
+    """
+    Associated data that binds an encrypted value to where it is stored.
+
+    Args:
+        table: Table name, or None for values that aren't tied to a row
+        column: Column (field) name
+        row_id: Primary key (or other unique key) of the row
+
+    Returns:
+        b"table.column:row_id", or b"" if table is None
+    """
+    if table is None:
+        return b""
+    return f"{table}.{column}:{row_id}".encode()
+
+
+# Blind-indexed fields: encrypted column -> column holding its blind index
+BLIND_INDEX_COLUMNS = {
+    "email": "email_bidx",
+    "email_results_to": "email_results_to_bidx",
+}
+# Tables with blind index columns (see 20251203000007_add_email_blind_index.sql)
+BLIND_INDEX_TABLES = {"rooms", "workflow_threads"}
+
+
+def email_blind_index(email: str | None) -> str | None:
+    """
+    Compute the blind index of an email address.
+
+    **Simple Explanation:**
+    Encrypted emails can't be searched: the same address encrypts differently
+    every time. The blind index is an HMAC-SHA256 of the normalized address
+    (trimmed, lowercased) with a key derived from ENCRYPTION_KEY. The same
+    address always gives the same value, so rows can be looked up by it with
+    a database index, but it can't be reversed or recomputed without the key.
+
+    Args:
+        email: Email address
+
+    Returns:
+        Hex digest, or None if email is None/empty
+    """
+    if not email or not email.strip():
+        return None
+    return hmac.new(
+        _blind_index_key(get_encryption_key()),
+        email.strip().lower().encode(),
+        hashlib.sha256,
+    ).hexdigest()
+
+
+@functools.lru_cache(maxsize=4)
+def _blind_index_key(fernet_key: bytes) -> bytes:
+    """Derive the blind index HMAC key from the PBKDF2 output (cached per key)."""
+    return HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=None,
+        info=b"pailflow-email-blind-index",
+    ).derive(base64.urlsafe_b64decode(fernet_key))
+
+
+def encrypted_value_version(value: str) -> str | None:
+    """
+    Tell how a stored sensitive value is encoded, from its prefix.
+
+    **Simple Explanation:**
+    Readers use this to pick the right decoder without trying to decrypt
+    first: "pf1" (Fernet) and "pf2" (AES-GCM) are the current envelopes,
+    "legacy" is base64 of a Fernet token (written before the envelope format),
+    and None means the value was stored unencrypted (written before field
+    encryption).
+
+    Args:
+        value: Value as stored in the database
+
+    Returns:
+        "pf1", "pf2", "legacy", or None for plaintext
+    """
+    cipher = FIELD_CIPHERS.get(value[:4])
+    if cipher is not None:
+        return cipher.prefix[:-1]
+    if value.startswith(LEGACY_CIPHERTEXT_PREFIX):
+        return "legacy"
+    return None
+
+
+def encrypt_field(value: str | None, associated_data: bytes = b"") -> str | None:
     """
     Encrypt a sensitive field value.
 
+    **Simple Explanation:**
+    The value is compressed (if it's long enough to benefit), encrypted with
+    the FIELD_CIPHER cipher, and stored as the cipher's prefix + its token
+    (e.g. "pf2:..."). The token is URL-safe base64 text, encoded once.
+
     Args:
         value: The string value to encrypt
+        associated_data: Where the value is stored (see field_associated_data);
+            the same bytes are needed to decrypt it
 
     Returns:
-        Encrypted value as base64 string, or None if input was None/empty
+        Encrypted value as an envelope string, or None if input was None/empty
     """
     if not value or value.strip() == "":
         return None
 
     try:
-        fernet = get_fernet()
-        encrypted = fernet.encrypt(value.encode())
-        # Return as base64 string for easy storage in JSON/database
-        return base64.urlsafe_b64encode(encrypted).decode()
+        cipher = get_field_cipher()
+        payload = _compress_plaintext(value.encode())
+        return cipher.prefix + cipher.encrypt(payload, associated_data)
     except Exception as e:
         logger.error(f"❌ Error encrypting field: {e}", exc_info=True)
         raise
 
 
-def decrypt_field(value: str | None) -> str | None:
+def decrypt_field(value: str | None, associated_data: bytes = b"") -> str | None:
     """
     Decrypt a sensitive field value.
 
+    Reads the envelope formats ("pf1:" Fernet, "pf2:" AES-GCM) and the legacy
+    format (base64 of an uncompressed Fernet token).
+
     Args:
-        value: The encrypted value as base64 string
+        value: The encrypted value
+        associated_data: The associated data it was encrypted with (ignored
+            by Fernet and legacy values)
 
     Returns:
         Decrypted value as string, or None if input was None/empty
+
+    Raises:
+        ValueError: If the value has no ciphertext version prefix (plaintext)
     """
     if not value or value.strip() == "":
         return None
 
+    version = encrypted_value_version(value)
+    if version is None:
+        raise ValueError("Value is not encrypted (no ciphertext version prefix)")
+
     try:
-        fernet = get_fernet()
-        # Decode from base64 first
+        if version != "legacy":
+            payload = FIELD_CIPHERS[value[:4]].decrypt(value[4:], associated_data)
+            return _decompress_plaintext(payload).decode()
+
+        # Legacy format: decode from base64 first
         encrypted_bytes = base64.urlsafe_b64decode(value.encode())
-        decrypted = fernet.decrypt(encrypted_bytes)
+        decrypted = get_fernet().decrypt(encrypted_bytes)
         return decrypted.decode()
     except Exception as e:
         logger.error(f"❌ Error decrypting field: {e}", exc_info=True)
         raise
 
 
-def encrypt_sensitive_data(data: Dict[str, Any]) -> Dict[str, Any]:
+def encrypt_sensitive_data(
+    data: Dict[str, Any], table: str | None = None, row_id: Any = None
+) -> Dict[str, Any]:
     """
     Encrypt sensitive fields in a dictionary.
 
+    For tables with blind index columns, the blind index of each email field
+    with a new value is added (e.g. email_bidx); it is None when the field is
+    cleared (None or empty), so the row no longer matches the old address.
+    Fields whose ciphertext is reused keep the index already stored.
+
     Args:
         data: Dictionary containing session data
+        table: Table the data is saved to (bound as associated data)
+        row_id: Primary key of the row it is saved to
 
     Returns:
         Dictionary with sensitive fields encrypted
     """
-    encrypted_data = data.copy()
+    encrypted_data, already_encrypted = _copy_for_encryption(data, table, row_id)
+
+    if table in BLIND_INDEX_TABLES:
+        for key, index_column in BLIND_INDEX_COLUMNS.items():
+            if key in encrypted_data and key not in already_encrypted:
+                value = encrypted_data[key]
+                encrypted_data[index_column] = (
+                    email_blind_index(value) if isinstance(value, str) else None
+                )
 
     for key, value in encrypted_data.items():
         # Encrypt if it's a sensitive field and has a value
+        if key in already_encrypted:
+            continue
         if key in ENCRYPTED_FIELDS and value is not None:
+            associated_data = field_associated_data(table, key, row_id)
             if isinstance(value, str):
-                encrypted_data[key] = encrypt_field(value)
+                encrypted_data[key] = encrypt_field(value, associated_data)
             elif isinstance(value, dict):
                 # Recursively encrypt nested dictionaries
-                encrypted_data[key] = encrypt_sensitive_data(value)
+                encrypted_data[key] = encrypt_sensitive_data(value, table, row_id)
             elif isinstance(value, list):
                 # Encrypt each item in the list if it's a string
                 encrypted_data[key] = [
-                    encrypt_field(item) if isinstance(item, str) else item
+                    (
+                        encrypt_field(item, associated_data)
+                        if isinstance(item, str)
+                        else item
+                    )
                     for item in value
                 ]
 
     return encrypted_data
 
 
-def decrypt_sensitive_data(data: Dict[str, Any]) -> Dict[str, Any]:
+def _decrypt_stored_value(key: str, value: str, associated_data: bytes = b"") -> str:
+    """
+    Decrypt a stored sensitive value, passing plaintext through.
+
+    **Simple Explanation:**
+    Values stored before field encryption existed have no version prefix and
+    are returned as they are. A value that has a prefix but doesn't decrypt
+    (wrong ENCRYPTION_KEY, corrupted data) is logged and returned unchanged.
+    """
+    version = encrypted_value_version(value)
+    encrypted_value_reads.inc(version or "plaintext")
+    if version is None:
+        return value
+
+    try:
+        decrypted = decrypt_field(value, associated_data)
+        field_decryptions.inc(key)
+        return decrypted
+    except Exception:
+        logger.warning(f"⚠️ Could not decrypt field {key}, returning stored value")
+        return value
+
+
+def decrypt_sensitive_data(
+    data: Dict[str, Any], table: str | None = None, row_id: Any = None
+) -> Dict[str, Any]:
     """
     Decrypt sensitive fields in a dictionary.
 
     Args:
         data: Dictionary containing encrypted session data
+        table: Table the data was read from (bound as associated data)
+        row_id: Primary key of the row it was read from
 
     Returns:
         Dictionary with sensitive fields decrypted
@@ -199,29 +578,218 @@ def decrypt_sensitive_data(data: Dict[str, Any]) -> Dict[str, Any]:
     for key, value in decrypted_data.items():
         # Decrypt if it's a sensitive field and has a value
         if key in ENCRYPTED_FIELDS and value is not None:
+            associated_data = field_associated_data(table, key, row_id)
             if isinstance(value, str):
-                # Try to decrypt - if it fails, assume it's not encrypted (backward compatibility)
-                try:
-                    decrypted_data[key] = decrypt_field(value)
-                except Exception:
-                    # If decryption fails, assume it's already unencrypted (for migration)
-                    logger.debug(
-                        f"Field {key} appears to be unencrypted, skipping decryption"
-                    )
-                    pass
+                decrypted_data[key] = _decrypt_stored_value(key, value, associated_data)
             elif isinstance(value, dict):
                 # Recursively decrypt nested dictionaries
-                decrypted_data[key] = decrypt_sensitive_data(value)
+                decrypted_data[key] = decrypt_sensitive_data(value, table, row_id)
             elif isinstance(value, list):
                 # Decrypt each item in the list if it's a string
                 decrypted_data[key] = [
-                    decrypt_field(item) if isinstance(item, str) else item
+                    (
+                        _decrypt_stored_value(key, item, associated_data)
+                        if isinstance(item, str)
+                        else item
+                    )
                     for item in value
                 ]
 
     return decrypted_data
 
 
+class LazyDecryptedDict(dict):
+    """
+    Dictionary whose encrypted fields are decrypted the first time they are read.
+
+    **Simple Explanation:**
+    Rows read from the database carry large encrypted columns (transcript_text,
+    candidate_summary), but most callers only look at flags like
+    workflow_paused or usage_stats. This dict keeps the ciphertext and decrypts
+    a field on first access - `d[key]`, `d.get(key)`, `items()`, `copy()`,
+    `dict(d)`, `{**d}` or `json.dumps(d)` - then keeps the plain value.
+
+    When the dict is saved again to the same row (encrypt_sensitive_data,
+    save_bot_session), fields that were never read keep their stored
+    ciphertext instead of being decrypted and re-encrypted. Copies and pickles
+    are plain (decrypted) dicts.
+
+    Args:
+        data: Row values as stored
+        table: Table the row was read from (for associated data)
+        row_id: Primary key of the row
+    """
+
+    def __init__(
+        self, data: Dict[str, Any], table: str | None = None, row_id: Any = None
+    ):
+        super().__init__(data)
+        self._table = table
+        self._row_id = row_id
+        # Encrypted fields whose value is still ciphertext (plaintext written
+        # before field encryption isn't pending, so it's encrypted on save)
+        self._pending: Set[str] = {
+            key
+            for key in ENCRYPTED_FIELDS
+            if isinstance(dict.get(self, key), str)
+            and encrypted_value_version(dict.get(self, key)) is not None
+        }
+        self._lock = threading.Lock()
+
+    def _decrypt(self, key: Any) -> None:
+        """Decrypt one field in place if it hasn't been yet."""
+        if key not in self._pending:
+            return
+        with self._lock:
+            if key not in self._pending:
+                return
+            value = _decrypt_stored_value(
+                key,
+                dict.__getitem__(self, key),
+                field_associated_data(self._table, key, self._row_id),
+            )
+            # Store the plain value before other threads stop treating it as pending
+            dict.__setitem__(self, key, value)
+            self._pending.discard(key)
+
+    def _decrypt_all(self) -> None:
+        """Decrypt every field that is still encrypted."""
+        for key in list(self._pending):
+            self._decrypt(key)
+
+    def is_stored_at(self, table: str | None, row_id: Any) -> bool:
+        """Check whether this dict was read from the given row."""
+        return (self._table, str(self._row_id)) == (table, str(row_id))
+
+    def raw_copy(self) -> Tuple[Dict[str, Any], Set[str]]:
+        """
+        Copy the stored values without decrypting anything.
+
+        Returns:
+            (values, fields that are still ciphertext in `values`)
+        """
+        with self._lock:
+            return dict(dict.items(self)), set(self._pending)
+
+    def __getitem__(self, key: Any) -> Any:
+        self._decrypt(key)
+        return dict.__getitem__(self, key)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        self._decrypt(key)
+        return dict.get(self, key, default)
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        self._decrypt(key)
+        return dict.setdefault(self, key, default)
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        self._decrypt(key)
+        return dict.pop(self, key, *default)
+
+    def popitem(self) -> Tuple[Any, Any]:
+        self._decrypt_all()
+        return dict.popitem(self)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._pending.discard(key)
+            dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        with self._lock:
+            self._pending.discard(key)
+            dict.__delitem__(self, key)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pending.clear()
+            dict.clear(self)
+
+    # Defining __iter__ makes dict(d), {**d} and dict.update(d) go through
+    # keys() and __getitem__ instead of copying the stored ciphertext
+    def __iter__(self):
+        return dict.__iter__(self)
+
+    def items(self):
+        self._decrypt_all()
+        return dict.items(self)
+
+    def values(self):
+        self._decrypt_all()
+        return dict.values(self)
+
+    def copy(self) -> Dict[str, Any]:
+        self._decrypt_all()
+        return dict(dict.items(self))
+
+    def __or__(self, other: Any) -> Any:
+        if not isinstance(other, dict):
+            return NotImplemented
+        return self.copy() | other
+
+    def __eq__(self, other: Any) -> bool:
+        self._decrypt_all()
+        if isinstance(other, LazyDecryptedDict):
+            other._decrypt_all()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other: Any) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __repr__(self) -> str:
+        return repr(self.copy())
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (dict, (self.copy(),))
+
+
+def _copy_for_encryption(
+    data: Dict[str, Any], table: str | None = None, row_id: Any = None
+) -> Tuple[Dict[str, Any], Set[str]]:
+    """
+    Copy data that is about to be encrypted and saved.
+
+    Ciphertext is only reused when the data is saved back to the row it was
+    read from; elsewhere its associated data wouldn't match.
+
+    Returns:
+        (copy, fields that are already encrypted - never-read LazyDecryptedDict fields)
+    """
+    if isinstance(data, LazyDecryptedDict) and data.is_stored_at(table, row_id):
+        return data.raw_copy()
+    return data.copy(), set()
+
+
+def _select_columns(fields: List[str] | None, columns: Tuple[str, ...]) -> str:
+    """
+    Build the select() argument for a column projection.
+
+    Args:
+        fields: Columns to read, or None for all columns
+        columns: Columns the row conversion knows about
+
+    Returns:
+        "*" or a comma-separated column list
+
+    Raises:
+        ValueError: If a field is not a known column
+    """
+    if fields is None:
+        return "*"
+    if not fields:
+        raise ValueError("At least one column must be requested")
+    unknown = [field for field in fields if field not in columns]
+    if unknown:
+        raise ValueError(f"Unknown columns requested: {', '.join(unknown)}")
+    return ",".join(dict.fromkeys(fields))
+
+
 def get_supabase_client() -> "Client | None":
     """
     Get a Supabase client instance for database operations.
@@ -477,7 +1045,7 @@ def save_session_data(room_name: str, session_data: Dict[str, Any]) -> bool:
 
     try:
         # Encrypt sensitive fields before saving
-        encrypted_data = encrypt_sensitive_data(session_data)
+        encrypted_data = encrypt_sensitive_data(session_data, "rooms", room_name)
 
         # Prepare data for Supabase insert/update
         # Map session_data keys to database columns
@@ -507,6 +1075,9 @@ def save_session_data(room_name: str, session_data: Dict[str, Any]) -> bool:
             "summary_format_prompt": encrypted_data.get("summary_format_prompt"),
             "transcript_text": encrypted_data.get("transcript_text"),
             "candidate_summary": encrypted_data.get("candidate_summary"),
+            # Blind indexes of the email fields (for lookups by email)
+            "email_bidx": encrypted_data.get("email_bidx"),
+            "email_results_to_bidx": encrypted_data.get("email_results_to_bidx"),
             # processing_status_by_key stores processing status per workflow_thread_id or room_name
             # This allows rooms to be reused without conflicts
             "processing_status_by_key": encrypted_data.get("processing_status_by_key"),
@@ -531,16 +1102,54 @@ def save_session_data(room_name: str, session_data: Dict[str, Any]) -> bool:
         return False
 
 
-def get_session_data(room_name: str) -> Dict[str, Any] | None:
+# Columns of the rooms table returned by get_session_data
+ROOM_SESSION_COLUMNS = (
+    "session_id",
+    "workflow_thread_id",
+    "meeting_status",
+    "meeting_start_time",
+    "meeting_end_time",
+    "bot_enabled",
+    "waiting_for_meeting_ended",
+    "waiting_for_transcript_webhook",
+    "transcript_processed",
+    "transcript_processing",
+    "email_sent",
+    "workflow_paused",
+    # Encrypted fields (decrypted lazily, see LazyDecryptedDict)
+    "webhook_callback_url",
+    "email_results_to",
+    "email",
+    "analysis_prompt",
+    "summary_format_prompt",
+    "transcript_text",
+    "candidate_summary",
+    # processing_status_by_key stores processing status per workflow_thread_id or room_name
+    "processing_status_by_key",
+)
+
+
+def get_session_data(
+    room_name: str, fields: List[str] | None = None
+) -> Dict[str, Any] | None:
     """
     Retrieve session data for a room from Supabase and decrypt sensitive fields.
 
+    **Simple Explanation:**
+    Pass `fields` to read only the columns you need (for example
+    `["workflow_thread_id"]`), so large encrypted columns like transcript_text
+    aren't transferred at all. Encrypted fields that are read are decrypted on
+    first access (see LazyDecryptedDict).
+
     Args:
         room_name: The room identifier (e.g., "abc123")
+        fields: Columns to read (from ROOM_SESSION_COLUMNS), or None for all
 
     Returns:
-        Dictionary with session data (sensitive fields decrypted), or None if not found
+        Dictionary with session data (sensitive fields decrypted on access), or None if not found
     """
+    columns = _select_columns(fields, ROOM_SESSION_COLUMNS)
+
     client = get_supabase_client()
     if not client:
         logger.error("❌ Cannot read from Supabase: client not available")
@@ -548,7 +1157,7 @@ def get_session_data(room_name: str) -> Dict[str, Any] | None:
 
     try:
         response = (
-            client.table("rooms").select("*").eq("room_name", room_name).execute()
+            client.table("rooms").select(columns).eq("room_name", room_name).execute()
         )
 
         if not response.data or len(response.data) == 0:
@@ -558,42 +1167,15 @@ def get_session_data(room_name: str) -> Dict[str, Any] | None:
         # Get the first (and should be only) row
         row = response.data[0]
 
-        # Convert database row back to session_data format
+        # Convert database row back to session_data format, removing None values
         session_data = {
-            "session_id": row.get("session_id"),
-            "workflow_thread_id": row.get("workflow_thread_id"),
-            "meeting_status": row.get("meeting_status"),
-            "meeting_start_time": row.get("meeting_start_time"),
-            "meeting_end_time": row.get("meeting_end_time"),
-            "bot_enabled": row.get("bot_enabled"),
-            "waiting_for_meeting_ended": row.get("waiting_for_meeting_ended"),
-            "waiting_for_transcript_webhook": row.get("waiting_for_transcript_webhook"),
-            "transcript_processed": row.get("transcript_processed"),
-            "transcript_processing": row.get("transcript_processing"),
-            "email_sent": row.get("email_sent"),
-            "workflow_paused": row.get("workflow_paused"),
-            # Encrypted fields (will be decrypted below)
-            "webhook_callback_url": row.get("webhook_callback_url"),
-            "email_results_to": row.get("email_results_to"),
-            "email": row.get("email"),
-            "analysis_prompt": row.get("analysis_prompt"),
-            "summary_format_prompt": row.get("summary_format_prompt"),
-            "transcript_text": row.get("transcript_text"),
-            "candidate_summary": row.get("candidate_summary"),
-            # processing_status_by_key stores processing status per workflow_thread_id or room_name
-            "processing_status_by_key": row.get("processing_status_by_key"),
+            column: row[column]
+            for column in fields or ROOM_SESSION_COLUMNS
+            if row.get(column) is not None
         }
 
-        # Remove None values
-        session_data = {k: v for k, v in session_data.items() if v is not None}
-
-        # Decrypt sensitive fields
-        decrypted_data = decrypt_sensitive_data(session_data)
-
-        logger.info(
-            f"✅ Retrieved session data from Supabase for room: {room_name} (sensitive fields decrypted)"
-        )
-        return decrypted_data
+        logger.info(f"✅ Retrieved session data from Supabase for room: {room_name}")
+        return LazyDecryptedDict(session_data, "rooms", room_name)
 
     except Exception as e:
         logger.error(
@@ -603,6 +1185,68 @@ def get_session_data(room_name: str) -> Dict[str, Any] | None:
         return None
 
 
+def _email_blind_index_filter(email: str) -> str | None:
+    """PostgREST `or` filter matching rows where either email field is `email`."""
+    index = email_blind_index(email)
+    if index is None:
+        return None
+    return ",".join(f"{column}.eq.{index}" for column in BLIND_INDEX_COLUMNS.values())
+
+
+def get_room_sessions(
+    email: str | None = None, limit: int = 20
+) -> list[Dict[str, Any]] | None:
+    """
+    Get the most recent room sessions, optionally only those for an email.
+
+    **Simple Explanation:**
+    With `email`, rooms whose email or email_results_to is that address are
+    found through their blind indexes (one indexed query), instead of reading
+    and decrypting every room. Each session includes room_name and created_at.
+
+    Args:
+        email: Only rooms for this address (email or email_results_to)
+        limit: Maximum number of rooms, newest first
+
+    Returns:
+        List of session data dictionaries (sensitive fields decrypted on access),
+        or None on error
+    """
+    client = get_supabase_client()
+    if not client:
+        logger.error("❌ Cannot read from Supabase: client not available")
+        return None
+
+    try:
+        columns = ("room_name", "created_at") + ROOM_SESSION_COLUMNS
+        query = client.table("rooms").select(",".join(columns))
+        if email is not None:
+            email_filter = _email_blind_index_filter(email)
+            if email_filter is None:
+                return []
+            query = query.or_(email_filter)
+        response = query.order("created_at", desc=True).limit(limit).execute()
+
+        return [
+            LazyDecryptedDict(
+                {
+                    column: row[column]
+                    for column in columns
+                    if row.get(column) is not None
+                },
+                "rooms",
+                row["room_name"],
+            )
+            for row in response.data or []
+        ]
+
+    except Exception as e:
+        logger.error(
+            f"❌ Error listing room sessions from Supabase: {e}", exc_info=True
+        )
+        return None
+
+
 def delete_session_data(room_name: str) -> bool:
     """
     Delete session data for a room from Supabase (optional cleanup).
@@ -639,6 +1283,21 @@ def delete_session_data(room_name: str) -> bool:
         return False
 
 
+def _canonical_bot_id(bot_id: str) -> str:
+    """
+    Get a bot ID the way Postgres returns it (lowercase, hyphenated UUID).
+
+    **Simple Explanation:**
+    transcript_text is bound to its bot_id (AES-GCM associated data), so the
+    same bot must always use the same spelling of its ID, whatever casing the
+    caller used. IDs that aren't UUIDs are returned unchanged.
+    """
+    try:
+        return str(uuid.UUID(bot_id))
+    except (TypeError, ValueError, AttributeError):
+        return bot_id
+
+
 def save_bot_session(bot_id: str, bot_session_data: Dict[str, Any]) -> bool:
     """
     Save or update bot session data in Supabase.
@@ -674,11 +1333,23 @@ def save_bot_session(bot_id: str, bot_session_data: Dict[str, Any]) -> bool:
         logger.error("❌ Cannot save bot session to Supabase: client not available")
         return False
 
+    bot_id = _canonical_bot_id(bot_id)
+
     try:
-        # Encrypt transcript_text if present (it's a sensitive field)
-        db_data = bot_session_data.copy()
-        if "transcript_text" in db_data and db_data["transcript_text"]:
-            db_data["transcript_text"] = encrypt_field(db_data["transcript_text"])
+        # Encrypt transcript_text if present (it's a sensitive field) and not
+        # still encrypted from the read
+        db_data, already_encrypted = _copy_for_encryption(
+            bot_session_data, "bot_sessions", bot_id
+        )
+        if (
+            "transcript_text" not in already_encrypted
+            and "transcript_text" in db_data
+            and db_data["transcript_text"]
+        ):
+            db_data["transcript_text"] = encrypt_field(
+                db_data["transcript_text"],
+                field_associated_data("bot_sessions", "transcript_text", bot_id),
+            )
 
         # Prepare data for Supabase
         # Convert ISO timestamps to proper format if they're strings
@@ -694,6 +1365,25 @@ def save_bot_session(bot_id: str, bot_session_data: Dict[str, Any]) -> bool:
         ).execute()
 
         logger.info(f"✅ Bot session saved to Supabase: bot_id={bot_id}")
+
+        # Drop the cached status response and wake up long-poll requests
+        from flow.utils.bot_status_cache import invalidate_bot_status
+
+        invalidate_bot_status(bot_id)
+
+        # Tell live event subscribers (GET /v1/api/bot/{bot_id}/events)
+        if bot_session_data.get("status"):
+            from flow.utils.bot_events import publish_bot_event
+
+            publish_bot_event(
+                bot_session_data.get("room_name"),
+                "status",
+                {
+                    "bot_id": bot_id,
+                    "status": bot_session_data["status"],
+                    "error": bot_session_data.get("error"),
+                },
+            )
         return True
 
     except Exception as e:
@@ -704,103 +1394,259 @@ def save_bot_session(bot_id: str, bot_session_data: Dict[str, Any]) -> bool:
         return False
 
 
-def get_bot_session(bot_id: str) -> Dict[str, Any] | None:
+def create_bot_run(
+    workflow_thread_data: Dict[str, Any],
+    bot_session_data: Dict[str, Any],
+    unkey_key_id: str | None = None,
+    required_credits: float | None = None,
+) -> Dict[str, Any] | None:
     """
-    Retrieve bot session data from Supabase.
+    Create the workflow_threads and bot_sessions rows for a bot join in one transaction.
 
     **Simple Explanation:**
-    This function retrieves bot session information from the database.
-    It decrypts the transcript_text field automatically.
+    Calls the `create_bot_run` Postgres function (see
+    supabase/migrations/20251203000004_add_create_bot_run_function.sql), so starting
+    a bot costs one database round trip instead of a credit check, a collision
+    probe and two separate saves. Either both rows are created or neither is.
+
+    If `required_credits` is set, the user's credit balance is checked inside the
+    same transaction first. If one of the IDs already exists, nothing is written
+    and the status is "conflict" - generate new IDs and call again.
 
     Args:
-        bot_id: Unique bot session identifier (UUID)
+        workflow_thread_data: Workflow thread fields (must include workflow_thread_id,
+            room_name and bot_id; sensitive fields are encrypted here)
+        bot_session_data: Bot session fields (must include bot_id, room_url, room_name)
+        unkey_key_id: API key ID to check credits for
+        required_credits: Minimum credit balance needed (None skips the check)
 
     Returns:
-        Dictionary with bot session data (transcript_text decrypted), or None if not found
+        Result dictionary with "status" ("created", "conflict", "user_not_found" or
+        "insufficient_credits", plus "balance" when known), or None on database error
     """
     client = get_supabase_client()
     if not client:
-        logger.error("❌ Cannot read bot session from Supabase: client not available")
+        logger.error("❌ Cannot create bot run in Supabase: client not available")
         return None
 
     try:
-        response = (
-            client.table("bot_sessions").select("*").eq("bot_id", bot_id).execute()
-        )
-
-        if not response.data or len(response.data) == 0:
-            logger.warning(f"⚠️ No bot session found in Supabase for bot_id: {bot_id}")
-            return None
-
-        # Get the first (and should be only) row
-        row = response.data[0]
-
-        # Convert database row to dictionary
-        bot_session = {
-            "bot_id": row.get("bot_id"),
-            "room_url": row.get("room_url"),
-            "room_name": row.get("room_name"),
-            "status": row.get("status"),
-            "started_at": row.get("started_at"),
-            "completed_at": row.get("completed_at"),
-            "process_insights": row.get("process_insights"),
-            "bot_config": row.get("bot_config"),
-            "transcript_text": row.get("transcript_text"),
-            "qa_pairs": row.get("qa_pairs"),
-            "insights": row.get("insights"),
-            "error": row.get("error"),
-            "created_at": row.get("created_at"),
-            "updated_at": row.get("updated_at"),
-        }
-
-        # Decrypt transcript_text if present
-        if bot_session.get("transcript_text"):
-            try:
-                bot_session["transcript_text"] = decrypt_field(
-                    bot_session["transcript_text"]
-                )
-            except Exception as e:
-                logger.warning(
-                    f"⚠️ Could not decrypt transcript_text for bot_id {bot_id}: {e}"
-                )
-                # If decryption fails, try to use as-is (might be unencrypted for migration)
-                pass
-
-        # Format timestamps as ISO strings with Z suffix for API responses
-        if bot_session.get("started_at"):
-            started_at = bot_session["started_at"]
-            if isinstance(started_at, str) and not started_at.endswith("Z"):
-                bot_session["started_at"] = started_at + "Z"
-        if bot_session.get("completed_at"):
-            completed_at = bot_session["completed_at"]
-            if isinstance(completed_at, str) and not completed_at.endswith("Z"):
-                bot_session["completed_at"] = completed_at + "Z"
+        response = client.rpc(
+            "create_bot_run",
+            {
+                "p_workflow_thread": encrypt_sensitive_data(
+                    workflow_thread_data,
+                    "workflow_threads",
+                    workflow_thread_data["workflow_thread_id"],
+                ),
+                "p_bot_session": bot_session_data,
+                "p_unkey_key_id": unkey_key_id,
+                "p_required_credits": required_credits,
+            },
+        ).execute()
+        result = response.data or {}
 
-        logger.info(
-            f"✅ Retrieved bot session from Supabase: bot_id={bot_id} (transcript_text decrypted)"
-        )
-        return bot_session
+        if result.get("status") == "created":
+            logger.info(
+                f"✅ Bot run created in Supabase: bot_id={bot_session_data['bot_id']}, "
+                f"workflow_thread_id={workflow_thread_data['workflow_thread_id']}"
+            )
+            # Same notifications as save_bot_session
+            from flow.utils.bot_events import publish_bot_event
+            from flow.utils.bot_status_cache import invalidate_bot_status
+
+            invalidate_bot_status(bot_session_data["bot_id"])
+            publish_bot_event(
+                bot_session_data.get("room_name"),
+                "status",
+                {
+                    "bot_id": bot_session_data["bot_id"],
+                    "status": bot_session_data.get("status", "running"),
+                    "error": None,
+                },
+            )
+        return result
 
     except Exception as e:
         logger.error(
-            f"❌ Error retrieving bot session from Supabase for {bot_id}: {e}",
+            f"❌ Error creating bot run in Supabase for {bot_session_data.get('bot_id')}: {e}",
             exc_info=True,
         )
         return None
 
 
-def get_bot_session_by_room_name(room_name: str) -> Dict[str, Any] | None:
+# Columns of the bot_sessions table returned by get_bot_session
+BOT_SESSION_COLUMNS = (
+    "bot_id",
+    "room_url",
+    "room_name",
+    "status",
+    "started_at",
+    "completed_at",
+    "process_insights",
+    "bot_config",
+    "transcript_text",
+    "qa_pairs",
+    "insights",
+    "error",
+    "created_at",
+    "updated_at",
+)
+
+# Columns returned when the heavy result fields (transcript, Q&A, insights)
+# are not needed, e.g. for cheap status polling
+BOT_SESSION_SUMMARY_COLUMNS = (
+    "bot_id,room_url,room_name,status,started_at,completed_at,"
+    "process_insights,error,created_at,updated_at"
+)
+
+
+def _bot_session_from_row(
+    row: Dict[str, Any], fields: List[str] | None = None
+) -> Dict[str, Any]:
     """
-    Retrieve bot session data by room_name (most recent session for that room).
+    Convert a bot_sessions row into a bot session dictionary.
 
     **Simple Explanation:**
-    This function finds the most recent bot session for a given room name.
-    Useful when you have a room_name but need to find the associated bot_id.
+    transcript_text is decrypted on first access (see LazyDecryptedDict) and
+    timestamps get a Z suffix for API responses. Columns that weren't selected
+    come back as None (or are left out when `fields` is given). The row must
+    include bot_id: encrypted fields are bound to the ID as stored.
+    """
+    bot_session = {column: row.get(column) for column in fields or BOT_SESSION_COLUMNS}
 
-    Args:
-        room_name: Room name to search for
+    # Format timestamps as ISO strings with Z suffix for API responses
+    if bot_session.get("started_at"):
+        started_at = bot_session["started_at"]
+        if isinstance(started_at, str) and not started_at.endswith("Z"):
+            bot_session["started_at"] = started_at + "Z"
+    if bot_session.get("completed_at"):
+        completed_at = bot_session["completed_at"]
+        if isinstance(completed_at, str) and not completed_at.endswith("Z"):
+            bot_session["completed_at"] = completed_at + "Z"
 
-    Returns:
+    return LazyDecryptedDict(bot_session, "bot_sessions", row["bot_id"])
+
+
+def get_bot_session(
+    bot_id: str, fields: List[str] | None = None
+) -> Dict[str, Any] | None:
+    """
+    Retrieve bot session data from Supabase.
+
+    **Simple Explanation:**
+    This function retrieves bot session information from the database.
+    The transcript_text field is decrypted automatically when it is first read.
+    Pass `fields` (e.g. `["status", "room_name"]`) to read only those columns.
+
+    Args:
+        bot_id: Unique bot session identifier (UUID)
+        fields: Columns to read (from BOT_SESSION_COLUMNS), or None for all
+
+    Returns:
+        Dictionary with bot session data (transcript_text decrypted on access), or None if not found
+    """
+    # bot_id is always read: transcript_text is bound to the stored ID
+    columns = _select_columns(
+        fields and list(dict.fromkeys(["bot_id", *fields])), BOT_SESSION_COLUMNS
+    )
+    bot_id = _canonical_bot_id(bot_id)
+
+    client = get_supabase_client()
+    if not client:
+        logger.error("❌ Cannot read bot session from Supabase: client not available")
+        return None
+
+    try:
+        response = (
+            client.table("bot_sessions").select(columns).eq("bot_id", bot_id).execute()
+        )
+
+        if not response.data or len(response.data) == 0:
+            logger.warning(f"⚠️ No bot session found in Supabase for bot_id: {bot_id}")
+            return None
+
+        # Get the first (and should be only) row
+        bot_session = _bot_session_from_row(response.data[0], fields)
+
+        logger.info(f"✅ Retrieved bot session from Supabase: bot_id={bot_id}")
+        return bot_session
+
+    except Exception as e:
+        logger.error(
+            f"❌ Error retrieving bot session from Supabase for {bot_id}: {e}",
+            exc_info=True,
+        )
+        return None
+
+
+def get_bot_sessions(
+    bot_ids: List[str], include_results: bool = True
+) -> Dict[str, Dict[str, Any]] | None:
+    """
+    Retrieve many bot sessions from Supabase in one query.
+
+    **Simple Explanation:**
+    Looks up all the bot IDs with a single `bot_id IN (...)` query instead of
+    one query per bot. With include_results=False only the small columns are
+    read (BOT_SESSION_SUMMARY_COLUMNS), so no transcript is transferred or
+    decrypted.
+
+    Args:
+        bot_ids: Bot session identifiers (UUIDs)
+        include_results: Whether to read transcript_text, qa_pairs, insights
+            and bot_config
+
+    Returns:
+        Dictionary of bot_id -> bot session data (bots that weren't found are
+        missing), or None if the query failed
+    """
+    if not bot_ids:
+        return {}
+
+    client = get_supabase_client()
+    if not client:
+        logger.error("❌ Cannot read bot sessions from Supabase: client not available")
+        return None
+
+    try:
+        columns = "*" if include_results else BOT_SESSION_SUMMARY_COLUMNS
+        response = (
+            client.table("bot_sessions")
+            .select(columns)
+            .in_("bot_id", [_canonical_bot_id(bot_id) for bot_id in bot_ids])
+            .execute()
+        )
+
+        bot_sessions = {}
+        for row in response.data or []:
+            bot_session = _bot_session_from_row(row)
+            bot_sessions[str(bot_session["bot_id"])] = bot_session
+
+        logger.info(
+            f"✅ Retrieved {len(bot_sessions)}/{len(bot_ids)} bot sessions from Supabase"
+        )
+        return bot_sessions
+
+    except Exception as e:
+        logger.error(
+            f"❌ Error retrieving bot sessions from Supabase: {e}",
+            exc_info=True,
+        )
+        return None
+
+
+def get_bot_session_by_room_name(room_name: str) -> Dict[str, Any] | None:
+    """
+    Retrieve bot session data by room_name (most recent session for that room).
+
+    **Simple Explanation:**
+    This function finds the most recent bot session for a given room name.
+    Useful when you have a room_name but need to find the associated bot_id.
+
+    Args:
+        room_name: Room name to search for
+
+    Returns:
         Dictionary with bot session data, or None if not found
     """
     client = get_supabase_client()
@@ -824,50 +1670,8 @@ def get_bot_session_by_room_name(room_name: str) -> Dict[str, Any] | None:
             )
             return None
 
-        # Get the first (most recent) row
-        row = response.data[0]
-
-        # Convert and decrypt (same as get_bot_session)
-        bot_session = {
-            "bot_id": row.get("bot_id"),
-            "room_url": row.get("room_url"),
-            "room_name": row.get("room_name"),
-            "status": row.get("status"),
-            "started_at": row.get("started_at"),
-            "completed_at": row.get("completed_at"),
-            "process_insights": row.get("process_insights"),
-            "bot_config": row.get("bot_config"),
-            "transcript_text": row.get("transcript_text"),
-            "qa_pairs": row.get("qa_pairs"),
-            "insights": row.get("insights"),
-            "error": row.get("error"),
-            "created_at": row.get("created_at"),
-            "updated_at": row.get("updated_at"),
-        }
-
-        # Decrypt transcript_text if present
-        if bot_session.get("transcript_text"):
-            try:
-                bot_session["transcript_text"] = decrypt_field(
-                    bot_session["transcript_text"]
-                )
-            except Exception as e:
-                logger.warning(
-                    f"⚠️ Could not decrypt transcript_text for room_name {room_name}: {e}"
-                )
-                pass
-
-        # Format timestamps
-        if bot_session.get("started_at"):
-            started_at = bot_session["started_at"]
-            if isinstance(started_at, str) and not started_at.endswith("Z"):
-                bot_session["started_at"] = started_at + "Z"
-        if bot_session.get("completed_at"):
-            completed_at = bot_session["completed_at"]
-            if isinstance(completed_at, str) and not completed_at.endswith("Z"):
-                bot_session["completed_at"] = completed_at + "Z"
-
-        return bot_session
+        # Get the first (most recent) row and convert it (same as get_bot_session)
+        return _bot_session_from_row(response.data[0])
 
     except Exception as e:
         logger.error(
@@ -912,7 +1716,9 @@ def save_workflow_thread_data(
 
     try:
         # Encrypt sensitive fields before saving
-        encrypted_data = encrypt_sensitive_data(thread_data)
+        encrypted_data = encrypt_sensitive_data(
+            thread_data, "workflow_threads", workflow_thread_id
+        )
 
         # Prepare data for Supabase insert/update
         # Map thread_data keys to database columns
@@ -944,6 +1750,9 @@ def save_workflow_thread_data(
             "qa_pairs": encrypted_data.get("qa_pairs"),
             "webhook_callback_url": encrypted_data.get("webhook_callback_url"),
             "email_results_to": encrypted_data.get("email_results_to"),
+            # Blind indexes of the email fields (for lookups by email)
+            "email_bidx": encrypted_data.get("email_bidx"),
+            "email_results_to_bidx": encrypted_data.get("email_results_to_bidx"),
             "workflow_paused": encrypted_data.get("workflow_paused", False),
             "waiting_for_meeting_ended": encrypted_data.get(
                 "waiting_for_meeting_ended", False
@@ -962,6 +1771,8 @@ def save_workflow_thread_data(
             "bot_join_time": thread_data.get("bot_join_time"),
             "bot_leave_time": thread_data.get("bot_leave_time"),
             "bot_duration": thread_data.get("bot_duration"),
+            # delivery_status is operational (per-sink status and timing), not sensitive
+            "delivery_status": thread_data.get("delivery_status"),
         }
 
         # Remove None values to avoid overwriting with NULL
@@ -975,6 +1786,11 @@ def save_workflow_thread_data(
         logger.info(
             f"✅ Workflow thread data saved to Supabase: workflow_thread_id={workflow_thread_id} (sensitive fields encrypted)"
         )
+
+        # Keep cached reads of this row current (see flow/utils/workflow_thread_cache.py)
+        from flow.utils.workflow_thread_cache import update_cached_workflow_thread
+
+        update_cached_workflow_thread(workflow_thread_id, db_data)
         return True
 
     except Exception as e:
@@ -982,10 +1798,137 @@ def save_workflow_thread_data(
             f"❌ Error saving workflow thread data to Supabase for {workflow_thread_id}: {e}",
             exc_info=True,
         )
+        from flow.utils.workflow_thread_cache import invalidate_workflow_thread
+
+        invalidate_workflow_thread(workflow_thread_id)
+        return False
+
+
+def update_workflow_thread_fields(
+    workflow_thread_id: str, fields: Dict[str, Any]
+) -> bool:
+    """
+    Update only the given columns of an existing workflow thread.
+
+    **Simple Explanation:**
+    save_workflow_thread_data writes every column (with defaults), so callers
+    read the row first to avoid resetting other fields. This writes just the
+    columns you pass, in one round trip without the read.
+
+    Args:
+        workflow_thread_id: Unique workflow thread identifier
+        fields: Column values to set (sensitive fields are encrypted here)
+
+    Returns:
+        True if the row was updated, False if it doesn't exist or on error
+    """
+    client = get_supabase_client()
+    if not client:
+        logger.error(
+            "❌ Cannot update workflow thread in Supabase: client not available"
+        )
+        return False
+
+    from flow.utils.workflow_thread_cache import (
+        invalidate_workflow_thread,
+        update_cached_workflow_thread,
+    )
+
+    try:
+        db_data = encrypt_sensitive_data(fields, "workflow_threads", workflow_thread_id)
+        response = (
+            client.table("workflow_threads")
+            .update(db_data)
+            .eq("workflow_thread_id", workflow_thread_id)
+            .execute()
+        )
+        if not response.data:
+            logger.debug(f"No workflow thread to update for {workflow_thread_id}")
+            return False
+
+        # Keep cached reads of this row current
+        update_cached_workflow_thread(workflow_thread_id, db_data)
+        return True
+
+    except Exception as e:
+        logger.error(
+            f"❌ Error updating workflow thread in Supabase for {workflow_thread_id}: {e}",
+            exc_info=True,
+        )
+        invalidate_workflow_thread(workflow_thread_id)
         return False
 
 
-def get_workflow_thread_data(workflow_thread_id: str) -> Dict[str, Any] | None:
+# Columns of the workflow_threads table returned by get_workflow_thread_data
+WORKFLOW_THREAD_COLUMNS = (
+    "workflow_thread_id",
+    "room_name",
+    "room_url",
+    "room_id",
+    "session_id",
+    "email",
+    "provider",
+    "analysis_prompt",
+    "summary_format_prompt",
+    "bot_enabled",
+    "bot_id",
+    "bot_config",
+    "meeting_status",
+    "meeting_start_time",
+    "meeting_end_time",
+    "duration",
+    "transcript_text",
+    "transcript_id",
+    "transcript_processed",
+    "transcript_processing",
+    "email_sent",
+    "webhook_sent",
+    "candidate_summary",
+    "insights",
+    "qa_pairs",
+    "webhook_callback_url",
+    "email_results_to",
+    "workflow_paused",
+    "waiting_for_meeting_ended",
+    "waiting_for_transcript_webhook",
+    "metadata",
+    # Operational fields (not sensitive)
+    "checkpoint_id",
+    "usage_stats",
+    "unkey_key_id",
+    "bot_join_time",
+    "bot_leave_time",
+    "bot_duration",
+    "delivery_status",
+)
+
+
+def _workflow_thread_from_row(
+    row: Dict[str, Any],
+    fields: List[str] | None = None,
+    workflow_thread_id: str | None = None,
+) -> Dict[str, Any]:
+    """
+    Convert a workflow_threads row into thread_data format.
+
+    **Simple Explanation:**
+    None values are removed, and encrypted fields are decrypted on first
+    access (see LazyDecryptedDict).
+    """
+    return LazyDecryptedDict(
+        {
+            column: row[column]
+            for column in fields or WORKFLOW_THREAD_COLUMNS
+            if row.get(column) is not None
+        },
+        "workflow_threads",
+        workflow_thread_id or row.get("workflow_thread_id"),
+    )
+
+
+def get_workflow_thread_data(
+    workflow_thread_id: str, fields: List[str] | None = None, fresh: bool = False
+) -> Dict[str, Any] | None:
     """
     Retrieve workflow thread data from Supabase and decrypt sensitive fields.
 
@@ -993,12 +1936,43 @@ def get_workflow_thread_data(workflow_thread_id: str) -> Dict[str, Any] | None:
     This function retrieves all data for a specific workflow run by its workflow_thread_id.
     This is the primary way to get workflow data - each workflow run has its own row.
 
+    Most callers only need a flag or two. Pass `fields` (e.g. `["unkey_key_id"]`
+    or `["usage_stats"]`) to read just those columns, so the transcript and
+    other large encrypted columns aren't transferred or decrypted. Encrypted
+    fields that are read are decrypted on first access.
+
+    Pass `fresh=True` before a read-modify-write (read the row, change it, save
+    it with save_workflow_thread_data): cached rows don't see writes from other
+    tasks or processes, and saving a stale copy would revert them.
+
     Args:
         workflow_thread_id: Unique workflow thread identifier (UUID string)
+        fields: Columns to read (from WORKFLOW_THREAD_COLUMNS), or None for all
+        fresh: Read from the database even if the row is cached (the cache is
+            refreshed with the result)
 
     Returns:
-        Dictionary with workflow thread data (sensitive fields decrypted), or None if not found
+        Dictionary with workflow thread data (sensitive fields decrypted on access), or None if not found
     """
+    columns = _select_columns(fields, WORKFLOW_THREAD_COLUMNS)
+
+    # Rows read earlier in this run (or a moment ago) are reused, see
+    # flow/utils/workflow_thread_cache.py
+    from flow.utils.workflow_thread_cache import (
+        get_cached_workflow_thread,
+        store_workflow_thread,
+    )
+
+    cached = (
+        None
+        if fresh
+        else get_cached_workflow_thread(
+            workflow_thread_id, fields or WORKFLOW_THREAD_COLUMNS
+        )
+    )
+    if cached is not None:
+        return _workflow_thread_from_row(cached, fields, workflow_thread_id)
+
     client = get_supabase_client()
     if not client:
         logger.error(
@@ -1009,7 +1983,7 @@ def get_workflow_thread_data(workflow_thread_id: str) -> Dict[str, Any] | None:
     try:
         response = (
             client.table("workflow_threads")
-            .select("*")
+            .select(columns)
             .eq("workflow_thread_id", workflow_thread_id)
             .execute()
         )
@@ -1022,62 +1996,13 @@ def get_workflow_thread_data(workflow_thread_id: str) -> Dict[str, Any] | None:
 
         # Get the first (and should be only) row
         row = response.data[0]
-
-        # Convert database row back to thread_data format
-        thread_data = {
-            "workflow_thread_id": row.get("workflow_thread_id"),
-            "room_name": row.get("room_name"),
-            "room_url": row.get("room_url"),
-            "room_id": row.get("room_id"),
-            "session_id": row.get("session_id"),
-            "email": row.get("email"),
-            "provider": row.get("provider"),
-            "analysis_prompt": row.get("analysis_prompt"),
-            "summary_format_prompt": row.get("summary_format_prompt"),
-            "bot_enabled": row.get("bot_enabled"),
-            "bot_id": row.get("bot_id"),
-            "bot_config": row.get("bot_config"),
-            "meeting_status": row.get("meeting_status"),
-            "meeting_start_time": row.get("meeting_start_time"),
-            "meeting_end_time": row.get("meeting_end_time"),
-            "duration": row.get("duration"),
-            "transcript_text": row.get("transcript_text"),
-            "transcript_id": row.get("transcript_id"),
-            "transcript_processed": row.get("transcript_processed"),
-            "transcript_processing": row.get("transcript_processing"),
-            "email_sent": row.get("email_sent"),
-            "webhook_sent": row.get("webhook_sent"),
-            "candidate_summary": row.get("candidate_summary"),
-            "insights": row.get("insights"),
-            "qa_pairs": row.get("qa_pairs"),
-            "webhook_callback_url": row.get("webhook_callback_url"),
-            "email_results_to": row.get("email_results_to"),
-            "workflow_paused": row.get("workflow_paused"),
-            "waiting_for_meeting_ended": row.get("waiting_for_meeting_ended"),
-            "waiting_for_transcript_webhook": row.get("waiting_for_transcript_webhook"),
-            "metadata": row.get("metadata"),
-            # checkpoint_id is an operational field (not sensitive), so include it directly
-            "checkpoint_id": row.get("checkpoint_id"),
-            # usage_stats is an operational field (not sensitive), so include it directly
-            "usage_stats": row.get("usage_stats"),
-            # unkey_key_id is an operational field (not sensitive), so include it directly
-            "unkey_key_id": row.get("unkey_key_id"),
-            # bot timing fields are operational (not sensitive), so include them directly
-            "bot_join_time": row.get("bot_join_time"),
-            "bot_leave_time": row.get("bot_leave_time"),
-            "bot_duration": row.get("bot_duration"),
-        }
-
-        # Remove None values
-        thread_data = {k: v for k, v in thread_data.items() if v is not None}
-
-        # Decrypt sensitive fields
-        decrypted_data = decrypt_sensitive_data(thread_data)
+        store_workflow_thread(workflow_thread_id, row)
+        thread_data = _workflow_thread_from_row(row, fields, workflow_thread_id)
 
         logger.info(
-            f"✅ Retrieved workflow thread data from Supabase: workflow_thread_id={workflow_thread_id} (sensitive fields decrypted)"
+            f"✅ Retrieved workflow thread data from Supabase: workflow_thread_id={workflow_thread_id}"
         )
-        return decrypted_data
+        return thread_data
 
     except Exception as e:
         logger.error(
@@ -1087,21 +2012,31 @@ def get_workflow_thread_data(workflow_thread_id: str) -> Dict[str, Any] | None:
         return None
 
 
-def get_workflow_threads_by_room_name(room_name: str) -> list[Dict[str, Any]]:
+def get_workflow_threads_by_room_name(
+    room_name: str, fields: List[str] | None = None
+) -> list[Dict[str, Any]]:
     """
     Get all workflow threads for a given room_name.
 
     **Simple Explanation:**
     This function retrieves all workflow runs that used a specific room.
     Useful for finding all workflow threads associated with a room, since
-    rooms can be reused across multiple workflow runs.
+    rooms can be reused across multiple workflow runs. Pass `fields` (e.g.
+    `["workflow_thread_id", "workflow_paused"]`) to read only those columns.
 
     Args:
         room_name: Room name to search for
+        fields: Columns to read (from WORKFLOW_THREAD_COLUMNS), or None for all
 
     Returns:
-        List of workflow thread data dictionaries (sensitive fields decrypted), empty list if none found
+        List of workflow thread data dictionaries (sensitive fields decrypted on access), empty list if none found
     """
+    # workflow_thread_id is always read: encrypted fields are bound to it
+    columns = _select_columns(
+        fields and list(dict.fromkeys(["workflow_thread_id", *fields])),
+        WORKFLOW_THREAD_COLUMNS,
+    )
+
     client = get_supabase_client()
     if not client:
         logger.error(
@@ -1112,7 +2047,7 @@ def get_workflow_threads_by_room_name(room_name: str) -> list[Dict[str, Any]]:
     try:
         response = (
             client.table("workflow_threads")
-            .select("*")
+            .select(columns)
             .eq("room_name", room_name)
             .order("created_at", desc=True)
             .execute()
@@ -1124,55 +2059,7 @@ def get_workflow_threads_by_room_name(room_name: str) -> list[Dict[str, Any]]:
             )
             return []
 
-        # Convert all rows and decrypt sensitive fields
-        threads = []
-        for row in response.data:
-            thread_data = {
-                "workflow_thread_id": row.get("workflow_thread_id"),
-                "room_name": row.get("room_name"),
-                "room_url": row.get("room_url"),
-                "room_id": row.get("room_id"),
-                "session_id": row.get("session_id"),
-                "email": row.get("email"),
-                "provider": row.get("provider"),
-                "analysis_prompt": row.get("analysis_prompt"),
-                "summary_format_prompt": row.get("summary_format_prompt"),
-                "bot_enabled": row.get("bot_enabled"),
-                "bot_id": row.get("bot_id"),
-                "bot_config": row.get("bot_config"),
-                "meeting_status": row.get("meeting_status"),
-                "meeting_start_time": row.get("meeting_start_time"),
-                "meeting_end_time": row.get("meeting_end_time"),
-                "duration": row.get("duration"),
-                "transcript_text": row.get("transcript_text"),
-                "transcript_id": row.get("transcript_id"),
-                "transcript_processed": row.get("transcript_processed"),
-                "transcript_processing": row.get("transcript_processing"),
-                "email_sent": row.get("email_sent"),
-                "webhook_sent": row.get("webhook_sent"),
-                "candidate_summary": row.get("candidate_summary"),
-                "insights": row.get("insights"),
-                "qa_pairs": row.get("qa_pairs"),
-                "webhook_callback_url": row.get("webhook_callback_url"),
-                "email_results_to": row.get("email_results_to"),
-                "workflow_paused": row.get("workflow_paused"),
-                "waiting_for_meeting_ended": row.get("waiting_for_meeting_ended"),
-                "waiting_for_transcript_webhook": row.get(
-                    "waiting_for_transcript_webhook"
-                ),
-                "metadata": row.get("metadata"),
-                # checkpoint_id is an operational field (not sensitive), so include it directly
-                "checkpoint_id": row.get("checkpoint_id"),
-                # usage_stats is an operational field (not sensitive), so include it directly
-                "usage_stats": row.get("usage_stats"),
-            }
-
-            # Remove None values
-            thread_data = {k: v for k, v in thread_data.items() if v is not None}
-
-            # Decrypt sensitive fields
-            decrypted_data = decrypt_sensitive_data(thread_data)
-            threads.append(decrypted_data)
+        threads = [_workflow_thread_from_row(row, fields) for row in response.data]
 
         logger.info(
             f"✅ Retrieved {len(threads)} workflow thread(s) from Supabase for room_name: {room_name}"
@@ -1187,6 +2074,125 @@ def get_workflow_threads_by_room_name(room_name: str) -> list[Dict[str, Any]]:
         return []
 
 
+def get_paused_workflow_thread_id(room_name: str) -> str | None:
+    """
+    Find the most recent paused workflow thread for a room.
+
+    **Simple Explanation:**
+    A bot that joins a room needs the workflow run waiting for it (the one
+    with workflow_paused set). Rooms are reused, so instead of reading every
+    historical thread for the room and checking the flag in Python, this asks
+    the database for just that one ID. The partial index
+    idx_workflow_threads_paused_room_name (room_name, created_at DESC WHERE
+    workflow_paused) keeps it a single index lookup however old the room is.
+
+    Args:
+        room_name: Room name to search for
+
+    Returns:
+        workflow_thread_id of the most recent paused thread, or None if there
+        is none (or on error)
+    """
+    client = get_supabase_client()
+    if not client:
+        logger.error(
+            "❌ Cannot read workflow threads from Supabase: client not available"
+        )
+        return None
+
+    try:
+        response = (
+            client.table("workflow_threads")
+            .select("workflow_thread_id")
+            .eq("room_name", room_name)
+            .eq("workflow_paused", True)
+            .order("created_at", desc=True)
+            .limit(1)
+            .execute()
+        )
+
+        if not response.data:
+            logger.debug(f"No paused workflow thread found for room_name: {room_name}")
+            return None
+
+        return response.data[0].get("workflow_thread_id")
+
+    except Exception as e:
+        logger.error(
+            f"❌ Error finding paused workflow thread in Supabase for {room_name}: {e}",
+            exc_info=True,
+        )
+        return None
+
+
+def get_workflow_threads_by_email(
+    email: str,
+    unkey_key_id: str,
+    fields: List[str] | None = None,
+    limit: int = 50,
+) -> list[Dict[str, Any]] | None:
+    """
+    Get an API key's workflow threads whose email or email_results_to is an address.
+
+    **Simple Explanation:**
+    The email columns are encrypted, so they can't be compared in SQL. Each
+    row also stores a blind index of both fields (email_bidx,
+    email_results_to_bidx; see email_blind_index), and this looks the address
+    up in those indexed columns - one query, no rows decrypted to search.
+    Results are always limited to one API key, so one tenant can't list
+    another tenant's threads.
+
+    Args:
+        email: Email address (matched case-insensitively)
+        unkey_key_id: API key the threads were created with (required)
+        fields: Columns to read (from WORKFLOW_THREAD_COLUMNS), or None for all
+        limit: Maximum number of threads, newest first
+
+    Returns:
+        List of workflow thread data dictionaries (sensitive fields decrypted
+        on access), or None on error
+    """
+    if not unkey_key_id:
+        raise ValueError("unkey_key_id is required to search workflow threads")
+
+    email_filter = _email_blind_index_filter(email)
+    if email_filter is None:
+        return []
+
+    # workflow_thread_id is always read: encrypted fields are bound to it
+    columns = _select_columns(
+        fields and list(dict.fromkeys(["workflow_thread_id", *fields])),
+        WORKFLOW_THREAD_COLUMNS,
+    )
+
+    client = get_supabase_client()
+    if not client:
+        logger.error(
+            "❌ Cannot read workflow threads from Supabase: client not available"
+        )
+        return None
+
+    try:
+        response = (
+            client.table("workflow_threads")
+            .select(columns)
+            .eq("unkey_key_id", unkey_key_id)
+            .or_(email_filter)
+            .order("created_at", desc=True)
+            .limit(limit)
+            .execute()
+        )
+
+        return [_workflow_thread_from_row(row, fields) for row in response.data or []]
+
+    except Exception as e:
+        logger.error(
+            f"❌ Error finding workflow threads by email in Supabase: {e}",
+            exc_info=True,
+        )
+        return None
+
+
 def increment_workflow_usage_cost(
     workflow_thread_id: str, cost_usd: float, posthog_trace_id: str | None = None
 ) -> bool:
@@ -1214,9 +2220,11 @@ def increment_workflow_usage_cost(
         return False
 
     try:
-        # Get current workflow thread data
-        thread_data = get_workflow_thread_data(workflow_thread_id)
-        if not thread_data:
+        # Get current usage_stats (only that column)
+        thread_data = get_workflow_thread_data(
+            workflow_thread_id, fields=["usage_stats"], fresh=True
+        )
+        if thread_data is None:
             logger.warning(
                 f"⚠️ Workflow thread not found: {workflow_thread_id} - cannot increment usage cost"
             )
@@ -1238,9 +2246,10 @@ def increment_workflow_usage_cost(
         if posthog_trace_id:
             usage_stats["posthog_trace_id"] = posthog_trace_id
 
-        # Save updated data
-        thread_data["usage_stats"] = usage_stats
-        return save_workflow_thread_data(workflow_thread_id, thread_data)
+        # Save updated usage_stats
+        return update_workflow_thread_fields(
+            workflow_thread_id, {"usage_stats": usage_stats}
+        )
 
     except Exception as e:
         logger.error(
@@ -1410,8 +2419,11 @@ def create_bot_usage_transaction(
 
     try:
         # Get workflow thread data to access unkey_key_id and usage_stats
-        thread_data = get_workflow_thread_data(workflow_thread_id)
-        if not thread_data:
+        thread_data = get_workflow_thread_data(
+            workflow_thread_id,
+            fields=["unkey_key_id", "usage_stats", "bot_id", "room_name"],
+        )
+        if thread_data is None:
             logger.warning(
                 f"⚠️ Workflow thread not found: {workflow_thread_id} - cannot create transaction"
             )
@@ -1581,3 +2593,583 @@ def deduct_user_credits(user_id: str, amount: float) -> bool:
             exc_info=True,
         )
         return False
+
+
+# Webhook Outbox
+
+
+def _webhook_delivery_from_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a webhook_deliveries row to a dict with url and payload decrypted."""
+    delivery = dict(row)
+    key = row.get("idempotency_key")
+    delivery["url"] = decrypt_field(
+        row.get("url"), field_associated_data("webhook_deliveries", "url", key)
+    )
+    payload = decrypt_field(
+        row.get("payload"), field_associated_data("webhook_deliveries", "payload", key)
+    )
+    delivery["payload"] = json.loads(payload) if payload else {}
+    return delivery
+
+
+def create_webhook_delivery(
+    idempotency_key: str,
+    url: str,
+    payload: Dict[str, Any],
+    workflow_thread_id: str | None = None,
+) -> Dict[str, Any] | None:
+    """
+    Record a webhook delivery in the outbox (once per idempotency key).
+
+    **Simple Explanation:**
+    Before a webhook is sent, it is written to the webhook_deliveries table. If a
+    delivery with the same idempotency key already exists (for example, because
+    transcript processing was retried), the existing row is returned instead of
+    creating a second one, so the customer never gets the same event twice.
+
+    The URL and payload are encrypted at rest (the payload contains the transcript).
+
+    Args:
+        idempotency_key: Unique key for this event (sent as the Idempotency-Key header)
+        url: Destination webhook URL
+        payload: JSON-serializable webhook body
+        workflow_thread_id: Workflow run this delivery belongs to (optional)
+
+    Returns:
+        Delivery dict (url and payload decrypted), or None on failure
+    """
+    client = get_supabase_client()
+    if not client:
+        logger.error("❌ Cannot record webhook delivery: Supabase client not available")
+        return None
+
+    try:
+        client.table("webhook_deliveries").upsert(
+            {
+                "idempotency_key": idempotency_key,
+                "workflow_thread_id": workflow_thread_id,
+                "url": encrypt_field(
+                    url,
+                    field_associated_data("webhook_deliveries", "url", idempotency_key),
+                ),
+                "payload": encrypt_field(
+                    json.dumps(payload),
+                    field_associated_data(
+                        "webhook_deliveries", "payload", idempotency_key
+                    ),
+                ),
+            },
+            on_conflict="idempotency_key",
+            ignore_duplicates=True,
+        ).execute()
+
+        response = (
+            client.table("webhook_deliveries")
+            .select("*")
+            .eq("idempotency_key", idempotency_key)
+            .execute()
+        )
+        if not response.data:
+            logger.warning(
+                f"⚠️ Webhook delivery not found after insert: {idempotency_key}"
+            )
+            return None
+
+        return _webhook_delivery_from_row(response.data[0])
+
+    except Exception as e:
+        logger.error(
+            f"❌ Error recording webhook delivery {idempotency_key}: {e}",
+            exc_info=True,
+        )
+        return None
+
+
+def get_webhook_delivery(delivery_id: str) -> Dict[str, Any] | None:
+    """
+    Retrieve a webhook delivery from the outbox.
+
+    Args:
+        delivery_id: Delivery UUID
+
+    Returns:
+        Delivery dict (url and payload decrypted), or None if not found
+    """
+    client = get_supabase_client()
+    if not client:
+        logger.error("❌ Cannot read webhook delivery: Supabase client not available")
+        return None
+
+    try:
+        response = (
+            client.table("webhook_deliveries")
+            .select("*")
+            .eq("id", delivery_id)
+            .execute()
+        )
+        if not response.data:
+            logger.warning(f"⚠️ No webhook delivery found for id: {delivery_id}")
+            return None
+
+        return _webhook_delivery_from_row(response.data[0])
+
+    except Exception as e:
+        logger.error(
+            f"❌ Error retrieving webhook delivery {delivery_id}: {e}", exc_info=True
+        )
+        return None
+
+
+def update_webhook_delivery(delivery_id: str, updates: Dict[str, Any]) -> bool:
+    """
+    Update delivery status fields (status, attempts, last_status_code, ...).
+
+    Args:
+        delivery_id: Delivery UUID
+        updates: Columns to update (url and payload are not updated here)
+
+    Returns:
+        True if updated successfully, False otherwise
+    """
+    client = get_supabase_client()
+    if not client:
+        logger.error("❌ Cannot update webhook delivery: Supabase client not available")
+        return False
+
+    try:
+        client.table("webhook_deliveries").update(updates).eq(
+            "id", delivery_id
+        ).execute()
+        return True
+    except Exception as e:
+        logger.error(
+            f"❌ Error updating webhook delivery {delivery_id}: {e}", exc_info=True
+        )
+        return False
+
+
+# Insight Cache
+
+
+def get_insight_cache_entry(cache_key: str) -> Dict[str, Any] | None:
+    """
+    Retrieve a cached insight extraction result.
+
+    Args:
+        cache_key: Content hash from flow.utils.insight_cache.compute_insight_cache_key
+
+    Returns:
+        Entry dict (insights decrypted), or None if not found or on error
+    """
+    client = get_supabase_client()
+    if not client:
+        return None
+
+    try:
+        response = (
+            client.table("insight_cache")
+            .select("*")
+            .eq("cache_key", cache_key)
+            .execute()
+        )
+        if not response.data:
+            return None
+
+        row = response.data[0]
+        insights = decrypt_field(
+            row.get("insights"),
+            field_associated_data("insight_cache", "insights", cache_key),
+        )
+        if not insights:
+            return None
+
+        return {
+            "insights": json.loads(insights),
+            "model": row.get("model"),
+            "prompt_tokens": row.get("prompt_tokens") or 0,
+            "completion_tokens": row.get("completion_tokens") or 0,
+            "cost_usd": float(row.get("cost_usd") or 0.0),
+        }
+
+    except Exception as e:
+        logger.error(
+            f"❌ Error retrieving insight cache entry {cache_key[:12]}: {e}",
+            exc_info=True,
+        )
+        return None
+
+
+def save_insight_cache_entry(cache_key: str, entry: Dict[str, Any]) -> bool:
+    """
+    Save an insight extraction result to the cache.
+
+    **Simple Explanation:**
+    Insights are derived from the transcript, so they are encrypted at rest just
+    like the transcript itself. Saving the same key twice keeps the first entry.
+
+    Args:
+        cache_key: Content hash from flow.utils.insight_cache.compute_insight_cache_key
+        entry: Dict with insights, model, prompt_tokens, completion_tokens, cost_usd
+
+    Returns:
+        True if saved successfully, False otherwise
+    """
+    client = get_supabase_client()
+    if not client:
+        return False
+
+    try:
+        client.table("insight_cache").upsert(
+            {
+                "cache_key": cache_key,
+                "model": entry.get("model"),
+                "insights": encrypt_field(
+                    json.dumps(entry["insights"]),
+                    field_associated_data("insight_cache", "insights", cache_key),
+                ),
+                "prompt_tokens": entry.get("prompt_tokens", 0),
+                "completion_tokens": entry.get("completion_tokens", 0),
+                "cost_usd": entry.get("cost_usd", 0.0),
+            },
+            on_conflict="cache_key",
+            ignore_duplicates=True,
+        ).execute()
+        logger.debug(f"✅ Saved insight cache entry {cache_key[:12]}")
+        return True
+
+    except Exception as e:
+        logger.error(
+            f"❌ Error saving insight cache entry {cache_key[:12]}: {e}",
+            exc_info=True,
+        )
+        return False
+
+
+# Idempotency Keys
+
+
+def claim_idempotency_key(
+    key_hash: str, request_hash: str, lock_seconds: int
+) -> Dict[str, Any] | None:
+    """
+    Claim an idempotency key for a request that is about to run.
+
+    **Simple Explanation:**
+    Inserts an "in_progress" row for the key. The primary key makes sure only
+    one request can claim it; everyone else gets the existing row back. A row
+    whose expires_at has passed (an old response, or a claim by a process that
+    died) can be taken over.
+
+    Args:
+        key_hash: Hash of the API key ID and Idempotency-Key header
+        request_hash: Hash of the request body
+        lock_seconds: How long the in-progress claim blocks other requests
+
+    Returns:
+        {"claimed": True} if this request owns the key,
+        {"claimed": False, **row} if another request does,
+        or None if the database is not available
+    """
+    client = get_supabase_client()
+    if not client:
+        return None
+
+    try:
+        from datetime import datetime, timedelta, timezone
+
+        now = datetime.now(timezone.utc)
+        row = {
+            "key_hash": key_hash,
+            "request_hash": request_hash,
+            "status": "in_progress",
+            "response": None,
+            "expires_at": (now + timedelta(seconds=lock_seconds)).isoformat(),
+        }
+
+        response = (
+            client.table("idempotency_keys")
+            .upsert(row, on_conflict="key_hash", ignore_duplicates=True)
+            .execute()
+        )
+        if response.data:
+            return {"claimed": True}
+
+        existing = get_idempotency_key(key_hash, include_expired=True)
+        if existing is None:
+            return {"claimed": False, "status": "in_progress"}
+
+        if existing["expired"]:
+            # Take over an expired row (only one request can win this update)
+            response = (
+                client.table("idempotency_keys")
+                .update(row)
+                .eq("key_hash", key_hash)
+                .lt("expires_at", now.isoformat())
+                .execute()
+            )
+            if response.data:
+                return {"claimed": True}
+
+        return {"claimed": False, **existing}
+
+    except Exception as e:
+        logger.error(
+            f"❌ Error claiming idempotency key {key_hash[:12]}: {e}",
+            exc_info=True,
+        )
+        return None
+
+
+def get_idempotency_key(
+    key_hash: str, include_expired: bool = False
+) -> Dict[str, Any] | None:
+    """
+    Retrieve an idempotency key row.
+
+    Args:
+        key_hash: Hash of the API key ID and Idempotency-Key header
+        include_expired: Also return expired rows (with "expired": True)
+
+    Returns:
+        Dict with status, request_hash, response and expired, or None if not
+        found (or expired) or on error
+    """
+    client = get_supabase_client()
+    if not client:
+        return None
+
+    try:
+        from datetime import datetime, timezone
+
+        response = (
+            client.table("idempotency_keys")
+            .select("status, request_hash, response, expires_at")
+            .eq("key_hash", key_hash)
+            .execute()
+        )
+        if not response.data:
+            return None
+
+        row = response.data[0]
+        expires_at = datetime.fromisoformat(row["expires_at"].replace("Z", "+00:00"))
+        expired = expires_at <= datetime.now(timezone.utc)
+        if expired and not include_expired:
+            return None
+
+        return {
+            "status": row.get("status"),
+            "request_hash": row.get("request_hash"),
+            "response": row.get("response"),
+            "expired": expired,
+        }
+
+    except Exception as e:
+        logger.error(
+            f"❌ Error retrieving idempotency key {key_hash[:12]}: {e}",
+            exc_info=True,
+        )
+        return None
+
+
+def complete_idempotency_key(
+    key_hash: str, response_body: Dict[str, Any], ttl_seconds: int
+) -> bool:
+    """
+    Store the response for a claimed idempotency key.
+
+    Args:
+        key_hash: Hash of the API key ID and Idempotency-Key header
+        response_body: JSON response to replay for later requests with the key
+        ttl_seconds: How long the response is replayed
+
+    Returns:
+        True if saved successfully, False otherwise
+    """
+    client = get_supabase_client()
+    if not client:
+        return False
+
+    try:
+        from datetime import datetime, timedelta, timezone
+
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)
+        (
+            client.table("idempotency_keys")
+            .update(
+                {
+                    "status": "completed",
+                    "response": response_body,
+                    "expires_at": expires_at.isoformat(),
+                }
+            )
+            .eq("key_hash", key_hash)
+            .execute()
+        )
+        return True
+
+    except Exception as e:
+        logger.error(
+            f"❌ Error completing idempotency key {key_hash[:12]}: {e}",
+            exc_info=True,
+        )
+        return False
+
+
+def release_idempotency_key(key_hash: str) -> bool:
+    """
+    Delete an in-progress idempotency key after its request failed.
+
+    Returns:
+        True if deleted successfully, False otherwise
+    """
+    client = get_supabase_client()
+    if not client:
+        return False
+
+    try:
+        (
+            client.table("idempotency_keys")
+            .delete()
+            .eq("key_hash", key_hash)
+            .eq("status", "in_progress")
+            .execute()
+        )
+        return True
+
+    except Exception as e:
+        logger.error(
+            f"❌ Error releasing idempotency key {key_hash[:12]}: {e}",
+            exc_info=True,
+        )
+        return False
+
+
+# Re-encryption of legacy values
+
+# Tables with encrypted columns: table -> (primary key, encrypted columns)
+REENCRYPTION_TABLES: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "rooms": (
+        "room_name",
+        tuple(c for c in ROOM_SESSION_COLUMNS if c in ENCRYPTED_FIELDS),
+    ),
+    "workflow_threads": (
+        "workflow_thread_id",
+        tuple(c for c in WORKFLOW_THREAD_COLUMNS if c in ENCRYPTED_FIELDS),
+    ),
+    "bot_sessions": ("bot_id", ("transcript_text",)),
+    "webhook_deliveries": ("idempotency_key", ("url", "payload")),
+    "insight_cache": ("cache_key", ("insights",)),
+}
+
+
+def reencrypt_legacy_rows(
+    table: str,
+    after: str | None = None,
+    batch_size: int = 100,
+    dry_run: bool = False,
+) -> Dict[str, Any] | None:
+    """
+    Re-encrypt one batch of rows whose encrypted columns use an old format.
+
+    **Simple Explanation:**
+    Reads up to `batch_size` rows in primary key order (starting after
+    `after`), and rewrites every encrypted column that isn't in an envelope
+    format ("pf1:", "pf2:") - legacy base64 Fernet values and plaintext stored
+    before field encryption existed. In tables with email blind indexes
+    (BLIND_INDEX_TABLES), missing index columns are filled in too, so rows
+    written before the indexes existed can be found by email. Call again with
+    the returned `next_after` until it is None (see
+    flow/scripts/reencrypt_legacy_fields.py).
+
+    Each update only applies while the columns are still in the old format
+    (and the index columns still empty), so a row written by the app in the
+    meantime isn't overwritten; it's counted as skipped.
+
+    Args:
+        table: Table name (a key of REENCRYPTION_TABLES)
+        after: Primary key of the last row of the previous batch, or None to start
+        batch_size: Rows to read
+        dry_run: Count the rows that need re-encryption without updating them
+
+    Returns:
+        Dict with scanned, reencrypted (rows updated), skipped and next_after
+        (None when the table is done), or None on error
+    """
+    if table not in REENCRYPTION_TABLES:
+        raise ValueError(f"Unknown table for re-encryption: {table}")
+    key_column, columns = REENCRYPTION_TABLES[table]
+    index_columns = BLIND_INDEX_COLUMNS if table in BLIND_INDEX_TABLES else {}
+
+    client = get_supabase_client()
+    if not client:
+        logger.error("❌ Cannot re-encrypt rows: Supabase client not available")
+        return None
+
+    try:
+        query = client.table(table).select(
+            ",".join((key_column,) + columns + tuple(index_columns.values()))
+        )
+        if after is not None:
+            query = query.gt(key_column, after)
+        response = query.order(key_column).limit(batch_size).execute()
+        rows = response.data or []
+
+        reencrypted = 0
+        skipped = 0
+        for row in rows:
+            updates = {}
+            for column in columns:
+                value = row.get(column)
+                if not isinstance(value, str) or not value.strip():
+                    continue
+                associated_data = field_associated_data(table, column, row[key_column])
+                version = encrypted_value_version(value)
+                needs_index = column in index_columns and not row.get(
+                    index_columns[column]
+                )
+                if version not in ("legacy", None) and not needs_index:
+                    continue
+                # decrypt_field raises if a value doesn't decrypt (e.g. wrong
+                # ENCRYPTION_KEY), so the batch stops instead of encrypting ciphertext
+                if version == "legacy":
+                    plaintext = decrypt_field(value)
+                elif version is None:
+                    plaintext = value
+                else:
+                    plaintext = decrypt_field(value, associated_data)
+                if version in ("legacy", None):
+                    updates[column] = encrypt_field(plaintext, associated_data)
+                if needs_index:
+                    updates[index_columns[column]] = email_blind_index(plaintext)
+            if not updates:
+                continue
+            if dry_run:
+                reencrypted += 1
+                continue
+
+            update = client.table(table).update(updates).eq(key_column, row[key_column])
+            for column in updates:
+                if column in columns:
+                    for prefix in FIELD_CIPHERS:
+                        update = update.not_.like(column, f"{prefix}%")
+                else:
+                    update = update.is_(column, "null")
+            if update.execute().data:
+                reencrypted += 1
+            else:
+                skipped += 1
+
+        logger.info(
+            f"🔐 Re-encrypted {reencrypted}/{len(rows)} {table} rows"
+            f"{' (dry run)' if dry_run else ''}"
+        )
+        return {
+            "scanned": len(rows),
+            "reencrypted": reencrypted,
+            "skipped": skipped,
+            "next_after": rows[-1][key_column] if len(rows) == batch_size else None,
+        }
+
+    except Exception as e:
+        logger.error(f"❌ Error re-encrypting {table} rows: {e}", exc_info=True)
+        return None
@@ -0,0 +1,78 @@
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Durable background jobs for PailFlow.
+
+**Simple Explanation:**
+Post-call work (resuming the workflow, processing the transcript, delivering
+webhooks) is enqueued in Postgres and run by `flow worker` processes instead of
+on the API's event loop.
+Jobs survive restarts, are retried with backoff, and run with bounded concurrency.
+
+When USE_JOB_QUEUE is not enabled (or the database is unavailable), `enqueue_job`
+returns None and callers run the work in-process as before.
+"""
+
+import logging
+from typing import Any, Dict
+
+from flow.jobs.handlers import (
+    JOB_DELIVER_WEBHOOK,
+    JOB_HANDLERS,
+    JOB_PROCESS_TRANSCRIPT,
+    JOB_RESUME_WORKFLOW,
+    QUEUE_TRANSCRIPTS,
+    QUEUE_WEBHOOKS,
+    get_queue_for_job,
+    register_job_handler,
+)
+from flow.jobs.queue import DEFAULT_MAX_ATTEMPTS, Job, enqueue, is_job_queue_enabled
+
+logger = logging.getLogger(__name__)
+
+
+async def enqueue_job(
+    job_type: str,
+    payload: Dict[str, Any],
+    dedupe_key: str | None = None,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+) -> int | None:
+    """
+    Enqueue a job on the queue registered for its type.
+
+    Args:
+        job_type: Registered job type (e.g. JOB_PROCESS_TRANSCRIPT)
+        payload: JSON-serializable job arguments
+        dedupe_key: Optional key to prevent duplicate active jobs
+        max_attempts: Attempts before the job is marked as failed
+
+    Returns:
+        Job ID, or None if the queue is disabled or unavailable
+        (the caller should then run the work in-process)
+    """
+    if not is_job_queue_enabled():
+        return None
+
+    return await enqueue(
+        get_queue_for_job(job_type),
+        job_type,
+        payload,
+        dedupe_key=dedupe_key,
+        max_attempts=max_attempts,
+    )
+
+
+__all__ = [
+    "JOB_DELIVER_WEBHOOK",
+    "JOB_HANDLERS",
+    "JOB_PROCESS_TRANSCRIPT",
+    "JOB_RESUME_WORKFLOW",
+    "QUEUE_TRANSCRIPTS",
+    "QUEUE_WEBHOOKS",
+    "Job",
+    "enqueue_job",
+    "get_queue_for_job",
+    "is_job_queue_enabled",
+    "register_job_handler",
+]
@@ -0,0 +1,200 @@
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Job handlers for the durable job queue.
+
+**Simple Explanation:**
+Each job type maps to a queue and an async handler. Workers only run handlers
+for the queues they subscribe to, so heavy work (like post-call processing)
+can be scaled on its own worker processes.
+
+A handler raises an exception to signal failure; the worker then schedules a
+retry with backoff.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+# Queue names
+QUEUE_TRANSCRIPTS = "transcripts"
+QUEUE_WEBHOOKS = "webhooks"
+
+# Job types
+JOB_PROCESS_TRANSCRIPT = "process_transcript"
+JOB_RESUME_WORKFLOW = "resume_workflow"
+JOB_DELIVER_WEBHOOK = "deliver_webhook"
+
+
+@dataclass
+class JobHandler:
+    """A registered job type: which queue it runs on and what it does."""
+
+    queue: str
+    handler: Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+JOB_HANDLERS: Dict[str, JobHandler] = {}
+
+
+def register_job_handler(job_type: str, queue: str) -> Callable[
+    [Callable[[Dict[str, Any]], Awaitable[None]]],
+    Callable[[Dict[str, Any]], Awaitable[None]],
+]:
+    """
+    Register an async function as the handler for a job type.
+
+    Example:
+        ```python
+        @register_job_handler("send_report", queue="reports")
+        async def send_report(payload: dict) -> None:
+            ...
+        ```
+    """
+
+    def decorator(
+        func: Callable[[Dict[str, Any]], Awaitable[None]],
+    ) -> Callable[[Dict[str, Any]], Awaitable[None]]:
+        JOB_HANDLERS[job_type] = JobHandler(queue=queue, handler=func)
+        return func
+
+    return decorator
+
+
+def get_queue_for_job(job_type: str) -> str:
+    """Get the queue a job type runs on."""
+    if job_type not in JOB_HANDLERS:
+        raise ValueError(f"Unknown job type: {job_type}")
+    return JOB_HANDLERS[job_type].queue
+
+
+@register_job_handler(JOB_PROCESS_TRANSCRIPT, queue=QUEUE_TRANSCRIPTS)
+async def process_transcript(payload: Dict[str, Any]) -> None:
+    """
+    Run the full ProcessTranscriptStep pipeline (Q&A, insights, email, webhook).
+
+    **Simple Explanation:**
+    The payload is the same state dict the step always received. The step keeps
+    its own idempotency flags (email_sent, webhook_sent), so a retry does not
+    resend anything that already went out.
+
+    Raises:
+        RuntimeError: If the step reports an error (so the job is retried)
+    """
+    from flow.steps.agent_call.steps.process_transcript import ProcessTranscriptStep
+
+    result = await ProcessTranscriptStep().execute(dict(payload))
+    if result.get("error"):
+        raise RuntimeError(result["error"])
+
+
+@register_job_handler(JOB_RESUME_WORKFLOW, queue=QUEUE_TRANSCRIPTS)
+async def resume_workflow(payload: Dict[str, Any]) -> None:
+    """
+    Resume a paused BotCallWorkflow so it runs the process_transcript node.
+
+    **Simple Explanation:**
+    The bot call workflow pauses after the bot joins. When the bot leaves, this
+    job resumes it from the saved checkpoint. If the checkpoint can't be found,
+    we fall back to running ProcessTranscriptStep directly.
+
+    Payload:
+        workflow_thread_id: Workflow thread to resume
+        room_name: Room the bot was in (used by the fallback)
+    """
+    from flow.db import get_workflow_thread_data
+    from flow.workflows.bot_call import BotCallWorkflow
+
+    workflow_thread_id = payload["workflow_thread_id"]
+    room_name = payload.get("room_name")
+
+    try:
+        workflow = BotCallWorkflow()
+
+        # Retrieve checkpoint_id from workflow_threads if available
+        # Simple Explanation: The checkpoint_id tells LangGraph exactly which
+        # checkpoint to resume from. Without it, LangGraph might resume from
+        # the wrong checkpoint or restart from the beginning.
+        workflow_thread_data = get_workflow_thread_data(
+            workflow_thread_id, fields=["checkpoint_id"]
+        )
+        checkpoint_id = (
+            workflow_thread_data.get("checkpoint_id") if workflow_thread_data else None
+        )
+
+        config: Dict[str, Any] = {"configurable": {"thread_id": workflow_thread_id}}
+        if checkpoint_id:
+            config["configurable"]["checkpoint_id"] = checkpoint_id
+            logger.info(f"   📍 Resuming from checkpoint_id: {checkpoint_id}")
+        else:
+            logger.warning(
+                "   ⚠️ No checkpoint_id found - workflow may restart from beginning"
+            )
+
+        graph = await workflow.graph
+
+        # Verify the checkpoint exists before resuming
+        # Simple Explanation: This helps us detect if the checkpoint is missing
+        # (e.g., if using MemorySaver and server restarted, or if checkpointer isn't configured)
+        state_snapshot = await graph.aget_state(config)
+        if not state_snapshot or not state_snapshot.values:
+            raise ValueError(
+                "Checkpoint state not found. This may happen if: "
+                "1) Using in-memory checkpointer and server restarted, "
+                "2) SUPABASE_DB_PASSWORD is not set in .env file, "
+                "3) Checkpoint was deleted or expired."
+            )
+        logger.info("   ✅ Checkpoint state found - resuming workflow")
+
+        # Pass None to resume from static interrupt - LangGraph will use checkpoint
+        # state and continue to the next node (process_transcript)
+        await graph.ainvoke(None, config=config)
+        logger.info("✅ Workflow resumed successfully")
+    except Exception as resume_error:
+        error_msg = str(resume_error)
+        logger.error(f"❌ Error resuming workflow: {error_msg}", exc_info=True)
+
+        if "SUPABASE_DB" in error_msg.upper() or "checkpoint" in error_msg.lower():
+            logger.error(
+                "   💡 TIP: This error is likely due to missing Supabase database credentials. "
+                "Add SUPABASE_DB_PASSWORD to your .env file. "
+                "Run: python scripts/diagnose_supabase.py to check your configuration."
+            )
+
+        # Fallback to full transcript processing if workflow resume fails
+        logger.info("   Falling back to full transcript processing...")
+        await process_transcript(
+            {"room_name": room_name, "workflow_thread_id": workflow_thread_id}
+        )
+
+
+@register_job_handler(JOB_DELIVER_WEBHOOK, queue=QUEUE_WEBHOOKS)
+async def deliver_webhook(payload: Dict[str, Any]) -> None:
+    """
+    Make one delivery attempt for a webhook in the outbox.
+
+    **Simple Explanation:**
+    Retryable failures raise, so the job queue schedules the next attempt with
+    backoff. Deliveries that already finished (delivered or permanently failed)
+    are skipped.
+
+    Payload:
+        delivery_id: webhook_deliveries row ID
+    """
+    from flow.db import get_webhook_delivery
+    from flow.jobs.webhook_outbox import attempt_delivery
+
+    delivery = get_webhook_delivery(payload["delivery_id"])
+    if delivery is None:
+        raise RuntimeError(f"Webhook delivery not found: {payload['delivery_id']}")
+
+    if delivery.get("status") in ("delivered", "failed"):
+        logger.info(
+            f"🔗 Webhook delivery {delivery['id']} already {delivery['status']} - skipping"
+        )
+        return
+
+    await attempt_delivery(delivery)
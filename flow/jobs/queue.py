@@ -0,0 +1,428 @@
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Postgres-backed job queue.
+
+**Simple Explanation:**
+Jobs are rows in the `flow_jobs` table. The API enqueues a row and returns
+immediately; a separate worker process (`python -m flow.worker`) claims rows with
+`SELECT ... FOR UPDATE SKIP LOCKED`, runs them, and marks them done. Because the
+job lives in the database, it survives API restarts and deploys.
+
+Each claimed job gets a lease (visibility timeout). If a worker dies mid-job, the
+lease expires and another worker picks the job up again. Failed jobs are retried
+with exponential backoff until `max_attempts` is reached.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import random
+from dataclasses import dataclass
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+# Default lease length for a claimed job (seconds)
+DEFAULT_VISIBILITY_TIMEOUT = int(os.getenv("FLOW_JOB_VISIBILITY_TIMEOUT", "300"))
+
+# Default number of attempts before a job is marked as failed
+DEFAULT_MAX_ATTEMPTS = int(os.getenv("FLOW_JOB_MAX_ATTEMPTS", "5"))
+
+# Retry backoff settings (seconds)
+RETRY_BASE_DELAY = 10.0
+RETRY_MAX_DELAY = 15 * 60.0
+
+# Simple Explanation: Shared connection pool for all queue operations in this process.
+# Created lazily on first use and kept alive for the process lifetime.
+_job_pool = None
+_job_pool_lock = None
+
+
+@dataclass
+class Job:
+    """A job claimed from the queue."""
+
+    id: int
+    queue: str
+    job_type: str
+    payload: Dict[str, Any]
+    attempts: int
+    max_attempts: int
+
+
+def is_job_queue_enabled() -> bool:
+    """
+    Check whether post-call work should go through the durable job queue.
+
+    **Simple Explanation:**
+    Set USE_JOB_QUEUE=true when at least one `flow worker` process is running.
+    When disabled, callers run the work in-process like before.
+    """
+    return os.getenv("USE_JOB_QUEUE", "false").lower() == "true"
+
+
+def compute_retry_delay(attempts: int) -> float:
+    """
+    Get how long to wait before retrying a job that failed `attempts` times.
+
+    **Simple Explanation:**
+    The delay doubles after each failure (10s, 20s, 40s, ...) up to 15 minutes,
+    with a little random jitter so failed jobs don't all retry at the same moment.
+
+    Args:
+        attempts: Number of attempts made so far (1 after the first failure)
+
+    Returns:
+        Delay in seconds
+    """
+    delay = min(RETRY_BASE_DELAY * (2 ** max(attempts - 1, 0)), RETRY_MAX_DELAY)
+    return delay * random.uniform(0.8, 1.2)
+
+
+async def _get_job_pool():
+    """
+    Get the shared async connection pool, creating it if needed.
+
+    Returns:
+        psycopg AsyncConnectionPool, or None if the database is not configured
+    """
+    global _job_pool, _job_pool_lock
+
+    if _job_pool_lock is None:
+        _job_pool_lock = asyncio.Lock()
+
+    async with _job_pool_lock:
+        if _job_pool is None:
+            try:
+                from psycopg_pool import AsyncConnectionPool
+            except ImportError:
+                logger.error(
+                    "❌ psycopg pool not available. Install with: pip install psycopg[binary,pool]"
+                )
+                return None
+
+            from flow.db import _get_db_connection_string
+
+            db_url = _get_db_connection_string()
+            if not db_url:
+                return None
+
+            # Simple Explanation: autocommit keeps every statement in its own short
+            # transaction, and prepare_threshold=None keeps us compatible with
+            # Supabase's transaction-mode pooler.
+            pool = AsyncConnectionPool(
+                db_url,
+                min_size=1,
+                max_size=int(os.getenv("FLOW_JOB_DB_POOL_SIZE", "5")),
+                kwargs={"autocommit": True, "prepare_threshold": None},
+                open=False,
+            )
+            await pool.open()
+            _job_pool = pool
+            logger.info("✅ Job queue connection pool opened")
+
+    return _job_pool
+
+
+async def close_job_pool() -> None:
+    """Close the shared connection pool (called on worker shutdown)."""
+    global _job_pool
+
+    if _job_pool is not None:
+        await _job_pool.close()
+        _job_pool = None
+
+
+async def enqueue(
+    queue: str,
+    job_type: str,
+    payload: Dict[str, Any],
+    dedupe_key: str | None = None,
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+) -> int | None:
+    """
+    Insert a job into the queue.
+
+    **Simple Explanation:**
+    If `dedupe_key` is set and a job with the same key is already queued or running,
+    no new row is inserted and the existing job's ID is returned. This stops repeated
+    webhooks from processing the same transcript twice.
+
+    Args:
+        queue: Queue name (workers subscribe to one or more queues)
+        job_type: Handler name (see flow.jobs.handlers)
+        payload: JSON-serializable job arguments
+        dedupe_key: Optional key to prevent duplicate active jobs
+        max_attempts: Attempts before the job is marked as failed
+
+    Returns:
+        Job ID, or None if the job could not be enqueued
+    """
+    pool = await _get_job_pool()
+    if pool is None:
+        return None
+
+    try:
+        async with pool.connection() as conn:
+            # Simple Explanation: Two tries cover the tiny window where the duplicate
+            # job finishes between our INSERT and SELECT.
+            for _ in range(2):
+                cursor = await conn.execute(
+                    """
+                    INSERT INTO flow_jobs (queue, job_type, payload, dedupe_key, max_attempts)
+                    VALUES (%s, %s, %s::jsonb, %s, %s)
+                    ON CONFLICT (dedupe_key)
+                        WHERE dedupe_key IS NOT NULL AND status IN ('queued', 'running')
+                        DO NOTHING
+                    RETURNING id
+                    """,
+                    (queue, job_type, json.dumps(payload), dedupe_key, max_attempts),
+                )
+                row = await cursor.fetchone()
+                if row:
+                    logger.info(
+                        f"📦 Enqueued job {row[0]} ({job_type}) on queue '{queue}'"
+                    )
+                    return row[0]
+
+                cursor = await conn.execute(
+                    """
+                    SELECT id FROM flow_jobs
+                    WHERE dedupe_key = %s AND status IN ('queued', 'running')
+                    """,
+                    (dedupe_key,),
+                )
+                row = await cursor.fetchone()
+                if row:
+                    logger.info(
+                        f"📦 Job {row[0]} already active for dedupe key {dedupe_key} - not enqueuing again"
+                    )
+                    return row[0]
+
+        logger.warning(f"⚠️ Could not enqueue job {job_type} (dedupe key race)")
+        return None
+    except Exception as e:
+        logger.error(f"❌ Error enqueuing job {job_type}: {e}", exc_info=True)
+        return None
+
+
+async def claim(
+    queues: list[str],
+    limit: int,
+    worker_id: str,
+    visibility_timeout: int = DEFAULT_VISIBILITY_TIMEOUT,
+) -> list[Job]:
+    """
+    Claim up to `limit` ready jobs from the given queues.
+
+    **Simple Explanation:**
+    A job is ready when it is queued and its run_at time has passed, or when it
+    was running but its lease expired (the worker that had it died) and it has
+    attempts left. Expired jobs that used all their attempts (e.g. one that
+    keeps crashing its worker) are marked 'failed' instead of being run again.
+    SKIP LOCKED lets many workers claim at the same time without blocking each
+    other or getting the same job.
+
+    Args:
+        queues: Queue names to claim from
+        limit: Maximum number of jobs to claim
+        worker_id: Identifier stored on the job for debugging
+        visibility_timeout: Lease length in seconds
+
+    Returns:
+        List of claimed jobs (empty if none are ready)
+    """
+    pool = await _get_job_pool()
+    if pool is None or limit <= 0:
+        return []
+
+    async with pool.connection() as conn:
+        cursor = await conn.execute(
+            """
+            UPDATE flow_jobs
+            SET status = 'failed', locked_until = NULL,
+                last_error = 'Lease expired on the last attempt (worker died or hung)',
+                completed_at = NOW(), updated_at = NOW()
+            WHERE queue = ANY(%s)
+              AND status = 'running'
+              AND locked_until < NOW()
+              AND attempts >= max_attempts
+            RETURNING id, job_type, attempts
+            """,
+            (queues,),
+        )
+        for job_id, job_type, attempts in await cursor.fetchall():
+            logger.error(
+                f"❌ Job {job_id} ({job_type}) failed permanently after {attempts} attempts (lease expired)"
+            )
+
+        cursor = await conn.execute(
+            """
+            WITH next_jobs AS (
+                SELECT id FROM flow_jobs
+                WHERE queue = ANY(%s)
+                  AND (
+                      (status = 'queued' AND run_at <= NOW())
+                      OR (
+                          status = 'running'
+                          AND locked_until < NOW()
+                          AND attempts < max_attempts
+                      )
+                  )
+                ORDER BY run_at
+                LIMIT %s
+                FOR UPDATE SKIP LOCKED
+            )
+            UPDATE flow_jobs AS j
+            SET status = 'running',
+                attempts = j.attempts + 1,
+                locked_by = %s,
+                locked_until = NOW() + make_interval(secs => %s),
+                updated_at = NOW()
+            FROM next_jobs
+            WHERE j.id = next_jobs.id
+            RETURNING j.id, j.queue, j.job_type, j.payload, j.attempts, j.max_attempts
+            """,
+            (queues, limit, worker_id, visibility_timeout),
+        )
+        rows = await cursor.fetchall()
+
+    return [
+        Job(
+            id=row[0],
+            queue=row[1],
+            job_type=row[2],
+            payload=row[3] or {},
+            attempts=row[4],
+            max_attempts=row[5],
+        )
+        for row in rows
+    ]
+
+
+async def extend_lease(
+    job_id: int, worker_id: str, visibility_timeout: int = DEFAULT_VISIBILITY_TIMEOUT
+) -> bool:
+    """
+    Extend the lease on a running job so it isn't reclaimed by another worker.
+
+    Returns:
+        True if the lease was extended, False if the job is no longer ours
+    """
+    pool = await _get_job_pool()
+    if pool is None:
+        return False
+
+    async with pool.connection() as conn:
+        cursor = await conn.execute(
+            """
+            UPDATE flow_jobs
+            SET locked_until = NOW() + make_interval(secs => %s), updated_at = NOW()
+            WHERE id = %s AND status = 'running' AND locked_by = %s
+            """,
+            (visibility_timeout, job_id, worker_id),
+        )
+        return cursor.rowcount == 1
+
+
+def _lease_lost(job_id: int, worker_id: str) -> bool:
+    """Log that another worker took the job over, so this result isn't recorded."""
+    logger.warning(
+        f"⚠️ Job {job_id} lease was taken over from worker {worker_id} - not recording result"
+    )
+    return False
+
+
+async def complete(job_id: int, worker_id: str) -> bool:
+    """
+    Mark a job as succeeded.
+
+    **Simple Explanation:**
+    Only the worker that still holds the lease can finish a job. If the lease
+    expired and another worker claimed the job, nothing is written.
+
+    Args:
+        job_id: Job ID
+        worker_id: Worker that ran the job
+
+    Returns:
+        True if the job was marked succeeded, False if the lease was lost
+    """
+    pool = await _get_job_pool()
+    if pool is None:
+        return False
+
+    async with pool.connection() as conn:
+        cursor = await conn.execute(
+            """
+            UPDATE flow_jobs
+            SET status = 'succeeded', locked_until = NULL, last_error = NULL,
+                completed_at = NOW(), updated_at = NOW()
+            WHERE id = %s AND status = 'running' AND locked_by = %s
+            """,
+            (job_id, worker_id),
+        )
+        if cursor.rowcount != 1:
+            return _lease_lost(job_id, worker_id)
+    return True
+
+
+async def fail(job: Job, error: str, worker_id: str) -> bool:
+    """
+    Record a failed attempt and schedule a retry (or give up).
+
+    **Simple Explanation:**
+    If the job still has attempts left it goes back to 'queued' with a later
+    run_at (exponential backoff). Otherwise it is marked 'failed' and kept in
+    the table for inspection. Like complete(), nothing is written if another
+    worker has taken the job over.
+
+    Args:
+        job: The claimed job
+        error: Error message to store
+        worker_id: Worker that ran the job
+
+    Returns:
+        True if the attempt was recorded, False if the lease was lost
+    """
+    pool = await _get_job_pool()
+    if pool is None:
+        return False
+
+    async with pool.connection() as conn:
+        if job.attempts >= job.max_attempts:
+            cursor = await conn.execute(
+                """
+                UPDATE flow_jobs
+                SET status = 'failed', locked_until = NULL, last_error = %s,
+                    completed_at = NOW(), updated_at = NOW()
+                WHERE id = %s AND status = 'running' AND locked_by = %s
+                """,
+                (error, job.id, worker_id),
+            )
+            if cursor.rowcount != 1:
+                return _lease_lost(job.id, worker_id)
+            logger.error(
+                f"❌ Job {job.id} ({job.job_type}) failed permanently after {job.attempts} attempts"
+            )
+        else:
+            delay = compute_retry_delay(job.attempts)
+            cursor = await conn.execute(
+                """
+                UPDATE flow_jobs
+                SET status = 'queued', locked_until = NULL, locked_by = NULL,
+                    last_error = %s, run_at = NOW() + make_interval(secs => %s),
+                    updated_at = NOW()
+                WHERE id = %s AND status = 'running' AND locked_by = %s
+                """,
+                (error, delay, job.id, worker_id),
+            )
+            if cursor.rowcount != 1:
+                return _lease_lost(job.id, worker_id)
+            logger.warning(
+                f"⚠️ Job {job.id} ({job.job_type}) failed (attempt {job.attempts}/{job.max_attempts}) - retrying in {delay:.0f}s"
+            )
+    return True
@@ -0,0 +1,431 @@
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Webhook Outbox
+
+Persistent, retried delivery of customer webhooks.
+
+**Simple Explanation:**
+Instead of POSTing to the customer's webhook while transcript processing waits,
+we write the event to the `webhook_deliveries` table (the "outbox") and deliver
+it separately:
+- With USE_JOB_QUEUE enabled, a `deliver_webhook` job runs on the "webhooks"
+  queue, so deliveries survive restarts and can scale on their own workers.
+- Otherwise, delivery runs in a background task in this process.
+
+Deliveries use one pooled HTTP client, are limited per destination host, retried
+with exponential backoff, signed with WEBHOOK_SIGNING_SECRET (if set), and carry
+an Idempotency-Key header so receivers can drop duplicates.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+import os
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Tuple
+from urllib.parse import urlparse
+
+import httpx
+
+from flow.jobs.queue import compute_retry_delay
+from flow.utils.metrics import get_counter, get_histogram
+
+logger = logging.getLogger(__name__)
+
+# Delivery settings
+WEBHOOK_TIMEOUT_SECONDS = float(os.getenv("WEBHOOK_TIMEOUT_SECONDS", "30"))
+WEBHOOK_MAX_ATTEMPTS = int(os.getenv("WEBHOOK_MAX_ATTEMPTS", "8"))
+WEBHOOK_MAX_CONCURRENCY_PER_HOST = int(
+    os.getenv("WEBHOOK_MAX_CONCURRENCY_PER_HOST", "4")
+)
+
+# Headers sent with every delivery
+SIGNATURE_HEADER = "X-PailKit-Signature"
+TIMESTAMP_HEADER = "X-PailKit-Timestamp"
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+# Metrics
+delivery_latency = get_histogram(
+    "webhook_delivery_latency_seconds",
+    "Time from sending a webhook request to receiving the response",
+)
+delivery_outcomes = get_counter(
+    "webhook_deliveries_total", "Webhook delivery attempts by outcome"
+)
+
+# Simple Explanation: One shared HTTP client per process (connection pooling), and one
+# semaphore per destination host so a slow customer endpoint can't take every slot.
+_http_client: httpx.AsyncClient | None = None
+_http_client_loop: asyncio.AbstractEventLoop | None = None
+_host_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+# Background deliveries started in this process (when the job queue is disabled)
+_pending_deliveries: set[asyncio.Task] = set()
+
+
+class WebhookDeliveryError(Exception):
+    """A delivery attempt failed with an error worth retrying (5xx, 429, timeout, network)."""
+
+
+def validate_webhook_url(url: str) -> Tuple[bool, str | None]:
+    """
+    Validate webhook URL format and structure.
+
+    Simple Explanation:
+    This function checks if a webhook URL is valid before we try to send data to it.
+    It makes sure the URL:
+    - Starts with http:// or https://
+    - Has a valid structure (can be parsed)
+    - Has a valid hostname (not empty)
+
+    Args:
+        url: The URL string to validate
+
+    Returns:
+        Tuple of (is_valid, error_message)
+        - is_valid: True if URL is valid, False otherwise
+        - error_message: None if valid, or a descriptive error message if invalid
+    """
+    if not url or not isinstance(url, str):
+        return False, "URL must be a non-empty string"
+
+    url = url.strip()
+    if not url:
+        return False, "URL cannot be empty or whitespace only"
+
+    # Check if URL starts with http:// or https://
+    if not url.startswith("http://") and not url.startswith("https://"):
+        return False, "URL must start with http:// or https://"
+
+    # Parse the URL to validate structure
+    try:
+        parsed = urlparse(url)
+
+        # Check if scheme is valid
+        if parsed.scheme not in ["http", "https"]:
+            return False, f"Invalid URL scheme: {parsed.scheme}. Must be http or https"
+
+        # Check if hostname/netloc exists
+        if not parsed.netloc:
+            return False, "URL must have a valid hostname (e.g., example.com)"
+
+        # Check for common malformed patterns
+        if " " in url:
+            return False, "URL cannot contain spaces"
+
+        # Basic check for valid hostname characters
+        if parsed.netloc.startswith(".") or parsed.netloc.endswith("."):
+            return False, "Hostname cannot start or end with a dot"
+
+        return True, None
+
+    except Exception as e:
+        return False, f"Invalid URL format: {str(e)}"
+
+
+def sign_webhook_body(body: bytes, timestamp: int) -> str | None:
+    """
+    Sign a webhook body with WEBHOOK_SIGNING_SECRET.
+
+    **Simple Explanation:**
+    The signature is HMAC-SHA256 over "{timestamp}.{body}". Receivers recompute it
+    with the shared secret to check the request really came from us and wasn't
+    replayed long after the timestamp.
+
+    Args:
+        body: Exact request body bytes
+        timestamp: Unix timestamp sent in the X-PailKit-Timestamp header
+
+    Returns:
+        Signature header value ("v1=<hex>"), or None if no secret is configured
+    """
+    secret = os.getenv("WEBHOOK_SIGNING_SECRET")
+    if not secret:
+        return None
+
+    signed = f"{timestamp}.".encode() + body
+    digest = hmac.new(secret.encode(), signed, hashlib.sha256).hexdigest()
+    return f"v1={digest}"
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client for the running event loop, creating it if needed."""
+    global _http_client, _http_client_loop
+
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client_loop is not loop or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=WEBHOOK_TIMEOUT_SECONDS,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+        _http_client_loop = loop
+        _host_semaphores.clear()
+    return _http_client
+
+
+def _get_host_semaphore(host: str) -> asyncio.Semaphore:
+    """Get the concurrency limiter for a destination host."""
+    semaphore = _host_semaphores.get(host)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(WEBHOOK_MAX_CONCURRENCY_PER_HOST)
+        _host_semaphores[host] = semaphore
+    return semaphore
+
+
+async def post_webhook(
+    url: str, payload: Dict[str, Any], idempotency_key: str
+) -> Tuple[int | None, str | None]:
+    """
+    Send one webhook request.
+
+    Args:
+        url: Destination URL
+        payload: JSON-serializable body
+        idempotency_key: Sent as the Idempotency-Key header
+
+    Returns:
+        Tuple of (status_code, error_message). status_code is None when no
+        response was received (timeout, connection error).
+    """
+    body = json.dumps(payload).encode()
+    timestamp = int(time.time())
+    headers = {
+        "Content-Type": "application/json",
+        IDEMPOTENCY_HEADER: idempotency_key,
+        TIMESTAMP_HEADER: str(timestamp),
+    }
+    signature = sign_webhook_body(body, timestamp)
+    if signature:
+        headers[SIGNATURE_HEADER] = signature
+
+    client = _get_http_client()
+    host = urlparse(url).netloc.lower()
+
+    async with _get_host_semaphore(host):
+        start = time.perf_counter()
+        try:
+            response = await client.post(url, content=body, headers=headers)
+        except httpx.TimeoutException:
+            delivery_latency.observe(time.perf_counter() - start)
+            return (
+                None,
+                f"Request timed out after {WEBHOOK_TIMEOUT_SECONDS:.0f} seconds",
+            )
+        except httpx.RequestError as e:
+            delivery_latency.observe(time.perf_counter() - start)
+            return None, f"Network error: {e}"
+        delivery_latency.observe(time.perf_counter() - start)
+
+    if response.is_success:
+        return response.status_code, None
+
+    # Truncate long responses to avoid log spam
+    response_text = response.text or ""
+    if len(response_text) > 500:
+        response_text = response_text[:500] + "... (truncated)"
+    return response.status_code, f"HTTP {response.status_code}: {response_text}"
+
+
+def _is_retryable(status_code: int | None) -> bool:
+    """Timeouts, network errors, 408, 429 and 5xx are retried; other 4xx are not."""
+    return status_code is None or status_code in (408, 429) or status_code >= 500
+
+
+async def attempt_delivery(delivery: Dict[str, Any]) -> bool:
+    """
+    Make one delivery attempt and record the result on the outbox row.
+
+    **Simple Explanation:**
+    - 2xx: marked delivered.
+    - 4xx (except 408/429): marked failed - retrying won't help, it's a
+      configuration problem on the receiver's side.
+    - Anything else: raises WebhookDeliveryError so the caller retries later,
+      until WEBHOOK_MAX_ATTEMPTS is reached.
+
+    Args:
+        delivery: Delivery dict from flow.db (url and payload decrypted)
+
+    Returns:
+        True if delivered, False if permanently failed
+
+    Raises:
+        WebhookDeliveryError: If the attempt failed and should be retried
+    """
+    from flow.db import update_webhook_delivery
+
+    delivery_id = delivery["id"]
+    url = delivery["url"]
+    attempts = (delivery.get("attempts") or 0) + 1
+
+    status_code, error = await post_webhook(
+        url, delivery["payload"], delivery["idempotency_key"]
+    )
+    now = datetime.now(timezone.utc).isoformat()
+    delivery["attempts"] = attempts
+
+    if error is None:
+        update_webhook_delivery(
+            delivery_id,
+            {
+                "status": "delivered",
+                "attempts": attempts,
+                "last_status_code": status_code,
+                "last_error": None,
+                "delivered_at": now,
+            },
+        )
+        delivery_outcomes.inc("delivered")
+        logger.info(
+            f"✅ Webhook delivered to {url} (status: {status_code}, attempt {attempts})"
+        )
+        return True
+
+    retryable = _is_retryable(status_code)
+    gave_up = not retryable or attempts >= WEBHOOK_MAX_ATTEMPTS
+    update_webhook_delivery(
+        delivery_id,
+        {
+            "status": "failed" if gave_up else "retrying",
+            "attempts": attempts,
+            "last_status_code": status_code,
+            "last_error": error,
+        },
+    )
+
+    if gave_up:
+        delivery_outcomes.inc("failed")
+        if status_code and 400 <= status_code < 500:
+            logger.warning(
+                f"⚠️ Webhook returned client error {status_code} for {url}. "
+                f"This usually indicates a configuration issue with the webhook URL. {error}"
+            )
+        else:
+            logger.error(
+                f"❌ Webhook delivery to {url} failed after {attempts} attempts: {error}"
+            )
+        return False
+
+    delivery_outcomes.inc("retried")
+    raise WebhookDeliveryError(error)
+
+
+async def _deliver_in_process(delivery: Dict[str, Any]) -> None:
+    """Deliver with retries in this process (used when the job queue is disabled)."""
+    while True:
+        try:
+            await attempt_delivery(delivery)
+            return
+        except WebhookDeliveryError as e:
+            delay = compute_retry_delay(delivery["attempts"])
+            logger.warning(
+                f"⚠️ Webhook delivery to {delivery['url']} failed ({e}) - retrying in {delay:.0f}s"
+            )
+            await asyncio.sleep(delay)
+        except Exception as e:
+            logger.error(
+                f"❌ Unexpected error delivering webhook to {delivery['url']}: {e}",
+                exc_info=True,
+            )
+            return
+
+
+async def enqueue_webhook(
+    url: str,
+    payload: Dict[str, Any],
+    idempotency_key: str,
+    workflow_thread_id: str | None = None,
+) -> bool:
+    """
+    Record a webhook in the outbox and schedule its delivery.
+
+    **Simple Explanation:**
+    This returns as soon as the delivery is recorded - it does not wait for the
+    customer's endpoint. Calling it again with the same idempotency key does not
+    send the event a second time.
+
+    Args:
+        url: Destination webhook URL
+        payload: JSON-serializable webhook body
+        idempotency_key: Unique key for this event
+        workflow_thread_id: Workflow run this delivery belongs to (optional)
+
+    Returns:
+        True if the delivery was recorded (or already delivered), False otherwise
+    """
+    from flow.db import create_webhook_delivery
+    from flow.jobs import JOB_DELIVER_WEBHOOK, enqueue_job
+
+    is_valid, error_message = validate_webhook_url(url)
+    if not is_valid:
+        logger.warning(
+            f"⚠️ Invalid webhook URL: {url}. Reason: {error_message}. Skipping webhook."
+        )
+        return False
+
+    try:
+        json.dumps(payload)
+    except (TypeError, ValueError) as e:
+        logger.error(
+            f"❌ Webhook payload contains non-serializable data: {e}. "
+            f"URL: {url}. Skipping webhook.",
+            exc_info=True,
+        )
+        return False
+
+    # Simple Explanation: The Supabase client is synchronous, so run it in a thread
+    # to keep other result sinks (like email) running while we wait.
+    delivery = await asyncio.to_thread(
+        create_webhook_delivery,
+        idempotency_key,
+        url,
+        payload,
+        workflow_thread_id=workflow_thread_id,
+    )
+    if delivery is None:
+        return False
+
+    if delivery.get("status") in ("delivered", "failed"):
+        logger.info(
+            f"🔗 Webhook {idempotency_key} already {delivery['status']} - not sending again"
+        )
+        return True
+
+    job_id = await enqueue_job(
+        JOB_DELIVER_WEBHOOK,
+        {"delivery_id": delivery["id"]},
+        dedupe_key=f"{JOB_DELIVER_WEBHOOK}:{delivery['id']}",
+        max_attempts=WEBHOOK_MAX_ATTEMPTS,
+    )
+    if job_id:
+        logger.info(f"📦 Webhook delivery queued as job {job_id}")
+        return True
+
+    task = asyncio.create_task(_deliver_in_process(delivery))
+    _pending_deliveries.add(task)
+    task.add_done_callback(_pending_deliveries.discard)
+    logger.info(f"🔗 Webhook delivery to {url} started in background")
+    return True
+
+
+async def wait_for_pending_deliveries(timeout: float | None = None) -> None:
+    """
+    Wait for background deliveries started in this process to finish.
+
+    **Simple Explanation:**
+    Short-lived processes (like a standalone bot run) call this before exiting so
+    in-process deliveries aren't cancelled when the event loop shuts down.
+    """
+    if not _pending_deliveries:
+        return
+
+    logger.info(f"⏳ Waiting for {len(_pending_deliveries)} webhook delivery(ies)...")
+    done, pending = await asyncio.wait(set(_pending_deliveries), timeout=timeout)
+    if pending:
+        logger.warning(
+            f"⚠️ {len(pending)} webhook delivery(ies) still pending after {timeout}s"
+        )
@@ -7,9 +7,11 @@ PailFlow FastAPI Application
 Main entry point for the PailFlow API server with REST API.
 """
 
+import json
 import logging
 import os
 import sys
+import time
 from pathlib import Path
 from typing import Any
 
@@ -30,10 +32,15 @@ from fastapi import (  # noqa: E402
     Request,
 )
 from fastapi.middleware.cors import CORSMiddleware  # noqa: E402
-from fastapi.responses import HTMLResponse, JSONResponse, Response  # noqa: E402
-from pydantic import BaseModel  # noqa: E402
+from fastapi.responses import (  # noqa: E402
+    HTMLResponse,
+    JSONResponse,
+    Response,
+    StreamingResponse,
+)
+from pydantic import BaseModel, Field  # noqa: E402
 from shared.auth import UnkeyAuthMiddleware  # noqa: E402
-from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+from starlette.types import ASGIApp, Message, Receive, Scope, Send  # noqa: E402
 
 
 # Setup logging first so we can use logger
@@ -71,26 +78,53 @@ app.add_middleware(
 app.add_middleware(UnkeyAuthMiddleware)
 
 
-class VersionHeaderMiddleware(BaseHTTPMiddleware):
-    """Add API version header to responses."""
+# Response headers added by VersionHeaderMiddleware, by path prefix
+_V1_HEADERS = [(b"x-api-version", b"v1")]
+_V2_HEADERS = [(b"x-api-version", b"v2")]
+_UNVERSIONED_HEADERS = [
+    (b"x-api-version", b"unversioned"),
+    (b"x-api-deprecated", b"true"),
+]
+# Unversioned endpoints that are not deprecated (no headers added)
+_UNVERSIONED_EXEMPT_PREFIXES = ("/health", "/webhooks", "/meet", "/favicon")
+
+
+class VersionHeaderMiddleware:
+    """
+    Add API version header to responses.
 
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
+    **Simple Explanation:**
+    This is a plain ASGI middleware: it only adds headers to the
+    `http.response.start` message as it goes out. Unlike BaseHTTPMiddleware it
+    doesn't wrap the request in an extra task or buffer the response body, so it
+    adds almost no per-request overhead and streaming responses (like SSE) work.
+    """
 
-        # Add version header for versioned endpoints
-        if request.url.path.startswith("/v1/"):
-            response.headers["X-API-Version"] = "v1"
-        elif request.url.path.startswith("/v2/"):
-            response.headers["X-API-Version"] = "v2"
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        if path.startswith("/v1/"):
+            extra_headers = _V1_HEADERS
+        elif path.startswith("/v2/"):
+            extra_headers = _V2_HEADERS
+        elif not path.startswith(_UNVERSIONED_EXEMPT_PREFIXES):
+            extra_headers = _UNVERSIONED_HEADERS
         else:
-            # Unversioned endpoints (except health, webhooks, meet, favicon)
-            if not request.url.path.startswith(
-                ("/health", "/webhooks", "/meet", "/favicon")
-            ):
-                response.headers["X-API-Version"] = "unversioned"
-                response.headers["X-API-Deprecated"] = "true"
+            await self.app(scope, receive, send)
+            return
 
-        return response
+        async def send_with_version_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *extra_headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_version_headers)
 
 
 app.add_middleware(VersionHeaderMiddleware)
@@ -109,14 +143,94 @@ async def startup_event():
     else:
         logger.info("🤖 Bot execution mode: DIRECT (in-process execution)")
 
+    # Render and compress the meeting page once up front
+    try:
+        meeting_page_cache.get()
+    except OSError as e:
+        logger.warning(f"⚠️ Could not cache meeting page: {e}")
+
+    # Bot status saves from other processes (Modal, Fly) clear this process's
+    # status cache through the bot_events channel (needs BOT_EVENTS_PG_NOTIFY)
+    ensure_bot_event_listener()
+
     logger.info("✅ PailFlow API server started")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background tasks started by the API server."""
+    await stop_bot_event_listener()
+
+
 # Shared Business Logic
 
 
+# Credits needed to start a bot (checked when the bot run is created)
+BOT_JOIN_REQUIRED_CREDITS = 0.15
+
+
+def _credit_error_details(error: str, balance: float | None = None) -> dict[str, Any]:
+    """
+    Build the error body for a failed credit check.
+
+    Args:
+        error: "authentication_error", "user_not_found", "insufficient_credits"
+            or "credit_check_error"
+        balance: Current credit balance (included for insufficient_credits)
+
+    Returns:
+        Error dictionary with error, detail and message (and balance)
+    """
+    if error == "authentication_error":
+        return {
+            "error": "authentication_error",
+            "detail": "API key authentication failed.",
+            "message": "Please verify your API key or contact support.",
+        }
+    if error == "user_not_found":
+        # User not found in database - could mean:
+        # 1. User hasn't added credits yet (exists in auth.users but not in public.users)
+        # 2. Invalid/wrong API key
+        return {
+            "error": "user_not_found",
+            "detail": "You haven't added credits yet, or this is the wrong API key.",
+            "message": "Please add credits to your account or verify your API key.",
+        }
+    if error == "insufficient_credits":
+        return {
+            "error": "insufficient_credits",
+            "detail": "Your account has insufficient credits to perform this action.",
+            "balance": balance,
+            "message": "Please add credits to your account to continue.",
+        }
+    return {
+        "error": "credit_check_error",
+        "detail": "An error occurred while checking your account credits.",
+        "message": "Please try again or contact support if the issue persists.",
+    }
+
+
+def _credit_error_response(credit_error: dict[str, Any]) -> JSONResponse:
+    """
+    Turn a failed credit check into an error response.
+
+    Insufficient credits get a 402 response; every other error raises a 401
+    HTTPException with the error dictionary as detail.
+    """
+    if credit_error.get("error") == "insufficient_credits":
+        # Use custom JSONResponse for 402 to set "Insufficient Credits" status text
+        return JSONResponse(
+            status_code=402,
+            content=credit_error,
+            headers={"X-Status-Reason": "Insufficient Credits"},
+        )
+    # user_not_found, authentication_error and other errors are Unauthorized
+    # Pass the full error dict as detail (FastAPI supports dict for detail)
+    raise HTTPException(status_code=401, detail=credit_error)
+
+
 def check_credits_for_request(
-    request: Request, required_credits: float = 0.15
+    request: Request, required_credits: float = BOT_JOIN_REQUIRED_CREDITS
 ) -> tuple[bool, dict[str, Any] | None]:
     """
     Check if the authenticated user has sufficient credits for the request.
@@ -126,6 +240,9 @@ def check_credits_for_request(
     has sufficient credits in their account. It follows the error handling pattern
     from bot_call.py with clear, actionable error messages.
 
+    POST /v1/api/bot/join checks credits inside flow.db.create_bot_run instead,
+    in the same database transaction that creates the bot run.
+
     Args:
         request: FastAPI Request object (contains unkey_key_id in request.state)
         required_credits: Minimum credits required (default: 0.15 for bot calls)
@@ -143,14 +260,7 @@ def check_credits_for_request(
 
         if not unkey_key_id:
             logger.warning("⚠️ No unkey_key_id in request state - cannot check credits")
-            return (
-                False,
-                {
-                    "error": "authentication_error",
-                    "detail": "API key authentication failed.",
-                    "message": "Please verify your API key or contact support.",
-                },
-            )
+            return (False, _credit_error_details("authentication_error"))
 
         # Check user credits using database helper
         from flow.db import check_user_credits
@@ -160,18 +270,8 @@ def check_credits_for_request(
         )
 
         if current_balance is None:
-            # User not found in database - could mean:
-            # 1. User hasn't added credits yet (exists in auth.users but not in public.users)
-            # 2. Invalid/wrong API key
             logger.warning("⚠️ User not found in database")
-            return (
-                False,
-                {
-                    "error": "user_not_found",
-                    "detail": "You haven't added credits yet, or this is the wrong API key.",
-                    "message": "Please add credits to your account or verify your API key.",
-                },
-            )
+            return (False, _credit_error_details("user_not_found"))
 
         if not has_credits:
             # Insufficient credits
@@ -180,12 +280,7 @@ def check_credits_for_request(
             )
             return (
                 False,
-                {
-                    "error": "insufficient_credits",
-                    "detail": "Your account has insufficient credits to perform this action.",
-                    "balance": current_balance,
-                    "message": "Please add credits to your account to continue.",
-                },
+                _credit_error_details("insufficient_credits", current_balance),
             )
 
         # Success - user has sufficient credits
@@ -199,14 +294,7 @@ def check_credits_for_request(
             f"❌ Error checking credits: {e}",
             exc_info=True,
         )
-        return (
-            False,
-            {
-                "error": "credit_check_error",
-                "detail": "An error occurred while checking your account credits.",
-                "message": "Please try again or contact support if the issue persists.",
-            },
-        )
+        return (False, _credit_error_details("credit_check_error"))
 
 
 # REST API Endpoints
@@ -218,6 +306,26 @@ async def health_check() -> dict[str, str]:
     return {"status": "healthy", "service": "pailflow"}
 
 
+@app.get("/metrics")
+async def get_metrics() -> dict[str, Any]:
+    """
+    In-process operational metrics (counters and latency histograms).
+
+    Simple Explanation: Each API instance reports its own metrics, such as
+    webhook delivery latency and LLM rate limiter queueing. Values reset when
+    the process restarts.
+    """
+    from flow.utils.llm_limiter import llm_limiter_status
+    from flow.utils.metrics import metrics_snapshot
+    from flow.utils.workflow_thread_cache import workflow_thread_cache_status
+
+    return {
+        "metrics": metrics_snapshot(),
+        "llm_limiters": llm_limiter_status(),
+        "workflow_thread_cache": workflow_thread_cache_status(),
+    }
+
+
 # ============================================================================
 # Bot API Router
 # ============================================================================
@@ -236,7 +344,53 @@ import uuid  # noqa: E402
 from datetime import datetime  # noqa: E402
 
 from flow.steps.agent_call.bot.bot_service import bot_service  # noqa: E402
-from flow.db import save_bot_session, get_bot_session  # noqa: E402
+from flow.db import save_bot_session, get_bot_session, get_bot_sessions  # noqa: E402
+from flow.db import get_workflow_threads_by_email  # noqa: E402
+from flow.utils.bot_status_cache import (  # noqa: E402
+    CachedBotStatus,
+    get_cached_bot_status,
+    store_bot_status,
+    wait_for_bot_status_change,
+)
+from flow.utils.bot_events import (  # noqa: E402
+    bot_event_broker,
+    ensure_bot_event_listener,
+    stop_bot_event_listener,
+)
+from flow.utils.idempotency import (  # noqa: E402
+    MAX_IDEMPOTENCY_KEY_LENGTH,
+    IdempotencyConflictError,
+    IdempotencyKeyReusedError,
+    hash_request_body,
+    run_idempotent,
+)
+from flow.utils.page_cache import StaticPageCache  # noqa: E402
+
+# Long-poll limits for GET /v1/api/bot/{bot_id}/status?wait=N
+BOT_STATUS_MAX_WAIT_SECONDS = 60
+BOT_STATUS_LONG_POLL_CHECK_SECONDS = float(
+    os.getenv("BOT_STATUS_LONG_POLL_CHECK_SECONDS", "5")
+)
+
+# Seconds between keep-alive comments on GET /v1/api/bot/{bot_id}/events
+BOT_EVENTS_KEEPALIVE_SECONDS = float(os.getenv("BOT_EVENTS_KEEPALIVE_SECONDS", "15"))
+
+# Most bot IDs accepted by POST /v1/api/bots/status:batch
+BOT_STATUS_BATCH_MAX_IDS = int(os.getenv("BOT_STATUS_BATCH_MAX_IDS", "100"))
+
+# Status response fields left out when a batch asks for include_results=false
+BOT_STATUS_RESULT_FIELDS = ("transcript", "qa_pairs", "insights")
+
+# Workflow thread columns returned by POST /v1/api/workflow-threads:search
+WORKFLOW_THREAD_SUMMARY_FIELDS = [
+    "workflow_thread_id",
+    "room_name",
+    "bot_id",
+    "meeting_status",
+    "transcript_processed",
+    "email_sent",
+    "webhook_sent",
+]
 
 
 # Pydantic models for bot API
@@ -292,6 +446,45 @@ class BotStatusResponse(BaseModel):
     error: str | None = None
 
 
+class BotStatusBatchRequest(BaseModel):
+    """Request to look up the status of many bots at once."""
+
+    bot_ids: list[str] = Field(..., min_length=1, max_length=BOT_STATUS_BATCH_MAX_IDS)
+    include_results: bool = True  # False: leave out transcript, qa_pairs, insights
+
+
+class BotStatusBatchResponse(BaseModel):
+    """Response for a batch bot status query."""
+
+    bots: list[BotStatusResponse]  # In request order (duplicates removed)
+    not_found: list[str]  # Requested bot IDs with no bot session
+
+
+class WorkflowThreadSearchRequest(BaseModel):
+    """Request to find workflow threads by email."""
+
+    email: str = Field(..., min_length=1)  # Matches email or email_results_to
+    limit: int = Field(20, ge=1, le=100)  # Newest threads first
+
+
+class WorkflowThreadSummary(BaseModel):
+    """Summary of one workflow thread."""
+
+    workflow_thread_id: str
+    room_name: str | None = None
+    bot_id: str | None = None
+    meeting_status: str | None = None
+    transcript_processed: bool | None = None
+    email_sent: bool | None = None
+    webhook_sent: bool | None = None
+
+
+class WorkflowThreadSearchResponse(BaseModel):
+    """Response for a workflow thread search."""
+
+    workflow_threads: list[WorkflowThreadSummary]
+
+
 @v1_router.post("/api/bot/join", response_model=BotJoinResponse)
 async def join_bot_v1(
     request: BotJoinRequest, http_request: Request
@@ -339,44 +532,101 @@ async def join_bot_v1(
 
     The bot runs in the background. Use GET /v1/api/bot/{bot_id}/status to check progress.
 
+    **Retries (Idempotency-Key):**
+    Send an `Idempotency-Key` header (any unique string, e.g. a UUID, up to 255
+    characters) to make retries safe. Repeating the request with the same key
+    returns the original response (with `Idempotent-Replayed: true`) instead of
+    starting another bot. A request that arrives while the first is still
+    starting waits for it. Reusing a key with a different body returns 422.
+
     Use: POST /v1/api/bot/join
     """
+    idempotency_key = http_request.headers.get("idempotency-key")
+    unkey_key_id = getattr(http_request.state, "unkey_key_id", None)
+    if not idempotency_key or not unkey_key_id:
+        return await _join_bot(request, http_request)
+
+    if len(idempotency_key) > MAX_IDEMPOTENCY_KEY_LENGTH:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Idempotency-Key must be at most {MAX_IDEMPOTENCY_KEY_LENGTH} characters",
+        )
+
+    async def start_bot_once() -> tuple[Any, dict[str, Any] | None]:
+        result = await _join_bot(request, http_request)
+        # Only successful starts are replayed; errors release the key for a retry
+        if isinstance(result, BotJoinResponse):
+            return result, result.model_dump()
+        return result, None
+
     try:
-        # Check credits before processing
-        # Simple Explanation: We check if the user has sufficient credits before starting
-        # the bot. This prevents starting expensive operations when credits are insufficient.
-        # The check follows the error handling pattern from bot_call.py.
-        credit_check_success, credit_error = check_credits_for_request(
-            http_request, required_credits=0.15
+        result, replayed = await run_idempotent(
+            unkey_key_id,
+            idempotency_key,
+            hash_request_body(request.model_dump_json()),
+            start_bot_once,
         )
-        if not credit_check_success:
-            # Determine appropriate HTTP status code based on error type
-            if credit_error.get("error") == "insufficient_credits":
-                # Use custom JSONResponse for 402 to set "Insufficient Credits" status text
-                return JSONResponse(
-                    status_code=402,
-                    content=credit_error,
-                    headers={"X-Status-Reason": "Insufficient Credits"},
-                )
-            elif credit_error.get("error") == "user_not_found":
-                status_code = 401  # Unauthorized for user not found
-            elif credit_error.get("error") == "authentication_error":
-                status_code = 401  # Unauthorized for auth errors
-            else:
-                status_code = 401  # Default to 401 for other errors
-            # Pass the full error dict as detail (FastAPI supports dict for detail)
-            raise HTTPException(
-                status_code=status_code,
-                detail=credit_error,
-            )
+    except IdempotencyKeyReusedError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except IdempotencyConflictError as e:
+        return JSONResponse(
+            status_code=409, content={"detail": str(e)}, headers={"Retry-After": "1"}
+        )
+
+    if not replayed or isinstance(result, Response):
+        return result
+    if isinstance(result, BotJoinResponse):
+        result = result.model_dump()
+    return JSONResponse(content=result, headers={"Idempotent-Replayed": "true"})
 
-        # Generate a unique bot_id for this bot session
-        bot_id = str(uuid.uuid4())
+
+async def _join_bot(
+    request: BotJoinRequest, http_request: Request
+) -> BotJoinResponse | Response:
+    """
+    Start a bot: create the bot run in the database and start the BotCallWorkflow.
+
+    **Simple Explanation:**
+    The body of POST /v1/api/bot/join, without Idempotency-Key handling. Returns a
+    402 response for insufficient credits and raises HTTPException for other errors.
+    """
+    try:
+        # Extract API key ID from request state (set by Unkey middleware)
+        unkey_key_id = getattr(http_request.state, "unkey_key_id", None)
+        if not unkey_key_id:
+            logger.warning("⚠️ No unkey_key_id in request state - cannot check credits")
+            return _credit_error_response(_credit_error_details("authentication_error"))
 
         # Extract room name from URL (last part after the last slash)
         room_name = request.room_url.split("/")[-1]
 
-        # Generate workflow_thread_id and save all configuration directly to workflow_threads
+        # Convert bot_config to dictionary format expected by bot_service
+        # Default video_mode to "animated" if not provided
+        video_mode = request.bot_config.video_mode or "animated"
+
+        # Validate static_image is provided when video_mode="static"
+        if video_mode == "static" and not request.bot_config.static_image:
+            raise HTTPException(
+                status_code=400,
+                detail="static_image is required when video_mode='static'",
+            )
+
+        bot_config_dict = {
+            "bot_prompt": request.bot_config.bot_prompt,
+            "name": request.bot_config.name,
+            "video_mode": video_mode,
+        }
+
+        # Only include static_image when video_mode="static"
+        if video_mode == "static" and request.bot_config.static_image:
+            bot_config_dict["static_image"] = request.bot_config.static_image
+
+        # Include bot_greeting if provided
+        if request.bot_config.bot_greeting:
+            bot_config_dict["bot_greeting"] = request.bot_config.bot_greeting
+
+        # Create the workflow_threads and bot_sessions rows and check credits in
+        # one database transaction (see flow.db.create_bot_run)
         # Simple Explanation:
         # - workflow_thread_id is OUR custom ID for tracking this workflow in our workflow_threads table
         # - We create it here BEFORE starting LangGraph, so we can save config to the database first
@@ -385,39 +635,22 @@ async def join_bot_v1(
         #
         # UUID4 Collision Safety:
         # - UUID4 has 2^122 possible values (5.3 x 10^36) - collision probability is astronomically low
-        # - Database has PRIMARY KEY constraint on workflow_thread_id (enforces uniqueness)
-        # - save_workflow_thread_data uses upsert, so collisions would update instead of fail
-        # - We retry with a new UUID if save fails (extra safety)
-        from flow.db import save_workflow_thread_data, get_workflow_thread_data
+        # - The PRIMARY KEYs on workflow_thread_id and bot_id reject duplicates, and the
+        #   function then returns "conflict" without writing anything
+        # - We retry with new UUIDs in that case (extra safety)
+        from flow.db import create_bot_run
 
-        # Retry logic for UUID collision (extremely unlikely but safe)
         max_retries = 3
-        workflow_thread_id = None
         for attempt in range(max_retries):
+            bot_id = str(uuid.uuid4())
             workflow_thread_id = str(uuid.uuid4())
 
-            # Check if this ID already exists (extra safety check before saving)
-            existing = get_workflow_thread_data(workflow_thread_id)
-            if existing:
-                logger.warning(
-                    f"⚠️ UUID collision detected (attempt {attempt + 1}/{max_retries}): {workflow_thread_id} - generating new UUID"
-                )
-                continue  # Try again with new UUID
-
-            # Extract API key ID from request state (set by Unkey middleware)
-            unkey_key_id = None
-            if hasattr(http_request.state, "unkey_key_id"):
-                unkey_key_id = http_request.state.unkey_key_id
-                logger.debug(
-                    f"Extracted unkey_key_id from request state: {unkey_key_id}"
-                )
-
             # Build workflow_thread_data with all configuration
             workflow_thread_data = {
                 "workflow_thread_id": workflow_thread_id,
                 "room_name": room_name,
                 "room_url": request.room_url,
-                "bot_id": bot_id,  # bot_id is defined above (line 310)
+                "bot_id": bot_id,
                 # API key ID for user attribution
                 "unkey_key_id": unkey_key_id,
                 # Provider support (default: "daily")
@@ -429,74 +662,63 @@ async def join_bot_v1(
                 "analysis_prompt": request.analysis_prompt,
                 "summary_format_prompt": request.summary_format_prompt,
                 "webhook_callback_url": request.webhook_callback_url,
-                # Bot configuration will be added in the workflow
+                # Bot configuration (the workflow adds process_insights later)
+                "bot_config": bot_config_dict,
                 "meeting_status": "in_progress",
             }
 
-            # Save to workflow_threads table
-            if save_workflow_thread_data(workflow_thread_id, workflow_thread_data):
+            # Bot session record (status is returned by GET /v1/api/bot/{bot_id}/status)
+            bot_session_data = {
+                "bot_id": bot_id,
+                "room_url": request.room_url,
+                "room_name": room_name,
+                "status": "running",
+                "started_at": datetime.utcnow().isoformat() + "Z",
+                "completed_at": None,
+                "process_insights": request.process_insights,
+                "bot_config": bot_config_dict,
+                "transcript_text": None,
+                "qa_pairs": None,
+                "insights": None,
+                "error": None,
+            }
+
+            run = create_bot_run(
+                workflow_thread_data,
+                bot_session_data,
+                unkey_key_id=unkey_key_id,
+                required_credits=BOT_JOIN_REQUIRED_CREDITS,
+            )
+            if run is None:
+                logger.error(f"❌ Failed to save bot run to database: bot_id={bot_id}")
+                raise HTTPException(
+                    status_code=500, detail="Failed to save bot session to database"
+                )
+
+            status = run.get("status")
+            if status == "created":
                 logger.info(
                     f"✅ Saved configuration to workflow_threads: workflow_thread_id={workflow_thread_id}"
                 )
-                break  # Success - exit retry loop
-            else:
+                break
+            if status in ("user_not_found", "insufficient_credits"):
                 logger.warning(
-                    f"⚠️ Failed to save workflow_thread_data (attempt {attempt + 1}/{max_retries}) - retrying with new UUID"
+                    f"⚠️ Credit check failed ({status}): balance={run.get('balance')}, "
+                    f"required={BOT_JOIN_REQUIRED_CREDITS}"
+                )
+                return _credit_error_response(
+                    _credit_error_details(status, run.get("balance"))
                 )
 
-        if not workflow_thread_id:
+            logger.warning(
+                f"⚠️ UUID collision detected (attempt {attempt + 1}/{max_retries}) - generating new UUIDs"
+            )
+        else:
             raise HTTPException(
                 status_code=500,
                 detail="Failed to create workflow_thread_id after multiple attempts",
             )
 
-        # Convert bot_config to dictionary format expected by bot_service
-        # Default video_mode to "animated" if not provided
-        video_mode = request.bot_config.video_mode or "animated"
-
-        # Validate static_image is provided when video_mode="static"
-        if video_mode == "static" and not request.bot_config.static_image:
-            raise HTTPException(
-                status_code=400,
-                detail="static_image is required when video_mode='static'",
-            )
-
-        bot_config_dict = {
-            "bot_prompt": request.bot_config.bot_prompt,
-            "name": request.bot_config.name,
-            "video_mode": video_mode,
-        }
-
-        # Only include static_image when video_mode="static"
-        if video_mode == "static" and request.bot_config.static_image:
-            bot_config_dict["static_image"] = request.bot_config.static_image
-
-        # Include bot_greeting if provided
-        if request.bot_config.bot_greeting:
-            bot_config_dict["bot_greeting"] = request.bot_config.bot_greeting
-
-        # Create bot session record in Supabase database
-        bot_session_data = {
-            "room_url": request.room_url,
-            "room_name": room_name,
-            "status": "running",
-            "started_at": datetime.utcnow().isoformat() + "Z",
-            "completed_at": None,
-            "process_insights": request.process_insights,
-            "bot_config": bot_config_dict,
-            "transcript_text": None,
-            "qa_pairs": None,
-            "insights": None,
-            "error": None,
-        }
-
-        # Save to database
-        if not save_bot_session(bot_id, bot_session_data):
-            logger.error(f"❌ Failed to save bot session to database: bot_id={bot_id}")
-            raise HTTPException(
-                status_code=500, detail="Failed to save bot session to database"
-            )
-
         # Add process_insights to bot_config so BotService knows to process insights
         bot_config_dict["process_insights"] = request.process_insights
 
@@ -555,8 +777,108 @@ async def join_bot_v1(
         raise HTTPException(status_code=500, detail=f"Error starting bot: {str(e)}")
 
 
+def _load_bot_status(bot_id: str) -> CachedBotStatus:
+    """
+    Get the status response for a bot, from the status cache or the database.
+
+    **Simple Explanation:**
+    On a cache miss this reads the bot session (decrypting the transcript), checks
+    whether the bot is still running, marks it completed if it finished, and
+    caches the response (see flow/utils/bot_status_cache.py).
+    """
+    # Saves invalidate the cache under the ID as stored (lowercase UUID)
+    bot_id = _canonical_bot_id(bot_id)
+    cached = get_cached_bot_status(bot_id)
+    if cached is not None:
+        return cached
+
+    # Get bot session from Supabase database
+    session = get_bot_session(bot_id)
+
+    if not session:
+        raise HTTPException(status_code=404, detail=f"Bot session {bot_id} not found")
+
+    # Check if bot is still running
+    if session["status"] == "running" and not bot_service.is_bot_running(
+        session["room_name"]
+    ):
+        _complete_bot_session(bot_id, session)
+
+    return store_bot_status(bot_id, _bot_status_body(session))
+
+
+def _complete_bot_session(bot_id: str, session: dict[str, Any]) -> None:
+    """
+    Mark a bot that is no longer running as completed, with its results.
+
+    **Simple Explanation:**
+    Copies the transcript, Q&A pairs and insights from the rooms table (bot_service
+    saves them there) into the session and saves it.
+    """
+    # Bot finished - update status in database
+    room_name = session["room_name"]
+    session["status"] = "completed"
+    session["completed_at"] = datetime.utcnow().isoformat() + "Z"
+
+    # Get results from rooms table (bot_service saves them there)
+    try:
+        from flow.db import get_session_data
+
+        session_data = get_session_data(room_name)
+        if session_data:
+            # Get transcript
+            if session_data.get("transcript_text"):
+                session["transcript_text"] = session_data["transcript_text"]
+
+            # Get Q&A pairs (if processed)
+            if session_data.get("qa_pairs"):
+                session["qa_pairs"] = session_data["qa_pairs"]
+
+            # Get insights (if processed)
+            if session_data.get("insights"):
+                session["insights"] = session_data["insights"]
+            elif session_data.get("candidate_summary"):
+                # If we have a summary but no insights, create a simple insights object
+                session["insights"] = {
+                    "summary": session_data["candidate_summary"],
+                }
+
+        # Update bot session in database with results
+        save_bot_session(bot_id, session)
+
+    except Exception as e:
+        logger.error(f"Error retrieving bot results: {e}", exc_info=True)
+        session["error"] = f"Error retrieving results: {str(e)}"
+        save_bot_session(bot_id, session)
+
+
+def _bot_status_body(session: dict[str, Any]) -> dict[str, Any]:
+    """Build the BotStatusResponse body for a bot session."""
+    response = BotStatusResponse(
+        status=session["status"],
+        bot_id=session["bot_id"],
+        room_url=session["room_url"],
+        started_at=session.get("started_at"),
+        completed_at=session.get("completed_at"),
+        transcript=session.get("transcript_text"),
+        qa_pairs=session.get("qa_pairs"),
+        insights=session.get("insights"),
+        error=session.get("error"),
+    )
+    return response.model_dump(mode="json")
+
+
 @v1_router.get("/api/bot/{bot_id}/status", response_model=BotStatusResponse)
-async def get_bot_status_by_id_v1(bot_id: str) -> BotStatusResponse:
+async def get_bot_status_by_id_v1(
+    bot_id: str,
+    http_request: Request,
+    wait: int | None = Query(
+        None,
+        ge=0,
+        le=BOT_STATUS_MAX_WAIT_SECONDS,
+        description="Long-poll: seconds to wait for the status to change",
+    ),
+) -> Response:
     """
     Get the status and results of a bot session (v1 API).
 
@@ -591,66 +913,303 @@ async def get_bot_status_by_id_v1(bot_id: str) -> BotStatusResponse:
     }
     ```
 
+    **Caching and long-polling:**
+    Responses carry an `ETag`. Send it back as `If-None-Match` to get an empty
+    304 when nothing changed. Add `?wait=30` (up to 60 seconds) to hold the
+    request open until the status changes, instead of polling in a loop.
+    Finished bots are served from an in-memory cache without database reads.
+
     Use: GET /v1/api/bot/{bot_id}/status
     """
-    # Get bot session from Supabase database
-    session = get_bot_session(bot_id)
+    bot_id = _canonical_bot_id(bot_id)
+    entry = _load_bot_status(bot_id)
+    client_etag = http_request.headers.get("if-none-match")
+
+    if wait and not entry.terminal:
+        # Long-poll: hold the request until the response differs from what the
+        # client has (its If-None-Match, or the current response if it sent none)
+        baseline_etag = client_etag or entry.etag
+        deadline = time.monotonic() + wait
+        while _etag_matches(baseline_etag, entry.etag) and not entry.terminal:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            # Saves in this process wake us up right away; re-check periodically
+            # for changes made elsewhere (e.g. bots running on Modal or Fly)
+            await wait_for_bot_status_change(
+                bot_id, min(remaining, BOT_STATUS_LONG_POLL_CHECK_SECONDS)
+            )
+            entry = _load_bot_status(bot_id)
 
-    if not session:
-        raise HTTPException(status_code=404, detail=f"Bot session {bot_id} not found")
+    headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+    if client_etag and _etag_matches(client_etag, entry.etag):
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(content=entry.body, headers=headers)
 
-    # Check if bot is still running
-    room_name = session["room_name"]
-    is_running = bot_service.is_bot_running(room_name)
 
-    # Update status if bot finished
-    if session["status"] == "running" and not is_running:
-        # Bot finished - update status in database
-        session["status"] = "completed"
-        session["completed_at"] = datetime.utcnow().isoformat() + "Z"
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag."""
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
+    )
+
+
+def _format_sse(event: str, data: dict[str, Any]) -> bytes:
+    """Format one Server-Sent Events message."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n".encode()
+
+
+@v1_router.get("/api/bot/{bot_id}/events")
+async def stream_bot_events_v1(bot_id: str) -> StreamingResponse:
+    """
+    Stream live events for a bot session as Server-Sent Events (v1 API).
+
+    **Simple Explanation:**
+    Instead of polling the status endpoint, keep this request open and receive
+    events while the bot is in the call:
+
+    - `status`: the bot status (sent first, then on every change)
+    - `transcript`: a new transcript line (speaker, role, content, timestamp)
+    - `speaker`: the speaker changed
+    - `cost`: LLM usage for the latest turn and the running total cost
+
+    ```
+    event: transcript
+    data: {"speaker": "Alice", "role": "user", "content": "Hi!", ...}
+    ```
+
+    The stream ends after the bot reaches "completed" or "failed". A comment
+    line is sent every 15 seconds to keep proxies from closing the connection.
+    When the bot runs in another process (Modal, Fly), set
+    BOT_EVENTS_PG_NOTIFY=true so events reach this server through Postgres
+    (see flow/utils/bot_events.py).
 
-        # Get results from rooms table (bot_service saves them there)
+    Use: GET /v1/api/bot/{bot_id}/events
+    """
+    # Raises 404 before the stream starts if the bot doesn't exist
+    entry = _load_bot_status(bot_id)
+    room_name = entry.body["room_url"].rstrip("/").rsplit("/", 1)[-1]
+
+    ensure_bot_event_listener()
+    subscription = bot_event_broker.subscribe(room_name)
+
+    async def event_stream():
+        nonlocal entry
         try:
-            from flow.db import get_session_data
-
-            session_data = get_session_data(room_name)
-            if session_data:
-                # Get transcript
-                if session_data.get("transcript_text"):
-                    session["transcript_text"] = session_data["transcript_text"]
-
-                # Get Q&A pairs (if processed)
-                if session_data.get("qa_pairs"):
-                    session["qa_pairs"] = session_data["qa_pairs"]
-
-                # Get insights (if processed)
-                if session_data.get("insights"):
-                    session["insights"] = session_data["insights"]
-                elif session_data.get("candidate_summary"):
-                    # If we have a summary but no insights, create a simple insights object
-                    session["insights"] = {
-                        "summary": session_data["candidate_summary"],
-                    }
+            last_status = entry.body["status"]
+            yield _format_sse("status", {"bot_id": bot_id, "status": last_status})
+
+            while not entry.terminal:
+                event = await subscription.get(timeout=BOT_EVENTS_KEEPALIVE_SECONDS)
+                if event is None:
+                    yield b": keep-alive\n\n"
+                elif event["event"] != "status":
+                    yield _format_sse(event["event"], event["data"])
+                elif event["data"].get("bot_id") not in (None, bot_id):
+                    # Status of another bot in the same room
+                    continue
+
+                # Re-check the status: status events may come from this bot, and
+                # bots in other processes are only seen through the database
+                if event is None or event["event"] == "status":
+                    entry = _load_bot_status(bot_id)
+                    if entry.body["status"] != last_status:
+                        last_status = entry.body["status"]
+                        yield _format_sse(
+                            "status",
+                            {
+                                "bot_id": bot_id,
+                                "status": last_status,
+                                "error": entry.body.get("error"),
+                            },
+                        )
+        finally:
+            bot_event_broker.unsubscribe(subscription)
 
-            # Update bot session in database with results
-            save_bot_session(bot_id, session)
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
-        except Exception as e:
-            logger.error(f"Error retrieving bot results: {e}", exc_info=True)
-            session["error"] = f"Error retrieving results: {str(e)}"
-            save_bot_session(bot_id, session)
 
-    return BotStatusResponse(
-        status=session["status"],
-        bot_id=session["bot_id"],
-        room_url=session["room_url"],
-        started_at=session.get("started_at"),
-        completed_at=session.get("completed_at"),
-        transcript=session.get("transcript_text"),
-        qa_pairs=session.get("qa_pairs"),
-        insights=session.get("insights"),
-        error=session.get("error"),
+def _canonical_bot_id(bot_id: str) -> str:
+    """Get a bot ID as stored (lowercase UUID); other values are unchanged."""
+    return str(uuid.UUID(bot_id)) if _is_uuid(bot_id) else bot_id
+
+
+def _is_uuid(value: str) -> bool:
+    """Check whether a string is a UUID (bot IDs are UUIDs)."""
+    try:
+        uuid.UUID(value)
+        return True
+    except ValueError:
+        return False
+
+
+@v1_router.post("/api/bots/status:batch", response_model=BotStatusBatchResponse)
+async def get_bot_statuses_batch_v1(request: BotStatusBatchRequest) -> dict[str, Any]:
+    """
+    Get the status of many bot sessions in one request (v1 API).
+
+    **Simple Explanation:**
+    Dashboards tracking many bots used to call GET /v1/api/bot/{bot_id}/status
+    once per bot. This endpoint takes up to 100 bot IDs and:
+    - Serves bots already in the status cache without touching the database
+    - Reads all the others with one `bot_id IN (...)` query
+    - Checks whether each room with a running bot is still live once per room
+    - Marks bots that finished as completed (same as the single status endpoint)
+
+    Set `include_results` to false for cheap polling: the transcript, Q&A pairs
+    and insights are left out (and not read from the database or decrypted).
+
+    **Request:**
+    ```json
+    {
+      "bot_ids": ["uuid-1", "uuid-2"],
+      "include_results": false
+    }
+    ```
+
+    **Response:**
+    ```json
+    {
+      "bots": [
+        {"status": "running", "bot_id": "uuid-1", "room_url": "...", ...}
+      ],
+      "not_found": ["uuid-2"]
+    }
+    ```
+
+    Use: POST /v1/api/bots/status:batch
+    """
+    bot_ids = list(dict.fromkeys(request.bot_ids))
+    bodies: dict[str, dict[str, Any]] = {}
+
+    # bot_id as stored (lowercase UUID) -> requested bot_id
+    misses: dict[str, str] = {}
+    for bot_id in bot_ids:
+        cached = get_cached_bot_status(bot_id)
+        if cached is not None:
+            bodies[bot_id] = cached.body
+        elif _is_uuid(bot_id):
+            misses[str(uuid.UUID(bot_id))] = bot_id
+
+    sessions = get_bot_sessions(list(misses), include_results=request.include_results)
+    if sessions is None:
+        raise HTTPException(status_code=500, detail="Failed to read bot sessions")
+
+    # One liveness check per room, however many bots are in it
+    live_rooms = {
+        room_name: bot_service.is_bot_running(room_name)
+        for room_name in {
+            session["room_name"]
+            for session in sessions.values()
+            if session["status"] == "running"
+        }
+    }
+
+    for stored_id, bot_id in misses.items():
+        session = sessions.get(stored_id)
+        if session is None:
+            continue
+
+        has_results = request.include_results
+        if session["status"] == "running" and not live_rooms[session["room_name"]]:
+            full_session = session
+            if not has_results:
+                # Completing saves the whole session, so read the full row first
+                full_session = get_bot_session(stored_id)
+            if full_session is not None:
+                session = full_session
+                has_results = True
+                _complete_bot_session(stored_id, session)
+            # Otherwise the summary row would overwrite bot_config and results:
+            # report it as running, and a later poll completes it
+
+        body = _bot_status_body(session)
+        if has_results:
+            store_bot_status(stored_id, body)
+        bodies[bot_id] = body
+
+    if not request.include_results:
+        bodies = {
+            bot_id: {
+                **body,
+                **{field: None for field in BOT_STATUS_RESULT_FIELDS},
+            }
+            for bot_id, body in bodies.items()
+        }
+
+    return {
+        "bots": [bodies[bot_id] for bot_id in bot_ids if bot_id in bodies],
+        "not_found": [bot_id for bot_id in bot_ids if bot_id not in bodies],
+    }
+
+
+@v1_router.post(
+    "/api/workflow-threads:search", response_model=WorkflowThreadSearchResponse
+)
+async def search_workflow_threads_v1(
+    request: WorkflowThreadSearchRequest, http_request: Request
+) -> dict[str, Any]:
+    """
+    Find workflow threads by email (v1 API).
+
+    **Simple Explanation:**
+    Returns the newest workflow threads whose email or email_results_to is
+    the given address (case-insensitive), created with the caller's API key.
+    Emails are stored encrypted, so the lookup uses their blind indexes: one
+    indexed query, without decrypting any rows. The email goes in the request
+    body rather than the URL so it doesn't end up in access logs.
+
+    Requests without a verified API key get 401: the search is only ever run
+    for one tenant's threads.
+
+    **Request:**
+    ```json
+    {
+      "email": "candidate@example.com",
+      "limit": 20
+    }
+    ```
+
+    **Response:**
+    ```json
+    {
+      "workflow_threads": [
+        {"workflow_thread_id": "uuid-1", "room_name": "...", "bot_id": "...", ...}
+      ]
+    }
+    ```
+
+    Use: POST /v1/api/workflow-threads:search
+    """
+    # Without a verified API key (e.g. Unkey verification disabled) there is no
+    # tenant to scope the search to
+    unkey_key_id = getattr(http_request.state, "unkey_key_id", None)
+    if not unkey_key_id:
+        raise HTTPException(
+            status_code=401, detail="A verified API key is required to search"
+        )
+
+    threads = get_workflow_threads_by_email(
+        request.email,
+        unkey_key_id,
+        fields=WORKFLOW_THREAD_SUMMARY_FIELDS,
+        limit=request.limit,
     )
+    if threads is None:
+        raise HTTPException(status_code=500, detail="Failed to search workflow threads")
+
+    return {
+        "workflow_threads": [
+            {field: thread.get(field) for field in WORKFLOW_THREAD_SUMMARY_FIELDS}
+            for thread in threads
+        ]
+    }
 
 
 @v1_router.get("/bots/status")
@@ -755,13 +1314,17 @@ async def join_bot(request: BotJoinRequest, http_request: Request) -> BotJoinRes
 
 
 @app.get("/api/bot/{bot_id}/status", response_model=BotStatusResponse)
-async def get_bot_status_by_id(bot_id: str) -> BotStatusResponse:
+async def get_bot_status_by_id(
+    bot_id: str,
+    http_request: Request,
+    wait: int | None = Query(None, ge=0, le=BOT_STATUS_MAX_WAIT_SECONDS),
+) -> Response:
     """
     Get bot status (unversioned - deprecated).
 
     ⚠️ DEPRECATED: Use GET /v1/api/bot/{bot_id}/status instead.
     """
-    return await get_bot_status_by_id_v1(bot_id)
+    return await get_bot_status_by_id_v1(bot_id, http_request, wait)
 
 
 @app.get("/bots/status")
@@ -800,8 +1363,26 @@ async def favicon() -> Response:
     return Response(status_code=204)  # No Content
 
 
+def _render_meeting_page(html_content: str) -> str:
+    """Inject DAILY_DOMAIN into the meeting page template."""
+    daily_domain = os.getenv("DAILY_DOMAIN", "https://your-domain.daily.co").rstrip("/")
+    return html_content.replace(
+        "const DAILY_DOMAIN = null;", f'const DAILY_DOMAIN = "{daily_domain}";'
+    )
+
+
+# Rendered meeting page, cached in memory (reloaded when meeting.html changes)
+MEETING_PAGE_MAX_AGE_SECONDS = int(os.getenv("MEETING_PAGE_MAX_AGE_SECONDS", "300"))
+meeting_page_cache = StaticPageCache(
+    Path(__file__).parent / "hosting" / "meeting.html",
+    _render_meeting_page,
+    cache_control=f"public, max-age={MEETING_PAGE_MAX_AGE_SECONDS}",
+)
+
+
 @app.get("/meet/{room_name}", response_class=HTMLResponse)
 async def serve_meeting_page(
+    request: Request,
     room_name: str,
     theme: str | None = Query("light", description="Theme: 'light' or 'dark'"),
     bgColor: str | None = Query(None, description="Background color (hex code)"),
@@ -820,6 +1401,9 @@ async def serve_meeting_page(
     The room URL is automatically constructed from the room name using the DAILY_DOMAIN
     environment variable. You can customize the look and feel using query parameters.
 
+    The rendered page is cached in memory and served gzip/brotli-compressed when the
+    client accepts it, with ETag/Last-Modified so repeat visits can get a 304.
+
     **Path Parameters:**
     - `room_name`: The Daily.co room name (e.g., "abc123")
 
@@ -838,32 +1422,13 @@ async def serve_meeting_page(
     ```
     """
     try:
-        # Get the path to the HTML template
-        hosting_dir = Path(__file__).parent / "hosting"
-        html_file = hosting_dir / "meeting.html"
-
-        if not html_file.exists():
-            logger.error(f"Meeting page template not found: {html_file}")
-            raise HTTPException(
-                status_code=500, detail="Meeting page template not found"
-            )
-
-        # Read the HTML template
-        with open(html_file, "r", encoding="utf-8") as f:
-            html_content = f.read()
-
-        # Inject DAILY_DOMAIN into the HTML template
-        daily_domain = os.getenv("DAILY_DOMAIN", "https://your-domain.daily.co").rstrip(
-            "/"
-        )
-        html_content = html_content.replace(
-            "const DAILY_DOMAIN = null;", f'const DAILY_DOMAIN = "{daily_domain}";'
-        )
-
-        # The HTML template already handles query parameters via JavaScript
-        # So we just need to serve it - the query params will be available in the URL
-        return HTMLResponse(content=html_content)
+        # The HTML template handles query parameters via JavaScript, so the page
+        # is the same for every room and is served from the in-memory cache
+        return meeting_page_cache.respond(request)
 
+    except FileNotFoundError:
+        logger.error(f"Meeting page template not found: {meeting_page_cache.path}")
+        raise HTTPException(status_code=500, detail="Meeting page template not found")
     except Exception as e:
         logger.error(f"Error serving meeting page: {e}", exc_info=True)
         raise HTTPException(
@@ -876,6 +1441,41 @@ async def serve_meeting_page(
 # The worker routes Daily.co webhooks here based on event type.
 
 
+async def _schedule_transcript_processing(
+    state: dict[str, Any],
+    background_tasks: BackgroundTasks,
+    step_class: type,
+) -> None:
+    """
+    Schedule ProcessTranscriptStep for a finished meeting.
+
+    **Simple Explanation:**
+    With USE_JOB_QUEUE enabled, the work is enqueued as a durable job and run by a
+    `flow worker` process, so it survives restarts and is retried on failure.
+    Otherwise (or if the queue is unavailable) it runs in FastAPI background tasks.
+    Either way the webhook returns 200 OK immediately.
+    """
+    from flow.jobs import JOB_PROCESS_TRANSCRIPT, enqueue_job
+
+    dedupe_target = state.get("workflow_thread_id") or state.get("room_name")
+    job_id = await enqueue_job(
+        JOB_PROCESS_TRANSCRIPT,
+        state,
+        dedupe_key=f"{JOB_PROCESS_TRANSCRIPT}:{dedupe_target}",
+    )
+    if job_id:
+        logger.info(
+            f"📦 Queued transcript processing as job {job_id} - returning 200 OK immediately"
+        )
+        return
+
+    step = step_class()
+    background_tasks.add_task(step.execute, state)
+    logger.info(
+        "🚀 Added transcript processing to background tasks - returning 200 OK immediately"
+    )
+
+
 async def handle_meeting_ended_webhook(
     payload: dict[str, Any],
     background_tasks: BackgroundTasks,
@@ -1167,14 +1767,9 @@ async def handle_meeting_ended_webhook(
                         session_data["transcript_processing"] = True
                         save_session_data(room_name, session_data)
 
-                    # Add processing to background tasks - return 200 OK immediately
-                    step = ProcessTranscriptStep()
-                    background_tasks.add_task(step.execute, state)
-
-                    # Return 200 OK immediately so webhook doesn't timeout
-                    # Processing will happen in background
-                    logger.info(
-                        "🚀 Added transcript processing to background tasks - returning 200 OK immediately"
+                    # Queue processing (or run it in background tasks) - return 200 OK immediately
+                    await _schedule_transcript_processing(
+                        state, background_tasks, ProcessTranscriptStep
                     )
                     return {
                         "status": "success",
@@ -1224,14 +1819,9 @@ async def handle_meeting_ended_webhook(
                     session_data["transcript_processing"] = True
                     save_session_data(room_name, session_data)
 
-                # Add processing to background tasks - return 200 OK immediately
-                step = ProcessTranscriptStep()
-                background_tasks.add_task(step.execute, state)
-
-                # Return 200 OK immediately so webhook doesn't timeout
-                # Processing will happen in background
-                logger.info(
-                    "🚀 Added transcript processing to background tasks - returning 200 OK immediately"
+                # Queue processing (or run it in background tasks) - return 200 OK immediately
+                await _schedule_transcript_processing(
+                    state, background_tasks, ProcessTranscriptStep
                 )
                 return {
                     "status": "success",
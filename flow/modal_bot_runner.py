@@ -113,6 +113,11 @@ async def run_bot(
             room_name=room_name,
             workflow_thread_id=workflow_thread_id,
         )
+
+        # Let in-process webhook deliveries finish before the function returns
+        from flow.jobs.webhook_outbox import wait_for_pending_deliveries
+
+        await wait_for_pending_deliveries(timeout=120)
         logger.info(f"✅ Bot execution completed for room: {room_name}")
 
     except Exception as e:
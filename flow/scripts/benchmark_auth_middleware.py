@@ -0,0 +1,139 @@
+#!/usr/bin/env python3.12
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Microbenchmark for UnkeyAuthMiddleware route classification
+
+Measures requests per second through the auth middleware for public routes
+(/health, /meet/{room}) and for a request that is rejected without a key, by
+calling the middleware directly with a no-op inner app.
+
+Simple Explanation:
+- "legacy": the previous classification (a Request built for every request,
+  then a chain of startswith checks), kept here only for comparison
+- "current": shared.auth.UnkeyAuthMiddleware (prefix table, scope access)
+- No API keys or network needed (UNKEY_ROOT_KEY is ignored)
+
+Usage:
+    python flow/scripts/benchmark_auth_middleware.py [--requests 50000]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+# Add project root to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+flow_dir = os.path.dirname(script_dir)
+project_root = os.path.dirname(flow_dir)
+sys.path.insert(0, project_root)
+
+os.environ.pop("UNKEY_ROOT_KEY", None)
+
+# ruff: noqa: E402
+from fastapi import Request
+from fastapi.responses import JSONResponse
+
+from shared.auth import UnkeyAuthMiddleware
+
+
+# Previous implementation (kept here only for comparison)
+
+
+class LegacyUnkeyAuthMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        request = Request(scope, receive=receive)
+        path = request.url.path.rstrip("/")
+        if (
+            path.startswith("/meet/")
+            or path.startswith("/webhooks/")
+            or path.startswith("/api/rooms/")
+            or path == "/favicon.ico"
+            or path == "/health"
+            or path == "/embed.js"
+            or path == "/test-embed"
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        auth_header = request.headers.get("authorization", "").strip()
+        if not auth_header or not auth_header.lower().startswith("bearer "):
+            response = JSONResponse(status_code=401, content={"detail": "missing"})
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+async def inner_app(scope, receive, send):
+    pass
+
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message):
+    pass
+
+
+def make_scope(path: str) -> dict:
+    return {
+        "type": "http",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"theme=dark",
+        "headers": [
+            (b"host", b"api.example.com"),
+            (b"user-agent", b"Mozilla/5.0"),
+            (b"accept", b"text/html"),
+            (b"accept-encoding", b"gzip, br"),
+        ],
+        "server": ("api.example.com", 443),
+    }
+
+
+async def run(middleware, path: str, count: int) -> float:
+    """Return requests per second for `count` requests to `path`."""
+    scope = make_scope(path)
+    start = time.perf_counter()
+    for _ in range(count):
+        await middleware(scope, receive, send)
+    return count / (time.perf_counter() - start)
+
+
+async def main_async(count: int) -> None:
+    legacy = LegacyUnkeyAuthMiddleware(inner_app)
+    current = UnkeyAuthMiddleware(inner_app)
+    paths = ["/health", "/meet/abc123", "/v1/api/bots (no key, 401)"]
+
+    print(f"{'path':<28} {'legacy req/s':>14} {'current req/s':>14} {'speedup':>8}")
+    for label in paths:
+        path = label.split(" ")[0]
+        await run(legacy, path, 1000)  # warm up
+        await run(current, path, 1000)
+        legacy_rps = await run(legacy, path, count)
+        current_rps = await run(current, path, count)
+        print(
+            f"{label:<28} {legacy_rps:>14,.0f} {current_rps:>14,.0f} "
+            f"{current_rps / legacy_rps:>7.2f}x"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--requests", type=int, default=50000)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3.12
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Benchmark for the template-compiled results email renderer
+
+Compares the previous transcript renderer (style strings rebuilt with .format
+and string concatenation for every message) with the precompiled templates
+rendering into one list buffer.
+
+Simple Explanation:
+- Builds fake transcripts with the given number of lines
+- "legacy": the old per-message string building, kept here only for comparison
+- "templates": format_transcript_html / generate_html_email from process_transcript
+- Reports the best time and the peak memory allocated while rendering
+  (tracemalloc), with the tokenizer cache warmed so only rendering is measured
+- No API keys or database needed
+
+Usage:
+    python flow/scripts/benchmark_email_renderer.py [--lines 1000 10000] [--repeat 5]
+"""
+
+import argparse
+import html
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+# Add project root to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+flow_dir = os.path.dirname(script_dir)
+project_root = os.path.dirname(flow_dir)
+sys.path.insert(0, project_root)
+
+# ruff: noqa: E402
+from flow.steps.agent_call.steps.process_transcript import (
+    format_transcript_html,
+    generate_html_email,
+)
+from flow.steps.agent_call.steps.transcript_parser import tokenize_transcript
+
+BOT_NAME = "assistant"
+SUMMARY = """OVERALL ASSESSMENT
+## Strengths
+- **Clear** communicator with good depth
+- Strong SQL and Python
+Score: 8.5
+Overall fit is 8/10.
+"""
+
+
+def build_transcript(lines: int) -> str:
+    """Build a synthetic transcript alternating bot questions and user answers."""
+    start = datetime(2025, 1, 1, 9, 0, tzinfo=timezone.utc)
+    out = []
+    for i in range(lines):
+        timestamp = (start + timedelta(seconds=i * 4)).isoformat()
+        if i % 2 == 0:
+            out.append(
+                f"[{timestamp}] assistant: Question {i // 2}: can you walk me "
+                "through how you approached that part of the project?"
+            )
+        else:
+            out.append(
+                f"[{timestamp}] Jordan: Sure - we measured where the time went, "
+                f"then fixed the slowest piece first (answer {i // 2}) & moved on."
+            )
+    return "\n".join(out) + "\n"
+
+
+# Previous implementation (kept here only for comparison)
+
+
+def legacy_format_transcript_html(transcript_text: str, bot_name: str) -> str:
+    html_parts = []
+    for record in tokenize_transcript(transcript_text):
+        timestamp, speaker_name, content = (
+            record.timestamp,
+            record.speaker,
+            record.content,
+        )
+        if speaker_name is None:
+            html_parts.append(f"<p>{html.escape(content)}</p>")
+            continue
+        if speaker_name == bot_name:
+            bg_color, border_color = "#f0f4ff", "#1f2de6"
+        else:
+            bg_color, border_color = "#f8f9fa", "#64748b"
+        message_html = '<div style="margin-bottom: 12px; padding: 12px; background-color: {}; border-left: 3px solid {}; border-radius: 4px;">'.format(
+            bg_color, border_color
+        )
+        header_style = "font-weight: 600; color: {}; font-size: 12px; margin-bottom: 6px; text-transform: uppercase; letter-spacing: 0.5px;".format(
+            border_color
+        )
+        message_html += f'<div style="{header_style}">{html.escape(speaker_name)}'
+        if timestamp:
+            clean_timestamp = timestamp.split("+")[0].split(".")[0]
+            message_html += f' <span style="font-weight: 400; opacity: 0.7;">({clean_timestamp})</span>'
+        message_html += "</div>"
+        message_html += f'<div style="color: #334155; line-height: 1.6;">{html.escape(content)}</div>'
+        message_html += "</div>"
+        html_parts.append(message_html)
+    return "\n".join(html_parts)
+
+
+def legacy_email(transcript_text: str) -> str:
+    transcript_html = legacy_format_transcript_html(transcript_text, BOT_NAME)
+    # The old page was one big f-string around the rendered transcript
+    return f"<html><body>{SUMMARY}{transcript_html}</body></html>"
+
+
+def template_email(transcript_text: str) -> str:
+    return generate_html_email(SUMMARY, transcript_text, "Jordan", None, None, BOT_NAME)
+
+
+def measure(fn, transcript_text: str, repeat: int) -> tuple[float, int]:
+    """Return (best seconds, peak bytes allocated) for fn(transcript_text)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(transcript_text)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    fn(transcript_text)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--lines", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    cases = [
+        (
+            "transcript",
+            lambda text: legacy_format_transcript_html(text, BOT_NAME),
+            lambda text: format_transcript_html(text, BOT_NAME),
+        ),
+        ("full email", legacy_email, template_email),
+    ]
+
+    print(
+        f"{'lines':>7} {'case':<11} {'legacy':>10} {'templates':>10} {'speedup':>8} "
+        f"{'legacy peak':>12} {'templates peak':>15}"
+    )
+    for lines in args.lines:
+        transcript_text = build_transcript(lines)
+        tokenize_transcript(transcript_text)  # warm the shared tokenizer cache
+        for name, legacy_fn, template_fn in cases:
+            legacy, legacy_peak = measure(legacy_fn, transcript_text, args.repeat)
+            new, new_peak = measure(template_fn, transcript_text, args.repeat)
+            print(
+                f"{lines:>7} {name:<11} {legacy * 1000:>8.1f}ms {new * 1000:>8.1f}ms "
+                f"{legacy / new:>7.2f}x {legacy_peak / 1e6:>10.1f}MB "
+                f"{new_peak / 1e6:>13.1f}MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3.12
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Benchmark for field encryption ciphers
+
+Compares encrypt/decrypt throughput and stored size of transcripts for the
+field encryption formats in flow/db.py.
+
+Simple Explanation:
+- Builds fake interview transcripts (one line every ~4 seconds, with varied
+  wording so compression isn't unrealistically good)
+- "legacy": base64 of a Fernet token, no compression (before the envelope format)
+- "fernet raw": "pf1:" envelope without compression (cipher cost only)
+- "fernet": "pf1:" envelope, compressed with FIELD_COMPRESSION
+- "aes-gcm raw": "pf2:" envelope without compression (cipher cost only)
+- "aes-gcm": "pf2:" envelope, compressed with FIELD_COMPRESSION (the default)
+- Throughput is plaintext MB/s; size is stored characters vs plaintext
+- No API keys or database needed (a throwaway ENCRYPTION_KEY is used if unset)
+
+Usage:
+    python flow/scripts/benchmark_field_encryption.py [--minutes 15 60 180] [--repeat 5]
+"""
+
+import argparse
+import base64
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+# Add project root to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+flow_dir = os.path.dirname(script_dir)
+project_root = os.path.dirname(flow_dir)
+sys.path.insert(0, project_root)
+
+os.environ.setdefault("ENCRYPTION_KEY", "benchmark-only-encryption-key-" + "x" * 32)
+
+# ruff: noqa: E402
+from flow import db
+from flow.db import decrypt_field, encrypt_field, field_associated_data
+
+SECONDS_PER_LINE = 4
+ASSOCIATED_DATA = field_associated_data("workflow_threads", "transcript_text", "t-1")
+
+OPENERS = [
+    "So",
+    "Right, so",
+    "Honestly,",
+    "I think",
+    "At my last job",
+    "Good question -",
+    "Mostly",
+    "In that project",
+]
+PHRASES = [
+    "we measured where the time went before changing anything",
+    "the database was the bottleneck for most of the requests",
+    "I paired with the on-call engineer to reproduce the incident",
+    "we moved the slow report into a background job",
+    "the cache hit rate went from about forty to ninety percent",
+    "I wrote a small benchmark so the team could compare options",
+    "we rolled it out behind a feature flag to five percent of users",
+    "the hardest part was agreeing on what done meant",
+    "I'd probably start with the logs and the slowest endpoints",
+    "we had to keep the old API working for the mobile clients",
+]
+
+
+def build_transcript(minutes: float, seed: int = 7) -> str:
+    """Build a synthetic interview transcript with varied answers."""
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1, 9, 0, tzinfo=timezone.utc)
+    lines = []
+    for i in range(int(minutes * 60 / SECONDS_PER_LINE)):
+        timestamp = (start + timedelta(seconds=i * SECONDS_PER_LINE)).isoformat()
+        if i % 2 == 0:
+            lines.append(
+                f"[{timestamp}] assistant: Can you tell me more about "
+                f"{rng.choice(PHRASES).split(' ', 2)[-1]}?"
+            )
+        else:
+            answer = " and ".join(rng.sample(PHRASES, rng.randint(1, 3)))
+            lines.append(
+                f"[{timestamp}] user: {rng.choice(OPENERS)} {answer} "
+                f"({rng.randint(2, 40)} people, {rng.randint(1, 18)} months)."
+            )
+    return "\n".join(lines) + "\n"
+
+
+def legacy_encrypt(text: str) -> str:
+    return base64.urlsafe_b64encode(db.get_fernet().encrypt(text.encode())).decode()
+
+
+def legacy_decrypt(value: str) -> str:
+    return db.get_fernet().decrypt(base64.urlsafe_b64decode(value.encode())).decode()
+
+
+def envelope(cipher: str, compression: str):
+    """Encrypt/decrypt functions for a FIELD_CIPHER and FIELD_COMPRESSION setting."""
+
+    def encrypt(text: str) -> str:
+        db.FIELD_CIPHER, db.FIELD_COMPRESSION = cipher, compression
+        return encrypt_field(text, ASSOCIATED_DATA)
+
+    def decrypt(value: str) -> str:
+        return decrypt_field(value, ASSOCIATED_DATA)
+
+    return encrypt, decrypt
+
+
+def best_of(fn, arg: str, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(arg)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--minutes", type=float, nargs="+", default=[15, 60, 180])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    compression = db.FIELD_COMPRESSION
+    formats = {
+        "legacy": (legacy_encrypt, legacy_decrypt),
+        "fernet raw": envelope("fernet", "none"),
+        "fernet": envelope("fernet", compression),
+        "aes-gcm raw": envelope("aes-gcm", "none"),
+        "aes-gcm": envelope("aes-gcm", compression),
+    }
+
+    # Derive the keys once so the first timing doesn't include PBKDF2
+    for encrypt, decrypt in formats.values():
+        decrypt(encrypt("warm up"))
+
+    print(f"Compression: {compression} (zstandard installed: {db.ZSTD_AVAILABLE})")
+    print(
+        f"{'minutes':>8} {'plaintext':>10} {'format':>12} {'encrypt':>12} "
+        f"{'decrypt':>12} {'stored':>10} {'ratio':>7}"
+    )
+    for minutes in args.minutes:
+        transcript_text = build_transcript(minutes)
+        size_mb = len(transcript_text.encode()) / 1_000_000
+        for name, (encrypt, decrypt) in formats.items():
+            stored = encrypt(transcript_text)
+            assert decrypt(stored) == transcript_text
+            encrypt_time = best_of(encrypt, transcript_text, args.repeat)
+            decrypt_time = best_of(decrypt, stored, args.repeat)
+            print(
+                f"{minutes:>8g} {len(transcript_text):>10} {name:>12} "
+                f"{size_mb / encrypt_time:>8.1f}MB/s {size_mb / decrypt_time:>8.1f}MB/s "
+                f"{len(stored):>10} {len(stored) / len(transcript_text):>6.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
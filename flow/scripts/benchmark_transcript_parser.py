@@ -0,0 +1,146 @@
+#!/usr/bin/env python3.12
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Benchmark for the shared transcript tokenizer
+
+Compares the previous approach (Q&A extraction and HTML rendering each running
+their own uncompiled regexes over every line) with the shared single-pass
+tokenizer on synthetic multi-hour transcripts.
+
+Simple Explanation:
+- Builds fake transcripts (one line every ~4 seconds of conversation)
+- "legacy parse": the per-line regex work the old Q&A extraction and HTML
+  rendering each did (two passes, uncompiled patterns looked up per call)
+- "shared parse": one pass of the shared tokenizer
+- "shared + consumers": tokenize once (cache cleared), then Q&A extraction and
+  HTML rendering on the shared records
+- No API keys or database needed
+
+Usage:
+    python flow/scripts/benchmark_transcript_parser.py [--hours 1 3 6] [--repeat 5]
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+# Add project root to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+flow_dir = os.path.dirname(script_dir)
+project_root = os.path.dirname(flow_dir)
+sys.path.insert(0, project_root)
+
+# ruff: noqa: E402
+from flow.steps.agent_call.steps.process_transcript import (
+    format_transcript_html,
+    parse_transcript_to_qa_pairs,
+)
+from flow.steps.agent_call.steps.transcript_parser import _tokenize, _tokenize_cached
+
+BOT_NAME = "assistant"
+SECONDS_PER_LINE = 4
+
+
+def build_transcript(hours: float) -> str:
+    """Build a synthetic transcript alternating bot questions and user answers."""
+    start = datetime(2025, 1, 1, 9, 0, tzinfo=timezone.utc)
+    lines = []
+    for i in range(int(hours * 3600 / SECONDS_PER_LINE)):
+        timestamp = (start + timedelta(seconds=i * SECONDS_PER_LINE)).isoformat()
+        if i % 2 == 0:
+            lines.append(
+                f"[{timestamp}] assistant: Question {i // 2}: can you walk me through "
+                "how you approached that part of the project?"
+            )
+        else:
+            lines.append(
+                f"[{timestamp}] user: Sure - we started by measuring where the time "
+                f"went, then fixed the slowest piece first (answer {i // 2})."
+            )
+    return "\n".join(lines) + "\n"
+
+
+# Previous implementation (kept here only for comparison)
+
+
+def legacy_parse_qa_pairs(transcript_text: str) -> int:
+    count = 0
+    for line in transcript_text.strip().split("\n"):
+        line = line.strip()
+        if not line:
+            continue
+        match = re.match(r"^\[.*?\]\s*(assistant|user):\s*(.+)$", line, re.IGNORECASE)
+        if not match:
+            match = re.match(r"^(assistant|user):\s*(.+)$", line, re.IGNORECASE)
+        if match:
+            count += 1
+    return count
+
+
+def legacy_format_html(transcript_text: str) -> int:
+    count = 0
+    for line in transcript_text.strip().split("\n"):
+        line = line.strip()
+        if not line:
+            continue
+        match = re.match(r"^\[(.+?)\]\s*([^:]+):\s*(.+)$", line)
+        if not match:
+            match = re.match(r"^([^:]+):\s*(.+)$", line)
+        if match:
+            count += 1
+    return count
+
+
+def legacy_parse(transcript_text: str) -> None:
+    legacy_parse_qa_pairs(transcript_text)
+    legacy_format_html(transcript_text)
+
+
+def shared_parse(transcript_text: str) -> None:
+    _tokenize(transcript_text)
+
+
+def shared_pipeline(transcript_text: str) -> None:
+    _tokenize_cached.cache_clear()
+    parse_transcript_to_qa_pairs(transcript_text)
+    format_transcript_html(transcript_text, BOT_NAME)
+
+
+def best_of(fn, transcript_text: str, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(transcript_text)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--hours", type=float, nargs="+", default=[1, 3, 6])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"{'hours':>6} {'lines':>8} {'legacy parse':>14} {'shared parse':>14} "
+        f"{'speedup':>8} {'shared + consumers':>19}"
+    )
+    for hours in args.hours:
+        transcript_text = build_transcript(hours)
+        lines = transcript_text.count("\n")
+        legacy = best_of(legacy_parse, transcript_text, args.repeat)
+        shared = best_of(shared_parse, transcript_text, args.repeat)
+        full = best_of(shared_pipeline, transcript_text, args.repeat)
+        print(
+            f"{hours:>6g} {lines:>8} {legacy * 1000:>12.1f}ms {shared * 1000:>12.1f}ms "
+            f"{legacy / shared:>7.2f}x {full * 1000:>17.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
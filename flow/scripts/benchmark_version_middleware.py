@@ -0,0 +1,131 @@
+#!/usr/bin/env python3.12
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Microbenchmark for VersionHeaderMiddleware
+
+Measures the per-request overhead of the version header middleware by calling a
+minimal ASGI app directly (no server or HTTP client), with and without the
+middleware.
+
+Simple Explanation:
+- "no middleware": the bare endpoint, as a baseline
+- "BaseHTTPMiddleware": the previous implementation, kept here only for comparison
+- "pure ASGI": the current VersionHeaderMiddleware from flow/main.py
+- Overhead = time per request minus the baseline
+- No API keys or database needed
+
+Usage:
+    python flow/scripts/benchmark_version_middleware.py [--requests 20000]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+# Add project root to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+flow_dir = os.path.dirname(script_dir)
+project_root = os.path.dirname(flow_dir)
+sys.path.insert(0, project_root)
+
+# ruff: noqa: E402
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from flow.main import VersionHeaderMiddleware
+
+
+# Previous implementation (kept here only for comparison)
+
+
+class LegacyVersionHeaderMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        if request.url.path.startswith("/v1/"):
+            response.headers["X-API-Version"] = "v1"
+        elif request.url.path.startswith("/v2/"):
+            response.headers["X-API-Version"] = "v2"
+        elif not request.url.path.startswith(
+            ("/health", "/webhooks", "/meet", "/favicon")
+        ):
+            response.headers["X-API-Version"] = "unversioned"
+            response.headers["X-API-Deprecated"] = "true"
+        return response
+
+
+async def status(request: Request) -> JSONResponse:
+    return JSONResponse({"status": "ok"})
+
+
+def build_app(middleware_class=None) -> Starlette:
+    middleware = [Middleware(middleware_class)] if middleware_class else []
+    return Starlette(routes=[Route("/v1/api/status", status)], middleware=middleware)
+
+
+async def run_requests(app: Starlette, count: int) -> float:
+    """Send `count` GET requests straight to the ASGI app; return seconds."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/v1/api/status",
+        "raw_path": b"/v1/api/status",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"localhost")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("localhost", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    start = time.perf_counter()
+    for _ in range(count):
+        await app(dict(scope), receive, send)
+    return time.perf_counter() - start
+
+
+async def main_async(count: int) -> None:
+    apps = [
+        ("no middleware", build_app()),
+        ("BaseHTTPMiddleware", build_app(LegacyVersionHeaderMiddleware)),
+        ("pure ASGI", build_app(VersionHeaderMiddleware)),
+    ]
+    for _, app in apps:
+        await run_requests(app, 500)  # warm up
+
+    results = {name: await run_requests(app, count) for name, app in apps}
+    baseline = results["no middleware"] / count
+
+    print(f"{'variant':<20} {'per request':>12} {'overhead':>10}")
+    for name, total in results.items():
+        per_request = total / count
+        print(
+            f"{name:<20} {per_request * 1e6:>10.1f}us "
+            f"{(per_request - baseline) * 1e6:>8.1f}us"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+    asyncio.run(main_async(args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Re-encrypt legacy encrypted fields in batches
+
+Rewrites encrypted columns that are still in an old format (base64 of a Fernet
+token, or plaintext stored before field encryption) into the current envelope
+format, so readers no longer need the legacy decode path. Also fills in the
+email blind index columns (email_bidx, email_results_to_bidx) of rooms and
+workflow_threads rows written before they existed.
+
+Simple Explanation:
+- Walks each table in primary key order, `--batch-size` rows at a time
+- Sleeps `--pause` seconds between batches to keep database load low
+- Safe to stop and rerun: rows already in the current format (with their blind
+  indexes) are left alone, and `--after` resumes a table from the last primary
+  key printed
+- `--dry-run` only counts rows that would be rewritten
+- Needs ENCRYPTION_KEY, SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY
+
+Usage:
+    python flow/scripts/reencrypt_legacy_fields.py [--table rooms] [--batch-size 100]
+        [--pause 0.5] [--after KEY] [--dry-run]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add project root to path
+script_dir = os.path.dirname(os.path.abspath(__file__))
+flow_dir = os.path.dirname(script_dir)
+project_root = os.path.dirname(flow_dir)
+sys.path.insert(0, project_root)
+
+# ruff: noqa: E402
+from dotenv import load_dotenv
+
+from flow.db import REENCRYPTION_TABLES, reencrypt_legacy_rows
+
+load_dotenv()
+
+
+def reencrypt_table(
+    table: str, batch_size: int, pause: float, after: str | None, dry_run: bool
+) -> bool:
+    """Re-encrypt one table batch by batch. Returns False if a batch failed."""
+    totals = {"scanned": 0, "reencrypted": 0, "skipped": 0}
+
+    while True:
+        result = reencrypt_legacy_rows(
+            table, after=after, batch_size=batch_size, dry_run=dry_run
+        )
+        if result is None:
+            print(
+                f"❌ {table}: batch failed - resume with --table {table} --after {after}"
+            )
+            return False
+
+        for key in totals:
+            totals[key] += result[key]
+        after = result["next_after"]
+        print(
+            f"   {table}: {totals['scanned']} scanned, "
+            f"{totals['reencrypted']} {'to re-encrypt' if dry_run else 're-encrypted'}, "
+            f"{totals['skipped']} skipped (last key: {after})"
+        )
+
+        if after is None:
+            return True
+        time.sleep(pause)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--table",
+        choices=sorted(REENCRYPTION_TABLES),
+        help="Only this table (default: all tables with encrypted columns)",
+    )
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--pause", type=float, default=0.5)
+    parser.add_argument("--after", help="Resume after this primary key (with --table)")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    if args.after and not args.table:
+        parser.error("--after requires --table")
+
+    tables = [args.table] if args.table else list(REENCRYPTION_TABLES)
+    print(f"🔐 Re-encrypting legacy fields in: {', '.join(tables)}")
+
+    ok = True
+    for table in tables:
+        if not reencrypt_table(
+            table, args.batch_size, args.pause, args.after, args.dry_run
+        ):
+            ok = False
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
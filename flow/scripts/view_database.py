@@ -5,11 +5,16 @@
 """
 View Supabase Database Contents
 
-Simple script to view what's stored in the Supabase database.
+Simple script to view what's stored in the Supabase database: the most recent
+room sessions, or with --email the rooms for an address (found through the
+email blind indexes, without decrypting other rows). With --unkey-key-id too,
+that API key's workflow threads for the address are listed as well.
 
-Run with: python flow/scripts/view_database.py
+Run with: python flow/scripts/view_database.py [--email alice@example.com]
+    [--unkey-key-id KEY_ID] [--limit 20]
 """
 
+import argparse
 import os
 import sys
 
@@ -19,7 +24,7 @@ flow_dir = os.path.dirname(script_dir)
 project_root = os.path.dirname(flow_dir)
 sys.path.insert(0, project_root)
 
-from flow.db import get_supabase_client, get_session_data  # noqa: E402
+from flow.db import get_room_sessions, get_workflow_threads_by_email  # noqa: E402
 from dotenv import load_dotenv  # noqa: E402
 
 load_dotenv()
@@ -67,60 +72,75 @@ def format_session_data(session_data: dict, room_name: str, created_at: str = No
     print()
 
 
-def view_database():
-    """Display all session data from Supabase database."""
+def view_database(
+    email: str | None = None, unkey_key_id: str | None = None, limit: int = 20
+):
+    """
+    Display recent session data from Supabase database.
+
+    Args:
+        email: Only rooms (and workflow threads) for this address
+        unkey_key_id: With email, also list this API key's workflow threads
+        limit: Maximum number of rooms (and threads) to show
+    """
     print(f"\n{'='*80}")
     print("📊 Supabase Database Viewer")
     print(f"{'='*80}\n")
 
-    client = get_supabase_client()
-    if not client:
+    # Newest rooms, or the rooms for an email via its blind index (one query,
+    # only the rows shown are decrypted)
+    sessions = get_room_sessions(email=email, limit=limit)
+    if sessions is None:
         print(
-            "❌ Cannot connect to Supabase. Check your SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY."
+            "❌ Cannot read from Supabase. Check your SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY."
         )
         return
 
-    try:
-        # Get all rooms ordered by created_at
-        response = (
-            client.table("rooms").select("*").order("created_at", desc=True).execute()
-        )
-
-        if not response.data or len(response.data) == 0:
+    if not sessions:
+        if email:
+            print(f"📭 No room sessions found for {email}.")
+        else:
             print("📭 Database is empty. No session data stored yet.")
-            return
-
-        print(f"📋 Found {len(response.data)} room session(s):\n")
-
-        for i, row in enumerate(response.data, 1):
-            room_name = row.get("room_name")
-            created_at = row.get("created_at")
-
-            # Get session data using the helper function (handles decryption)
-            session_data = get_session_data(room_name)
-
-            if session_data:
-                format_session_data(session_data, room_name, created_at)
-            else:
+    else:
+        print(f"📋 Showing {len(sessions)} room session(s):\n")
+
+    for session in sessions:
+        session_data = dict(session)
+        room_name = session_data.pop("room_name")
+        created_at = session_data.pop("created_at", None)
+        format_session_data(session_data, room_name, created_at)
+
+    if email and unkey_key_id:
+        threads = get_workflow_threads_by_email(email, unkey_key_id, limit=limit)
+        if threads is None:
+            print("❌ Error reading workflow threads from Supabase.")
+        else:
+            print(f"🧵 Found {len(threads)} workflow thread(s) for {email}:\n")
+            for thread in threads:
+                thread_data = dict(thread)
                 print(f"{'='*80}")
-                print(f"Room #{i}: {room_name}")
-                print(f"Created: {created_at}")
-                print(f"{'-'*80}")
-                print("   ⚠️ Could not retrieve session data")
+                print(f"Workflow thread: {thread_data.pop('workflow_thread_id')}")
+                for key, value in thread_data.items():
+                    display_value = str(value)
+                    if len(display_value) > 100:
+                        display_value = display_value[:100] + "..."
+                    print(f"   {key}: {display_value}")
                 print()
 
-        print(f"{'='*80}\n")
-
-    except Exception as e:
-        print(f"❌ Error reading from Supabase: {e}")
-        import traceback
-
-        traceback.print_exc()
-
-
-if __name__ == "__main__":
-    view_database()
+    print(f"{'='*80}\n")
 
 
 if __name__ == "__main__":
-    view_database()
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--email", help="Only rooms for this email address")
+    parser.add_argument(
+        "--unkey-key-id",
+        help="With --email, also list this API key's workflow threads",
+    )
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.unkey_key_id and not args.email:
+        parser.error("--unkey-key-id requires --email")
+
+    view_database(email=args.email, unkey_key_id=args.unkey_key_id, limit=args.limit)
@@ -271,14 +271,10 @@ IMPORTANT: Your output will be spoken aloud, so:
             # otherwise look for a paused workflow for this room as fallback.
             if not workflow_thread_id:
                 try:
-                    from flow.db import get_workflow_threads_by_room_name
+                    from flow.db import get_paused_workflow_thread_id
 
-                    threads = get_workflow_threads_by_room_name(room_name)
                     # Get the most recent paused workflow thread
-                    for thread in threads:
-                        if thread.get("workflow_paused"):
-                            workflow_thread_id = thread.get("workflow_thread_id")
-                            break
+                    workflow_thread_id = get_paused_workflow_thread_id(room_name)
                 except Exception as e:
                     logger.debug(
                         f"Could not find workflow_thread_id for room {room_name}: {e}"
@@ -315,7 +311,7 @@ IMPORTANT: Your output will be spoken aloud, so:
 
             # Create metrics processor to track LLM usage costs in real-time
             metrics_processor = UsageMetricsProcessor(
-                workflow_thread_id=workflow_thread_id
+                workflow_thread_id=workflow_thread_id, room_name=room_name
             )
 
             # Build pipeline with Deepgram STT and TranscriptProcessor
@@ -622,7 +618,7 @@ IMPORTANT: Your output will be spoken aloud, so:
                 # workflow, it will have a workflow_thread_id. First try to use the
                 # workflow_thread_id stored in transcript_handler (most reliable), then
                 # check session_data (for backward compatibility), and finally lookup by room_name.
-                from flow.db import get_session_data, get_workflow_thread_data
+                from flow.db import get_session_data
 
                 # First try to use workflow_thread_id from transcript_handler (most reliable)
                 workflow_thread_id = (
@@ -633,19 +629,17 @@ IMPORTANT: Your output will be spoken aloud, so:
 
                 # If not found, try to get workflow_thread_id from session_data (for backward compatibility)
                 if not workflow_thread_id:
-                    session_data = get_session_data(room_name) or {}
+                    session_data = (
+                        get_session_data(room_name, fields=["workflow_thread_id"]) or {}
+                    )
                     workflow_thread_id = session_data.get("workflow_thread_id")
 
                 # If still not found, try to find it from workflow_threads by room_name (fallback)
                 if not workflow_thread_id:
-                    from flow.db import get_workflow_threads_by_room_name
+                    from flow.db import get_paused_workflow_thread_id
 
-                    threads = get_workflow_threads_by_room_name(room_name)
                     # Get the most recent paused workflow thread
-                    for thread in threads:
-                        if thread.get("workflow_paused"):
-                            workflow_thread_id = thread.get("workflow_thread_id")
-                            break
+                    workflow_thread_id = get_paused_workflow_thread_id(room_name)
 
                 if workflow_thread_id:
                     # Close all connections before resuming workflow to prevent errors during resume
@@ -671,114 +665,35 @@ IMPORTANT: Your output will be spoken aloud, so:
                             f"Error during connection cleanup (may already be closed): {cleanup_error}"
                         )
 
-                    # Resume the workflow in a background task after cleanup
+                    # Resume the workflow after cleanup
                     # Simple Explanation: The workflow paused after starting the bot.
                     # Now that the bot has finished and connections are closed, we resume it to continue to the
-                    # process_transcript step.
+                    # process_transcript step. With USE_JOB_QUEUE enabled this is a durable job run by
+                    # a `flow worker` process (survives restarts, retried on failure); otherwise it runs
+                    # in a background task in this process.
                     logger.info(
                         f"🔄 Resuming workflow with thread_id: {workflow_thread_id}"
                     )
+                    from flow.jobs import JOB_RESUME_WORKFLOW, enqueue_job
+                    from flow.jobs.handlers import resume_workflow
 
-                    async def resume_workflow_task():
-                        """Background task to resume workflow after connections are closed."""
-                        try:
-                            from flow.workflows.bot_call import BotCallWorkflow
-
-                            workflow = BotCallWorkflow()
-
-                            # Retrieve checkpoint_id from workflow_threads if available
-                            # Simple Explanation: The checkpoint_id tells LangGraph exactly which
-                            # checkpoint to resume from. Without it, LangGraph might resume from
-                            # the wrong checkpoint or restart from the beginning.
-                            workflow_thread_data = get_workflow_thread_data(
-                                workflow_thread_id
-                            )
-                            checkpoint_id = (
-                                workflow_thread_data.get("checkpoint_id")
-                                if workflow_thread_data
-                                else None
-                            )
-
-                            # Build config with thread_id and checkpoint_id (if available)
-                            config = {"configurable": {"thread_id": workflow_thread_id}}
-                            if checkpoint_id:
-                                config["configurable"]["checkpoint_id"] = checkpoint_id
-                                logger.info(
-                                    f"   📍 Resuming from checkpoint_id: {checkpoint_id}"
-                                )
-                            else:
-                                logger.warning(
-                                    "   ⚠️ No checkpoint_id found - workflow may restart from beginning"
-                                )
-
-                            # Simple Explanation: LangGraph automatically resumes from the specified
-                            # checkpoint when you call ainvoke with a config containing both thread_id
-                            # and checkpoint_id. When resuming from a static interrupt (interrupt_after),
-                            # you should pass None - LangGraph will use the state from the checkpoint
-                            # and continue to the next node (process_transcript). The checkpoint already
-                            # has all the state from when the workflow paused, so we don't need to pass anything.
-                            # Resume the workflow - it will continue to process_transcript node
-                            graph = await workflow.graph
-
-                            # Try to get the checkpoint state first to verify it exists
-                            # Simple Explanation: This helps us detect if the checkpoint is missing
-                            # (e.g., if using MemorySaver and server restarted, or if checkpointer isn't configured)
-                            try:
-                                state_snapshot = await graph.aget_state(config)
-                                if not state_snapshot or not state_snapshot.values:
-                                    raise ValueError(
-                                        "Checkpoint state not found. This may happen if: "
-                                        "1) Using in-memory checkpointer and server restarted, "
-                                        "2) SUPABASE_DB_PASSWORD is not set in .env file, "
-                                        "3) Checkpoint was deleted or expired."
-                                    )
-                                logger.info(
-                                    "   ✅ Checkpoint state found - resuming workflow"
-                                )
-                            except Exception as state_error:
-                                logger.warning(
-                                    f"   ⚠️ Could not retrieve checkpoint state: {state_error}"
-                                )
-                                logger.warning(
-                                    "   This usually means the checkpointer isn't configured properly. "
-                                    "Check that SUPABASE_DB_PASSWORD is set in your .env file."
-                                )
-                                raise
-
-                            # Pass None to resume from static interrupt - LangGraph will use checkpoint state and continue to next node
-                            await graph.ainvoke(None, config=config)
-                            logger.info("✅ Workflow resumed successfully")
-                        except Exception as resume_error:
-                            error_msg = str(resume_error)
-                            logger.error(
-                                f"❌ Error resuming workflow: {error_msg}",
-                                exc_info=True,
-                            )
-
-                            # Provide helpful error message if it's a checkpointer issue
-                            if (
-                                "SUPABASE_DB" in error_msg.upper()
-                                or "checkpoint" in error_msg.lower()
-                            ):
-                                logger.error(
-                                    "   💡 TIP: This error is likely due to missing Supabase database credentials. "
-                                    "Add SUPABASE_DB_PASSWORD to your .env file. "
-                                    "Run: python scripts/diagnose_supabase.py to check your configuration."
-                                )
-
-                            # Fallback to full transcript processing if workflow resume fails
-                            # Simple Explanation: If workflow resume fails, we use ProcessTranscriptStep
-                            # which includes the full pipeline: Q&A parsing, insights, email, webhook
-                            logger.info(
-                                "   Falling back to full transcript processing..."
-                            )
-                            await self.result_processor.process_full_pipeline(
-                                room_name, transcript_handler
-                            )
-
-                    # Start workflow resume in background task (non-blocking)
-                    # This allows the bot to finish cleanup while workflow resumes
-                    resume_task = asyncio.create_task(resume_workflow_task())
+                    resume_payload = {
+                        "workflow_thread_id": workflow_thread_id,
+                        "room_name": room_name,
+                    }
+                    job_id = await enqueue_job(
+                        JOB_RESUME_WORKFLOW,
+                        resume_payload,
+                        dedupe_key=f"{JOB_RESUME_WORKFLOW}:{workflow_thread_id}",
+                    )
+                    if job_id:
+                        logger.info(f"📦 Workflow resume queued as job {job_id}")
+                    else:
+                        # Start workflow resume in background task (non-blocking)
+                        # This allows the bot to finish cleanup while workflow resumes
+                        resume_task = asyncio.create_task(
+                            resume_workflow(resume_payload)
+                        )
                 else:
                     # No workflow - use full transcript processing pipeline
                     # Simple Explanation: Even without a workflow, we should run the full
@@ -833,7 +748,9 @@ IMPORTANT: Your output will be spoken aloud, so:
                         save_workflow_thread_data,
                     )
 
-                    thread_data = get_workflow_thread_data(workflow_thread_id) or {}
+                    thread_data = (
+                        get_workflow_thread_data(workflow_thread_id, fresh=True) or {}
+                    )
                     thread_data["workflow_thread_id"] = workflow_thread_id
                     thread_data["bot_join_time"] = bot_join_time.isoformat()
                     if save_workflow_thread_data(workflow_thread_id, thread_data):
@@ -882,7 +799,10 @@ IMPORTANT: Your output will be spoken aloud, so:
                             save_workflow_thread_data,
                         )
 
-                        thread_data = get_workflow_thread_data(workflow_thread_id) or {}
+                        thread_data = (
+                            get_workflow_thread_data(workflow_thread_id, fresh=True)
+                            or {}
+                        )
                         thread_data["workflow_thread_id"] = workflow_thread_id
                         thread_data["bot_leave_time"] = bot_leave_time.isoformat()
                         thread_data["bot_duration"] = bot_duration
@@ -1049,7 +969,9 @@ IMPORTANT: Your output will be spoken aloud, so:
                         save_workflow_thread_data,
                     )
 
-                    thread_data = get_workflow_thread_data(workflow_thread_id) or {}
+                    thread_data = (
+                        get_workflow_thread_data(workflow_thread_id, fresh=True) or {}
+                    )
                     thread_data["workflow_thread_id"] = workflow_thread_id
                     thread_data["bot_leave_time"] = bot_leave_time.isoformat()
                     thread_data["bot_duration"] = bot_duration
@@ -1160,7 +1082,9 @@ IMPORTANT: Your output will be spoken aloud, so:
                         save_workflow_thread_data,
                     )
 
-                    thread_data = get_workflow_thread_data(workflow_thread_id) or {}
+                    thread_data = (
+                        get_workflow_thread_data(workflow_thread_id, fresh=True) or {}
+                    )
                     thread_data["workflow_thread_id"] = workflow_thread_id
                     thread_data["bot_leave_time"] = bot_leave_time.isoformat()
                     thread_data["bot_duration"] = bot_duration
@@ -1323,17 +1247,23 @@ def main():
         transport_map=transport_map,
     )
 
+    async def run_bot_and_flush_webhooks():
+        await executor.run(
+            room_url=args.room_url,
+            token=args.token,
+            bot_config=bot_config,
+            room_name=room_name,
+            workflow_thread_id=workflow_thread_id,
+        )
+        # Simple Explanation: When the job queue is disabled, webhooks are delivered
+        # in background tasks. Let them finish before the event loop shuts down.
+        from flow.jobs.webhook_outbox import wait_for_pending_deliveries
+
+        await wait_for_pending_deliveries(timeout=120)
+
     # Run the bot
     try:
-        asyncio.run(
-            executor.run(
-                room_url=args.room_url,
-                token=args.token,
-                bot_config=bot_config,
-                room_name=room_name,
-                workflow_thread_id=workflow_thread_id,
-            )
-        )
+        asyncio.run(run_bot_and_flush_webhooks())
     except KeyboardInterrupt:
         logger.info("Bot interrupted by user")
     except Exception as e:
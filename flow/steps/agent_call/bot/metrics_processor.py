@@ -35,12 +35,17 @@ class UsageMetricsProcessor(FrameProcessor):
     so it can capture all LLM usage metrics.
     """
 
-    def __init__(self, workflow_thread_id: Optional[str] = None):
+    def __init__(
+        self,
+        workflow_thread_id: Optional[str] = None,
+        room_name: Optional[str] = None,
+    ):
         """
         Initialize the metrics processor.
 
         Args:
             workflow_thread_id: Workflow thread ID to associate usage stats with
+            room_name: Room name the bot is in (for live "cost" events)
         """
         if FrameProcessor is None:
             raise ImportError(
@@ -49,6 +54,7 @@ class UsageMetricsProcessor(FrameProcessor):
 
         super().__init__()
         self.workflow_thread_id = workflow_thread_id
+        self.room_name = room_name
         self._usage_data = []  # Store usage data for aggregation
 
     async def process_frame(self, frame: Any, direction: str) -> None:
@@ -89,10 +95,6 @@ class UsageMetricsProcessor(FrameProcessor):
         When the LLM is used, this method extracts the token counts and saves them
         to the database so we can track usage.
         """
-        if not self.workflow_thread_id:
-            logger.debug("No workflow_thread_id - skipping metrics capture")
-            return
-
         try:
             prompt_tokens = metrics_data.prompt_tokens or 0
             completion_tokens = metrics_data.completion_tokens or 0
@@ -123,6 +125,24 @@ class UsageMetricsProcessor(FrameProcessor):
             }
             self._usage_data.append(usage_entry)
 
+            # Stream the cost to live event subscribers (GET /v1/api/bot/{bot_id}/events)
+            from flow.utils.bot_events import publish_bot_event
+
+            publish_bot_event(
+                self.room_name,
+                "cost",
+                {
+                    **usage_entry,
+                    "total_cost_usd": sum(
+                        entry["cost_usd"] for entry in self._usage_data
+                    ),
+                },
+            )
+
+            if not self.workflow_thread_id:
+                logger.debug("No workflow_thread_id - skipping metrics capture")
+                return
+
             # Save cost to database immediately using update_workflow_usage_cost
             from flow.utils.usage_tracking import update_workflow_usage_cost
 
@@ -139,7 +159,9 @@ class UsageMetricsProcessor(FrameProcessor):
             # Get workflow thread data to find unkey_key_id for PostHog tracking
             from flow.db import get_workflow_thread_data
 
-            thread_data = get_workflow_thread_data(self.workflow_thread_id)
+            thread_data = get_workflow_thread_data(
+                self.workflow_thread_id, fields=["unkey_key_id"]
+            )
             if not thread_data:
                 logger.debug(
                     f"Could not find workflow_thread_data for {self.workflow_thread_id} - skipping PostHog tracking"
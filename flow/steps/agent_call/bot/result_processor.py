@@ -77,7 +77,9 @@ class BotResultProcessor:
             # We also pass workflow_thread_id if available so processing status can be tracked per workflow run.
             from flow.db import get_session_data
 
-            session_data = get_session_data(room_name) or {}
+            session_data = (
+                get_session_data(room_name, fields=["workflow_thread_id"]) or {}
+            )
             workflow_thread_id = session_data.get("workflow_thread_id")
 
             state = {
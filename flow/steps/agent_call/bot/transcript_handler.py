@@ -14,6 +14,8 @@ if TYPE_CHECKING:
 from pipecat.frames.frames import TranscriptionMessage, TranscriptionUpdateFrame
 from pipecat.processors.transcript_processor import TranscriptProcessor
 
+from flow.utils.bot_events import publish_bot_event
+
 logger = logging.getLogger(__name__)
 
 
@@ -62,6 +64,7 @@ class TranscriptHandler:
         )  # Track participant join order for mapping
         self.bot_session_id: Optional[str] = None
         self.workflow_thread_id: Optional[str] = workflow_thread_id
+        self._last_speaker: Optional[str] = None  # For "speaker" live events
         logger.info(
             f"TranscriptHandler initialized for room: {room_name}, bot_name: {self.bot_name}, workflow_thread_id: {workflow_thread_id}"
         )
@@ -134,7 +137,7 @@ class TranscriptHandler:
                 from flow.db import get_workflow_thread_data, save_workflow_thread_data
 
                 workflow_thread_data = (
-                    get_workflow_thread_data(self.workflow_thread_id) or {}
+                    get_workflow_thread_data(self.workflow_thread_id, fresh=True) or {}
                 )
                 workflow_thread_data["workflow_thread_id"] = self.workflow_thread_id
                 workflow_thread_data["transcript_text"] = self.transcript_text
@@ -145,38 +148,28 @@ class TranscriptHandler:
                 )
             else:
                 # Fallback: try to find workflow_thread_id by room_name
-                from flow.db import get_workflow_threads_by_room_name
+                from flow.db import get_paused_workflow_thread_id
 
-                threads = get_workflow_threads_by_room_name(self.room_name)
                 # Get the most recent paused workflow thread
-                for thread in threads:
-                    if thread.get("workflow_paused"):
-                        workflow_thread_id = thread.get("workflow_thread_id")
-                        if workflow_thread_id:
-                            from flow.db import (
-                                get_workflow_thread_data,
-                                save_workflow_thread_data,
-                            )
-
-                            workflow_thread_data = (
-                                get_workflow_thread_data(workflow_thread_id) or {}
-                            )
-                            workflow_thread_data["workflow_thread_id"] = (
-                                workflow_thread_id
-                            )
-                            workflow_thread_data["transcript_text"] = (
-                                self.transcript_text
-                            )
-
-                            save_workflow_thread_data(
-                                workflow_thread_id, workflow_thread_data
-                            )
-                            logger.debug(
-                                f"✅ Transcript saved to workflow_threads (found by room_name): workflow_thread_id={workflow_thread_id}"
-                            )
-                            # Cache the workflow_thread_id for future saves
-                            self.workflow_thread_id = workflow_thread_id
-                            break
+                workflow_thread_id = get_paused_workflow_thread_id(self.room_name)
+                if workflow_thread_id:
+                    from flow.db import (
+                        get_workflow_thread_data,
+                        save_workflow_thread_data,
+                    )
+
+                    workflow_thread_data = (
+                        get_workflow_thread_data(workflow_thread_id, fresh=True) or {}
+                    )
+                    workflow_thread_data["workflow_thread_id"] = workflow_thread_id
+                    workflow_thread_data["transcript_text"] = self.transcript_text
+
+                    save_workflow_thread_data(workflow_thread_id, workflow_thread_data)
+                    logger.debug(
+                        f"✅ Transcript saved to workflow_threads (found by room_name): workflow_thread_id={workflow_thread_id}"
+                    )
+                    # Cache the workflow_thread_id for future saves
+                    self.workflow_thread_id = workflow_thread_id
                 else:
                     logger.warning(
                         f"⚠️ No workflow_thread_id found for room: {self.room_name} - transcript not saved"
@@ -255,5 +248,25 @@ class TranscriptHandler:
             )
             self.transcript_text += line + "\n"
 
+            # Stream the line to live event subscribers (GET /v1/api/bot/{bot_id}/events)
+            if speaker_name != self._last_speaker:
+                self._last_speaker = speaker_name
+                publish_bot_event(
+                    self.room_name,
+                    "speaker",
+                    {"speaker": speaker_name, "role": msg.role},
+                )
+            publish_bot_event(
+                self.room_name,
+                "transcript",
+                {
+                    "speaker": speaker_name,
+                    "role": msg.role,
+                    "content": msg.content,
+                    "timestamp": self._normalize_timestamp(msg.timestamp),
+                    "line": line,
+                },
+            )
+
             # Save to database (updates session data with latest transcript)
             await self._save_to_database()
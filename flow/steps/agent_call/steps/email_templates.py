@@ -0,0 +1,224 @@
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Email Templates
+
+Precompiled HTML fragments for the results email.
+
+**Simple Explanation:**
+The results email is mostly static HTML with inline styles. Instead of building
+those style strings again for every transcript line, each template is split once
+(at import time) into its static pieces and its `$placeholders`. Rendering then
+just appends the static pieces and the values to a list buffer, which is joined
+into one string at the very end. Templates use `string.Template` syntax
+(`$name`, `${name}`, `$$` for a literal dollar sign).
+"""
+
+from string import Template
+from typing import List, Tuple
+
+
+class CompiledTemplate:
+    """
+    A `string.Template` split into static text and placeholders ahead of time.
+
+    **Simple Explanation:**
+    "Hello $name!" is stored as the static parts ("Hello ", "!") and the slot
+    ("name",). Rendering appends the parts and values to a buffer in order, with
+    no parsing or intermediate strings.
+    """
+
+    __slots__ = ("slots", "_parts", "_slot_indices", "_in_order")
+
+    def __init__(self, source: str):
+        statics: List[str] = []
+        slots: List[str] = []
+        slot_indices: List[int] = []
+        position = 0
+        pending = ""
+
+        for match in Template.pattern.finditer(source):
+            pending += source[position : match.start()]
+            position = match.end()
+            if match.group("escaped") is not None:
+                pending += "$"
+                continue
+            name = match.group("named") or match.group("braced")
+            if name is None:
+                raise ValueError(f"Invalid placeholder in template: {match.group()}")
+            if name not in slots:
+                slots.append(name)
+            statics.append(pending)
+            slot_indices.append(slots.index(name))
+            pending = ""
+
+        statics.append(pending + source[position:])
+
+        # Static parts with a None gap for each placeholder:
+        # [static, None, static, None, ..., static]
+        parts: List[str | None] = [statics[0]]
+        for static in statics[1:]:
+            parts.append(None)
+            parts.append(static)
+
+        self.slots: Tuple[str, ...] = tuple(slots)
+        self._parts = parts
+        self._slot_indices: Tuple[int, ...] = tuple(slot_indices)
+        # Common case: each slot used once, in order (values fill the gaps directly)
+        self._in_order = self._slot_indices == tuple(range(len(slots)))
+
+    def render_into(self, buffer: List[str], *values: str) -> None:
+        """
+        Append the rendered template to a buffer.
+
+        Args:
+            buffer: List the output pieces are appended to
+            *values: One (already escaped) string per slot, in `self.slots` order
+        """
+        parts = self._parts.copy()
+        if self._in_order:
+            parts[1::2] = values
+        else:
+            parts[1::2] = [values[i] for i in self._slot_indices]
+        buffer.extend(parts)
+
+    def render(self, **values: str) -> str:
+        """Render the template to a string (values are passed by slot name)."""
+        buffer: List[str] = []
+        self.render_into(buffer, *(values[name] for name in self.slots))
+        return "".join(buffer)
+
+
+# Transcript
+
+
+def _transcript_message_open(bg_color: str, border_color: str) -> str:
+    """Opening tags of one transcript message, up to the speaker name."""
+    return (
+        f'<div style="margin-bottom: 12px; padding: 12px; background-color: {bg_color}; '
+        f'border-left: 3px solid {border_color}; border-radius: 4px;">'
+        f'<div style="font-weight: 600; color: {border_color}; font-size: 12px; '
+        'margin-bottom: 6px; text-transform: uppercase; letter-spacing: 0.5px;">'
+    )
+
+
+# Brand colors: assistant messages in brand blue, participants in slate
+TRANSCRIPT_ASSISTANT_MESSAGE = CompiledTemplate(
+    _transcript_message_open("#f0f4ff", "#1f2de6") + "$speaker$timestamp</div>"
+    '<div style="color: #334155; line-height: 1.6;">$content</div></div>'
+)
+TRANSCRIPT_USER_MESSAGE = CompiledTemplate(
+    _transcript_message_open("#f8f9fa", "#64748b") + "$speaker$timestamp</div>"
+    '<div style="color: #334155; line-height: 1.6;">$content</div></div>'
+)
+# Timestamp wraps the cleaned timestamp text: OPEN + timestamp + CLOSE
+TRANSCRIPT_TIMESTAMP_OPEN = ' <span style="font-weight: 400; opacity: 0.7;">('
+TRANSCRIPT_TIMESTAMP_CLOSE = ")</span>"
+TRANSCRIPT_PLAIN_LINE = CompiledTemplate("<p>$content</p>")
+
+
+# Summary
+
+SUMMARY_H2 = CompiledTemplate(
+    '<h2 style="color: #1e293b; font-size: 20px; font-weight: 600; margin: 24px 0 12px 0; padding-bottom: 8px; border-bottom: 1px solid #e2e8f0;">$text</h2>'
+)
+SUMMARY_H3 = CompiledTemplate(
+    '<h3 style="color: #1e293b; font-size: 18px; font-weight: 600; margin: 20px 0 10px 0;">$text</h3>'
+)
+SUMMARY_H4 = CompiledTemplate(
+    '<h4 style="color: #1e293b; font-size: 16px; font-weight: 600; margin: 16px 0 8px 0;">$text</h4>'
+)
+SUMMARY_SECTION_HEADER = CompiledTemplate(
+    '<h2 style="color: #1e293b; font-size: 18px; font-weight: 600; margin: 24px 0 12px 0; padding-bottom: 8px; border-bottom: 1px solid #e2e8f0;">$text</h2>'
+)
+SUMMARY_LIST_OPEN = '<ul style="margin: 12px 0; padding-left: 24px;">'
+SUMMARY_LIST_CLOSE = "</ul>"
+SUMMARY_LIST_ITEM = CompiledTemplate(
+    '<li style="margin-bottom: 8px; line-height: 1.6;">$text</li>'
+)
+SUMMARY_QUESTION = CompiledTemplate(
+    '<div style="margin: 16px 0 8px 0;"><strong style="color: #1f2de6;">$label:</strong> <span style="color: #1e293b;">$text</span></div>'
+)
+SUMMARY_ANSWER = CompiledTemplate(
+    '<div style="margin: 0 0 16px 20px; padding: 8px; background-color: #f8f9fa; border-left: 2px solid #e2e8f0; color: #475569;">$text</div>'
+)
+SUMMARY_PARAGRAPH = CompiledTemplate(
+    '<p style="margin: 8px 0; line-height: 1.6; color: #334155;">$text</p>'
+)
+SCORE_HIGHLIGHT_STYLE = (
+    "background-color: #fff3cd; padding: 2px 6px; border-radius: 3px; font-weight: 600;"
+)
+
+
+# Email page
+
+EMAIL_CANDIDATE_NAME = CompiledTemplate(
+    '<p style="margin: 8px 0 0 0; color: #64748b; font-size: 14px; line-height: 1.5;">$candidate_name</p>'
+)
+
+# Use brand colors: #1f2de6 (brand blue), clean flat design
+# The page is split around the transcript so the transcript can be rendered
+# straight into the same buffer: EMAIL_PAGE_HEAD + transcript + EMAIL_PAGE_FOOT
+EMAIL_PAGE_HEAD = CompiledTemplate(
+    """<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>$interview_type Results</title>
+</head>
+<body style="margin: 0; padding: 0; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif; background-color: #f8f9fa;">
+    <table role="presentation" style="width: 100%; border-collapse: collapse; background-color: #f8f9fa; padding: 20px;">
+        <tr>
+            <td align="center">
+                <table role="presentation" style="max-width: 600px; width: 100%; border-collapse: collapse; background-color: #ffffff; border-radius: 0; overflow: hidden; box-shadow: 0 1px 3px rgba(0,0,0,0.1);">
+                    <!-- Top Brand Line -->
+                    <tr>
+                        <td style="height: 4px; background-color: #1f2de6; width: 100%;"></td>
+                    </tr>
+                    <!-- Header -->
+                    <tr>
+                        <td style="background-color: #ffffff; padding: 32px 24px 24px 24px; border-bottom: 1px solid #e2e8f0;">
+                            <div style="margin-bottom: 16px;">
+                                <div style="font-weight: 700; font-size: 18px; line-height: 1.2; color: #1e293b; letter-spacing: -0.01em;">PailFlow</div>
+                                <div style="font-size: 10px; font-weight: 600; color: #94a3b8; text-transform: uppercase; letter-spacing: 0.1em; margin-top: 2px;">Workspace</div>
+                            </div>
+                            <h1 style="margin: 0; color: #1e293b; font-size: 22px; font-weight: 600; line-height: 1.3;">$interview_type Complete</h1>
+                            $candidate_html
+                        </td>
+                    </tr>
+
+                    <!-- Summary Section -->
+                    <tr>
+                        <td style="padding: 32px 24px;">
+                            <div style="margin-bottom: 0;">
+                                $summary_html
+                            </div>
+                        </td>
+                    </tr>
+
+                    <!-- Transcript Section -->
+                    <tr>
+                        <td style="padding: 0 24px 32px 24px;">
+                            <h2 style="color: #1e293b; font-size: 18px; font-weight: 600; margin: 0 0 16px 0; padding-bottom: 8px; border-bottom: 1px solid #e2e8f0;">Full Transcript</h2>
+                            <div style="max-height: 600px; overflow-y: auto; padding: 16px; background-color: #f8f9fa; border-radius: 6px; border: 1px solid #e2e8f0;">
+                                """
+)
+EMAIL_PAGE_FOOT = """
+                            </div>
+                        </td>
+                    </tr>
+
+                    <!-- Footer -->
+                    <tr>
+                        <td style="padding: 20px 24px; text-align: center; background-color: #ffffff; border-top: 1px solid #e2e8f0;">
+                            <p style="margin: 0; color: #94a3b8; font-size: 12px; font-weight: 500;">Sent by PailFlow</p>
+                        </td>
+                    </tr>
+                </table>
+            </td>
+        </tr>
+    </table>
+</body>
+</html>"""
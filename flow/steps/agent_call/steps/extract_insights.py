@@ -10,14 +10,315 @@ This step extracts insights and assesses competencies from the interview.
 import asyncio
 import json
 import logging
+import os
 import time
 import uuid
-from typing import Any, Dict, List, cast
+from typing import Any, Awaitable, Callable, Dict, List, Tuple, cast
 
 from flow.steps.agent_call.steps.base import InterviewStep
+from flow.utils.insight_cache import (
+    compute_insight_cache_key,
+    get_cached_insights,
+    store_cached_insights,
+)
+from flow.utils.llm_limiter import PRIORITY_HIGH, PRIORITY_NORMAL, get_llm_limiter
 
 logger = logging.getLogger(__name__)
 
+# Insight extraction settings
+# Simple Explanation: Long conversations are split into chunks that are analyzed in
+# parallel ("map") and then merged with one more call ("reduce"). Token counts are
+# estimated from text length, which is close enough for budgeting chunks.
+INSIGHTS_TIMEOUT_SECONDS = float(os.getenv("INSIGHTS_TIMEOUT_SECONDS", "30"))
+INSIGHTS_MAP_REDUCE_THRESHOLD_TOKENS = int(
+    os.getenv("INSIGHTS_MAP_REDUCE_THRESHOLD_TOKENS", "12000")
+)
+INSIGHTS_CHUNK_TOKEN_BUDGET = int(os.getenv("INSIGHTS_CHUNK_TOKEN_BUDGET", "6000"))
+CHARS_PER_TOKEN = 4
+# Expected completion size, added to the prompt estimate when reserving rate-limit tokens
+ESTIMATED_COMPLETION_TOKENS = 1000
+
+SYSTEM_PROMPT_POSTHOG = (
+    "You are an expert call evaluator. Always respond with valid JSON only."
+)
+SYSTEM_PROMPT_OPENAI = (
+    "You are an expert interview evaluator. Always respond with valid JSON only."
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """Roughly estimate the number of tokens in text (~4 characters per token)."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def format_qa_pairs(qa_pairs: List[Dict[str, Any]], start: int = 0) -> str:
+    """
+    Format Q&A pairs as prompt text ("Q1: ...\\nA1: ...").
+
+    Args:
+        qa_pairs: Q&A pairs to format
+        start: Index of the first pair in the full conversation (keeps numbering
+            consistent across chunks)
+
+    Returns:
+        Formatted transcript text
+    """
+    return "\n\n".join(
+        [
+            f"Q{i + 1}: {qa.get('question', '')}\nA{i + 1}: {qa.get('answer', '')}"
+            for i, qa in enumerate(qa_pairs, start=start)
+        ]
+    )
+
+
+def chunk_qa_pairs(
+    qa_pairs: List[Dict[str, Any]], token_budget: int
+) -> List[Tuple[int, List[Dict[str, Any]]]]:
+    """
+    Split Q&A pairs into consecutive chunks that fit a token budget.
+
+    **Simple Explanation:**
+    Pairs are never split. A single pair bigger than the budget gets its own chunk.
+
+    Args:
+        qa_pairs: All Q&A pairs, in order
+        token_budget: Maximum estimated tokens per chunk
+
+    Returns:
+        List of (start_index, pairs) tuples
+    """
+    chunks: List[Tuple[int, List[Dict[str, Any]]]] = []
+    current: List[Dict[str, Any]] = []
+    current_start = 0
+    current_tokens = 0
+
+    for i, qa in enumerate(qa_pairs):
+        qa_tokens = estimate_tokens(format_qa_pairs([qa], start=i))
+        if current and current_tokens + qa_tokens > token_budget:
+            chunks.append((current_start, current))
+            current = []
+            current_tokens = 0
+        if not current:
+            current_start = i
+        current.append(qa)
+        current_tokens += qa_tokens
+
+    if current:
+        chunks.append((current_start, current))
+    return chunks
+
+
+def build_analysis_prompt(analysis_prompt: str | None, qa_text: str) -> str:
+    """
+    Build the analysis prompt for a transcript.
+
+    Args:
+        analysis_prompt: Custom analysis prompt, or None for the default prompt
+        qa_text: Formatted Q&A transcript text
+
+    Returns:
+        Prompt with the transcript included
+    """
+    # Use custom analysis prompt if provided, otherwise use default
+    if analysis_prompt:
+        # User provided a custom prompt - inject the transcript into it
+        # Look for placeholders like {transcript} or {qa_text} or just append
+        if "{transcript}" in analysis_prompt:
+            return analysis_prompt.replace("{transcript}", qa_text)
+        if "{qa_text}" in analysis_prompt:
+            return analysis_prompt.replace("{qa_text}", qa_text)
+        # No placeholder found - append transcript at the end
+        return f"{analysis_prompt}\n\nConversation Transcript:\n{qa_text}"
+
+    # Default analysis prompt (generic, not interview-specific)
+    return f"""Analyze this conversation transcript and provide a comprehensive assessment.
+
+Conversation Transcript:
+{qa_text}
+
+Please provide a JSON response with the following structure:
+{{
+    "overall_score": <number 0-10>,
+    "competency_scores": {{
+        "<competency_name>": <score 0-10>,
+        ...
+    }},
+    "strengths": ["<strength1>", "<strength2>", ...],
+    "weaknesses": ["<weakness1>", "<weakness2>", ...],
+    "question_assessments": [
+        {{
+            "question": "<question text>",
+            "answer": "<answer text>",
+            "score": <number 0-10>,
+            "notes": "<brief assessment notes>"
+        }},
+        ...
+    ]
+}}
+
+Guidelines:
+- Analyze the conversation objectively
+- Identify key themes, competencies, or topics discussed
+- Provide specific, constructive feedback
+- Score each Q&A pair individually (0-10)
+- Focus on what was actually said in the transcript
+
+Return ONLY valid JSON, no additional text."""
+
+
+def build_chunk_prompt(
+    analysis_prompt: str | None, qa_text: str, part: int, total_parts: int
+) -> str:
+    """Build the "map" prompt for one chunk of a long conversation."""
+    return (
+        f"The conversation below is part {part} of {total_parts} of a longer conversation. "
+        "Analyze only this part; the partial results will be merged afterwards.\n\n"
+        + build_analysis_prompt(analysis_prompt, qa_text)
+    )
+
+
+def build_reduce_prompt(
+    analysis_prompt: str | None, partial_insights: List[Dict[str, Any]]
+) -> str:
+    """
+    Build the "reduce" prompt that merges partial analyses into one result.
+
+    Args:
+        analysis_prompt: Custom analysis prompt, or None for the default prompt
+        partial_insights: Parsed JSON results of each chunk, in conversation order
+
+    Returns:
+        Prompt asking for one merged JSON analysis
+    """
+    instructions = build_analysis_prompt(
+        analysis_prompt, "(provided in parts - see the partial analyses below)"
+    )
+    partials_text = "\n\n".join(
+        f"Part {i + 1}:\n{json.dumps(partial, indent=2)}"
+        for i, partial in enumerate(partial_insights)
+    )
+    return f"""A long conversation was analyzed in {len(partial_insights)} consecutive parts.
+Merge the partial analyses into ONE final analysis of the whole conversation.
+
+Original analysis instructions:
+{instructions}
+
+Partial analyses (in conversation order):
+{partials_text}
+
+Rules for merging:
+- Follow the JSON structure requested in the original instructions exactly
+- Re-assess overall and competency scores for the whole conversation
+- Combine lists (strengths, weaknesses, ...) and remove duplicates
+- Keep every per-question assessment, in order
+- Prefer specific values (names, dates, ...) over "Unknown"
+
+Return ONLY valid JSON, no additional text."""
+
+
+def merge_partial_insights(partial_insights: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge partial analyses without an LLM call (used if the reduce call fails).
+
+    **Simple Explanation:**
+    Scores are averaged, lists are combined without duplicates, and question
+    assessments are concatenated in order. Other fields keep the first
+    non-empty value.
+
+    Args:
+        partial_insights: Parsed JSON results of each chunk, in conversation order
+
+    Returns:
+        Merged insights dictionary
+    """
+    merged: Dict[str, Any] = {}
+    scores: List[float] = []
+    competency_scores: Dict[str, List[float]] = {}
+
+    for partial in partial_insights:
+        for key, value in partial.items():
+            if key == "overall_score":
+                try:
+                    scores.append(float(value))
+                except (TypeError, ValueError):
+                    pass
+            elif key == "competency_scores" and isinstance(value, dict):
+                for name, score in value.items():
+                    try:
+                        competency_scores.setdefault(name, []).append(float(score))
+                    except (TypeError, ValueError):
+                        pass
+            elif isinstance(value, list):
+                existing = merged.setdefault(key, [])
+                if key == "question_assessments":
+                    existing.extend(value)
+                else:
+                    existing.extend(item for item in value if item not in existing)
+            elif key not in merged or merged[key] in (None, "", "Unknown"):
+                merged[key] = value
+
+    if scores:
+        merged["overall_score"] = sum(scores) / len(scores)
+    merged["competency_scores"] = {
+        name: sum(values) / len(values) for name, values in competency_scores.items()
+    }
+    return merged
+
+
+# Simple Explanation: All built-in prompt text, used in the insight cache key so that
+# changing any prompt in code automatically invalidates previously cached results.
+INSIGHTS_PROMPT_TEMPLATE = "\n".join(
+    [
+        SYSTEM_PROMPT_POSTHOG,
+        SYSTEM_PROMPT_OPENAI,
+        build_chunk_prompt(None, "{qa_text}", 0, 0),
+        build_reduce_prompt(None, []),
+    ]
+)
+
+
+def _extract_token_usage(response: Any) -> Tuple[int, int]:
+    """
+    Extract (prompt_tokens, completion_tokens) from an OpenAI response.
+
+    PostHog-wrapped responses may expose usage differently than regular OpenAI responses.
+    """
+    prompt_tokens = 0
+    completion_tokens = 0
+
+    # Try multiple ways to access usage data
+    usage = None
+    if hasattr(response, "usage") and response.usage:
+        usage = response.usage
+    elif hasattr(response, "_response") and hasattr(response._response, "usage"):
+        # PostHog might wrap the response
+        usage = response._response.usage
+    elif hasattr(response, "response") and hasattr(response.response, "usage"):
+        # Alternative wrapper structure
+        usage = response.response.usage
+
+    if usage:
+        # Try standard OpenAI usage attributes
+        prompt_tokens = getattr(usage, "prompt_tokens", 0) or 0
+        completion_tokens = getattr(usage, "completion_tokens", 0) or 0
+
+        # If standard attributes don't work, try alternative names
+        if prompt_tokens == 0 and completion_tokens == 0:
+            prompt_tokens = getattr(usage, "input_tokens", 0) or 0
+            completion_tokens = getattr(usage, "output_tokens", 0) or 0
+
+        if prompt_tokens == 0 and completion_tokens == 0:
+            logger.warning(
+                f"⚠️ Usage object found but no token counts extracted. Usage object: {usage}, attributes: {dir(usage)}"
+            )
+    else:
+        # Log response structure for debugging
+        logger.warning(
+            f"⚠️ No usage information found in OpenAI response. Response type: {type(response)}, attributes: {[attr for attr in dir(response) if not attr.startswith('_')]}"
+        )
+
+    return prompt_tokens, completion_tokens
+
 
 class ExtractInsightsStep(InterviewStep):
     """
@@ -73,7 +374,10 @@ class ExtractInsightsStep(InterviewStep):
         # all LLM calls to PostHog. If PostHog isn't configured, it returns a
         # regular OpenAI client without tracking.
         from flow.utils.posthog_config import get_posthog_llm_client
-        from flow.utils.usage_tracking import update_workflow_usage_cost
+        from flow.utils.usage_tracking import (
+            record_cache_hit,
+            update_workflow_usage_cost,
+        )
         from flow.utils.pricing import calculate_cost
         from flow.db import get_workflow_thread_data
 
@@ -91,11 +395,17 @@ class ExtractInsightsStep(InterviewStep):
         # - distinct_id (should be workflow_thread_id or unkey_key_id)
         # - timestamp (when the call was made)
         # - model name (e.g., "gpt-4.1")
+        # One read for both usage_stats (trace ID) and unkey_key_id (distinct ID)
+        thread_data = (
+            get_workflow_thread_data(
+                workflow_thread_id, fields=["usage_stats", "unkey_key_id"]
+            )
+            if workflow_thread_id
+            else None
+        )
         posthog_trace_id = None
-        if workflow_thread_id:
-            thread_data = get_workflow_thread_data(workflow_thread_id)
-            if thread_data and thread_data.get("usage_stats"):
-                posthog_trace_id = thread_data["usage_stats"].get("posthog_trace_id")
+        if thread_data and thread_data.get("usage_stats"):
+            posthog_trace_id = thread_data["usage_stats"].get("posthog_trace_id")
 
         if not posthog_trace_id:
             posthog_trace_id = str(uuid.uuid4())
@@ -105,140 +415,98 @@ class ExtractInsightsStep(InterviewStep):
         # Simple Explanation: distinct_id identifies who made the API call. We prefer
         # the API key ID (unkey_key_id) if available, otherwise use workflow_thread_id.
         posthog_distinct_id = workflow_thread_id or "unknown"
-        if workflow_thread_id:
-            thread_data = get_workflow_thread_data(workflow_thread_id)
-            if thread_data:
-                unkey_key_id = thread_data.get("unkey_key_id")
-                if unkey_key_id:
-                    posthog_distinct_id = unkey_key_id
+        if thread_data:
+            unkey_key_id = thread_data.get("unkey_key_id")
+            if unkey_key_id:
+                posthog_distinct_id = unkey_key_id
 
         try:
             # Build transcript text from Q&A pairs
-            qa_text = "\n\n".join(
-                [
-                    f"Q{i + 1}: {qa.get('question', '')}\nA{i + 1}: {qa.get('answer', '')}"
-                    for i, qa in enumerate(qa_pairs)
-                ]
+            qa_text = format_qa_pairs(qa_pairs)
+            estimated_tokens = estimate_tokens(qa_text)
+
+            # Simple Explanation: Short conversations are analyzed in one call. Long ones
+            # would hit the timeout or the model's context limit, so we split them into
+            # chunks, analyze the chunks in parallel, and merge the results (map-reduce).
+            use_map_reduce = (
+                len(qa_pairs) > 1
+                and estimated_tokens > INSIGHTS_MAP_REDUCE_THRESHOLD_TOKENS
             )
 
-            # Use custom analysis prompt if provided, otherwise use default
-            if analysis_prompt:
-                # User provided a custom prompt - inject the transcript into it
-                # Look for placeholders like {transcript} or {qa_text} or just append
-                if "{transcript}" in analysis_prompt:
-                    final_prompt = analysis_prompt.replace("{transcript}", qa_text)
-                elif "{qa_text}" in analysis_prompt:
-                    final_prompt = analysis_prompt.replace("{qa_text}", qa_text)
-                else:
-                    # No placeholder found - append transcript at the end
-                    final_prompt = (
-                        f"{analysis_prompt}\n\nConversation Transcript:\n{qa_text}"
-                    )
-            else:
-                # Default analysis prompt (generic, not interview-specific)
-                final_prompt = f"""Analyze this conversation transcript and provide a comprehensive assessment.
-
-Conversation Transcript:
-{qa_text}
-
-Please provide a JSON response with the following structure:
-{{
-    "overall_score": <number 0-10>,
-    "competency_scores": {{
-        "<competency_name>": <score 0-10>,
-        ...
-    }},
-    "strengths": ["<strength1>", "<strength2>", ...],
-    "weaknesses": ["<weakness1>", "<weakness2>", ...],
-    "question_assessments": [
-        {{
-            "question": "<question text>",
-            "answer": "<answer text>",
-            "score": <number 0-10>,
-            "notes": "<brief assessment notes>"
-        }},
-        ...
-    ]
-}}
-
-Guidelines:
-- Analyze the conversation objectively
-- Identify key themes, competencies, or topics discussed
-- Provide specific, constructive feedback
-- Score each Q&A pair individually (0-10)
-- Focus on what was actually said in the transcript
+            # Call OpenAI API with PostHog tracking
+            model_name = "gpt-4.1" if is_posthog_enabled else "gpt-4o"
+            posthog_properties = {
+                "workflow_thread_id": workflow_thread_id,
+                "room_name": room_name,
+                "step_name": "extract_insights",
+            }
+            if is_posthog_enabled:
+                logger.debug(
+                    f"📊 PostHog tracking parameters: distinct_id={posthog_distinct_id}, "
+                    f"trace_id={posthog_trace_id}, properties={posthog_properties}"
+                )
 
-Return ONLY valid JSON, no additional text."""
+            # Check the insight cache first
+            # Simple Explanation: Reprocessing the same transcript (webhook retries, resume
+            # after a crash) reuses the earlier result instead of paying for another LLM call.
+            cache_key = compute_insight_cache_key(
+                model_name, INSIGHTS_PROMPT_TEMPLATE, analysis_prompt, qa_text
+            )
+            cached = get_cached_insights(cache_key)
+            if cached is not None:
+                logger.info(
+                    f"⚡ Insight cache hit ({cache_key[:12]}) - skipping LLM call"
+                )
+                if workflow_thread_id:
+                    record_cache_hit(
+                        workflow_thread_id,
+                        "insights",
+                        saved_cost_usd=cached["cost_usd"],
+                        saved_tokens=cached["prompt_tokens"]
+                        + cached["completion_tokens"],
+                    )
+                return self._set_insights(state, cached["insights"], qa_pairs)
+
+            async def call_llm(
+                prompt: str, priority: int = PRIORITY_NORMAL
+            ) -> tuple[Any, str]:
+                return await self._call_llm(
+                    client,
+                    is_posthog_enabled,
+                    model_name,
+                    prompt,
+                    priority=priority,
+                    posthog_distinct_id=posthog_distinct_id,
+                    posthog_trace_id=posthog_trace_id,
+                    posthog_properties=posthog_properties,
+                )
 
-            # Call OpenAI API with PostHog tracking
-            timeout_seconds = 30
-            logger.info("🤖 Calling OpenAI API for analysis...")
-            model_name = None  # Will be set based on which client we use
             start_time = time.perf_counter()
             try:
-                if is_posthog_enabled:
-                    # Use PostHog-wrapped client with responses.create()
-                    # Simple Explanation: PostHog's wrapper uses responses.create() instead of
-                    # chat.completions.create(). We use the input parameter (same structure as messages)
-                    # PostHog automatically tracks all calls made through this client.
-                    # Note: response_format is not supported, so we rely on the prompt to request JSON format.
-                    # PostHog tracking parameters:
-                    # - posthog_distinct_id: Identifies the user/API key (required for tracking)
-                    # - posthog_trace_id: Optional trace ID for correlating events
-                    # - posthog_properties: Optional additional properties for the event
-                    posthog_properties = {
-                        "workflow_thread_id": workflow_thread_id,
-                        "room_name": room_name,
-                        "step_name": "extract_insights",
-                    }
-                    logger.debug(
-                        f"📊 PostHog tracking parameters: distinct_id={posthog_distinct_id}, "
-                        f"trace_id={posthog_trace_id}, properties={posthog_properties}"
+                if use_map_reduce:
+                    logger.info(
+                        f"🤖 Long transcript (~{estimated_tokens} tokens) - using map-reduce analysis"
                     )
-                    model_name = "gpt-4.1"
-                    response = await asyncio.wait_for(
-                        client.responses.create(
-                            model=model_name,
-                            input=[
-                                {
-                                    "role": "system",
-                                    "content": "You are an expert call evaluator. Always respond with valid JSON only.",
-                                },
-                                {"role": "user", "content": final_prompt},
-                            ],
-                            temperature=0.3,  # Lower temperature for more consistent analysis
-                            posthog_distinct_id=posthog_distinct_id,
-                            posthog_trace_id=posthog_trace_id,
-                            posthog_properties=posthog_properties,
-                        ),
-                        timeout=timeout_seconds,
+                    insights, responses = await self._analyze_map_reduce(
+                        qa_pairs, analysis_prompt, call_llm
                     )
                 else:
-                    # Fallback to regular OpenAI API (no PostHog tracking)
-                    model_name = "gpt-4o"
-                    response = await asyncio.wait_for(
-                        client.chat.completions.create(
-                            model=model_name,
-                            messages=[
-                                {
-                                    "role": "system",
-                                    "content": "You are an expert interview evaluator. Always respond with valid JSON only.",
-                                },
-                                {"role": "user", "content": final_prompt},
-                            ],
-                            temperature=0.3,  # Lower temperature for more consistent analysis
-                            response_format={"type": "json_object"},
-                        ),
-                        timeout=timeout_seconds,
+                    logger.info("🤖 Calling OpenAI API for analysis...")
+                    response, response_text = await call_llm(
+                        build_analysis_prompt(analysis_prompt, qa_text)
                     )
-                elapsed = time.perf_counter() - start_time
-                logger.info(f"🤖 OpenAI response received in {elapsed:.2f}s")
+                    insights = json.loads(response_text)
+                    responses = [response]
             except asyncio.TimeoutError:
                 elapsed = time.perf_counter() - start_time
-                error_msg = f"insights_error: timeout after {timeout_seconds}s"
+                error_msg = (
+                    f"insights_error: timeout after {INSIGHTS_TIMEOUT_SECONDS:.0f}s"
+                )
                 logger.error(f"❌ {error_msg} (waited {elapsed:.2f}s)")
                 state["error"] = error_msg
                 return state
+            except json.JSONDecodeError:
+                raise
             except Exception as call_error:
                 elapsed = time.perf_counter() - start_time
                 error_msg = f"insights_error: {call_error}"
@@ -249,66 +517,33 @@ Return ONLY valid JSON, no additional text."""
                 state["error"] = error_msg
                 return state
 
-            # Parse response
-            # Simple Explanation: PostHog-wrapped responses use output_text attribute
-            # instead of the standard OpenAI response structure. For fallback (non-PostHog),
-            # we still use the standard structure.
-            if is_posthog_enabled:
-                response_text = response.output_text
-            else:
-                response_text = response.choices[0].message.content
-            insights = json.loads(response_text)
-
-            # Extract token usage and calculate cost from OpenAI response
+            # Extract token usage and calculate cost from OpenAI responses
             # Simple Explanation: We extract token usage directly from OpenAI's response.usage
             # (standard OpenAI structure that works for both PostHog-wrapped and regular responses).
             # We calculate the cost ourselves using the pricing module, then save it to the database.
             # PostHog is only used for getting the trace ID (for correlation in PostHog dashboard).
+            # In map-reduce mode, usage is summed across every chunk call and the reduce call.
             cost_usd = 0.0
             actual_posthog_trace_id = None
 
-            # Extract token usage from OpenAI response
-            # PostHog-wrapped responses may expose usage differently than regular OpenAI responses
             prompt_tokens = 0
             completion_tokens = 0
+            for call_response in responses:
+                call_prompt_tokens, call_completion_tokens = _extract_token_usage(
+                    call_response
+                )
+                prompt_tokens += call_prompt_tokens
+                completion_tokens += call_completion_tokens
 
-            # Try multiple ways to access usage data
-            usage = None
-            if hasattr(response, "usage") and response.usage:
-                usage = response.usage
-            elif hasattr(response, "_response") and hasattr(
-                response._response, "usage"
-            ):
-                # PostHog might wrap the response
-                usage = response._response.usage
-            elif hasattr(response, "response") and hasattr(response.response, "usage"):
-                # Alternative wrapper structure
-                usage = response.response.usage
-
-            if usage:
-                # Try standard OpenAI usage attributes
-                prompt_tokens = getattr(usage, "prompt_tokens", 0) or 0
-                completion_tokens = getattr(usage, "completion_tokens", 0) or 0
-
-                # If standard attributes don't work, try alternative names
-                if prompt_tokens == 0 and completion_tokens == 0:
-                    prompt_tokens = getattr(usage, "input_tokens", 0) or 0
-                    completion_tokens = getattr(usage, "output_tokens", 0) or 0
-
-                if prompt_tokens > 0 or completion_tokens > 0:
-                    logger.info(
-                        f"📊 Token usage: {prompt_tokens} prompt + {completion_tokens} completion = {prompt_tokens + completion_tokens} total"
-                    )
-                else:
-                    logger.warning(
-                        f"⚠️ Usage object found but no token counts extracted. Usage object: {usage}, attributes: {dir(usage)}"
-                    )
-            else:
-                # Log response structure for debugging
-                logger.warning(
-                    f"⚠️ No usage information found in OpenAI response. Response type: {type(response)}, attributes: {[attr for attr in dir(response) if not attr.startswith('_')]}"
+            if prompt_tokens > 0 or completion_tokens > 0:
+                logger.info(
+                    f"📊 Token usage: {prompt_tokens} prompt + {completion_tokens} completion = {prompt_tokens + completion_tokens} total"
+                    f" ({len(responses)} call(s))"
                 )
 
+            # PostHog trace ID lookup uses the last response (the reduce call in map-reduce mode)
+            response = responses[-1]
+
             # Calculate cost from token usage
             if prompt_tokens > 0 or completion_tokens > 0:
                 try:
@@ -398,19 +633,17 @@ Return ONLY valid JSON, no additional text."""
                 state["error"] = error_msg
                 return state
 
-            state["insights"] = insights
-            state = self.update_status(state, "insights_extracted")
-            state.pop("error", None)
-
-            logger.info(f"✅ Extracted insights for {len(qa_pairs)} questions")
-            logger.info(f"   Overall Score: {insights.get('overall_score', 0.0)}/10")
-            logger.info(
-                f"   Competencies: {len(insights.get('competency_scores', {}))}"
+            # Cache the validated result so reprocessing this transcript is free
+            store_cached_insights(
+                cache_key,
+                model_name,
+                insights,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                cost_usd=cost_usd,
             )
-            logger.info(f"   Strengths: {len(insights.get('strengths', []))}")
-            logger.info(f"   Weaknesses: {len(insights.get('weaknesses', []))}")
 
-            return state
+            return self._set_insights(state, insights, qa_pairs)
 
         except json.JSONDecodeError as e:
             error_msg = f"insights_error: failed to parse AI response ({e})"
@@ -430,6 +663,176 @@ Return ONLY valid JSON, no additional text."""
             state["error"] = error_msg
             return state
 
+    def _set_insights(
+        self,
+        state: Dict[str, Any],
+        insights: Dict[str, Any],
+        qa_pairs: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Store validated insights in the state and mark the step as done.
+        """
+        state["insights"] = insights
+        state = self.update_status(state, "insights_extracted")
+        state.pop("error", None)
+
+        logger.info(f"✅ Extracted insights for {len(qa_pairs)} questions")
+        logger.info(f"   Overall Score: {insights.get('overall_score', 0.0)}/10")
+        logger.info(f"   Competencies: {len(insights.get('competency_scores', {}))}")
+        logger.info(f"   Strengths: {len(insights.get('strengths', []))}")
+        logger.info(f"   Weaknesses: {len(insights.get('weaknesses', []))}")
+
+        return state
+
+    async def _call_llm(
+        self,
+        client: Any,
+        is_posthog_enabled: bool,
+        model_name: str,
+        prompt: str,
+        posthog_distinct_id: str,
+        posthog_trace_id: str,
+        posthog_properties: Dict[str, Any],
+        priority: int = PRIORITY_NORMAL,
+    ) -> Tuple[Any, str]:
+        """
+        Make one analysis call to OpenAI.
+
+        **Simple Explanation:**
+        The call goes through the process-wide limiter for the model first (see
+        flow.utils.llm_limiter), which caps concurrency, requests/min and tokens/min
+        and retries rate limits. Each attempt then has INSIGHTS_TIMEOUT_SECONDS to
+        finish (time spent waiting in the limiter doesn't count against the timeout).
+
+        Returns:
+            Tuple of (raw response, response text)
+
+        Raises:
+            asyncio.TimeoutError: If the call takes longer than the timeout
+        """
+
+        async def attempt() -> Tuple[Any, str]:
+            start_time = time.perf_counter()
+            if is_posthog_enabled:
+                # Use PostHog-wrapped client with responses.create()
+                # Simple Explanation: PostHog's wrapper uses responses.create() instead of
+                # chat.completions.create(). We use the input parameter (same structure as messages)
+                # PostHog automatically tracks all calls made through this client.
+                # Note: response_format is not supported, so we rely on the prompt to request JSON format.
+                # PostHog tracking parameters:
+                # - posthog_distinct_id: Identifies the user/API key (required for tracking)
+                # - posthog_trace_id: Optional trace ID for correlating events
+                # - posthog_properties: Optional additional properties for the event
+                response = await asyncio.wait_for(
+                    client.responses.create(
+                        model=model_name,
+                        input=[
+                            {"role": "system", "content": SYSTEM_PROMPT_POSTHOG},
+                            {"role": "user", "content": prompt},
+                        ],
+                        temperature=0.3,  # Lower temperature for more consistent analysis
+                        posthog_distinct_id=posthog_distinct_id,
+                        posthog_trace_id=posthog_trace_id,
+                        posthog_properties=posthog_properties,
+                    ),
+                    timeout=INSIGHTS_TIMEOUT_SECONDS,
+                )
+                # PostHog-wrapped responses use output_text instead of choices
+                response_text = response.output_text
+            else:
+                # Fallback to regular OpenAI API (no PostHog tracking)
+                response = await asyncio.wait_for(
+                    client.chat.completions.create(
+                        model=model_name,
+                        messages=[
+                            {"role": "system", "content": SYSTEM_PROMPT_OPENAI},
+                            {"role": "user", "content": prompt},
+                        ],
+                        temperature=0.3,  # Lower temperature for more consistent analysis
+                        response_format={"type": "json_object"},
+                    ),
+                    timeout=INSIGHTS_TIMEOUT_SECONDS,
+                )
+                response_text = response.choices[0].message.content
+
+            elapsed = time.perf_counter() - start_time
+            logger.info(f"🤖 OpenAI response received in {elapsed:.2f}s")
+            return response, response_text
+
+        return await get_llm_limiter(model_name).call(
+            attempt,
+            estimated_tokens=estimate_tokens(prompt) + ESTIMATED_COMPLETION_TOKENS,
+            priority=priority,
+            usage=lambda result: sum(_extract_token_usage(result[0])),
+        )
+
+    async def _analyze_map_reduce(
+        self,
+        qa_pairs: List[Dict[str, Any]],
+        analysis_prompt: str | None,
+        call_llm: Callable[..., Awaitable[Tuple[Any, str]]],
+    ) -> Tuple[Dict[str, Any], List[Any]]:
+        """
+        Analyze a long conversation in chunks and merge the results.
+
+        **Simple Explanation:**
+        1. Map: split qa_pairs into chunks of INSIGHTS_CHUNK_TOKEN_BUDGET tokens and
+           analyze every chunk in parallel (limited by the shared LLM limiter).
+        2. Reduce: one more call merges the partial results into the final insights.
+           If that call fails, the partial results are merged without the LLM.
+
+        Args:
+            qa_pairs: All Q&A pairs, in order
+            analysis_prompt: Custom analysis prompt, or None for the default prompt
+            call_llm: Function that sends a prompt (and optional priority) and
+                returns (response, response_text)
+
+        Returns:
+            Tuple of (insights, list of raw responses for usage tracking)
+        """
+        chunks = chunk_qa_pairs(qa_pairs, INSIGHTS_CHUNK_TOKEN_BUDGET)
+        logger.info(f"   Map: analyzing {len(chunks)} chunks in parallel")
+
+        async def analyze_chunk(
+            part: int, start: int, chunk: List[Dict[str, Any]]
+        ) -> Tuple[Any, Dict[str, Any]]:
+            prompt = build_chunk_prompt(
+                analysis_prompt, format_qa_pairs(chunk, start=start), part, len(chunks)
+            )
+            response, response_text = await call_llm(prompt)
+            return response, json.loads(response_text)
+
+        results = await asyncio.gather(
+            *(
+                analyze_chunk(part, start, chunk)
+                for part, (start, chunk) in enumerate(chunks, start=1)
+            ),
+            return_exceptions=True,
+        )
+        # Every chunk is needed - a missing chunk would silently drop part of the call
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        chunk_results = cast(List[Tuple[Any, Dict[str, Any]]], results)
+        responses = [response for response, _ in chunk_results]
+        partial_insights = [partial for _, partial in chunk_results]
+
+        logger.info(f"   Reduce: merging {len(partial_insights)} partial analyses")
+        try:
+            # The reduce call goes first in the limiter queue: its chunks are already paid for
+            response, response_text = await call_llm(
+                build_reduce_prompt(analysis_prompt, partial_insights),
+                priority=PRIORITY_HIGH,
+            )
+            responses.append(response)
+            return json.loads(response_text), responses
+        except Exception as e:
+            logger.warning(
+                f"⚠️ Reduce call failed ({type(e).__name__}: {e}) - merging partial analyses directly"
+            )
+            return merge_partial_insights(partial_insights), responses
+
     def _validate_insights(
         self, insights: Dict[str, Any], qa_pairs: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
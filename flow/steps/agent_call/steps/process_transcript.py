@@ -6,7 +6,7 @@ Process Transcript Step
 
 This step handles the complete transcript processing pipeline:
 1. Downloads transcript from Daily.co
-2. Parses VTT format to extract text
+2. Streams and parses the VTT file to extract text
 3. Retrieves session data
 4. Generates AI summary
 5. Sends results via webhook/email
@@ -18,17 +18,66 @@ import json
 import logging
 import os
 import re
-from typing import Any, Dict, Tuple
-from urllib.parse import urlparse
+from typing import Any, Dict
 
 import httpx
 import resend
 
 from flow.steps.agent_call.steps.base import InterviewStep
+from flow.steps.agent_call.steps.email_templates import (
+    EMAIL_CANDIDATE_NAME,
+    EMAIL_PAGE_FOOT,
+    EMAIL_PAGE_HEAD,
+    SCORE_HIGHLIGHT_STYLE,
+    SUMMARY_ANSWER,
+    SUMMARY_H2,
+    SUMMARY_H3,
+    SUMMARY_H4,
+    SUMMARY_LIST_CLOSE,
+    SUMMARY_LIST_ITEM,
+    SUMMARY_LIST_OPEN,
+    SUMMARY_PARAGRAPH,
+    SUMMARY_QUESTION,
+    SUMMARY_SECTION_HEADER,
+    TRANSCRIPT_ASSISTANT_MESSAGE,
+    TRANSCRIPT_PLAIN_LINE,
+    TRANSCRIPT_TIMESTAMP_CLOSE,
+    TRANSCRIPT_TIMESTAMP_OPEN,
+    TRANSCRIPT_USER_MESSAGE,
+)
 from flow.steps.agent_call.steps.extract_insights import ExtractInsightsStep
+from flow.steps.agent_call.steps.result_sinks import (
+    DEFAULT_RESULT_SINKS,
+    ResultSink,
+    SinkContext,
+    run_result_sinks,
+)
+from flow.steps.agent_call.steps.transcript_parser import (
+    VTTTranscriptBuilder,
+    aiter_vtt_cues,
+    iter_vtt_cues,
+    tokenize_transcript,
+    transcript_records_to_dicts,
+)
+from flow.utils.workflow_thread_cache import workflow_thread_cache_scope
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns for summary formatting
+_SECTION_DIVIDER = "=" * 30
+_MARKDOWN_HEADER = re.compile(r"^#{1,3}\s+(.+)$")
+_MARKDOWN_LIST_ITEM = re.compile(r"^[-*]\s+(.+)$")
+_NUMBERED_LIST_ITEM = re.compile(r"^(\d+)\.\s+(.+)$")
+_QA_LINE = re.compile(r"^(Q|A|Question \d+):\s*(.+)$", re.IGNORECASE)
+_MARKDOWN_BOLD_STARS = re.compile(r"\*\*(.+?)\*\*")
+_MARKDOWN_BOLD_UNDERSCORES = re.compile(r"__(.+?)__")
+_MARKDOWN_ITALIC_STAR = re.compile(r"(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)")
+_MARKDOWN_ITALIC_UNDERSCORE = re.compile(r"(?<!_)_(?!_)(.+?)(?<!_)_(?!_)")
+_SCORE_OUT_OF_TEN = re.compile(r"(\d+\.?\d*)/10")
+_SCORE_OUT_OF_TEN_HTML = rf'<span style="{SCORE_HIGHLIGHT_STYLE}">\1/10</span>'
+_SCORE_LABEL = re.compile(r"Score:\s*(\d+\.?\d*)")
+_SCORE_LABEL_HTML = rf'Score: <span style="{SCORE_HIGHLIGHT_STYLE}">\1</span>'
+
 
 # Helper Functions
 
@@ -38,34 +87,19 @@ def parse_vtt_to_text(vtt_content: str) -> str:
     Parse VTT (WebVTT) format and extract plain text.
 
     Removes timestamps, metadata, and speaker labels to get just the text.
+    For downloads, prefer download_transcript_text, which streams the file and
+    keeps speaker labels.
     """
-    # Remove VTT header
-    text = re.sub(r"^WEBVTT.*\n", "", vtt_content, flags=re.MULTILINE)
-
-    # Remove timestamp lines (format: 00:00:00.000 --> 00:00:00.000)
-    text = re.sub(
-        r"\d{2}:\d{2}:\d{2}\.\d{3} --> \d{2}:\d{2}:\d{2}\.\d{3}.*\n",
-        "",
-        text,
-        flags=re.MULTILINE,
-    )
-
-    # Remove metadata lines (NOTE, STYLE, REGION)
-    text = re.sub(r"^(NOTE|STYLE|REGION).*\n", "", text, flags=re.MULTILINE)
-
-    # Remove speaker labels (<v Speaker>text</v>)
-    text = re.sub(r"<v\s+[^>]+>", "", text)
-    text = re.sub(r"</v>", "", text)
-
-    # Remove empty lines and join
-    lines = [line.strip() for line in text.split("\n") if line.strip()]
-    return " ".join(lines)
+    return " ".join(cue.text for cue in iter_vtt_cues(vtt_content.splitlines()))
 
 
 def parse_transcript_to_qa_pairs(transcript_text: str) -> list[Dict[str, Any]]:
     """
     Parse transcript text to extract Q&A pairs.
 
+    Lines are read from the shared tokenizer (see transcript_parser), so the
+    transcript is only parsed once for Q&A extraction and HTML rendering.
+
     Args:
         transcript_text: Full transcript text with timestamps and role labels
 
@@ -73,32 +107,14 @@ def parse_transcript_to_qa_pairs(transcript_text: str) -> list[Dict[str, Any]]:
         List of dictionaries with 'question' and 'answer' keys
     """
     qa_pairs = []
-    lines = transcript_text.strip().split("\n")
 
     current_question = None
     current_answer_parts = []
 
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-
-        # Match format: [timestamp] role: content
-        # Or simpler: role: content (if no timestamp)
-        # First try with timestamp: [timestamp] assistant: content
-        match = re.match(r"^\[.*?\]\s*(assistant|user):\s*(.+)$", line, re.IGNORECASE)
-        if match:
-            role = match.group(1).lower()
-            content = match.group(2)
-        else:
-            # Try without timestamp: assistant: content
-            match = re.match(r"^(assistant|user):\s*(.+)$", line, re.IGNORECASE)
-            if match:
-                role = match.group(1).lower()
-                content = match.group(2)
-            else:
-                # Skip lines that don't match the expected format
-                continue
+    for record in tokenize_transcript(transcript_text):
+        # Only lines labeled "assistant:" or "user:" (with or without [timestamp]) count
+        role = record.role
+        content = record.content
 
         if role and content:
             if role == "assistant":
@@ -193,213 +209,31 @@ async def get_transcript_download_link(transcript_id: str) -> str | None:
         return None
 
 
-async def download_transcript_vtt(download_link: str) -> str | None:
-    """Download VTT transcript file from the access link."""
-    try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(download_link)
-            response.raise_for_status()
-            return response.text
-
-    except Exception as e:
-        logger.error(f"❌ Error downloading VTT file: {e}", exc_info=True)
-        return None
-
-
-def validate_webhook_url(url: str) -> Tuple[bool, str | None]:
+async def download_transcript_text(download_link: str) -> str | None:
     """
-    Validate webhook URL format and structure.
-
-    Simple Explanation:
-    This function checks if a webhook URL is valid before we try to send data to it.
-    It makes sure the URL:
-    - Starts with http:// or https://
-    - Has a valid structure (can be parsed)
-    - Has a valid hostname (not empty)
+    Download a VTT transcript file and convert it to transcript text.
 
-    Args:
-        url: The URL string to validate
-
-    Returns:
-        Tuple of (is_valid, error_message)
-        - is_valid: True if URL is valid, False otherwise
-        - error_message: None if valid, or a descriptive error message if invalid
-    """
-    if not url or not isinstance(url, str):
-        return False, "URL must be a non-empty string"
-
-    url = url.strip()
-    if not url:
-        return False, "URL cannot be empty or whitespace only"
-
-    # Check if URL starts with http:// or https://
-    if not url.startswith("http://") and not url.startswith("https://"):
-        return False, "URL must start with http:// or https://"
-
-    # Parse the URL to validate structure
-    try:
-        parsed = urlparse(url)
-
-        # Check if scheme is valid
-        if parsed.scheme not in ["http", "https"]:
-            return False, f"Invalid URL scheme: {parsed.scheme}. Must be http or https"
-
-        # Check if hostname/netloc exists
-        if not parsed.netloc:
-            return False, "URL must have a valid hostname (e.g., example.com)"
-
-        # Check for common malformed patterns
-        if " " in url:
-            return False, "URL cannot contain spaces"
-
-        # Basic check for valid hostname characters
-        if parsed.netloc.startswith(".") or parsed.netloc.endswith("."):
-            return False, "Hostname cannot start or end with a dot"
-
-        return True, None
-
-    except Exception as e:
-        return False, f"Invalid URL format: {str(e)}"
-
-
-async def send_webhook(url: str, payload: dict[str, Any]) -> bool:
-    """
-    Send results to webhook URL with comprehensive error handling.
-
-    Simple Explanation:
-    This function sends data to a webhook URL (like a callback endpoint).
-    Before sending, it:
-    1. Validates the URL is properly formatted
-    2. Checks that the payload can be converted to JSON
-    3. Makes the HTTP request
-    4. Handles different types of errors gracefully
-
-    The function will never crash the workflow - it always returns True or False
-    to indicate success or failure, and logs detailed error information.
-
-    Args:
-        url: The webhook URL to send data to
-        payload: Dictionary of data to send (will be converted to JSON)
-
-    Returns:
-        True if webhook was sent successfully, False otherwise
+    **Simple Explanation:**
+    The file is streamed line by line into the WebVTT parser instead of being
+    loaded into memory first, so only the cue being read is held at a time.
+    Speaker labels from <v Speaker> tags are kept as "Speaker: text" lines.
     """
-    # Step 1: Validate URL format
-    is_valid, error_message = validate_webhook_url(url)
-    if not is_valid:
-        logger.warning(
-            f"⚠️ Invalid webhook URL: {url}. Reason: {error_message}. Skipping webhook."
-        )
-        return False
-
-    # Step 2: Validate payload can be serialized to JSON
-    try:
-        # Try to serialize the payload to check if it's valid JSON
-        json_payload = json.dumps(payload)
-        payload_size = len(json_payload)
-        logger.debug(f"📦 Webhook payload size: {payload_size} bytes")
-    except TypeError as e:
-        logger.error(
-            f"❌ Webhook payload contains non-serializable data: {e}. "
-            f"URL: {url}. Skipping webhook.",
-            exc_info=True,
-        )
-        return False
-    except Exception as e:
-        logger.error(
-            f"❌ Error serializing webhook payload: {e}. URL: {url}. Skipping webhook.",
-            exc_info=True,
-        )
-        return False
-
-    # Step 3: Send HTTP request with detailed error handling
     try:
+        builder = VTTTranscriptBuilder()
+        cue_count = 0
         async with httpx.AsyncClient() as client:
-            response = await client.post(
-                url,
-                json=payload,
-                headers={"Content-Type": "application/json"},
-                timeout=30.0,
-            )
-            response.raise_for_status()
-            logger.info(
-                f"✅ Webhook sent successfully to {url} (status: {response.status_code})"
-            )
-            return True
-
-    except httpx.HTTPStatusError as e:
-        # HTTP error (4xx, 5xx status codes)
-        status_code = e.response.status_code
-        response_body = None
-
-        # Try to get response body for debugging (truncate if too long)
-        try:
-            response_text = e.response.text
-            if response_text:
-                # Truncate long responses to avoid log spam
-                max_body_length = 500
-                if len(response_text) > max_body_length:
-                    response_body = response_text[:max_body_length] + "... (truncated)"
-                else:
-                    response_body = response_text
-        except Exception:
-            # If we can't read the response body, that's okay
-            pass
-
-        # Use different log levels based on error type
-        if 400 <= status_code < 500:
-            # Client errors (4xx) - likely configuration issue
-            log_msg = (
-                f"⚠️ Webhook returned client error {status_code} for {url}. "
-                f"This usually indicates a configuration issue with the webhook URL."
-            )
-            if response_body:
-                log_msg += f" Response: {response_body}"
-            logger.warning(log_msg)
-        else:
-            # Server errors (5xx) - temporary server issue
-            log_msg = (
-                f"❌ Webhook returned server error {status_code} for {url}. "
-                f"The webhook endpoint may be temporarily unavailable."
-            )
-            if response_body:
-                log_msg += f" Response: {response_body}"
-            logger.error(log_msg)
+            async with client.stream("GET", download_link) as response:
+                response.raise_for_status()
+                async for cue in aiter_vtt_cues(response.aiter_lines()):
+                    builder.add(cue)
+                    cue_count += 1
 
-        return False
-
-    except httpx.TimeoutException:
-        # Timeout error - request took too long
-        logger.error(
-            f"❌ Webhook request timed out after 30 seconds for {url}. "
-            f"The webhook endpoint may be slow or unreachable.",
-            exc_info=True,
-        )
-        return False
-
-    except httpx.ConnectError as e:
-        # Connection error - can't reach the server (DNS, network, etc.)
-        logger.error(
-            f"❌ Cannot connect to webhook URL {url}. "
-            f"This may indicate a network issue, DNS problem, or the server is down. "
-            f"Error: {str(e)}",
-            exc_info=True,
-        )
-        return False
-
-    except httpx.RequestError as e:
-        # Other request errors (network issues, etc.)
-        logger.error(
-            f"❌ Network error sending webhook to {url}: {str(e)}", exc_info=True
-        )
-        return False
+        logger.info(f"✅ Parsed {cue_count} VTT cues")
+        return builder.build()
 
     except Exception as e:
-        # Catch-all for any other unexpected errors
-        logger.error(
-            f"❌ Unexpected error sending webhook to {url}: {str(e)}", exc_info=True
-        )
-        return False
+        logger.error(f"❌ Error downloading VTT file: {e}", exc_info=True)
+        return None
 
 
 def format_json_summary_html(summary_json: Dict[str, Any]) -> str:
@@ -471,6 +305,41 @@ def format_json_summary_html(summary_json: Dict[str, Any]) -> str:
     return "\n".join(html_parts)
 
 
+def _render_transcript_html(
+    buffer: list[str], transcript_text: str, bot_name: str
+) -> None:
+    """Append transcript message HTML to a buffer (see format_transcript_html)."""
+    escape = html.escape
+    append = buffer.append
+    render_assistant = TRANSCRIPT_ASSISTANT_MESSAGE.render_into
+    render_user = TRANSCRIPT_USER_MESSAGE.render_into
+    render_plain = TRANSCRIPT_PLAIN_LINE.render_into
+    separator = ""
+
+    # Lines come from the shared tokenizer: [timestamp] SpeakerName: content
+    for timestamp, speaker_name, _role, content in tokenize_transcript(transcript_text):
+        append(separator)
+        separator = "\n"
+
+        if speaker_name is None:
+            # Plain text line - escape and add it
+            render_plain(buffer, escape(content))
+            continue
+
+        timestamp_html = ""
+        if timestamp:
+            # Format timestamp nicely (remove timezone and milliseconds)
+            clean_timestamp = timestamp.partition("+")[0].partition(".")[0]
+            timestamp_html = (
+                TRANSCRIPT_TIMESTAMP_OPEN + clean_timestamp + TRANSCRIPT_TIMESTAMP_CLOSE
+            )
+
+        # Assistant messages are the ones whose speaker name matches bot_name
+        # (escape content to prevent XSS)
+        render = render_assistant if speaker_name == bot_name else render_user
+        render(buffer, escape(speaker_name), timestamp_html, escape(content))
+
+
 def format_transcript_html(transcript_text: str, bot_name: str) -> str:
     """
     Format transcript text into HTML with alternating speaker colors.
@@ -480,6 +349,9 @@ def format_transcript_html(transcript_text: str, bot_name: str) -> str:
     - Timestamps styled subtly
     - Clear speaker labels using actual speaker names
 
+    Messages are rendered from precompiled templates into one list buffer (see
+    email_templates), so long transcripts only build the final string once.
+
     Args:
         transcript_text: The transcript text to format
         bot_name: The bot's name (used to identify assistant messages)
@@ -490,77 +362,9 @@ def format_transcript_html(transcript_text: str, bot_name: str) -> str:
     if not bot_name:
         return "<p><em>Error: Process transcript needs the bot config name.</em></p>"
 
-    lines = transcript_text.strip().split("\n")
-    html_parts = []
-
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-
-        # Match format: [timestamp] SpeakerName: content
-        # Or simpler: SpeakerName: content (if no timestamp)
-        timestamp_match = re.match(r"^\[(.+?)\]\s*([^:]+):\s*(.+)$", line)
-        if timestamp_match:
-            timestamp = timestamp_match.group(1)
-            speaker_name = timestamp_match.group(2).strip()
-            content = timestamp_match.group(3)
-        else:
-            # Try without timestamp
-            speaker_match = re.match(r"^([^:]+):\s*(.+)$", line)
-            if speaker_match:
-                timestamp = None
-                speaker_name = speaker_match.group(1).strip()
-                content = speaker_match.group(2)
-            else:
-                # Plain text line - escape and add it
-                escaped_line = html.escape(line)
-                html_parts.append(f"<p>{escaped_line}</p>")
-                continue
-
-        # Determine if this is an assistant message by comparing speaker name with bot_name
-        is_assistant = speaker_name == bot_name
-
-        # Determine speaker label and styling (using brand colors)
-        if is_assistant:
-            speaker_label = speaker_name  # Use actual bot name
-            bg_color = "#f0f4ff"
-            border_color = "#1f2de6"
-        else:
-            speaker_label = (
-                speaker_name  # Use actual participant name (no "User" fallback)
-            )
-            bg_color = "#f8f9fa"
-            border_color = "#64748b"
-
-        # Build HTML for this message
-        message_html = '<div style="margin-bottom: 12px; padding: 12px; background-color: {}; border-left: 3px solid {}; border-radius: 4px;">'.format(
-            bg_color, border_color
-        )
-
-        # Add speaker label and timestamp
-        header_style = "font-weight: 600; color: {}; font-size: 12px; margin-bottom: 6px; text-transform: uppercase; letter-spacing: 0.5px;".format(
-            border_color
-        )
-        message_html += f'<div style="{header_style}">{html.escape(speaker_label)}'
-        if timestamp:
-            # Format timestamp nicely (remove timezone if present)
-            clean_timestamp = timestamp.split("+")[0].split(".")[
-                0
-            ]  # Remove timezone and milliseconds
-            message_html += f' <span style="font-weight: 400; opacity: 0.7;">({clean_timestamp})</span>'
-        message_html += "</div>"
-
-        # Add content (escape HTML to prevent XSS)
-        escaped_content = html.escape(content)
-        message_html += (
-            f'<div style="color: #334155; line-height: 1.6;">{escaped_content}</div>'
-        )
-        message_html += "</div>"
-
-        html_parts.append(message_html)
-
-    return "\n".join(html_parts)
+    buffer: list[str] = []
+    _render_transcript_html(buffer, transcript_text, bot_name)
+    return "".join(buffer)
 
 
 def convert_markdown_to_html(text: str) -> str:
@@ -574,13 +378,17 @@ def convert_markdown_to_html(text: str) -> str:
     - ### Header -> <h3>Header</h3>
     - - list item -> <li>list item</li>
     """
+    # Skip the regexes entirely for lines without any markdown markers
+    if "*" not in text and "_" not in text:
+        return text
+
     # Convert bold (**text** or __text__)
-    text = re.sub(r"\*\*(.+?)\*\*", r"<strong>\1</strong>", text)
-    text = re.sub(r"__(.+?)__", r"<strong>\1</strong>", text)
+    text = _MARKDOWN_BOLD_STARS.sub(r"<strong>\1</strong>", text)
+    text = _MARKDOWN_BOLD_UNDERSCORES.sub(r"<strong>\1</strong>", text)
 
     # Convert italic (*text* or _text_)
-    text = re.sub(r"(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)", r"<em>\1</em>", text)
-    text = re.sub(r"(?<!_)_(?!_)(.+?)(?<!_)_(?!_)", r"<em>\1</em>", text)
+    text = _MARKDOWN_ITALIC_STAR.sub(r"<em>\1</em>", text)
+    text = _MARKDOWN_ITALIC_UNDERSCORE.sub(r"<em>\1</em>", text)
 
     return text
 
@@ -613,141 +421,129 @@ def format_summary_html(summary_text: str) -> str:
             logger.debug(f"Summary is not valid JSON: {e}, using text formatting")
             pass
 
-    lines = summary_text.split("\n")
-    html_parts = []
+    # Every element is appended after a "\n" separator (the first one is dropped
+    # at the end), so the output matches "\n".join(elements)
+    html_parts: list[str] = []
+    append = html_parts.append
+    escape = html.escape
     in_list = False
 
-    for line in lines:
+    for line in summary_text.split("\n"):
         line = line.strip()
 
         # Skip empty lines (but close lists if needed)
         if not line:
             if in_list:
-                html_parts.append("</ul>")
+                append("\n")
+                append(SUMMARY_LIST_CLOSE)
                 in_list = False
             continue
 
         # Check for section headers (lines with === or all caps)
-        if line.startswith("=" * 30):
+        if line.startswith(_SECTION_DIVIDER):
             # Section divider - skip it, we'll style the next line as a header
             continue
 
-        # Check if this looks like a header (all caps, short, or followed by ===)
-        is_header = (
-            line.isupper()
-            and len(line) < 80
-            and not line.startswith("Q:")
-            and not line.startswith("A:")
-        ) or line.endswith(":")
-
         # Check for Markdown headers (## Header or ### Header)
-        markdown_header_match = re.match(r"^#{1,3}\s+(.+)$", line)
+        markdown_header_match = _MARKDOWN_HEADER.match(line)
         if markdown_header_match:
             if in_list:
-                html_parts.append("</ul>")
+                append("\n")
+                append(SUMMARY_LIST_CLOSE)
                 in_list = False
             header_text = markdown_header_match.group(1).strip()
             header_level = len(line) - len(line.lstrip("#"))
-            escaped_header = html.escape(header_text)
             # Convert any markdown in header text
-            escaped_header = convert_markdown_to_html(escaped_header)
+            escaped_header = convert_markdown_to_html(escape(header_text))
+            append("\n")
             if header_level == 1:
-                html_parts.append(
-                    f'<h2 style="color: #1e293b; font-size: 20px; font-weight: 600; margin: 24px 0 12px 0; padding-bottom: 8px; border-bottom: 1px solid #e2e8f0;">{escaped_header}</h2>'
-                )
+                SUMMARY_H2.render_into(html_parts, escaped_header)
             elif header_level == 2:
-                html_parts.append(
-                    f'<h3 style="color: #1e293b; font-size: 18px; font-weight: 600; margin: 20px 0 10px 0;">{escaped_header}</h3>'
-                )
+                SUMMARY_H3.render_into(html_parts, escaped_header)
             else:
-                html_parts.append(
-                    f'<h4 style="color: #1e293b; font-size: 16px; font-weight: 600; margin: 16px 0 8px 0;">{escaped_header}</h4>'
-                )
+                SUMMARY_H4.render_into(html_parts, escaped_header)
             continue
 
         # Check for Markdown list items (- item or * item)
-        markdown_list_match = re.match(r"^[-*]\s+(.+)$", line)
+        markdown_list_match = _MARKDOWN_LIST_ITEM.match(line)
         if markdown_list_match:
             if not in_list:
-                html_parts.append('<ul style="margin: 12px 0; padding-left: 24px;">')
+                append("\n")
+                append(SUMMARY_LIST_OPEN)
                 in_list = True
             item_text = markdown_list_match.group(1).strip()
             # Escape HTML first, then convert markdown
-            escaped_item = html.escape(item_text)
-            escaped_item = convert_markdown_to_html(escaped_item)
-            html_parts.append(
-                f'<li style="margin-bottom: 8px; line-height: 1.6;">{escaped_item}</li>'
+            append("\n")
+            SUMMARY_LIST_ITEM.render_into(
+                html_parts, convert_markdown_to_html(escape(item_text))
             )
             continue
 
         # Check for numbered list items
-        list_match = re.match(r"^(\d+)\.\s+(.+)$", line)
-
-        # Check for Q&A format
-        qa_match = re.match(r"^(Q|A|Question \d+):\s*(.+)$", line, re.IGNORECASE)
-
+        list_match = _NUMBERED_LIST_ITEM.match(line)
         if list_match:
             if not in_list:
-                html_parts.append('<ul style="margin: 12px 0; padding-left: 24px;">')
+                append("\n")
+                append(SUMMARY_LIST_OPEN)
                 in_list = True
-            item_text = html.escape(list_match.group(2))
             # Convert markdown in numbered list items too
-            item_text = convert_markdown_to_html(item_text)
-            html_parts.append(
-                f'<li style="margin-bottom: 8px; line-height: 1.6;">{item_text}</li>'
+            append("\n")
+            SUMMARY_LIST_ITEM.render_into(
+                html_parts, convert_markdown_to_html(escape(list_match.group(2)))
             )
-        elif qa_match:
-            if in_list:
-                html_parts.append("</ul>")
-                in_list = False
-            qa_type = html.escape(qa_match.group(1))
-            qa_content = html.escape(qa_match.group(2))
+            continue
+
+        if in_list:
+            append("\n")
+            append(SUMMARY_LIST_CLOSE)
+            in_list = False
+
+        # Check for Q&A format
+        qa_match = _QA_LINE.match(line)
+        if qa_match:
+            qa_type = escape(qa_match.group(1))
+            qa_content = escape(qa_match.group(2))
+            append("\n")
             if qa_type.upper().startswith("Q"):
-                html_parts.append(
-                    f'<div style="margin: 16px 0 8px 0;"><strong style="color: #1f2de6;">{qa_type}:</strong> <span style="color: #1e293b;">{qa_content}</span></div>'
-                )
+                SUMMARY_QUESTION.render_into(html_parts, qa_type, qa_content)
             else:
-                html_parts.append(
-                    f'<div style="margin: 0 0 16px 20px; padding: 8px; background-color: #f8f9fa; border-left: 2px solid #e2e8f0; color: #475569;">{qa_content}</div>'
-                )
-        elif is_header and len(line) < 100:
-            if in_list:
-                html_parts.append("</ul>")
-                in_list = False
+                SUMMARY_ANSWER.render_into(html_parts, qa_content)
+            continue
+
+        # Check if this looks like a header (all caps, short, or ends with ":")
+        is_header = (
+            line.isupper()
+            and len(line) < 80
+            and not line.startswith("Q:")
+            and not line.startswith("A:")
+        ) or line.endswith(":")
+
+        if is_header and len(line) < 100:
             # Style as section header (using brand colors)
-            escaped_header = html.escape(line)
-            html_parts.append(
-                f'<h2 style="color: #1e293b; font-size: 18px; font-weight: 600; margin: 24px 0 12px 0; padding-bottom: 8px; border-bottom: 1px solid #e2e8f0;">{escaped_header}</h2>'
-            )
+            append("\n")
+            SUMMARY_SECTION_HEADER.render_into(html_parts, escape(line))
         else:
-            if in_list:
-                html_parts.append("</ul>")
-                in_list = False
             # Regular paragraph
             # Escape HTML first, then convert markdown, then highlight scores
-            escaped_line = html.escape(line)
-            # Convert markdown formatting (bold, italic)
-            formatted_line = convert_markdown_to_html(escaped_line)
+            formatted_line = convert_markdown_to_html(escape(line))
             # Highlight scores (e.g., "8.5/10" or "Score: 7.0")
-            formatted_line = re.sub(
-                r"(\d+\.?\d*)/10",
-                r'<span style="background-color: #fff3cd; padding: 2px 6px; border-radius: 3px; font-weight: 600;">\1/10</span>',
-                formatted_line,
-            )
-            formatted_line = re.sub(
-                r"Score:\s*(\d+\.?\d*)",
-                r'Score: <span style="background-color: #fff3cd; padding: 2px 6px; border-radius: 3px; font-weight: 600;">\1</span>',
-                formatted_line,
-            )
-            html_parts.append(
-                f'<p style="margin: 8px 0; line-height: 1.6; color: #334155;">{formatted_line}</p>'
-            )
+            if "/10" in formatted_line:
+                formatted_line = _SCORE_OUT_OF_TEN.sub(
+                    _SCORE_OUT_OF_TEN_HTML, formatted_line
+                )
+            if "Score:" in formatted_line:
+                formatted_line = _SCORE_LABEL.sub(_SCORE_LABEL_HTML, formatted_line)
+            append("\n")
+            SUMMARY_PARAGRAPH.render_into(html_parts, formatted_line)
 
     # Close any open list
     if in_list:
-        html_parts.append("</ul>")
+        append("\n")
+        append(SUMMARY_LIST_CLOSE)
 
-    return "\n".join(html_parts)
+    if html_parts:
+        html_parts[0] = ""
+    return "".join(html_parts)
 
 
 def generate_html_email(
@@ -775,9 +571,8 @@ def generate_html_email(
         insights: Optional insights dictionary
         bot_name: The bot's name (required for transcript formatting)
     """
-    # Format the summary and transcript
+    # Format the summary (the transcript is rendered into the page buffer below)
     summary_html = format_summary_html(summary_text)
-    transcript_html = format_transcript_html(transcript_text, bot_name)
 
     # Use sensible defaults if values are missing
     if not interview_type:
@@ -789,69 +584,30 @@ def generate_html_email(
         html.escape(str(candidate_name)) if candidate_name else None
     )
 
-    # Build the complete HTML email
-    # Use brand colors: #1f2de6 (brand blue), clean flat design
-    html_content = f"""<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{escaped_interview_type} Results</title>
-</head>
-<body style="margin: 0; padding: 0; font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif; background-color: #f8f9fa;">
-    <table role="presentation" style="width: 100%; border-collapse: collapse; background-color: #f8f9fa; padding: 20px;">
-        <tr>
-            <td align="center">
-                <table role="presentation" style="max-width: 600px; width: 100%; border-collapse: collapse; background-color: #ffffff; border-radius: 0; overflow: hidden; box-shadow: 0 1px 3px rgba(0,0,0,0.1);">
-                    <!-- Top Brand Line -->
-                    <tr>
-                        <td style="height: 4px; background-color: #1f2de6; width: 100%;"></td>
-                    </tr>
-                    <!-- Header -->
-                    <tr>
-                        <td style="background-color: #ffffff; padding: 32px 24px 24px 24px; border-bottom: 1px solid #e2e8f0;">
-                            <div style="margin-bottom: 16px;">
-                                <div style="font-weight: 700; font-size: 18px; line-height: 1.2; color: #1e293b; letter-spacing: -0.01em;">PailFlow</div>
-                                <div style="font-size: 10px; font-weight: 600; color: #94a3b8; text-transform: uppercase; letter-spacing: 0.1em; margin-top: 2px;">Workspace</div>
-                            </div>
-                            <h1 style="margin: 0; color: #1e293b; font-size: 22px; font-weight: 600; line-height: 1.3;">{escaped_interview_type} Complete</h1>
-                            {f'<p style="margin: 8px 0 0 0; color: #64748b; font-size: 14px; line-height: 1.5;">{escaped_candidate_name}</p>' if escaped_candidate_name else ""}
-                        </td>
-                    </tr>
-
-                    <!-- Summary Section -->
-                    <tr>
-                        <td style="padding: 32px 24px;">
-                            <div style="margin-bottom: 0;">
-                                {summary_html}
-                            </div>
-                        </td>
-                    </tr>
-
-                    <!-- Transcript Section -->
-                    <tr>
-                        <td style="padding: 0 24px 32px 24px;">
-                            <h2 style="color: #1e293b; font-size: 18px; font-weight: 600; margin: 0 0 16px 0; padding-bottom: 8px; border-bottom: 1px solid #e2e8f0;">Full Transcript</h2>
-                            <div style="max-height: 600px; overflow-y: auto; padding: 16px; background-color: #f8f9fa; border-radius: 6px; border: 1px solid #e2e8f0;">
-                                {transcript_html}
-                            </div>
-                        </td>
-                    </tr>
-
-                    <!-- Footer -->
-                    <tr>
-                        <td style="padding: 20px 24px; text-align: center; background-color: #ffffff; border-top: 1px solid #e2e8f0;">
-                            <p style="margin: 0; color: #94a3b8; font-size: 12px; font-weight: 500;">Sent by PailFlow</p>
-                        </td>
-                    </tr>
-                </table>
-            </td>
-        </tr>
-    </table>
-</body>
-</html>"""
-
-    return html_content
+    # Build the complete HTML email from the precompiled page template,
+    # rendering the transcript straight into the same buffer
+    buffer: list[str] = []
+    EMAIL_PAGE_HEAD.render_into(
+        buffer,
+        escaped_interview_type,
+        (
+            EMAIL_CANDIDATE_NAME.render(candidate_name=escaped_candidate_name)
+            if escaped_candidate_name
+            else ""
+        ),
+        summary_html,
+    )
+    if not transcript_text:
+        buffer.append("<p><em>No transcript available</em></p>")
+    elif not bot_name:
+        buffer.append(
+            "<p><em>Error: Process transcript needs the bot config name.</em></p>"
+        )
+    else:
+        _render_transcript_html(buffer, transcript_text, bot_name)
+    buffer.append(EMAIL_PAGE_FOOT)
+
+    return "".join(buffer)
 
 
 async def send_email(
@@ -940,11 +696,18 @@ class ProcessTranscriptStep(InterviewStep):
     Process transcript from Daily.co webhook.
     """
 
-    def __init__(self):
+    def __init__(self, sinks: list[ResultSink] | None = None):
+        """
+        Initialize the step.
+
+        Args:
+            sinks: Result delivery targets (defaults to webhook + email)
+        """
         super().__init__(
             name="process_transcript",
             description="Download and process transcript from Daily.co",
         )
+        self.sinks = sinks if sinks is not None else DEFAULT_RESULT_SINKS
 
     async def execute(self, state: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -960,6 +723,12 @@ class ProcessTranscriptStep(InterviewStep):
         Returns:
             Updated state with transcript_text, summary, and delivery status
         """
+        # Each workflow_threads row is read from the database once per run
+        with workflow_thread_cache_scope():
+            return await self._execute_pipeline(state)
+
+    async def _execute_pipeline(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the transcript processing pipeline (see execute)."""
         logger.info("=" * 80)
         logger.info("🎬 Starting transcript processing pipeline")
         logger.info("=" * 80)
@@ -987,7 +756,9 @@ class ProcessTranscriptStep(InterviewStep):
             if workflow_thread_id:
                 from flow.db import get_workflow_thread_data
 
-                workflow_thread_data = get_workflow_thread_data(workflow_thread_id)
+                workflow_thread_data = get_workflow_thread_data(
+                    workflow_thread_id, fields=["transcript_text"]
+                )
                 if workflow_thread_data and workflow_thread_data.get("transcript_text"):
                     transcript_text = workflow_thread_data.get("transcript_text")
                     logger.info(
@@ -1023,18 +794,13 @@ class ProcessTranscriptStep(InterviewStep):
 
                 logger.info("✅ Got download link")
 
-                # Step 3: Download VTT file
-                logger.info("\n📄 STEP 3: Downloading VTT file")
-                vtt_content = await download_transcript_vtt(download_link)
+                # Steps 3-4: Stream the VTT file and extract text as it downloads
+                logger.info("\n📄 STEP 3-4: Downloading and parsing VTT file")
+                transcript_text = await download_transcript_text(download_link)
 
-                if not vtt_content:
+                if transcript_text is None:
                     return self.set_error(state, "Failed to download VTT file")
 
-                logger.info(f"✅ Downloaded VTT ({len(vtt_content)} chars)")
-
-                # Step 4: Parse VTT to extract text
-                logger.info("\n🔤 STEP 4: Extracting text from VTT")
-                transcript_text = parse_vtt_to_text(vtt_content)
                 logger.info(f"✅ Extracted text ({len(transcript_text)} chars)")
 
                 # Save transcript_text to workflow_threads (for non-bot case, bot already saves it)
@@ -1045,7 +811,7 @@ class ProcessTranscriptStep(InterviewStep):
                     )
 
                     workflow_thread_data = (
-                        get_workflow_thread_data(workflow_thread_id) or {}
+                        get_workflow_thread_data(workflow_thread_id, fresh=True) or {}
                     )
                     workflow_thread_data["workflow_thread_id"] = workflow_thread_id
                     workflow_thread_data["transcript_text"] = transcript_text
@@ -1063,14 +829,10 @@ class ProcessTranscriptStep(InterviewStep):
 
             if not workflow_thread_id:
                 # Try to find workflow_thread_id by room_name
-                from flow.db import get_workflow_threads_by_room_name
+                from flow.db import get_paused_workflow_thread_id
 
-                threads = get_workflow_threads_by_room_name(room_name)
                 # Get the most recent paused workflow thread
-                for thread in threads:
-                    if thread.get("workflow_paused"):
-                        workflow_thread_id = thread.get("workflow_thread_id")
-                        break
+                workflow_thread_id = get_paused_workflow_thread_id(room_name)
 
             if workflow_thread_id:
                 from flow.db import get_workflow_thread_data
@@ -1145,13 +907,8 @@ class ProcessTranscriptStep(InterviewStep):
                     "   Continuing with processing to ensure email/webhook are sent..."
                 )
 
-            webhook_callback_url = session_data.get("webhook_callback_url")
-            email_results_to = session_data.get("email_results_to") or session_data.get(
-                "email"
-            )
-
             # Note: email_already_sent and webhook_already_sent are already checked above
-            # using the processing_status_by_key structure
+            # Destinations (webhook_callback_url, email_results_to) are read by the result sinks
 
             # Build participant_info from session_data
             # Use email from session_data (renamed from candidate_email)
@@ -1173,9 +930,15 @@ class ProcessTranscriptStep(InterviewStep):
             }
 
             # Step 6: Parse transcript to extract Q&A pairs
+            # Simple Explanation: The transcript is tokenized once here; Q&A extraction,
+            # the webhook payload and the HTML email all reuse the same records.
             logger.info("\n📝 STEP 6: Parsing transcript to extract Q&A pairs")
+            transcript_records = tokenize_transcript(transcript_text)
             qa_pairs = parse_transcript_to_qa_pairs(transcript_text)
-            logger.info(f"✅ Extracted {len(qa_pairs)} Q&A pairs from transcript")
+            logger.info(
+                f"✅ Extracted {len(qa_pairs)} Q&A pairs from transcript "
+                f"({len(transcript_records)} lines)"
+            )
 
             if not qa_pairs:
                 logger.warning(
@@ -1245,6 +1008,7 @@ class ProcessTranscriptStep(InterviewStep):
                 "room_name": room_name,
                 "duration_seconds": duration,
                 "transcript_text": transcript_text,
+                "transcript_segments": transcript_records_to_dicts(transcript_records),
                 "summary": candidate_summary,
             }
 
@@ -1256,155 +1020,41 @@ class ProcessTranscriptStep(InterviewStep):
                     f"Error processing insights for this call: {insights_error}"
                 )
 
-            # Send webhook (only if not already sent)
-            webhook_sent = False
-            if webhook_callback_url and not webhook_already_sent:
-                logger.info(f"🔗 Sending webhook to: {webhook_callback_url}")
-                webhook_sent = await send_webhook(webhook_callback_url, results_payload)
-
-                # Note: webhook_sent status will be saved at the end with all other processing results
-                # No need to save individually here - we'll save everything together
-            elif webhook_already_sent:
-                logger.info("🔗 Webhook already sent - skipping duplicate")
-                webhook_sent = True  # Mark as sent since it was already sent
-            elif not webhook_callback_url:
-                logger.info("🔗 No webhook URL configured - skipping webhook")
-
-            state["webhook_sent"] = webhook_sent
-
-            # Send email (only if not already sent)
-            email_sent = False
-            if email_results_to and not email_already_sent:
-                logger.info(f"📧 Sending email to: {email_results_to}")
-
-                # Try to extract name from insights if available
-                # The insights might have person_name (from lead qualification) or the name might be in the summary JSON
-                email_candidate_name = "Unknown"
-                insights = state.get("insights", {})
-
-                # Check if insights has person_name (for lead qualification flows)
-                if insights and isinstance(insights, dict):
-                    extracted_name = insights.get("person_name")
-                    if (
-                        extracted_name
-                        and extracted_name != "Unknown"
-                        and extracted_name.strip()
-                    ):
-                        email_candidate_name = extracted_name
-                        logger.info(
-                            f"   📝 Using extracted name from insights: {email_candidate_name}"
-                        )
-
-                # Also try to extract from summary JSON if it's a lead qualification summary
-                # The summary might be JSON with lead.name field
-                if email_candidate_name == "Unknown" and candidate_summary:
-                    try:
-                        # Try to parse JSON from summary (lead qualification summaries are JSON)
-                        summary_json = json.loads(candidate_summary.strip())
-                        if isinstance(summary_json, dict):
-                            lead_info = summary_json.get("lead", {})
-                            if isinstance(lead_info, dict):
-                                lead_name = lead_info.get("name")
-                                if (
-                                    lead_name
-                                    and lead_name != "Unknown"
-                                    and lead_name.strip()
-                                ):
-                                    email_candidate_name = lead_name
-                                    logger.info(
-                                        f"   📝 Using extracted name from summary JSON: {email_candidate_name}"
-                                    )
-                    except (json.JSONDecodeError, AttributeError):
-                        # Summary is not JSON, that's fine - use the name we have
-                        pass
-
-                # Ensure we have valid values (not None)
-                email_candidate_name = (
-                    email_candidate_name if email_candidate_name else "Unknown"
-                )
+            # Deliver to all sinks (webhook, email, ...) concurrently
+            # Simple Explanation: Each sink is independent, so they run at the same time.
+            # Sinks that already succeeded on an earlier run are skipped. The webhook sink
+            # only records the event in the outbox; delivery happens separately with retries.
+            sink_context = SinkContext(
+                results_payload=results_payload,
+                session_data=session_data,
+                room_name=room_name,
+                workflow_thread_id=workflow_thread_id,
+                transcript_text=transcript_text or "",
+                candidate_summary=candidate_summary,
+                insights=state.get("insights") or {},
+                bot_name=bot_name,
+            )
+            delivery_status = await run_result_sinks(
+                self.sinks,
+                sink_context,
+                already_sent={
+                    "webhook_sent": webhook_already_sent,
+                    "email_sent": email_already_sent,
+                },
+            )
+            for sink in self.sinks:
+                state[sink.status_field] = delivery_status[sink.name]["sent"]
+            state["delivery_status"] = delivery_status
+            webhook_sent = state.get("webhook_sent", webhook_already_sent)
+            email_sent = state.get("email_sent", email_already_sent)
 
-                # If we have a valid name (not "Unknown"), update the summary JSON/text to replace "Unknown" with the actual name
-                # This ensures the email body shows the correct name, not "Unknown"
-                email_summary = candidate_summary
-                if email_candidate_name != "Unknown" and candidate_summary:
-                    try:
-                        # Try to parse and update JSON summary (for lead qualification)
-                        summary_json = json.loads(candidate_summary.strip())
-                        if isinstance(summary_json, dict):
-                            # Check if there's a lead.name field that needs updating
-                            lead_info = summary_json.get("lead", {})
-                            if (
-                                isinstance(lead_info, dict)
-                                and lead_info.get("name") == "Unknown"
-                            ):
-                                # Update the name in the JSON
-                                summary_json["lead"]["name"] = email_candidate_name
-                                # Re-serialize the JSON with proper formatting
-                                email_summary = json.dumps(summary_json, indent=2)
-                                logger.info(
-                                    f"   📝 Updated summary JSON to use name: {email_candidate_name}"
-                                )
-                            # Also check for other name fields that might be "Unknown"
-                            elif (
-                                "name" in summary_json
-                                and summary_json.get("name") == "Unknown"
-                            ):
-                                summary_json["name"] = email_candidate_name
-                                email_summary = json.dumps(summary_json, indent=2)
-                                logger.info(
-                                    f"   📝 Updated summary JSON name field: {email_candidate_name}"
-                                )
-                    except (json.JSONDecodeError, AttributeError, TypeError):
-                        # Summary is not JSON or couldn't be updated, try text replacement
-                        if "Unknown" in candidate_summary:
-                            # Replace "Unknown" with the extracted name in the summary text
-                            # Be careful to only replace when it's clearly a name field
-                            email_summary = candidate_summary.replace(
-                                '"name": "Unknown"', f'"name": "{email_candidate_name}"'
-                            )
-                            email_summary = email_summary.replace(
-                                "name: Unknown", f"name: {email_candidate_name}"
-                            )
-                            email_summary = email_summary.replace(
-                                "Participant: Unknown",
-                                f"Participant: {email_candidate_name}",
-                            )
-                            email_summary = email_summary.replace(
-                                "Candidate: Unknown",
-                                f"Candidate: {email_candidate_name}",
-                            )
-                            logger.info(
-                                f"   📝 Updated summary text to use name: {email_candidate_name}"
-                            )
-
-                # Generate subject: "Session Complete" (generic, not interview-specific)
-                subject = "Session Complete"
-                if email_candidate_name != "Unknown":
-                    subject = f"{subject}: {email_candidate_name}"
-
-                logger.info(f"   Subject: {subject}")
-
-                email_transcript = transcript_text if transcript_text else ""
-
-                email_sent = await send_email(
-                    to_email=email_results_to,
-                    subject=subject,
-                    body=email_summary,  # Summary text (may have been updated with extracted name)
-                    candidate_name=email_candidate_name,
-                    interview_type="Session",  # Generic "Session" instead of interview_type
-                    transcript_text=email_transcript,  # Transcript formatted separately
-                    insights=insights,  # Include insights for potential JSON formatting
-                    bot_name=bot_name,  # Bot name for transcript formatting
+            logger.info(
+                "   Delivery: "
+                + ", ".join(
+                    f"{name}={result['status']} ({result['duration_ms']}ms)"
+                    for name, result in delivery_status.items()
                 )
-
-                # Note: email_sent status will be saved at the end with all other processing results
-                # No need to save individually here - we'll save everything together
-            elif email_already_sent:
-                logger.info("📧 Email already sent - skipping duplicate")
-            elif not email_results_to:
-                logger.info("📧 No email address configured - skipping email")
-
-            state["email_sent"] = email_sent
+            )
 
             # Save all important fields to workflow_threads after processing completes
             # Simple Explanation: All data is saved to workflow_threads table, organized by workflow_thread_id.
@@ -1413,7 +1063,9 @@ class ProcessTranscriptStep(InterviewStep):
                 from flow.db import save_workflow_thread_data, get_workflow_thread_data
 
                 # Get existing thread data or create new
-                thread_data = get_workflow_thread_data(workflow_thread_id) or {}
+                thread_data = (
+                    get_workflow_thread_data(workflow_thread_id, fresh=True) or {}
+                )
 
                 # Update with all the data we have
                 thread_data.update(
@@ -1432,6 +1084,7 @@ class ProcessTranscriptStep(InterviewStep):
                         "transcript_processing": False,
                         "email_sent": email_sent,
                         "webhook_sent": webhook_sent,
+                        "delivery_status": delivery_status,
                         "candidate_summary": candidate_summary
                         or thread_data.get("candidate_summary"),
                         "insights": state.get("insights")
@@ -1497,7 +1150,7 @@ class ProcessTranscriptStep(InterviewStep):
                     )
 
                     workflow_thread_data = (
-                        get_workflow_thread_data(workflow_thread_id) or {}
+                        get_workflow_thread_data(workflow_thread_id, fresh=True) or {}
                     )
                     workflow_thread_data["workflow_thread_id"] = workflow_thread_id
                     workflow_thread_data["transcript_processing"] = False
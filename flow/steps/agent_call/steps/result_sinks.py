@@ -0,0 +1,295 @@
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Result Sinks
+
+Delivery targets for processed session results (webhook, email, ...).
+
+**Simple Explanation:**
+After a transcript is processed, the results go out to one or more "sinks".
+Each sink is independent, so ProcessTranscriptStep runs them all at the same
+time with `asyncio.gather` instead of one after another. Every sink reports its
+status and how long it took, and the step saves all of that in one update.
+
+To add a new destination (for example Slack), subclass ResultSink and pass it to
+ProcessTranscriptStep(sinks=[...]).
+"""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SinkContext:
+    """Everything a sink may need to deliver results for one workflow run."""
+
+    results_payload: Dict[str, Any]
+    session_data: Dict[str, Any]
+    room_name: str
+    workflow_thread_id: str | None = None
+    transcript_text: str = ""
+    candidate_summary: str = ""
+    insights: Dict[str, Any] = field(default_factory=dict)
+    bot_name: str | None = None
+
+
+class ResultSink(ABC):
+    """
+    Base class for result delivery targets.
+
+    Attributes:
+        name: Short name used in delivery_status (e.g. "webhook")
+        status_field: workflow_threads flag that records a successful send
+            (e.g. "webhook_sent"), used to skip duplicates on reprocessing
+    """
+
+    name: str = ""
+    status_field: str = ""
+
+    @abstractmethod
+    def is_configured(self, context: SinkContext) -> bool:
+        """Return True if this sink has a destination for this workflow run."""
+
+    @abstractmethod
+    async def send(self, context: SinkContext) -> bool:
+        """Deliver the results. Return True on success."""
+
+
+class WebhookSink(ResultSink):
+    """Records the results in the webhook outbox (delivered separately with retries)."""
+
+    name = "webhook"
+    status_field = "webhook_sent"
+
+    def is_configured(self, context: SinkContext) -> bool:
+        return bool(context.session_data.get("webhook_callback_url"))
+
+    def _idempotency_key(self, context: SinkContext) -> str:
+        """
+        Build the outbox key for this run's session_complete event.
+
+        **Simple Explanation:**
+        The key must name this run, not the room: rooms are reused, so a
+        room-based key would mark every later session in that room as already
+        delivered. Without a workflow thread, the Daily.co transcript ID names
+        the run; if there is none, a fresh ID is used (a retried run may then
+        send again, but a new session is never dropped).
+        """
+        run_id = (
+            context.workflow_thread_id
+            or context.results_payload.get("transcript_id")
+            or f"run-{uuid.uuid4()}"
+        )
+        return f"session_complete:{run_id}"
+
+    async def send(self, context: SinkContext) -> bool:
+        from flow.jobs.webhook_outbox import enqueue_webhook
+
+        webhook_callback_url = context.session_data["webhook_callback_url"]
+        logger.info(f"🔗 Queueing webhook to: {webhook_callback_url}")
+        return await enqueue_webhook(
+            webhook_callback_url,
+            context.results_payload,
+            idempotency_key=self._idempotency_key(context),
+            workflow_thread_id=context.workflow_thread_id,
+        )
+
+
+class EmailSink(ResultSink):
+    """Sends the HTML results email via Resend."""
+
+    name = "email"
+    status_field = "email_sent"
+
+    def _recipient(self, context: SinkContext) -> str | None:
+        return context.session_data.get("email_results_to") or context.session_data.get(
+            "email"
+        )
+
+    def is_configured(self, context: SinkContext) -> bool:
+        return bool(self._recipient(context))
+
+    async def send(self, context: SinkContext) -> bool:
+        from flow.steps.agent_call.steps.process_transcript import send_email
+
+        email_results_to = self._recipient(context)
+        logger.info(f"📧 Sending email to: {email_results_to}")
+
+        email_candidate_name, email_summary = resolve_email_name_and_summary(
+            context.insights, context.candidate_summary
+        )
+
+        # Generate subject: "Session Complete" (generic, not interview-specific)
+        subject = "Session Complete"
+        if email_candidate_name != "Unknown":
+            subject = f"{subject}: {email_candidate_name}"
+
+        logger.info(f"   Subject: {subject}")
+
+        return await send_email(
+            to_email=email_results_to,
+            subject=subject,
+            body=email_summary,  # Summary text (may have been updated with extracted name)
+            candidate_name=email_candidate_name,
+            interview_type="Session",  # Generic "Session" instead of interview_type
+            transcript_text=context.transcript_text or "",
+            insights=context.insights,  # Include insights for potential JSON formatting
+            bot_name=context.bot_name,  # Bot name for transcript formatting
+        )
+
+
+def resolve_email_name_and_summary(
+    insights: Dict[str, Any] | None, candidate_summary: str
+) -> tuple[str, str]:
+    """
+    Find the participant's name for the email and fill it into the summary.
+
+    **Simple Explanation:**
+    The name may come from insights (person_name, for lead qualification flows) or
+    from a JSON summary (lead.name). If we find one, we also replace "Unknown"
+    placeholders in the summary so the email body shows the real name.
+
+    Args:
+        insights: Insights dictionary (may be empty)
+        candidate_summary: Summary text (plain text or JSON)
+
+    Returns:
+        Tuple of (name or "Unknown", summary for the email body)
+    """
+    email_candidate_name = "Unknown"
+
+    # Check if insights has person_name (for lead qualification flows)
+    if insights and isinstance(insights, dict):
+        extracted_name = insights.get("person_name")
+        if extracted_name and extracted_name != "Unknown" and extracted_name.strip():
+            email_candidate_name = extracted_name
+            logger.info(
+                f"   📝 Using extracted name from insights: {email_candidate_name}"
+            )
+
+    # Also try to extract from summary JSON if it's a lead qualification summary
+    # The summary might be JSON with lead.name field
+    if email_candidate_name == "Unknown" and candidate_summary:
+        try:
+            summary_json = json.loads(candidate_summary.strip())
+            if isinstance(summary_json, dict):
+                lead_info = summary_json.get("lead", {})
+                if isinstance(lead_info, dict):
+                    lead_name = lead_info.get("name")
+                    if lead_name and lead_name != "Unknown" and lead_name.strip():
+                        email_candidate_name = lead_name
+                        logger.info(
+                            f"   📝 Using extracted name from summary JSON: {email_candidate_name}"
+                        )
+        except (json.JSONDecodeError, AttributeError):
+            # Summary is not JSON, that's fine - use the name we have
+            pass
+
+    # If we have a valid name (not "Unknown"), update the summary JSON/text to replace "Unknown" with the actual name
+    # This ensures the email body shows the correct name, not "Unknown"
+    email_summary = candidate_summary
+    if email_candidate_name != "Unknown" and candidate_summary:
+        try:
+            # Try to parse and update JSON summary (for lead qualification)
+            summary_json = json.loads(candidate_summary.strip())
+            if isinstance(summary_json, dict):
+                lead_info = summary_json.get("lead", {})
+                if isinstance(lead_info, dict) and lead_info.get("name") == "Unknown":
+                    summary_json["lead"]["name"] = email_candidate_name
+                    email_summary = json.dumps(summary_json, indent=2)
+                    logger.info(
+                        f"   📝 Updated summary JSON to use name: {email_candidate_name}"
+                    )
+                # Also check for other name fields that might be "Unknown"
+                elif "name" in summary_json and summary_json.get("name") == "Unknown":
+                    summary_json["name"] = email_candidate_name
+                    email_summary = json.dumps(summary_json, indent=2)
+                    logger.info(
+                        f"   📝 Updated summary JSON name field: {email_candidate_name}"
+                    )
+        except (json.JSONDecodeError, AttributeError, TypeError):
+            # Summary is not JSON or couldn't be updated, try text replacement
+            if "Unknown" in candidate_summary:
+                # Be careful to only replace when it's clearly a name field
+                email_summary = candidate_summary.replace(
+                    '"name": "Unknown"', f'"name": "{email_candidate_name}"'
+                )
+                email_summary = email_summary.replace(
+                    "name: Unknown", f"name: {email_candidate_name}"
+                )
+                email_summary = email_summary.replace(
+                    "Participant: Unknown", f"Participant: {email_candidate_name}"
+                )
+                email_summary = email_summary.replace(
+                    "Candidate: Unknown", f"Candidate: {email_candidate_name}"
+                )
+                logger.info(
+                    f"   📝 Updated summary text to use name: {email_candidate_name}"
+                )
+
+    return email_candidate_name, email_summary
+
+
+DEFAULT_RESULT_SINKS: list[ResultSink] = [WebhookSink(), EmailSink()]
+
+
+async def _run_sink(
+    sink: ResultSink, context: SinkContext, already_sent: bool
+) -> Dict[str, Any]:
+    """Run one sink and describe the outcome (never raises)."""
+    if already_sent:
+        logger.info(f"   {sink.name}: already sent - skipping duplicate")
+        return {"status": "already_sent", "sent": True, "duration_ms": 0}
+
+    if not sink.is_configured(context):
+        logger.info(f"   {sink.name}: not configured - skipping")
+        return {"status": "not_configured", "sent": False, "duration_ms": 0}
+
+    start = time.perf_counter()
+    try:
+        sent = await sink.send(context)
+        result: Dict[str, Any] = {"status": "sent" if sent else "failed", "sent": sent}
+    except Exception as e:
+        logger.error(f"❌ Result sink '{sink.name}' failed: {e}", exc_info=True)
+        result = {"status": "error", "sent": False, "error": str(e)}
+
+    result["duration_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    return result
+
+
+async def run_result_sinks(
+    sinks: list[ResultSink],
+    context: SinkContext,
+    already_sent: Dict[str, bool],
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Run all sinks concurrently.
+
+    **Simple Explanation:**
+    Sinks run at the same time, so total delivery time is the slowest sink rather
+    than the sum of all of them. A failing sink never stops the others.
+
+    Args:
+        sinks: Sinks to run
+        context: Results and session data for this workflow run
+        already_sent: status_field -> True for sinks that already succeeded earlier
+
+    Returns:
+        Dictionary of sink name -> {"status", "sent", "duration_ms", ["error"]}
+    """
+    outcomes = await asyncio.gather(
+        *(
+            _run_sink(sink, context, already_sent.get(sink.status_field, False))
+            for sink in sinks
+        )
+    )
+    return {sink.name: outcome for sink, outcome in zip(sinks, outcomes)}
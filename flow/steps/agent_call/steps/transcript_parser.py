@@ -0,0 +1,316 @@
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Transcript Parser
+
+Single-pass tokenizer for transcript text.
+
+**Simple Explanation:**
+Transcripts are stored as lines like:
+
+    [2025-01-01T10:00:00] Interviewer: Tell me about yourself
+    assistant: Tell me about yourself
+
+Q&A extraction, the HTML email and the webhook payload all need the same pieces
+(timestamp, speaker, content). Instead of each of them running its own regexes
+over every line, `tokenize_transcript` splits the text once with one precompiled
+pattern and returns typed records. The result is memoized, so the step and the
+email renderer share the same parse of the same transcript.
+
+It also contains a streaming WebVTT parser for Daily.co transcript files, which
+turns a VTT download into the same "Speaker: content" lines one line at a time.
+"""
+
+import html
+import re
+from functools import lru_cache
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Tuple,
+)
+
+# [timestamp] Speaker: content   (timestamp optional)
+# Simple Explanation: Surrounding whitespace is matched by the pattern itself, so
+# lines don't need to be stripped first, and speaker/content come out trimmed.
+_LINE_PATTERN = re.compile(r"\s*(?:\[([^\]]*)\]\s*)?([^:]*[^:\s])\s*:\s*(.*\S)\s*")
+
+# Speaker labels that carry a role directly (older "assistant:"/"user:" transcripts)
+_ROLE_LABELS = {"assistant": "assistant", "user": "user"}
+
+
+class TranscriptRecord(NamedTuple):
+    """
+    One line of a transcript.
+
+    A NamedTuple rather than a dataclass: multi-hour transcripts have thousands of
+    lines, and tuples are much cheaper to create.
+
+    Attributes:
+        timestamp: Text inside the leading [...] (None if the line has none)
+        speaker: Speaker label before the colon (None for plain text lines)
+        role: "assistant" or "user" when the speaker label is one of those words,
+            otherwise None (compare speaker with the bot name to find bot lines)
+        content: Message text (the whole line for plain text lines)
+    """
+
+    timestamp: str | None
+    speaker: str | None
+    role: str | None
+    content: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary (for webhook payloads)."""
+        return self._asdict()
+
+
+def _tokenize(transcript_text: str) -> Tuple[TranscriptRecord, ...]:
+    # Local names avoid repeated attribute lookups in the hot loop
+    match_line = _LINE_PATTERN.fullmatch
+    role_for = _ROLE_LABELS.get
+    new_record = tuple.__new__
+    records: List[TranscriptRecord] = []
+    append = records.append
+
+    for line in transcript_text.splitlines():
+        match = match_line(line)
+        if match is None:
+            # Plain text line (no "Speaker:" label), or an empty line
+            line = line.strip()
+            if line:
+                append(new_record(TranscriptRecord, (None, None, None, line)))
+            continue
+
+        timestamp, speaker, content = match.groups()
+        append(
+            new_record(
+                TranscriptRecord,
+                (timestamp, speaker, role_for(speaker.lower()), content),
+            )
+        )
+
+    return tuple(records)
+
+
+@lru_cache(maxsize=16)
+def _tokenize_cached(transcript_text: str) -> Tuple[TranscriptRecord, ...]:
+    return _tokenize(transcript_text)
+
+
+def tokenize_transcript(transcript_text: str | None) -> Tuple[TranscriptRecord, ...]:
+    """
+    Split transcript text into typed records (one per non-empty line).
+
+    **Simple Explanation:**
+    Results for recent transcripts are memoized, so calling this again with the
+    same text (for example from the email renderer after Q&A extraction) is free.
+
+    Args:
+        transcript_text: Full transcript text
+
+    Returns:
+        Tuple of TranscriptRecord, in transcript order
+    """
+    if not transcript_text:
+        return ()
+    return _tokenize_cached(transcript_text)
+
+
+def transcript_records_to_dicts(
+    records: Tuple[TranscriptRecord, ...],
+) -> List[Dict[str, Any]]:
+    """Convert records to dictionaries, skipping plain text lines without a speaker."""
+    return [record.to_dict() for record in records if record.speaker is not None]
+
+
+# WebVTT
+
+
+# Voice span opening tag: <v Speaker> or <v.class Speaker>
+_VTT_VOICE_PATTERN = re.compile(r"<v(?:\.[^\s>]*)?\s+([^>]*?)\s*>")
+# Any other markup inside a cue (</v>, <i>, <c.class>, <00:00:01.000>, ...)
+_VTT_TAG_PATTERN = re.compile(r"<[^>]*>")
+# Blocks that are not cues and are skipped up to the next blank line
+_VTT_SKIPPED_BLOCKS = ("NOTE", "STYLE", "REGION")
+
+
+class VTTCue(NamedTuple):
+    """
+    One WebVTT cue with markup removed.
+
+    Attributes:
+        start: Cue start time as written in the file (e.g. "00:01:02.500")
+        end: Cue end time as written in the file
+        speaker: Name from the <v Speaker> voice tag (None if the cue has none)
+        text: Cue text with tags removed and entities decoded
+    """
+
+    start: str
+    end: str
+    speaker: str | None
+    text: str
+
+
+class WebVTTParser:
+    """
+    Incremental WebVTT parser.
+
+    **Simple Explanation:**
+    Lines are fed in one at a time (for example straight from an HTTP response),
+    and a VTTCue is returned as soon as a cue is complete. Only the cue that is
+    currently being read is kept in memory, so a very long recording never has
+    to be loaded as one big string. Header, NOTE, STYLE and REGION blocks and cue
+    identifiers are dropped; voice tags become the cue's `speaker`.
+    """
+
+    def __init__(self) -> None:
+        self._in_header = True
+        self._skipping_block = False
+        self._timing: Tuple[str, str] | None = None
+        self._speaker: str | None = None
+        self._text_parts: List[str] = []
+
+    def feed_line(self, line: str) -> VTTCue | None:
+        """
+        Feed one line of the file.
+
+        Args:
+            line: One line of VTT text (trailing newline optional)
+
+        Returns:
+            The completed cue if this line ended one, otherwise None
+        """
+        line = line.strip()
+
+        if not line:
+            # Blank lines end the header, skipped blocks and cues
+            self._in_header = False
+            self._skipping_block = False
+            return self._flush()
+
+        if self._in_header:
+            if line.startswith("WEBVTT"):
+                return None
+            # No header block (not strictly valid, but accepted)
+            self._in_header = False
+
+        if self._skipping_block:
+            return None
+
+        if "-->" in line:
+            # Timing line. A missing blank line before it still starts a new cue.
+            cue = self._flush()
+            start, _, rest = line.partition("-->")
+            end = rest.split(None, 1)[0] if rest.strip() else ""
+            self._timing = (start.strip(), end)
+            return cue
+
+        if self._timing is None:
+            # Outside a cue: block keyword or cue identifier
+            if line.split(None, 1)[0] in _VTT_SKIPPED_BLOCKS:
+                self._skipping_block = True
+            return None
+
+        # Cue payload line
+        if self._speaker is None:
+            voice = _VTT_VOICE_PATTERN.search(line)
+            if voice:
+                self._speaker = voice.group(1) or None
+        if "<" in line:
+            line = _VTT_TAG_PATTERN.sub("", line).strip()
+        if "&" in line:
+            line = html.unescape(line)
+        if line:
+            self._text_parts.append(line)
+        return None
+
+    def close(self) -> VTTCue | None:
+        """Finish parsing and return the last cue if the file did not end with a blank line."""
+        return self._flush()
+
+    def _flush(self) -> VTTCue | None:
+        timing = self._timing
+        if timing is None:
+            return None
+
+        text = " ".join(self._text_parts)
+        speaker = self._speaker
+        self._timing = None
+        self._speaker = None
+        self._text_parts = []
+
+        if not text:
+            return None
+        return VTTCue(timing[0], timing[1], speaker, text)
+
+
+def iter_vtt_cues(lines: Iterable[str]) -> Iterator[VTTCue]:
+    """Parse WebVTT lines into cues (see WebVTTParser)."""
+    parser = WebVTTParser()
+    for line in lines:
+        cue = parser.feed_line(line)
+        if cue is not None:
+            yield cue
+    cue = parser.close()
+    if cue is not None:
+        yield cue
+
+
+async def aiter_vtt_cues(lines: AsyncIterable[str]) -> AsyncIterator[VTTCue]:
+    """
+    Parse WebVTT lines from an async source into cues.
+
+    **Simple Explanation:**
+    Same as iter_vtt_cues, but reads from something like httpx's
+    `response.aiter_lines()`, so cues are produced while the file downloads.
+    """
+    parser = WebVTTParser()
+    async for line in lines:
+        cue = parser.feed_line(line)
+        if cue is not None:
+            yield cue
+    cue = parser.close()
+    if cue is not None:
+        yield cue
+
+
+class VTTTranscriptBuilder:
+    """
+    Build transcript text from VTT cues.
+
+    **Simple Explanation:**
+    Consecutive cues from the same speaker are merged into one line, written as
+    "Speaker: text" so the transcript tokenizer picks the speaker up again. Cues
+    without a voice tag become plain text lines.
+    """
+
+    def __init__(self) -> None:
+        self._lines: List[str] = []
+        self._speaker: str | None = None
+        self._parts: List[str] = []
+
+    def add(self, cue: VTTCue) -> None:
+        """Add the next cue."""
+        if cue.speaker is None or cue.speaker != self._speaker:
+            self._flush()
+            self._speaker = cue.speaker
+        self._parts.append(cue.text)
+
+    def build(self) -> str:
+        """Return the transcript text (one line per speaker turn)."""
+        self._flush()
+        return "\n".join(self._lines)
+
+    def _flush(self) -> None:
+        if not self._parts:
+            return
+        text = " ".join(self._parts)
+        self._lines.append(f"{self._speaker}: {text}" if self._speaker else text)
+        self._parts = []
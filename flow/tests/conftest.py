@@ -16,10 +16,34 @@ from flow.main import app
 # Load environment variables
 load_dotenv()
 
+# All tests share one API key, so turn off per-key rate limiting for the app
+# (test_rate_limit.py builds its own app with limits)
+os.environ["RATE_LIMIT_REQUESTS_PER_MINUTE"] = "0"
+
 # Test authentication token (can be overridden via environment)
 TEST_AUTH_TOKEN = os.getenv("TEST_AUTH_TOKEN", "test-key")
 
 
+@pytest.fixture(autouse=True)
+def clear_bot_status_cache():
+    """Start every test with an empty bot status response cache."""
+    from flow.utils.bot_status_cache import clear_bot_status_cache
+
+    clear_bot_status_cache()
+    yield
+    clear_bot_status_cache()
+
+
+@pytest.fixture(autouse=True)
+def clear_workflow_thread_cache():
+    """Start every test with an empty workflow thread row cache."""
+    from flow.utils.workflow_thread_cache import clear_workflow_thread_cache
+
+    clear_workflow_thread_cache()
+    yield
+    clear_workflow_thread_cache()
+
+
 @pytest.fixture
 def client() -> TestClient:
     """Create a test client for the FastAPI app."""
@@ -99,3 +99,29 @@ def test_auth_mcp_endpoint_with_token(
     # 404 is acceptable if FastMCP requires different setup in test environment
     # The important thing is it's not accessible without auth (tested in other tests)
     assert response.status_code in [200, 307, 400, 401, 404, 405]  # Should be mounted
+
+
+def test_public_routes_skip_auth_without_building_request(monkeypatch) -> None:
+    """Test public route matching from the ASGI scope (trailing slashes included)."""
+    from fastapi import FastAPI
+    from shared.auth import UnkeyAuthMiddleware
+
+    monkeypatch.delenv("UNKEY_ROOT_KEY", raising=False)
+    app = FastAPI()
+    app.add_middleware(UnkeyAuthMiddleware)
+
+    @app.get("/meet/{room_name}")
+    async def meet(room_name: str) -> dict[str, str]:
+        return {"room": room_name}
+
+    @app.get("/private")
+    async def private() -> dict[str, str]:
+        return {"ok": "yes"}
+
+    public_client = TestClient(app)
+    assert public_client.get("/meet/abc").json() == {"room": "abc"}
+    assert public_client.get("/private").status_code == 401
+    assert (
+        public_client.get("/private", headers={"Authorization": "Bearer k"}).status_code
+        == 200
+    )
@@ -16,33 +16,28 @@ All tests are fast, isolated unit tests.
 import uuid
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
 from fastapi.testclient import TestClient
 
 
 class TestBotJoinEndpoint:
     """Tests for POST /v1/api/bot/join endpoint."""
 
-    @patch("flow.main.check_credits_for_request")
-    @patch("flow.db.save_workflow_thread_data")
-    @patch("flow.db.get_workflow_thread_data")
+    @patch("flow.db.create_bot_run")
     @patch("flow.main.save_bot_session")
     @patch("flow.workflows.bot_call.BotCallWorkflow")
     def test_join_bot_success_basic(
         self,
         mock_workflow_class: MagicMock,
         mock_save_bot_session: MagicMock,
-        mock_get_workflow_thread_data: MagicMock,
-        mock_save_workflow_thread_data: MagicMock,
-        mock_check_credits: MagicMock,
+        mock_create_bot_run: MagicMock,
         client: TestClient,
         auth_headers: dict[str, str],
         sample_bot_request: dict,
     ) -> None:
         """Test successful bot join with basic request."""
         # Setup mocks
-        mock_check_credits.return_value = (True, None)
-        mock_get_workflow_thread_data.return_value = None  # No existing thread
-        mock_save_workflow_thread_data.return_value = True
+        mock_create_bot_run.return_value = {"status": "created", "balance": 10.0}
         mock_save_bot_session.return_value = True
 
         mock_workflow_instance = MagicMock()
@@ -66,32 +61,30 @@ class TestBotJoinEndpoint:
         assert data["room_url"] == sample_bot_request["room_url"]
         assert uuid.UUID(data["bot_id"])  # Valid UUID
 
-        # Verify mocks were called
-        mock_check_credits.assert_called_once()
-        mock_save_bot_session.assert_called_once()
+        # Verify mocks were called: one database call creates the bot run
+        mock_create_bot_run.assert_called_once()
+        thread_data, session_data = mock_create_bot_run.call_args.args
+        assert thread_data["bot_id"] == session_data["bot_id"] == data["bot_id"]
+        assert thread_data["room_name"] == session_data["room_name"] == "test-room"
+        assert mock_create_bot_run.call_args.kwargs["required_credits"] == 0.15
+        mock_save_bot_session.assert_not_called()
         mock_workflow_instance.execute_async.assert_called_once()
 
-    @patch("flow.main.check_credits_for_request")
-    @patch("flow.db.save_workflow_thread_data")
-    @patch("flow.db.get_workflow_thread_data")
+    @patch("flow.db.create_bot_run")
     @patch("flow.main.save_bot_session")
     @patch("flow.workflows.bot_call.BotCallWorkflow")
     def test_join_bot_success_with_optional_fields(
         self,
         mock_workflow_class: MagicMock,
         mock_save_bot_session: MagicMock,
-        mock_get_workflow_thread_data: MagicMock,
-        mock_save_workflow_thread_data: MagicMock,
-        mock_check_credits: MagicMock,
+        mock_create_bot_run: MagicMock,
         client: TestClient,
         auth_headers: dict[str, str],
         sample_bot_request_with_optional_fields: dict,
     ) -> None:
         """Test successful bot join with all optional fields."""
         # Setup mocks
-        mock_check_credits.return_value = (True, None)
-        mock_get_workflow_thread_data.return_value = None
-        mock_save_workflow_thread_data.return_value = True
+        mock_create_bot_run.return_value = {"status": "created", "balance": 10.0}
         mock_save_bot_session.return_value = True
 
         mock_workflow_instance = MagicMock()
@@ -173,16 +166,14 @@ class TestBotJoinEndpoint:
 
         assert response.status_code == 422  # Validation error
 
-    @patch("flow.main.check_credits_for_request")
+    @patch("flow.db.create_bot_run")
     def test_join_bot_static_mode_without_image(
         self,
-        mock_check_credits: MagicMock,
+        mock_create_bot_run: MagicMock,
         client: TestClient,
         auth_headers: dict[str, str],
     ) -> None:
         """Test bot join with static video_mode but no static_image."""
-        # Mock credit check to pass
-        mock_check_credits.return_value = (True, None)
 
         request = {
             "room_url": "https://test.daily.co/test-room",
@@ -203,26 +194,22 @@ class TestBotJoinEndpoint:
         assert response.status_code == 400
         data = response.json()
         assert "static_image" in data["detail"].lower()
+        mock_create_bot_run.assert_not_called()
 
-    @patch("flow.main.check_credits_for_request")
+    @patch("flow.db.create_bot_run")
     def test_join_bot_insufficient_credits(
         self,
-        mock_check_credits: MagicMock,
+        mock_create_bot_run: MagicMock,
         client: TestClient,
         auth_headers: dict[str, str],
         sample_bot_request: dict,
     ) -> None:
         """Test bot join with insufficient credits (402 error)."""
         # Setup mock to return insufficient credits
-        mock_check_credits.return_value = (
-            False,
-            {
-                "error": "insufficient_credits",
-                "detail": "Your account has insufficient credits to perform this action.",
-                "balance": 0.0,
-                "message": "Please add credits to your account to continue.",
-            },
-        )
+        mock_create_bot_run.return_value = {
+            "status": "insufficient_credits",
+            "balance": 0.0,
+        }
 
         response = client.post(
             "/v1/api/bot/join",
@@ -233,7 +220,7 @@ class TestBotJoinEndpoint:
         assert response.status_code == 402
         data = response.json()
         assert data["error"] == "insufficient_credits"
-        assert "balance" in data
+        assert data["balance"] == 0.0
 
     def test_join_bot_no_auth_header(
         self,
@@ -249,12 +236,16 @@ class TestBotJoinEndpoint:
 
         assert response.status_code == 401
 
+    @patch("flow.db.create_bot_run")
     def test_join_bot_invalid_auth_header(
         self,
+        mock_create_bot_run: MagicMock,
         client: TestClient,
         sample_bot_request: dict,
     ) -> None:
         """Test bot join with invalid authentication header."""
+        # Unknown API keys have no user row
+        mock_create_bot_run.return_value = {"status": "user_not_found"}
         response = client.post(
             "/v1/api/bot/join",
             headers={"Authorization": "Bearer invalid-token"},
@@ -263,26 +254,16 @@ class TestBotJoinEndpoint:
 
         assert response.status_code == 401
 
-    @patch("flow.main.check_credits_for_request")
-    @patch("flow.db.save_workflow_thread_data")
-    @patch("flow.db.get_workflow_thread_data")
-    @patch("flow.main.save_bot_session")
+    @patch("flow.db.create_bot_run")
     def test_join_bot_database_save_failure(
         self,
-        mock_get_workflow_thread_data: MagicMock,
-        mock_save_workflow_thread_data: MagicMock,
-        mock_save_bot_session: MagicMock,
-        mock_check_credits: MagicMock,
+        mock_create_bot_run: MagicMock,
         client: TestClient,
         auth_headers: dict[str, str],
         sample_bot_request: dict,
     ) -> None:
         """Test bot join when database save fails."""
-        # Setup mocks
-        mock_check_credits.return_value = (True, None)
-        mock_get_workflow_thread_data.return_value = None
-        mock_save_workflow_thread_data.return_value = True
-        mock_save_bot_session.return_value = False  # Database save fails
+        mock_create_bot_run.return_value = None  # Database call fails
 
         response = client.post(
             "/v1/api/bot/join",
@@ -295,27 +276,21 @@ class TestBotJoinEndpoint:
         assert "detail" in data
         assert "database" in data["detail"].lower()
 
-    @patch("flow.main.check_credits_for_request")
-    @patch("flow.db.save_workflow_thread_data")
-    @patch("flow.db.get_workflow_thread_data")
+    @patch("flow.db.create_bot_run")
     @patch("flow.main.save_bot_session")
     @patch("flow.workflows.bot_call.BotCallWorkflow")
     def test_join_bot_workflow_execution_failure(
         self,
         mock_workflow_class: MagicMock,
         mock_save_bot_session: MagicMock,
-        mock_get_workflow_thread_data: MagicMock,
-        mock_save_workflow_thread_data: MagicMock,
-        mock_check_credits: MagicMock,
+        mock_create_bot_run: MagicMock,
         client: TestClient,
         auth_headers: dict[str, str],
         sample_bot_request: dict,
     ) -> None:
         """Test bot join when workflow execution fails."""
         # Setup mocks
-        mock_check_credits.return_value = (True, None)
-        mock_get_workflow_thread_data.return_value = None
-        mock_save_workflow_thread_data.return_value = True
+        mock_create_bot_run.return_value = {"status": "created", "balance": 10.0}
         mock_save_bot_session.return_value = True
 
         mock_workflow_instance = MagicMock()
@@ -335,7 +310,41 @@ class TestBotJoinEndpoint:
         assert "detail" in data
 
         # Verify bot session was updated with failure
-        assert mock_save_bot_session.call_count >= 2  # Initial save + failure update
+        mock_create_bot_run.assert_called_once()
+        mock_save_bot_session.assert_called_once()
+        assert mock_save_bot_session.call_args.args[1]["status"] == "failed"
+
+    @patch("flow.db.create_bot_run")
+    @patch("flow.workflows.bot_call.BotCallWorkflow")
+    def test_join_bot_retries_on_id_conflict(
+        self,
+        mock_workflow_class: MagicMock,
+        mock_create_bot_run: MagicMock,
+        client: TestClient,
+        auth_headers: dict[str, str],
+        sample_bot_request: dict,
+    ) -> None:
+        """Test that a primary key conflict is retried with new IDs."""
+        mock_create_bot_run.side_effect = [
+            {"status": "conflict"},
+            {"status": "created"},
+        ]
+        mock_workflow_instance = MagicMock()
+        mock_workflow_instance.execute_async = AsyncMock(
+            return_value={"success": True, "thread_id": "test-thread-id"}
+        )
+        mock_workflow_class.return_value = mock_workflow_instance
+
+        response = client.post(
+            "/v1/api/bot/join",
+            headers=auth_headers,
+            json=sample_bot_request,
+        )
+
+        assert response.status_code == 200
+        first, second = (call.args[0] for call in mock_create_bot_run.call_args_list)
+        assert first["workflow_thread_id"] != second["workflow_thread_id"]
+        assert second["bot_id"] == response.json()["bot_id"]
 
 
 class TestBotStatusEndpoint:
@@ -525,6 +534,373 @@ class TestBotStatusEndpoint:
         # Verify session was saved with updated status
         assert mock_save_bot_session.called
 
+    @patch("flow.main.bot_service")
+    @patch("flow.main.get_bot_session")
+    def test_get_bot_status_terminal_cache_and_etag(
+        self,
+        mock_get_bot_session: MagicMock,
+        mock_bot_service: MagicMock,
+        client: TestClient,
+        auth_headers: dict[str, str],
+        mock_completed_bot_session: dict,
+    ) -> None:
+        """Test that finished bots are served from cache and unchanged polls get 304."""
+        mock_get_bot_session.return_value = mock_completed_bot_session
+        mock_bot_service.is_bot_running.return_value = False
+        url = f"/v1/api/bot/{mock_completed_bot_session['bot_id']}/status"
+
+        first = client.get(url, headers=auth_headers)
+        etag = first.headers["etag"]
+        second = client.get(url, headers={**auth_headers, "If-None-Match": etag})
+
+        assert first.status_code == 200
+        assert first.json()["status"] == "completed"
+        assert second.status_code == 304
+        assert second.headers["etag"] == etag
+        assert mock_get_bot_session.call_count == 1
+
+    @patch("flow.main.bot_service")
+    @patch("flow.main.get_bot_session")
+    def test_get_bot_status_completed_without_results_is_not_frozen(
+        self,
+        mock_get_bot_session: MagicMock,
+        mock_bot_service: MagicMock,
+        client: TestClient,
+        auth_headers: dict[str, str],
+        mock_bot_session: dict,
+        mock_completed_bot_session: dict,
+    ) -> None:
+        """Test that a completed bot still waiting for results isn't cached for long."""
+        from flow.utils import bot_status_cache
+
+        mock_get_bot_session.return_value = {
+            **mock_completed_bot_session,
+            "transcript_text": None,
+            "qa_pairs": None,
+            "insights": None,
+        }
+        url = f"/v1/api/bot/{mock_bot_session['bot_id']}/status"
+
+        with patch.object(bot_status_cache, "BOT_STATUS_RUNNING_TTL_SECONDS", 0):
+            first = client.get(url, headers=auth_headers)
+            # The bot's process saves the results
+            mock_get_bot_session.return_value = mock_completed_bot_session
+            second = client.get(url, headers=auth_headers)
+
+        assert first.json()["transcript"] is None
+        assert second.json()["transcript"] == "This is a test transcript."
+        assert first.headers["etag"] != second.headers["etag"]
+
+    @patch("flow.main.bot_service")
+    @patch("flow.main.get_bot_session")
+    def test_get_bot_status_long_poll_resolves_on_change(
+        self,
+        mock_get_bot_session: MagicMock,
+        mock_bot_service: MagicMock,
+        auth_headers: dict[str, str],
+        mock_bot_session: dict,
+        mock_completed_bot_session: dict,
+    ) -> None:
+        """Test that ?wait= holds the request until the bot session is saved."""
+        import asyncio
+
+        import httpx
+
+        from flow.main import app
+        from flow.utils.bot_status_cache import invalidate_bot_status
+
+        mock_get_bot_session.return_value = mock_bot_session
+        mock_bot_service.is_bot_running.return_value = True
+        bot_id = mock_bot_session["bot_id"]
+
+        async def run() -> httpx.Response:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://test"
+            ) as async_client:
+                poll = asyncio.create_task(
+                    async_client.get(
+                        f"/v1/api/bot/{bot_id}/status?wait=10", headers=auth_headers
+                    )
+                )
+                await asyncio.sleep(0.2)
+                assert not poll.done()
+
+                mock_get_bot_session.return_value = mock_completed_bot_session
+                invalidate_bot_status(bot_id)
+                return await asyncio.wait_for(poll, 2)
+
+        response = asyncio.run(run())
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "completed"
+
+
+class TestBotStatusBatchEndpoint:
+    """Tests for POST /v1/api/bots/status:batch endpoint."""
+
+    @patch("flow.main.bot_service")
+    @patch("flow.main.get_bot_sessions")
+    def test_batch_status_one_query_and_one_liveness_check_per_room(
+        self,
+        mock_get_bot_sessions: MagicMock,
+        mock_bot_service: MagicMock,
+        client: TestClient,
+        auth_headers: dict[str, str],
+        mock_bot_session: dict,
+        mock_completed_bot_session: dict,
+    ) -> None:
+        """Test that bots are read with one query and rooms checked once each."""
+        second = {**mock_bot_session, "bot_id": str(uuid.uuid4())}
+        finished = {**mock_completed_bot_session, "bot_id": str(uuid.uuid4())}
+        missing = str(uuid.uuid4())
+        mock_get_bot_sessions.return_value = {
+            session["bot_id"]: session
+            for session in (mock_bot_session, second, finished)
+        }
+        mock_bot_service.is_bot_running.return_value = True
+        bot_ids = [mock_bot_session["bot_id"], second["bot_id"], finished["bot_id"]]
+
+        response = client.post(
+            "/v1/api/bots/status:batch",
+            headers=auth_headers,
+            json={"bot_ids": [*bot_ids, missing, "not-a-uuid", bot_ids[0]]},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [bot["bot_id"] for bot in data["bots"]] == bot_ids
+        assert [bot["status"] for bot in data["bots"]] == [
+            "running",
+            "running",
+            "completed",
+        ]
+        assert data["bots"][2]["transcript"] == "This is a test transcript."
+        assert data["not_found"] == [missing, "not-a-uuid"]
+        mock_get_bot_sessions.assert_called_once_with(
+            [*bot_ids, missing], include_results=True
+        )
+        # Both running bots are in test-room
+        mock_bot_service.is_bot_running.assert_called_once_with("test-room")
+
+    @patch("flow.main.bot_service")
+    @patch("flow.main.get_bot_sessions")
+    def test_batch_status_without_results(
+        self,
+        mock_get_bot_sessions: MagicMock,
+        mock_bot_service: MagicMock,
+        client: TestClient,
+        auth_headers: dict[str, str],
+        mock_completed_bot_session: dict,
+    ) -> None:
+        """Test that include_results=false leaves out transcript, Q&A and insights."""
+        from flow.utils.bot_status_cache import store_bot_status
+
+        bot_id = mock_completed_bot_session["bot_id"]
+        cached_id = str(uuid.uuid4())
+        store_bot_status(
+            cached_id,
+            {
+                "status": "completed",
+                "bot_id": cached_id,
+                "room_url": "https://test.daily.co/other-room",
+                "transcript": "Cached transcript",
+            },
+        )
+        mock_get_bot_sessions.return_value = {
+            bot_id: {
+                **mock_completed_bot_session,
+                "transcript_text": None,
+                "qa_pairs": None,
+                "insights": None,
+            }
+        }
+
+        response = client.post(
+            "/v1/api/bots/status:batch",
+            headers=auth_headers,
+            json={"bot_ids": [bot_id, cached_id], "include_results": False},
+        )
+
+        assert response.status_code == 200
+        bots = response.json()["bots"]
+        assert [bot["status"] for bot in bots] == ["completed", "completed"]
+        assert all(bot["transcript"] is None for bot in bots)
+        # Only the uncached bot is read, and finished bots need no liveness check
+        mock_get_bot_sessions.assert_called_once_with([bot_id], include_results=False)
+        mock_bot_service.is_bot_running.assert_not_called()
+
+    @patch("flow.main.bot_service")
+    @patch("flow.main.get_bot_session")
+    @patch("flow.main.get_bot_sessions")
+    @patch("flow.db.get_session_data")
+    @patch("flow.main.save_bot_session")
+    def test_batch_status_marks_finished_bot_completed(
+        self,
+        mock_save_bot_session: MagicMock,
+        mock_get_session_data: MagicMock,
+        mock_get_bot_sessions: MagicMock,
+        mock_get_bot_session: MagicMock,
+        mock_bot_service: MagicMock,
+        client: TestClient,
+        auth_headers: dict[str, str],
+        mock_bot_session: dict,
+        mock_session_data: dict,
+    ) -> None:
+        """Test that a bot that stopped running is completed from its full row."""
+        bot_id = mock_bot_session["bot_id"]
+        mock_get_bot_sessions.return_value = {bot_id: dict(mock_bot_session)}
+        mock_get_bot_session.return_value = dict(mock_bot_session)
+        mock_bot_service.is_bot_running.return_value = False
+        mock_get_session_data.return_value = mock_session_data
+
+        response = client.post(
+            "/v1/api/bots/status:batch",
+            headers=auth_headers,
+            json={"bot_ids": [bot_id], "include_results": False},
+        )
+
+        assert response.status_code == 200
+        bot = response.json()["bots"][0]
+        assert bot["status"] == "completed"
+        assert bot["transcript"] is None
+        mock_get_bot_session.assert_called_once_with(bot_id)
+        mock_save_bot_session.assert_called_once()
+        assert mock_save_bot_session.call_args[0][1]["status"] == "completed"
+
+    @patch("flow.main.bot_service")
+    @patch("flow.main.get_bot_session")
+    @patch("flow.main.get_bot_sessions")
+    @patch("flow.main.save_bot_session")
+    def test_batch_status_skips_completion_without_full_row(
+        self,
+        mock_save_bot_session: MagicMock,
+        mock_get_bot_sessions: MagicMock,
+        mock_get_bot_session: MagicMock,
+        mock_bot_service: MagicMock,
+        client: TestClient,
+        auth_headers: dict[str, str],
+        mock_bot_session: dict,
+    ) -> None:
+        """Test that the summary row is never saved over the stored results."""
+        bot_id = mock_bot_session["bot_id"]
+        mock_get_bot_sessions.return_value = {bot_id: dict(mock_bot_session)}
+        mock_get_bot_session.return_value = None
+        mock_bot_service.is_bot_running.return_value = False
+
+        response = client.post(
+            "/v1/api/bots/status:batch",
+            headers=auth_headers,
+            json={"bot_ids": [bot_id], "include_results": False},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["bots"][0]["status"] == "running"
+        mock_save_bot_session.assert_not_called()
+
+    def test_batch_status_rejects_too_many_ids(
+        self,
+        client: TestClient,
+        auth_headers: dict[str, str],
+    ) -> None:
+        """Test that more than BOT_STATUS_BATCH_MAX_IDS bot IDs are rejected."""
+        from flow.main import BOT_STATUS_BATCH_MAX_IDS
+
+        response = client.post(
+            "/v1/api/bots/status:batch",
+            headers=auth_headers,
+            json={
+                "bot_ids": [
+                    str(uuid.uuid4()) for _ in range(BOT_STATUS_BATCH_MAX_IDS + 1)
+                ]
+            },
+        )
+
+        assert response.status_code == 422
+
+
+class TestWorkflowThreadSearchEndpoint:
+    """Tests for POST /v1/api/workflow-threads:search endpoint."""
+
+    @patch("flow.main.get_workflow_threads_by_email")
+    def test_search_workflow_threads_by_email(
+        self,
+        mock_get_workflow_threads_by_email: MagicMock,
+        client: TestClient,
+        auth_headers: dict[str, str],
+    ) -> None:
+        """Test that threads are found with one lookup and returned as summaries."""
+        mock_get_workflow_threads_by_email.return_value = [
+            {
+                "workflow_thread_id": "thread-1",
+                "room_name": "test-room",
+                "meeting_status": "completed",
+                "email_sent": True,
+            }
+        ]
+
+        response = client.post(
+            "/v1/api/workflow-threads:search",
+            headers=auth_headers,
+            json={"email": "Candidate@Example.com", "limit": 5},
+        )
+
+        assert response.status_code == 200
+        thread = response.json()["workflow_threads"][0]
+        assert thread["workflow_thread_id"] == "thread-1"
+        assert thread["email_sent"] is True
+        assert thread["bot_id"] is None
+        mock_get_workflow_threads_by_email.assert_called_once()
+        args, kwargs = mock_get_workflow_threads_by_email.call_args
+        # Always scoped to the caller's API key (set by the auth middleware)
+        assert args == ("Candidate@Example.com", "test-key-id")
+        assert kwargs["limit"] == 5
+
+    @patch("flow.main.get_workflow_threads_by_email")
+    def test_search_workflow_threads_requires_api_key(
+        self,
+        mock_get_workflow_threads_by_email: MagicMock,
+    ) -> None:
+        """Test that a request without a verified API key can't search all tenants."""
+        import asyncio
+        from types import SimpleNamespace
+
+        from fastapi import HTTPException
+
+        from flow.main import WorkflowThreadSearchRequest, search_workflow_threads_v1
+
+        # Unkey verification disabled: the middleware sets no unkey_key_id
+        http_request = SimpleNamespace(state=SimpleNamespace())
+
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(
+                search_workflow_threads_v1(
+                    WorkflowThreadSearchRequest(email="victim@example.com"),
+                    http_request,
+                )
+            )
+
+        assert exc_info.value.status_code == 401
+        mock_get_workflow_threads_by_email.assert_not_called()
+
+    @patch("flow.main.get_workflow_threads_by_email")
+    def test_search_workflow_threads_database_error(
+        self,
+        mock_get_workflow_threads_by_email: MagicMock,
+        client: TestClient,
+        auth_headers: dict[str, str],
+    ) -> None:
+        """Test that a database error is reported instead of an empty result."""
+        mock_get_workflow_threads_by_email.return_value = None
+
+        response = client.post(
+            "/v1/api/workflow-threads:search",
+            headers=auth_headers,
+            json={"email": "candidate@example.com"},
+        )
+
+        assert response.status_code == 500
+
 
 class TestOtherBotEndpoints:
     """Tests for other bot management endpoints."""
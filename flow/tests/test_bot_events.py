@@ -0,0 +1,184 @@
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for live bot events (flow/utils/bot_events.py) and
+GET /v1/api/bot/{bot_id}/events.
+"""
+
+import asyncio
+import json
+import threading
+from unittest.mock import MagicMock, patch
+
+import httpx
+
+from flow.utils.bot_events import (
+    PROCESS_ID,
+    BotEventBroker,
+    bot_event_broker,
+    handle_bot_event_notification,
+    publish_bot_event,
+)
+
+
+def test_subscriber_buffer_drops_oldest_when_full() -> None:
+    """Test that a slow subscriber keeps only the newest events."""
+    broker = BotEventBroker(buffer_size=2)
+
+    async def run() -> list:
+        subscription = broker.subscribe("room-a")
+        for i in range(3):
+            broker.deliver("room-a", {"event": "transcript", "data": {"i": i}})
+        await asyncio.sleep(0)
+        events = [await subscription.get(timeout=1), await subscription.get(timeout=1)]
+        assert await subscription.get(timeout=0.01) is None
+        assert subscription.dropped == 1
+        broker.unsubscribe(subscription)
+        return events
+
+    events = asyncio.run(run())
+
+    assert [event["data"]["i"] for event in events] == [1, 2]
+    assert not broker.has_subscribers("room-a")
+
+
+def test_publish_from_another_thread_reaches_subscriber() -> None:
+    """Test that events published off the event loop (bot threads) are delivered."""
+
+    async def run() -> dict | None:
+        subscription = bot_event_broker.subscribe("room-thread")
+        try:
+            thread = threading.Thread(
+                target=publish_bot_event,
+                args=("room-thread", "cost", {"cost_usd": 0.01}),
+            )
+            thread.start()
+            thread.join()
+            return await subscription.get(timeout=1)
+        finally:
+            bot_event_broker.unsubscribe(subscription)
+
+    event = asyncio.run(run())
+
+    assert event == {"event": "cost", "data": {"cost_usd": 0.01}}
+
+
+def test_notifications_from_other_processes_are_delivered() -> None:
+    """Test LISTEN payloads: other processes' events are delivered, our own skipped."""
+
+    async def run() -> list:
+        subscription = bot_event_broker.subscribe("room-b")
+        try:
+            for origin, text in ((PROCESS_ID, "own"), ("other-process", "remote")):
+                handle_bot_event_notification(
+                    json.dumps(
+                        {
+                            "origin": origin,
+                            "topic": "room-b",
+                            "event": "transcript",
+                            "data": {"content": text},
+                        }
+                    )
+                )
+            handle_bot_event_notification("not json")
+            await asyncio.sleep(0)
+            return [await subscription.get(timeout=0.05) for _ in range(2)]
+        finally:
+            bot_event_broker.unsubscribe(subscription)
+
+    first, second = asyncio.run(run())
+
+    assert first["data"] == {"content": "remote"}
+    assert second is None
+
+
+def test_status_notification_clears_cached_status() -> None:
+    """Test that a status saved in another process drops the cached response."""
+    from flow.utils.bot_status_cache import get_cached_bot_status, store_bot_status
+
+    store_bot_status("bot-remote", {"status": "completed", "bot_id": "bot-remote"})
+
+    handle_bot_event_notification(
+        json.dumps(
+            {
+                "origin": "other-process",
+                "topic": "room-c",
+                "event": "status",
+                "data": {"bot_id": "bot-remote", "status": "completed"},
+            }
+        )
+    )
+
+    assert get_cached_bot_status("bot-remote") is None
+
+
+@patch("flow.main.bot_service")
+@patch("flow.main.get_bot_session")
+def test_events_endpoint_streams_until_bot_finishes(
+    mock_get_bot_session: MagicMock,
+    mock_bot_service: MagicMock,
+    auth_headers: dict[str, str],
+    mock_bot_session: dict,
+    mock_completed_bot_session: dict,
+) -> None:
+    """Test that the SSE stream sends status, transcript and the final status."""
+    from flow.main import app
+    from flow.utils.bot_status_cache import invalidate_bot_status
+
+    mock_get_bot_session.return_value = mock_bot_session
+    mock_bot_service.is_bot_running.return_value = True
+    bot_id = mock_bot_session["bot_id"]
+
+    async def run() -> httpx.Response:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as async_client:
+            stream = asyncio.create_task(
+                async_client.get(f"/v1/api/bot/{bot_id}/events", headers=auth_headers)
+            )
+            await asyncio.sleep(0.2)
+            assert bot_event_broker.has_subscribers("test-room")
+
+            publish_bot_event(
+                "test-room", "transcript", {"speaker": "Alice", "content": "Hi!"}
+            )
+            mock_get_bot_session.return_value = mock_completed_bot_session
+            invalidate_bot_status(bot_id)
+            publish_bot_event(
+                "test-room", "status", {"bot_id": bot_id, "status": "completed"}
+            )
+            return await asyncio.wait_for(stream, 2)
+
+    response = asyncio.run(run())
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    messages = [
+        (block.split("\n")[0], json.loads(block.split("\n")[1][len("data: ") :]))
+        for block in response.text.strip().split("\n\n")
+    ]
+    assert [event for event, _ in messages] == [
+        "event: status",
+        "event: transcript",
+        "event: status",
+    ]
+    assert messages[0][1]["status"] == "running"
+    assert messages[1][1]["content"] == "Hi!"
+    assert messages[2][1]["status"] == "completed"
+    assert not bot_event_broker.has_subscribers("test-room")
+
+
+@patch("flow.main.get_bot_session")
+def test_events_endpoint_not_found(
+    mock_get_bot_session: MagicMock,
+    client,
+    auth_headers: dict[str, str],
+) -> None:
+    """Test that an unknown bot gets 404 instead of an empty stream."""
+    mock_get_bot_session.return_value = None
+
+    response = client.get("/v1/api/bot/missing/events", headers=auth_headers)
+
+    assert response.status_code == 404
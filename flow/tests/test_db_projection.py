@@ -0,0 +1,134 @@
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for column projection (fields=[...]), lazy decryption
+(LazyDecryptedDict) and the paused-thread lookup in flow/db.py reads.
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from flow import db
+from flow.db import LazyDecryptedDict, encrypt_field, encrypt_sensitive_data
+
+
+@pytest.fixture(autouse=True)
+def encryption_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Use a fixed encryption key."""
+    monkeypatch.setenv("ENCRYPTION_KEY", "test-encryption-key-" + "x" * 32)
+
+
+def _mock_client(rows: list[dict]) -> MagicMock:
+    """Supabase client whose table(...).select(...)...execute() returns `rows`."""
+    client = MagicMock()
+    query = client.table.return_value.select.return_value
+    query.eq.return_value = query
+    query.order.return_value = query
+    query.limit.return_value = query
+    query.execute.return_value.data = rows
+    return client
+
+
+def test_fields_are_decrypted_on_first_access() -> None:
+    """Test that encrypted fields stay encrypted until they are read."""
+    ciphertext = encrypt_field("Alice: Hello")
+    row = LazyDecryptedDict({"transcript_text": ciphertext, "workflow_paused": True})
+
+    with patch.object(db, "decrypt_field", wraps=db.decrypt_field) as decrypt:
+        assert row["workflow_paused"] is True
+        decrypt.assert_not_called()
+
+        assert row.get("transcript_text") == "Alice: Hello"
+        assert row["transcript_text"] == "Alice: Hello"
+        decrypt.assert_called_once()
+
+    # Copies and serialization see plain values
+    later = LazyDecryptedDict({"transcript_text": ciphertext})
+    assert {**later} == {"transcript_text": "Alice: Hello"}
+    serialized = json.dumps(LazyDecryptedDict({"transcript_text": ciphertext}))
+    assert json.loads(serialized) == {"transcript_text": "Alice: Hello"}
+
+
+def test_saving_keeps_ciphertext_of_fields_never_read() -> None:
+    """Test that a read-modify-write doesn't decrypt and re-encrypt untouched fields."""
+    ciphertext = encrypt_field("Alice: Hello")
+    row = LazyDecryptedDict(
+        {"transcript_text": ciphertext, "email": encrypt_field("a@example.com")}
+    )
+    row["email"] = "b@example.com"
+
+    with patch.object(db, "decrypt_field") as decrypt:
+        encrypted = encrypt_sensitive_data(row)
+
+    decrypt.assert_not_called()
+    assert encrypted["transcript_text"] == ciphertext
+    assert db.decrypt_field(encrypted["email"]) == "b@example.com"
+
+
+def test_get_workflow_thread_data_reads_only_requested_columns() -> None:
+    """Test that fields=[...] selects only those columns."""
+    client = _mock_client([{"unkey_key_id": "key-1", "usage_stats": None}])
+
+    with patch.object(db, "get_supabase_client", return_value=client):
+        thread_data = db.get_workflow_thread_data(
+            "thread-1", fields=["unkey_key_id", "usage_stats"]
+        )
+
+    client.table.return_value.select.assert_called_once_with("unkey_key_id,usage_stats")
+    assert thread_data == {"unkey_key_id": "key-1"}
+
+
+def test_get_workflow_threads_by_room_name_projection() -> None:
+    """Test the paused-thread lookup reads flags only."""
+    client = _mock_client(
+        [
+            {"workflow_thread_id": "thread-2", "workflow_paused": True},
+            {"workflow_thread_id": "thread-1", "workflow_paused": False},
+        ]
+    )
+
+    with patch.object(db, "get_supabase_client", return_value=client):
+        threads = db.get_workflow_threads_by_room_name(
+            "room-1", fields=["workflow_thread_id", "workflow_paused"]
+        )
+
+    client.table.return_value.select.assert_called_once_with(
+        "workflow_thread_id,workflow_paused"
+    )
+    assert [thread["workflow_thread_id"] for thread in threads] == [
+        "thread-2",
+        "thread-1",
+    ]
+
+
+def test_unknown_field_is_rejected() -> None:
+    """Test that a typo in fields fails loudly instead of returning None."""
+    with pytest.raises(ValueError):
+        db.get_workflow_thread_data("thread-1", fields=["unkey_id"])
+
+
+def test_paused_thread_lookup_is_one_indexed_row() -> None:
+    """Test that the paused thread is found by the database, not by scanning threads."""
+    client = _mock_client([{"workflow_thread_id": "thread-3"}])
+    query = client.table.return_value.select.return_value
+
+    with patch.object(db, "get_supabase_client", return_value=client):
+        workflow_thread_id = db.get_paused_workflow_thread_id("room-1")
+
+    assert workflow_thread_id == "thread-3"
+    client.table.return_value.select.assert_called_once_with("workflow_thread_id")
+    query.eq.assert_any_call("room_name", "room-1")
+    query.eq.assert_any_call("workflow_paused", True)
+    query.order.assert_called_once_with("created_at", desc=True)
+    query.limit.assert_called_once_with(1)
+
+
+def test_paused_thread_lookup_without_paused_thread() -> None:
+    """Test that a room without a paused thread gives None."""
+    client = _mock_client([])
+
+    with patch.object(db, "get_supabase_client", return_value=client):
+        assert db.get_paused_workflow_thread_id("room-1") is None
@@ -0,0 +1,47 @@
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for the precompiled email templates and the results email renderer.
+"""
+
+from flow.steps.agent_call.steps.email_templates import CompiledTemplate
+from flow.steps.agent_call.steps.process_transcript import (
+    format_summary_html,
+    generate_html_email,
+)
+
+
+def test_compiled_template_rendering() -> None:
+    """Test placeholders, repeated slots and $$ escapes."""
+    template = CompiledTemplate("<b>$name</b> costs $$${price} ($name)")
+
+    assert template.slots == ("name", "price")
+    assert template.render(name="Tea", price="3") == "<b>Tea</b> costs $3 (Tea)"
+
+    buffer = ["start|"]
+    template.render_into(buffer, "Cake", "5")
+    assert "".join(buffer) == "start|<b>Cake</b> costs $5 (Cake)"
+
+
+def test_generate_html_email_escapes_and_orders_content() -> None:
+    """Test that the page, summary and transcript are rendered in order and escaped."""
+    summary_text = "STRENGTHS\n- **Clear** <answers>\nScore: 8.5"
+    transcript_text = (
+        "[2025-01-01T10:00:00.123+00:00] Coach: Hi <there>\nJordan: Hello & welcome"
+    )
+
+    email_html = generate_html_email(
+        summary_text, transcript_text, "Jordan <J>", "Interview", None, "Coach"
+    )
+
+    assert "<title>Interview Results</title>" in email_html
+    assert "Jordan &lt;J&gt;</p>" in email_html
+    assert format_summary_html(summary_text) in email_html
+    assert "<strong>Clear</strong> &lt;answers&gt;" in email_html
+    assert "(2025-01-01T10:00:00)" in email_html
+    assert "Hi &lt;there&gt;" in email_html
+    assert email_html.index("Hi &lt;there&gt;") < email_html.index(
+        "Hello &amp; welcome"
+    )
+    assert email_html.endswith("</html>")
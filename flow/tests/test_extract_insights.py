@@ -0,0 +1,154 @@
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for insight extraction (map-reduce and caching).
+
+OpenAI calls are mocked; no network access is needed.
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from flow.steps.agent_call.steps import extract_insights
+from flow.steps.agent_call.steps.extract_insights import (
+    ExtractInsightsStep,
+    chunk_qa_pairs,
+    merge_partial_insights,
+)
+from flow.utils.insight_cache import (
+    clear_insight_cache_memory,
+    compute_insight_cache_key,
+)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_insight_cache():
+    """Start every test with an empty in-process cache and no database."""
+    clear_insight_cache_memory()
+    with patch("flow.db.get_supabase_client", return_value=None):
+        yield
+    clear_insight_cache_memory()
+
+
+def _make_qa_pairs(count: int, answer_chars: int) -> list[dict]:
+    return [
+        {"question": f"Question {i}", "answer": "x" * answer_chars}
+        for i in range(count)
+    ]
+
+
+def _chat_response(content: dict) -> SimpleNamespace:
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=json.dumps(content)))],
+        usage=SimpleNamespace(prompt_tokens=100, completion_tokens=10),
+    )
+
+
+def test_chunk_qa_pairs_respects_budget_and_order() -> None:
+    """Test that chunks stay within budget, keep order, and never split pairs."""
+    qa_pairs = _make_qa_pairs(10, answer_chars=400)  # ~100+ tokens each
+
+    chunks = chunk_qa_pairs(qa_pairs, token_budget=250)
+
+    assert [start for start, _ in chunks] == [0, 2, 4, 6, 8]
+    assert [qa for _, chunk in chunks for qa in chunk] == qa_pairs
+
+
+def test_merge_partial_insights() -> None:
+    """Test the fallback merge used when the reduce call fails."""
+    merged = merge_partial_insights(
+        [
+            {
+                "overall_score": 6,
+                "competency_scores": {"clarity": 6},
+                "strengths": ["a"],
+                "question_assessments": [{"question": "Q1"}],
+                "person_name": "Unknown",
+            },
+            {
+                "overall_score": 8,
+                "competency_scores": {"clarity": 8},
+                "strengths": ["a", "b"],
+                "question_assessments": [{"question": "Q2"}],
+                "person_name": "Sam",
+            },
+        ]
+    )
+
+    assert merged["overall_score"] == 7
+    assert merged["competency_scores"] == {"clarity": 7}
+    assert merged["strengths"] == ["a", "b"]
+    assert len(merged["question_assessments"]) == 2
+    assert merged["person_name"] == "Sam"
+
+
+@pytest.mark.asyncio
+async def test_long_transcript_uses_map_reduce() -> None:
+    """Test that long transcripts are analyzed per chunk and merged in one reduce call."""
+    qa_pairs = _make_qa_pairs(6, answer_chars=400)
+    final = {
+        "overall_score": 7,
+        "question_assessments": [
+            {"question": qa["question"], "answer": qa["answer"], "score": 7}
+            for qa in qa_pairs
+        ],
+    }
+
+    client = MagicMock()
+    client.chat.completions.create = AsyncMock(
+        side_effect=[_chat_response({"overall_score": 5})] * 3 + [_chat_response(final)]
+    )
+
+    with (
+        patch.object(extract_insights, "INSIGHTS_MAP_REDUCE_THRESHOLD_TOKENS", 300),
+        patch.object(extract_insights, "INSIGHTS_CHUNK_TOKEN_BUDGET", 250),
+        patch(
+            "flow.utils.posthog_config.get_posthog_llm_client",
+            return_value=(client, False),
+        ),
+    ):
+        state = await ExtractInsightsStep().execute({"qa_pairs": qa_pairs})
+
+    assert "error" not in state
+    assert client.chat.completions.create.await_count == 4
+    assert state["insights"]["overall_score"] == 7.0
+    reduce_prompt = client.chat.completions.create.await_args.kwargs["messages"][1][
+        "content"
+    ]
+    assert "analyzed in 3 consecutive parts" in reduce_prompt
+
+
+def test_cache_key_depends_on_all_inputs() -> None:
+    """Test that any change to model, prompts or transcript changes the key."""
+    base = compute_insight_cache_key("gpt-4o", "template", None, "Q1: a")
+
+    assert base == compute_insight_cache_key("gpt-4o", "template", None, "Q1: a")
+    assert base != compute_insight_cache_key("gpt-4.1", "template", None, "Q1: a")
+    assert base != compute_insight_cache_key("gpt-4o", "template2", None, "Q1: a")
+    assert base != compute_insight_cache_key("gpt-4o", "template", "custom", "Q1: a")
+    assert base != compute_insight_cache_key("gpt-4o", "template", None, "Q1: b")
+
+
+@pytest.mark.asyncio
+async def test_reprocessing_uses_cache() -> None:
+    """Test that analyzing the same transcript twice calls the LLM only once."""
+    qa_pairs = _make_qa_pairs(1, answer_chars=20)
+    client = MagicMock()
+    client.chat.completions.create = AsyncMock(
+        return_value=_chat_response({"overall_score": 9})
+    )
+
+    with patch(
+        "flow.utils.posthog_config.get_posthog_llm_client",
+        return_value=(client, False),
+    ):
+        first = await ExtractInsightsStep().execute({"qa_pairs": list(qa_pairs)})
+        second = await ExtractInsightsStep().execute({"qa_pairs": list(qa_pairs)})
+
+    assert client.chat.completions.create.await_count == 1
+    assert first["insights"] == second["insights"]
+    assert second["insights"]["overall_score"] == 9.0
@@ -0,0 +1,278 @@
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for field-level encryption (encrypt_field / decrypt_field) in flow/db.py.
+"""
+
+import base64
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from flow import db
+from flow.db import (
+    LazyDecryptedDict,
+    decrypt_field,
+    encrypt_field,
+    encrypt_sensitive_data,
+    field_associated_data,
+)
+
+TRANSCRIPT = "\n".join(
+    f"[00:{i // 60:02d}:{i % 60:02d}] {'Interviewer' if i % 2 else 'Candidate'}: "
+    f"Can you walk me through how you would design the caching layer for item {i}?"
+    for i in range(200)
+)
+
+
+@pytest.fixture(autouse=True)
+def encryption_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Use a fixed encryption key."""
+    monkeypatch.setenv("ENCRYPTION_KEY", "test-encryption-key-" + "x" * 32)
+
+
+def test_transcript_is_compressed_before_encryption() -> None:
+    """Test that a transcript round-trips and is stored smaller than the plaintext."""
+    ciphertext = encrypt_field(TRANSCRIPT)
+
+    assert ciphertext.startswith("pf2:")
+    assert len(ciphertext) < len(TRANSCRIPT) / 3
+    assert decrypt_field(ciphertext) == TRANSCRIPT
+
+
+def test_short_value_is_stored_uncompressed() -> None:
+    """Test that short values round-trip without compression."""
+    with patch.object(db.zlib, "compress") as compress:
+        ciphertext = encrypt_field("alice@example.com")
+
+    compress.assert_not_called()
+    assert decrypt_field(ciphertext) == "alice@example.com"
+
+
+def test_zlib_is_used_without_zstandard() -> None:
+    """Test the zlib fallback, and that zlib values read back with zstd enabled."""
+    with patch.object(db, "ZSTD_AVAILABLE", False):
+        ciphertext = encrypt_field(TRANSCRIPT)
+        assert decrypt_field(ciphertext) == TRANSCRIPT
+
+    assert len(ciphertext) < len(TRANSCRIPT) / 3
+    assert decrypt_field(ciphertext) == TRANSCRIPT
+
+
+def test_legacy_value_is_decrypted() -> None:
+    """Test that values written before the envelope format still decrypt."""
+    token = db.get_fernet().encrypt(b"alice@example.com")
+    legacy = base64.urlsafe_b64encode(token).decode()
+
+    assert decrypt_field(legacy) == "alice@example.com"
+
+
+def test_plaintext_is_routed_without_decrypting() -> None:
+    """Test that values stored before field encryption skip the cipher entirely."""
+    with patch.object(db, "decrypt_field") as decrypt:
+        data = db.decrypt_sensitive_data({"email": "alice@example.com"})
+
+    assert data == {"email": "alice@example.com"}
+    decrypt.assert_not_called()
+    assert db.encrypted_value_version(encrypt_field("alice@example.com")) == "pf2"
+    with pytest.raises(ValueError):
+        decrypt_field("alice@example.com")
+
+
+def test_reencrypt_legacy_rows() -> None:
+    """Test that legacy and plaintext columns are rewritten, current ones are not."""
+    legacy = base64.urlsafe_b64encode(
+        db.get_fernet().encrypt(b"alice@example.com")
+    ).decode()
+    current = encrypt_field("bob@example.com")
+    client = MagicMock()
+    query = client.table.return_value.select.return_value
+    query.order.return_value.limit.return_value.execute.return_value.data = [
+        {"bot_id": "bot-1", "transcript_text": legacy},
+        {"bot_id": "bot-2", "transcript_text": current},
+        {"bot_id": "bot-3", "transcript_text": "Alice: Hello"},
+    ]
+    update = client.table.return_value.update
+    guarded_update = update.return_value.eq.return_value
+    guarded_update.not_.like.return_value = guarded_update
+    guarded_update.execute.return_value.data = [{}]
+
+    with patch.object(db, "get_supabase_client", return_value=client):
+        result = db.reencrypt_legacy_rows("bot_sessions", batch_size=3)
+
+    assert result == {
+        "scanned": 3,
+        "reencrypted": 2,
+        "skipped": 0,
+        "next_after": "bot-3",
+    }
+    written = [call.args[0]["transcript_text"] for call in update.call_args_list]
+    assert [
+        decrypt_field(
+            value, field_associated_data("bot_sessions", "transcript_text", bot_id)
+        )
+        for value, bot_id in zip(written, ["bot-1", "bot-3"])
+    ] == ["alice@example.com", "Alice: Hello"]
+    # Rows the app rewrote in the meantime (in an envelope format) are left alone
+    guarded_update.not_.like.assert_any_call("transcript_text", "pf1:%")
+    guarded_update.not_.like.assert_any_call("transcript_text", "pf2:%")
+
+
+def test_fernet_values_stay_readable() -> None:
+    """Test that values written with FIELD_CIPHER=fernet decrypt under aes-gcm."""
+    with patch.object(db, "FIELD_CIPHER", "fernet"):
+        ciphertext = encrypt_field(TRANSCRIPT, b"rooms.transcript_text:room-1")
+
+    assert ciphertext.startswith("pf1:")
+    assert decrypt_field(ciphertext, b"rooms.transcript_text:room-1") == TRANSCRIPT
+
+
+def test_ciphertext_is_bound_to_its_row() -> None:
+    """Test that AES-GCM values don't decrypt for another row or column."""
+    associated_data = field_associated_data("rooms", "email", "room-1")
+    ciphertext = encrypt_field("alice@example.com", associated_data)
+
+    assert decrypt_field(ciphertext, associated_data) == "alice@example.com"
+    for other in (
+        field_associated_data("rooms", "email", "room-2"),
+        field_associated_data("rooms", "email_results_to", "room-1"),
+    ):
+        with pytest.raises(Exception):
+            decrypt_field(ciphertext, other)
+
+
+def test_row_copied_to_another_row_is_reencrypted() -> None:
+    """Test that unread ciphertext is only reused when saving to the same row."""
+    stored = encrypt_sensitive_data(
+        {"email": "alice@example.com"}, "workflow_threads", "thread-1"
+    )
+    row = LazyDecryptedDict(stored, "workflow_threads", "thread-1")
+
+    same_row = encrypt_sensitive_data(row, "workflow_threads", "thread-1")
+    other_row = encrypt_sensitive_data(row, "workflow_threads", "thread-2")
+
+    assert same_row["email"] == stored["email"]
+    assert (
+        db.decrypt_sensitive_data(other_row, "workflow_threads", "thread-2")["email"]
+        == "alice@example.com"
+    )
+
+
+def test_email_blind_index_is_saved_and_normalized() -> None:
+    """Test that saved rows get a blind index matching the normalized address."""
+    stored = encrypt_sensitive_data(
+        {"email": "Alice@Example.com ", "transcript_text": "Alice: Hello"},
+        "workflow_threads",
+        "thread-1",
+    )
+
+    assert stored["email_bidx"] == db.email_blind_index("alice@example.com")
+    assert "alice" not in stored["email_bidx"].lower()
+    assert "email_results_to_bidx" not in stored
+    # Tables without blind index columns don't get them
+    assert "email_bidx" not in encrypt_sensitive_data(
+        {"email": "alice@example.com"}, "bot_sessions", "bot-1"
+    )
+
+
+def test_workflow_threads_are_found_by_blind_index() -> None:
+    """Test that an email lookup is one query on the blind index columns."""
+    index = db.email_blind_index("alice@example.com")
+    stored = encrypt_sensitive_data(
+        {"workflow_thread_id": "thread-1", "email": "alice@example.com"},
+        "workflow_threads",
+        "thread-1",
+    )
+    client = MagicMock()
+    select = client.table.return_value.select.return_value
+    query = select.eq.return_value.or_.return_value
+    query.order.return_value.limit.return_value.execute.return_value.data = [stored]
+
+    with patch.object(db, "get_supabase_client", return_value=client):
+        threads = db.get_workflow_threads_by_email(
+            " ALICE@example.com", "key-1", fields=["email"]
+        )
+        # The search is never run across every API key
+        with pytest.raises(ValueError):
+            db.get_workflow_threads_by_email("alice@example.com", None)
+
+    select.eq.assert_called_once_with("unkey_key_id", "key-1")
+    select.eq.return_value.or_.assert_called_once_with(
+        f"email_bidx.eq.{index},email_results_to_bidx.eq.{index}"
+    )
+    assert threads == [{"email": "alice@example.com"}]
+
+
+def test_reencrypt_backfills_blind_index() -> None:
+    """Test that rows saved before the blind index existed get one."""
+    client = MagicMock()
+    query = client.table.return_value.select.return_value
+    query.order.return_value.limit.return_value.execute.return_value.data = [
+        {
+            "room_name": "room-1",
+            "email": encrypt_field(
+                "alice@example.com", field_associated_data("rooms", "email", "room-1")
+            ),
+            "email_bidx": None,
+        },
+    ]
+    update = client.table.return_value.update
+    guarded_update = update.return_value.eq.return_value
+    guarded_update.is_.return_value = guarded_update
+    guarded_update.execute.return_value.data = [{}]
+
+    with patch.object(db, "get_supabase_client", return_value=client):
+        result = db.reencrypt_legacy_rows("rooms")
+
+    assert result["reencrypted"] == 1
+    # The ciphertext is current, so only the index is written
+    update.assert_called_once_with(
+        {"email_bidx": db.email_blind_index("alice@example.com")}
+    )
+    guarded_update.is_.assert_called_once_with("email_bidx", "null")
+
+
+def test_clearing_email_clears_blind_index() -> None:
+    """Test that a removed address no longer matches, and a reused one still does."""
+    client = MagicMock()
+    update = client.table.return_value.update
+    update.return_value.eq.return_value.execute.return_value.data = [{}]
+    stored = encrypt_sensitive_data(
+        {"email": "alice@example.com"}, "workflow_threads", "thread-1"
+    )
+
+    with patch.object(db, "get_supabase_client", return_value=client):
+        db.update_workflow_thread_fields(
+            "thread-1", {"email": None, "email_results_to": ""}
+        )
+        reused = encrypt_sensitive_data(
+            LazyDecryptedDict(stored, "workflow_threads", "thread-1"),
+            "workflow_threads",
+            "thread-1",
+        )
+
+    written = update.call_args.args[0]
+    assert written["email_bidx"] is None
+    assert written["email_results_to_bidx"] is None
+    # Unread ciphertext is saved as is, and the stored index is left alone
+    assert reused["email"] == stored["email"]
+    assert reused["email_bidx"] == stored["email_bidx"]
+
+
+def test_bot_transcript_decrypts_whatever_the_id_casing() -> None:
+    """Test that transcripts are bound to the stored bot ID, not the caller's."""
+    bot_id = "550e8400-e29b-41d4-a716-446655440000"
+    client = MagicMock()
+    upsert = client.table.return_value.upsert
+
+    with patch.object(db, "get_supabase_client", return_value=client):
+        db.save_bot_session(bot_id.upper(), {"transcript_text": "Alice: Hello"})
+        row = upsert.call_args.args[0]
+        select = client.table.return_value.select.return_value
+        select.eq.return_value.execute.return_value.data = [row]
+        bot_session = db.get_bot_session(bot_id.upper(), fields=["transcript_text"])
+
+    assert row["bot_id"] == bot_id
+    select.eq.assert_called_once_with("bot_id", bot_id)
+    assert bot_session["transcript_text"] == "Alice: Hello"
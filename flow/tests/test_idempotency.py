@@ -0,0 +1,205 @@
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for Idempotency-Key handling (flow/utils/idempotency.py) on
+POST /v1/api/bot/join.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from flow.utils import idempotency
+from flow.utils.idempotency import (
+    IdempotencyConflictError,
+    clear_idempotency_cache,
+    hash_request_body,
+    run_idempotent,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_idempotency_responses():
+    """Start every test with an empty in-process response cache."""
+    clear_idempotency_cache()
+    yield
+    clear_idempotency_cache()
+
+
+def _mock_workflow(mock_workflow_class: MagicMock, delay: float = 0.0) -> AsyncMock:
+    """Make BotCallWorkflow().execute_async succeed (after `delay` seconds)."""
+
+    async def execute_async(context):
+        await asyncio.sleep(delay)
+        return {"success": True, "thread_id": context["workflow_thread_id"]}
+
+    execute = AsyncMock(side_effect=execute_async)
+    mock_workflow_class.return_value.execute_async = execute
+    return execute
+
+
+@patch("flow.db.create_bot_run")
+@patch("flow.workflows.bot_call.BotCallWorkflow")
+def test_replayed_join_returns_original_response(
+    mock_workflow_class: MagicMock,
+    mock_create_bot_run: MagicMock,
+    client: TestClient,
+    auth_headers: dict[str, str],
+    sample_bot_request: dict,
+) -> None:
+    """Test that a retried join with the same key doesn't start a second bot."""
+    mock_create_bot_run.return_value = {"status": "created"}
+    execute = _mock_workflow(mock_workflow_class)
+    headers = {**auth_headers, "Idempotency-Key": "join-1"}
+
+    first = client.post("/v1/api/bot/join", headers=headers, json=sample_bot_request)
+    second = client.post("/v1/api/bot/join", headers=headers, json=sample_bot_request)
+
+    assert first.status_code == second.status_code == 200
+    assert second.json() == first.json()
+    assert second.headers["idempotent-replayed"] == "true"
+    assert "idempotent-replayed" not in first.headers
+    mock_create_bot_run.assert_called_once()
+    execute.assert_called_once()
+
+
+@patch("flow.db.create_bot_run")
+@patch("flow.workflows.bot_call.BotCallWorkflow")
+def test_reused_key_with_different_body_is_rejected(
+    mock_workflow_class: MagicMock,
+    mock_create_bot_run: MagicMock,
+    client: TestClient,
+    auth_headers: dict[str, str],
+    sample_bot_request: dict,
+) -> None:
+    """Test that an Idempotency-Key can't be reused for a different request."""
+    mock_create_bot_run.return_value = {"status": "created"}
+    _mock_workflow(mock_workflow_class)
+    headers = {**auth_headers, "Idempotency-Key": "join-2"}
+
+    client.post("/v1/api/bot/join", headers=headers, json=sample_bot_request)
+    response = client.post(
+        "/v1/api/bot/join",
+        headers=headers,
+        json={**sample_bot_request, "room_url": "https://test.daily.co/other-room"},
+    )
+
+    assert response.status_code == 422
+    mock_create_bot_run.assert_called_once()
+
+
+@patch("flow.db.create_bot_run")
+@patch("flow.workflows.bot_call.BotCallWorkflow")
+def test_failed_join_releases_key(
+    mock_workflow_class: MagicMock,
+    mock_create_bot_run: MagicMock,
+    client: TestClient,
+    auth_headers: dict[str, str],
+    sample_bot_request: dict,
+) -> None:
+    """Test that a join that failed (402) can be retried with the same key."""
+    mock_create_bot_run.side_effect = [
+        {"status": "insufficient_credits", "balance": 0.0},
+        {"status": "created"},
+    ]
+    _mock_workflow(mock_workflow_class)
+    headers = {**auth_headers, "Idempotency-Key": "join-3"}
+
+    first = client.post("/v1/api/bot/join", headers=headers, json=sample_bot_request)
+    second = client.post("/v1/api/bot/join", headers=headers, json=sample_bot_request)
+
+    assert first.status_code == 402
+    assert second.status_code == 200
+    assert mock_create_bot_run.call_count == 2
+
+
+@patch("flow.db.create_bot_run")
+@patch("flow.workflows.bot_call.BotCallWorkflow")
+def test_concurrent_duplicates_share_one_launch(
+    mock_workflow_class: MagicMock,
+    mock_create_bot_run: MagicMock,
+    auth_headers: dict[str, str],
+    sample_bot_request: dict,
+) -> None:
+    """Test that duplicates arriving during the launch wait for it instead of launching."""
+    from flow.main import app
+
+    mock_create_bot_run.return_value = {"status": "created"}
+    execute = _mock_workflow(mock_workflow_class, delay=0.2)
+    headers = {**auth_headers, "Idempotency-Key": "join-4"}
+
+    async def run() -> list[httpx.Response]:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as async_client:
+            return await asyncio.gather(
+                *(
+                    async_client.post(
+                        "/v1/api/bot/join", headers=headers, json=sample_bot_request
+                    )
+                    for _ in range(3)
+                )
+            )
+
+    responses = asyncio.run(run())
+
+    assert [response.status_code for response in responses] == [200, 200, 200]
+    assert len({response.json()["bot_id"] for response in responses}) == 1
+    mock_create_bot_run.assert_called_once()
+    execute.assert_called_once()
+
+
+def test_waits_for_request_running_in_another_process() -> None:
+    """Test that a key claimed elsewhere replays the response once it's stored."""
+    request_hash = hash_request_body("{}")
+    operation = AsyncMock()
+    body = {"status": "started", "bot_id": "bot-1", "room_url": "https://x/y"}
+
+    with (
+        patch(
+            "flow.db.claim_idempotency_key",
+            return_value={
+                "claimed": False,
+                "status": "in_progress",
+                "request_hash": request_hash,
+            },
+        ),
+        patch(
+            "flow.db.get_idempotency_key",
+            return_value={
+                "status": "completed",
+                "request_hash": request_hash,
+                "response": body,
+            },
+        ),
+        patch.object(idempotency, "IDEMPOTENCY_POLL_INTERVAL_SECONDS", 0.01),
+    ):
+        result, replayed = asyncio.run(
+            run_idempotent("key-id", "join-5", request_hash, operation)
+        )
+
+    assert result == body
+    assert replayed is True
+    operation.assert_not_called()
+
+
+def test_conflict_when_other_process_does_not_finish() -> None:
+    """Test that a duplicate gives up with a conflict after the wait timeout."""
+    request_hash = hash_request_body("{}")
+    in_progress = {
+        "claimed": False,
+        "status": "in_progress",
+        "request_hash": request_hash,
+    }
+
+    with (
+        patch("flow.db.claim_idempotency_key", return_value=in_progress),
+        patch.object(idempotency, "IDEMPOTENCY_WAIT_SECONDS", 0.0),
+    ):
+        with pytest.raises(IdempotencyConflictError):
+            asyncio.run(run_idempotent("key-id", "join-6", request_hash, AsyncMock()))
@@ -0,0 +1,130 @@
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for the durable job queue and worker.
+
+Database calls are mocked - these tests only cover scheduling logic.
+"""
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from flow.jobs import JOB_PROCESS_TRANSCRIPT, enqueue_job
+from flow.jobs import queue as job_queue
+from flow.jobs.queue import RETRY_MAX_DELAY, Job, compute_retry_delay
+from flow.worker import JobWorker
+
+
+def _make_job(job_type: str = JOB_PROCESS_TRANSCRIPT, attempts: int = 1) -> Job:
+    return Job(
+        id=1,
+        queue="transcripts",
+        job_type=job_type,
+        payload={"room_name": "test-room"},
+        attempts=attempts,
+        max_attempts=5,
+    )
+
+
+def _mock_pool(rows: list | None = None, rowcount: int = 1) -> tuple:
+    """Job pool whose connection returns `rows` and `rowcount` for every query."""
+    cursor = MagicMock()
+    cursor.fetchall = AsyncMock(return_value=rows or [])
+    cursor.rowcount = rowcount
+    conn = MagicMock()
+    conn.execute = AsyncMock(return_value=cursor)
+
+    @asynccontextmanager
+    async def connection():
+        yield conn
+
+    pool = MagicMock()
+    pool.connection = connection
+    return pool, conn
+
+
+def test_retry_delay_grows_and_is_capped() -> None:
+    """Test that retry delay doubles per attempt and never exceeds the cap."""
+    assert compute_retry_delay(1) <= 12
+    assert compute_retry_delay(3) >= 32
+    assert compute_retry_delay(50) <= RETRY_MAX_DELAY * 1.2
+
+
+@pytest.mark.asyncio
+async def test_enqueue_job_disabled_returns_none(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that callers fall back to in-process execution when the queue is off."""
+    monkeypatch.delenv("USE_JOB_QUEUE", raising=False)
+    with patch("flow.jobs.enqueue", new=AsyncMock()) as mock_enqueue:
+        assert await enqueue_job(JOB_PROCESS_TRANSCRIPT, {"room_name": "r"}) is None
+        mock_enqueue.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_worker_completes_successful_job() -> None:
+    """Test that a job whose handler succeeds is marked complete."""
+    handler = AsyncMock()
+    worker = JobWorker(["transcripts"])
+    with (
+        patch.dict(
+            "flow.worker.JOB_HANDLERS",
+            {"test_job": type("H", (), {"queue": "transcripts", "handler": handler})},
+        ),
+        patch("flow.worker.job_queue.complete", new=AsyncMock()) as mock_complete,
+        patch("flow.worker.job_queue.fail", new=AsyncMock()) as mock_fail,
+    ):
+        await worker.run_job(_make_job("test_job"))
+
+    handler.assert_awaited_once_with({"room_name": "test-room"})
+    mock_complete.assert_awaited_once_with(1, worker.worker_id)
+    mock_fail.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_worker_records_failure_for_retry() -> None:
+    """Test that a handler exception is recorded as a failed attempt."""
+    handler = AsyncMock(side_effect=RuntimeError("boom"))
+    worker = JobWorker(["transcripts"])
+    job = _make_job("test_job")
+    with (
+        patch.dict(
+            "flow.worker.JOB_HANDLERS",
+            {"test_job": type("H", (), {"queue": "transcripts", "handler": handler})},
+        ),
+        patch("flow.worker.job_queue.complete", new=AsyncMock()) as mock_complete,
+        patch("flow.worker.job_queue.fail", new=AsyncMock()) as mock_fail,
+    ):
+        await worker.run_job(job)
+
+    mock_fail.assert_awaited_once_with(job, "boom", worker.worker_id)
+    mock_complete.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_claim_does_not_rerun_jobs_out_of_attempts() -> None:
+    """Test that an expired lease on the last attempt fails the job instead."""
+    pool, conn = _mock_pool()
+    with patch.object(job_queue, "_get_job_pool", new=AsyncMock(return_value=pool)):
+        await job_queue.claim(["transcripts"], 5, "worker-1")
+
+    fail_sql, claim_sql = (call.args[0] for call in conn.execute.await_args_list)
+    assert "SET status = 'failed'" in fail_sql
+    assert "attempts >= max_attempts" in fail_sql
+    assert "attempts < max_attempts" in claim_sql
+
+
+@pytest.mark.asyncio
+async def test_complete_and_fail_skip_jobs_taken_over() -> None:
+    """Test that a worker whose lease was taken over doesn't record a result."""
+    pool, conn = _mock_pool(rowcount=0)
+    with patch.object(job_queue, "_get_job_pool", new=AsyncMock(return_value=pool)):
+        assert await job_queue.complete(1, "worker-1") is False
+        assert await job_queue.fail(_make_job(), "boom", "worker-1") is False
+
+    for call in conn.execute.await_args_list:
+        assert "locked_by = %s" in call.args[0]
+        assert call.args[1][-1] == "worker-1"
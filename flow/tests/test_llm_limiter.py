@@ -0,0 +1,121 @@
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for the process-wide LLM rate limiter.
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from flow.utils.llm_limiter import (
+    PRIORITY_HIGH,
+    PRIORITY_LOW,
+    LLMRateLimiter,
+    _retry_after_seconds,
+)
+
+
+class _RateLimitError(Exception):
+    """Looks like openai.RateLimitError (status_code and response headers)."""
+
+    status_code = 429
+
+    def __init__(self, retry_after: str):
+        super().__init__("rate limited")
+        self.response = httpx.Response(429, headers={"retry-after": retry_after})
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap_and_priority_order() -> None:
+    """Test that only max_concurrency calls run and waiters go in priority order."""
+    limiter = LLMRateLimiter("test", max_concurrency=1)
+    order: list[str] = []
+    release = asyncio.Event()
+
+    async def hold() -> None:
+        async with limiter.acquire():
+            await release.wait()
+
+    async def record(name: str, priority: int) -> None:
+        async with limiter.acquire(priority=priority):
+            order.append(name)
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    low = asyncio.create_task(record("low", PRIORITY_LOW))
+    high = asyncio.create_task(record("high", PRIORITY_HIGH))
+    await asyncio.sleep(0)
+
+    assert limiter.in_flight == 1
+    assert limiter.queued == 2
+
+    release.set()
+    await asyncio.gather(holder, low, high)
+    assert order == ["high", "low"]
+
+
+@pytest.mark.asyncio
+async def test_requests_per_minute_bucket_delays_calls() -> None:
+    """Test that an empty request bucket delays the next call until it refills."""
+    limiter = LLMRateLimiter(
+        "test", requests_per_minute=600, tokens_per_minute=0, max_concurrency=10
+    )
+    limiter._request_bucket = 0.0  # 600/min refills one request every 0.1s
+
+    start = time.monotonic()
+    async with limiter.acquire():
+        pass
+
+    assert time.monotonic() - start >= 0.08
+
+
+@pytest.mark.asyncio
+async def test_429_retry_after_pauses_and_retries() -> None:
+    """Test that a 429 is retried after the Retry-After delay."""
+    limiter = LLMRateLimiter("test")
+    calls = 0
+
+    async def flaky() -> str:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise _RateLimitError("0.1")
+        return "ok"
+
+    start = time.monotonic()
+    assert await limiter.call(flaky, max_retries=2) == "ok"
+
+    assert calls == 2
+    assert time.monotonic() - start >= 0.08
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_errors_are_raised() -> None:
+    """Test that client errors (4xx other than 429) are not retried."""
+    limiter = LLMRateLimiter("test")
+
+    class BadRequest(Exception):
+        status_code = 400
+
+    async def bad() -> None:
+        raise BadRequest()
+
+    with pytest.raises(BadRequest):
+        await limiter.call(bad)
+    assert limiter.in_flight == 0
+
+
+def test_retry_after_header_parsing() -> None:
+    """Test retry-after-ms, seconds, and missing headers."""
+    error = _RateLimitError("2")
+    assert _retry_after_seconds(error) == 2.0
+
+    error.response = httpx.Response(429, headers={"retry-after-ms": "1500"})
+    assert _retry_after_seconds(error) == 1.5
+
+    error.response = httpx.Response(429)
+    assert _retry_after_seconds(error) is None
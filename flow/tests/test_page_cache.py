@@ -0,0 +1,88 @@
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for the in-memory static page cache (ETag, compression, 304s).
+"""
+
+import os
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from flow.utils.page_cache import StaticPageCache, choose_encoding
+
+
+def _client(tmp_path):
+    page_file = tmp_path / "page.html"
+    page_file.write_text("<html>const DOMAIN = null;</html>", encoding="utf-8")
+    renders = []
+
+    def render(text: str) -> str:
+        renders.append(text)
+        return text.replace("null", '"https://example.daily.co"')
+
+    cache = StaticPageCache(page_file, render, cache_control="public, max-age=60")
+    app = FastAPI()
+
+    @app.get("/page")
+    async def page(request: Request):
+        return cache.respond(request)
+
+    return TestClient(app), page_file, renders
+
+
+def test_serves_cached_compressed_page_with_validators(tmp_path) -> None:
+    """Test gzip selection, caching headers, and rendering only once."""
+    client, _, renders = _client(tmp_path)
+
+    response = client.get("/page", headers={"Accept-Encoding": "gzip"})
+    client.get("/page", headers={"Accept-Encoding": "identity"})
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text == '<html>const DOMAIN = "https://example.daily.co";</html>'
+    assert response.headers["etag"].endswith('-gzip"')
+    assert response.headers["cache-control"] == "public, max-age=60"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert "last-modified" in response.headers
+    assert len(renders) == 1
+
+
+def test_conditional_requests_and_reload(tmp_path) -> None:
+    """Test 304 for If-None-Match / If-Modified-Since and reload on mtime change."""
+    client, page_file, renders = _client(tmp_path)
+    first = client.get("/page", headers={"Accept-Encoding": "identity"})
+    etag = first.headers["etag"]
+
+    not_modified = client.get("/page", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    since = client.get(
+        "/page", headers={"If-Modified-Since": first.headers["last-modified"]}
+    )
+    assert since.status_code == 304
+
+    page_file.write_text("<html>changed</html>", encoding="utf-8")
+    stat = page_file.stat()
+    os.utime(page_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+    changed = client.get(
+        "/page", headers={"If-None-Match": etag, "Accept-Encoding": "identity"}
+    )
+    assert changed.status_code == 200
+    assert changed.text == "<html>changed</html>"
+    assert changed.headers["etag"] != etag
+    assert len(renders) == 2
+
+
+def test_choose_encoding() -> None:
+    """Test Accept-Encoding parsing with q values and wildcards."""
+    available = ("identity", "gzip", "br")
+    assert choose_encoding("gzip, deflate, br", available) == "br"
+    assert choose_encoding("br;q=0.5, gzip", available) == "gzip"
+    assert choose_encoding("br", ("identity", "gzip")) == "identity"
+    assert choose_encoding("*", available) == "br"
+    assert choose_encoding("gzip;q=0", available) == "identity"
+    assert choose_encoding("", available) == "identity"
@@ -0,0 +1,71 @@
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for per-API-key rate limiting in the auth middleware.
+"""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from shared.auth import UnkeyAuthMiddleware
+from shared.auth.rate_limit import TokenBucketRateLimiter, route_cost
+
+
+def test_token_bucket_refill_and_retry_after() -> None:
+    """Test spending, rejection with Retry-After, and refill over time."""
+    limiter = TokenBucketRateLimiter(requests_per_minute=60, burst=2)
+
+    assert limiter.acquire("key", now=0.0).allowed
+    assert limiter.acquire("key", now=0.0).remaining == 0
+    rejected = limiter.acquire("key", now=0.5)
+    assert not rejected.allowed
+    assert rejected.retry_after_seconds == 0.5
+
+    assert limiter.acquire("key", now=1.0).allowed
+    assert limiter.acquire("other", now=1.0).remaining == 1
+
+
+def test_lru_eviction_and_route_costs() -> None:
+    """Test that memory is bounded and expensive routes cost more."""
+    limiter = TokenBucketRateLimiter(requests_per_minute=60, burst=5, max_keys=2)
+    for key in ("a", "b", "a", "c"):
+        limiter.acquire(key, now=0.0)
+
+    assert len(limiter) == 2
+    assert "b" not in limiter._buckets
+    assert route_cost("POST", "/v1/api/bot/join") == 10
+    assert route_cost("GET", "/v1/api/bot/abc/status") == 1
+
+
+def test_middleware_returns_429_with_headers(monkeypatch) -> None:
+    """Test RateLimit headers on success and 429 + Retry-After when exhausted."""
+    monkeypatch.delenv("UNKEY_ROOT_KEY", raising=False)
+    monkeypatch.setenv("RATE_LIMIT_REQUESTS_PER_MINUTE", "60")
+    monkeypatch.setenv("RATE_LIMIT_BURST", "2")
+    app = FastAPI()
+    app.add_middleware(UnkeyAuthMiddleware)
+
+    @app.get("/v1/api/bot/{bot_id}/status")
+    async def status(bot_id: str) -> dict[str, str]:
+        return {"bot_id": bot_id}
+
+    client = TestClient(app)
+    headers = {"Authorization": "Bearer key-one"}
+
+    first = client.get("/v1/api/bot/b1/status", headers=headers)
+    assert first.status_code == 200
+    assert first.headers["ratelimit-limit"] == "2"
+    assert first.headers["ratelimit-remaining"] == "1"
+    assert first.headers["ratelimit-policy"] == "60;w=60;burst=2"
+
+    client.get("/v1/api/bot/b1/status", headers=headers)
+    limited = client.get("/v1/api/bot/b1/status", headers=headers)
+    assert limited.status_code == 429
+    assert int(limited.headers["retry-after"]) >= 1
+    assert limited.headers["ratelimit-remaining"] == "0"
+
+    other_key = client.get(
+        "/v1/api/bot/b1/status", headers={"Authorization": "Bearer key-two"}
+    )
+    assert other_key.status_code == 200
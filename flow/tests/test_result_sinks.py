@@ -0,0 +1,103 @@
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for result sinks (concurrent delivery of session results).
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from flow.steps.agent_call.steps.result_sinks import (
+    ResultSink,
+    SinkContext,
+    WebhookSink,
+    run_result_sinks,
+)
+
+
+class _SlowSink(ResultSink):
+    def __init__(self, name: str, delay: float, fail: bool = False):
+        self.name = name
+        self.status_field = f"{name}_sent"
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+
+    def is_configured(self, context: SinkContext) -> bool:
+        return True
+
+    async def send(self, context: SinkContext) -> bool:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("boom")
+        return True
+
+
+def _make_context() -> SinkContext:
+    return SinkContext(results_payload={}, session_data={}, room_name="room-1")
+
+
+@pytest.mark.asyncio
+async def test_sinks_run_concurrently() -> None:
+    """Test that total time is close to the slowest sink, not the sum."""
+    sinks = [_SlowSink("a", 0.2), _SlowSink("b", 0.2)]
+
+    start = time.perf_counter()
+    status = await run_result_sinks(sinks, _make_context(), already_sent={})
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.35
+    assert status["a"]["status"] == "sent"
+    assert status["b"]["duration_ms"] >= 150
+
+
+@pytest.mark.asyncio
+async def test_sink_errors_are_isolated_and_sent_sinks_skipped() -> None:
+    """Test that one failing sink doesn't affect others and sent sinks aren't re-run."""
+    failing = _SlowSink("a", 0, fail=True)
+    done = _SlowSink("b", 0)
+
+    status = await run_result_sinks(
+        [failing, done], _make_context(), already_sent={"b_sent": True}
+    )
+
+    assert status["a"] == {
+        "status": "error",
+        "sent": False,
+        "error": "boom",
+        "duration_ms": status["a"]["duration_ms"],
+    }
+    assert status["b"]["status"] == "already_sent"
+    assert done.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_webhook_key_is_per_run_not_per_room() -> None:
+    """Test that two sessions in a reused room without a thread get different keys."""
+    contexts = [
+        SinkContext(
+            results_payload={"transcript_id": transcript_id},
+            session_data={"webhook_callback_url": "https://example.com/hook"},
+            room_name="room-1",
+        )
+        for transcript_id in ("transcript-1", "transcript-2", None, None)
+    ]
+
+    with patch(
+        "flow.jobs.webhook_outbox.enqueue_webhook", new=AsyncMock(return_value=True)
+    ) as mock_enqueue:
+        for context in contexts:
+            assert await WebhookSink().send(context) is True
+
+    keys = [call.kwargs["idempotency_key"] for call in mock_enqueue.await_args_list]
+    assert keys[:2] == [
+        "session_complete:transcript-1",
+        "session_complete:transcript-2",
+    ]
+    assert len(set(keys)) == 4
+    assert "session_complete:room-1" not in keys
@@ -0,0 +1,131 @@
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for the shared transcript tokenizer and its consumers.
+"""
+
+import pytest
+
+from flow.steps.agent_call.steps.process_transcript import (
+    format_transcript_html,
+    parse_transcript_to_qa_pairs,
+    parse_vtt_to_text,
+)
+from flow.steps.agent_call.steps.transcript_parser import (
+    TranscriptRecord,
+    VTTCue,
+    VTTTranscriptBuilder,
+    aiter_vtt_cues,
+    tokenize_transcript,
+    transcript_records_to_dicts,
+)
+
+TRANSCRIPT = """
+[2025-01-01T10:00:00+00:00] assistant: What did you work on last quarter?
+[2025-01-01T10:00:05+00:00] user: I rebuilt our billing pipeline end to end.
+Some unlabeled note
+USER: It took about three months: mostly migrations.
+"""
+
+
+def test_tokenize_transcript_records() -> None:
+    """Test that lines become typed records with timestamp, speaker, role, content."""
+    records = tokenize_transcript(TRANSCRIPT)
+
+    assert records[0] == TranscriptRecord(
+        "2025-01-01T10:00:00+00:00",
+        "assistant",
+        "assistant",
+        "What did you work on last quarter?",
+    )
+    assert records[2] == TranscriptRecord(None, None, None, "Some unlabeled note")
+    assert records[3].role == "user"
+    assert records[3].content == "It took about three months: mostly migrations."
+    assert len(transcript_records_to_dicts(records)) == 3
+
+
+def test_tokenize_transcript_is_memoized() -> None:
+    """Test that the same transcript is only parsed once."""
+    assert tokenize_transcript(TRANSCRIPT) is tokenize_transcript(TRANSCRIPT)
+    assert tokenize_transcript("") == ()
+
+
+def test_consumers_share_records() -> None:
+    """Test Q&A extraction and HTML rendering on the shared records."""
+    qa_pairs = parse_transcript_to_qa_pairs(TRANSCRIPT)
+    assert qa_pairs == [
+        {
+            "question": "What did you work on last quarter?",
+            "answer": "I rebuilt our billing pipeline end to end. "
+            "It took about three months: mostly migrations.",
+        }
+    ]
+
+    transcript_html = format_transcript_html(TRANSCRIPT, "assistant")
+    assert "#1f2de6" in transcript_html  # bot line styled as assistant
+    assert "(2025-01-01T10:00:00)" in transcript_html
+    assert "<p>Some unlabeled note</p>" in transcript_html
+
+
+VTT = """WEBVTT
+Kind: captions
+
+NOTE This is a comment
+that spans two lines
+
+STYLE
+::cue { color: white }
+
+1
+00:00:01.000 --> 00:00:04.000 align:start
+<v.loud Interviewer>Tell me about</v>
+<v Interviewer>your <i>last</i> role</v>
+
+00:00:05.000 --> 00:00:07.500
+<v Interviewer>&amp; your team.</v>
+
+00:00:08.000 --> 00:00:10.000
+<v Jordan Lee>I led the data team.</v>
+00:00:10.000 --> 00:00:11.000
+No voice tag here"""
+
+
+async def _aiter(lines):
+    for line in lines:
+        yield line
+
+
+@pytest.mark.asyncio
+async def test_streaming_vtt_parser_keeps_speakers() -> None:
+    """Test that cues, notes, styles and tags are stripped and speakers kept."""
+    cues = [cue async for cue in aiter_vtt_cues(_aiter(VTT.splitlines()))]
+
+    assert cues == [
+        VTTCue(
+            "00:00:01.000",
+            "00:00:04.000",
+            "Interviewer",
+            "Tell me about your last role",
+        ),
+        VTTCue("00:00:05.000", "00:00:07.500", "Interviewer", "& your team."),
+        VTTCue("00:00:08.000", "00:00:10.000", "Jordan Lee", "I led the data team."),
+        VTTCue("00:00:10.000", "00:00:11.000", None, "No voice tag here"),
+    ]
+
+    builder = VTTTranscriptBuilder()
+    for cue in cues:
+        builder.add(cue)
+    assert builder.build() == (
+        "Interviewer: Tell me about your last role & your team.\n"
+        "Jordan Lee: I led the data team.\n"
+        "No voice tag here"
+    )
+
+
+def test_parse_vtt_to_text_plain_output() -> None:
+    """Test that the in-memory helper still returns text without speakers."""
+    assert parse_vtt_to_text(VTT) == (
+        "Tell me about your last role & your team. "
+        "I led the data team. No voice tag here"
+    )
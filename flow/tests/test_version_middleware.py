@@ -0,0 +1,64 @@
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for the pure-ASGI VersionHeaderMiddleware.
+"""
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from flow.main import VersionHeaderMiddleware
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(VersionHeaderMiddleware)
+
+    @app.get("/v1/api/items")
+    async def items_v1():
+        return {"ok": True}
+
+    @app.get("/legacy")
+    async def legacy():
+        return {"ok": True}
+
+    @app.get("/health")
+    async def health():
+        return {"ok": True}
+
+    @app.get("/v1/api/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"data: {i}\n\n"
+
+        return StreamingResponse(chunks(), media_type="text/event-stream")
+
+    return TestClient(app)
+
+
+def test_version_headers_by_path() -> None:
+    """Test v1, deprecated unversioned, and exempt paths."""
+    client = _client()
+
+    v1 = client.get("/v1/api/items")
+    assert v1.headers["x-api-version"] == "v1"
+    assert "x-api-deprecated" not in v1.headers
+
+    legacy = client.get("/legacy")
+    assert legacy.headers["x-api-version"] == "unversioned"
+    assert legacy.headers["x-api-deprecated"] == "true"
+
+    health = client.get("/health")
+    assert "x-api-version" not in health.headers
+    assert health.json() == {"ok": True}
+
+
+def test_streaming_response_passes_through() -> None:
+    """Test that streamed bodies are passed through unchanged with the header."""
+    response = _client().get("/v1/api/stream")
+
+    assert response.headers["x-api-version"] == "v1"
+    assert response.text == "data: 0\n\ndata: 1\n\ndata: 2\n\n"
@@ -0,0 +1,96 @@
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for webhook outbox delivery.
+
+HTTP calls use httpx.MockTransport and database updates are mocked.
+"""
+
+import hashlib
+import hmac
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from flow.jobs import webhook_outbox
+from flow.jobs.webhook_outbox import (
+    WebhookDeliveryError,
+    attempt_delivery,
+    sign_webhook_body,
+)
+
+
+def _make_delivery() -> dict:
+    return {
+        "id": "delivery-1",
+        "idempotency_key": "session_complete:thread-1",
+        "url": "https://example.com/webhook",
+        "payload": {"event": "session_complete"},
+        "attempts": 0,
+        "status": "pending",
+    }
+
+
+def _mock_client(status_code: int, seen: list[httpx.Request]) -> httpx.AsyncClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(status_code, text="ok")
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def test_sign_webhook_body(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that signatures are HMAC-SHA256 over '{timestamp}.{body}'."""
+    monkeypatch.setenv("WEBHOOK_SIGNING_SECRET", "secret")
+    expected = hmac.new(b"secret", b"123.{}", hashlib.sha256).hexdigest()
+    assert sign_webhook_body(b"{}", 123) == f"v1={expected}"
+
+    monkeypatch.delenv("WEBHOOK_SIGNING_SECRET")
+    assert sign_webhook_body(b"{}", 123) is None
+
+
+@pytest.mark.asyncio
+async def test_attempt_delivery_success_records_delivered() -> None:
+    """Test that a 2xx response marks the delivery as delivered."""
+    seen: list[httpx.Request] = []
+    with (
+        patch.object(
+            webhook_outbox, "_get_http_client", return_value=_mock_client(200, seen)
+        ),
+        patch("flow.db.update_webhook_delivery") as mock_update,
+    ):
+        assert await attempt_delivery(_make_delivery()) is True
+
+    assert seen[0].headers["Idempotency-Key"] == "session_complete:thread-1"
+    assert mock_update.call_args[0][1]["status"] == "delivered"
+
+
+@pytest.mark.asyncio
+async def test_attempt_delivery_server_error_is_retried() -> None:
+    """Test that a 5xx response raises so the delivery is retried."""
+    with (
+        patch.object(
+            webhook_outbox, "_get_http_client", return_value=_mock_client(503, [])
+        ),
+        patch("flow.db.update_webhook_delivery") as mock_update,
+    ):
+        with pytest.raises(WebhookDeliveryError):
+            await attempt_delivery(_make_delivery())
+
+    assert mock_update.call_args[0][1]["status"] == "retrying"
+
+
+@pytest.mark.asyncio
+async def test_attempt_delivery_client_error_is_not_retried() -> None:
+    """Test that a 4xx response marks the delivery as permanently failed."""
+    with (
+        patch.object(
+            webhook_outbox, "_get_http_client", return_value=_mock_client(404, [])
+        ),
+        patch("flow.db.update_webhook_delivery", new=MagicMock()) as mock_update,
+    ):
+        assert await attempt_delivery(_make_delivery()) is False
+
+    assert mock_update.call_args[0][1]["status"] == "failed"
@@ -0,0 +1,142 @@
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Unit tests for the workflow thread row cache (flow/utils/workflow_thread_cache.py)
+used by get_workflow_thread_data.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from flow import db
+from flow.utils import workflow_thread_cache
+from flow.utils.workflow_thread_cache import (
+    workflow_thread_cache_lookups,
+    workflow_thread_cache_scope,
+)
+
+
+def _mock_client(row: dict) -> MagicMock:
+    """Supabase client returning `row` for reads and for updates."""
+    client = MagicMock()
+    table = client.table.return_value
+    select = table.select.return_value
+    select.eq.return_value.execute.return_value.data = [row]
+    table.update.return_value.eq.return_value.execute.return_value.data = [row]
+    return client
+
+
+def _select_count(client: MagicMock) -> int:
+    """Number of SELECT queries sent."""
+    return client.table.return_value.select.call_count
+
+
+def test_run_scope_reads_each_row_once() -> None:
+    """Test that a run reads the row once, whatever each call projects."""
+    client = _mock_client(
+        {"workflow_thread_id": "thread-1", "usage_stats": None, "unkey_key_id": "k"}
+    )
+
+    with (
+        patch.object(db, "get_supabase_client", return_value=client),
+        patch.object(workflow_thread_cache, "WORKFLOW_THREAD_CACHE_TTL_SECONDS", 0),
+        workflow_thread_cache_scope(),
+    ):
+        db.get_workflow_thread_data("thread-1", fields=["usage_stats", "unkey_key_id"])
+        assert db.get_workflow_thread_data("thread-1", fields=["unkey_key_id"]) == {
+            "unkey_key_id": "k"
+        }
+        db.update_workflow_thread_fields(
+            "thread-1", {"usage_stats": {"total_cost_usd": 0.5}}
+        )
+        thread_data = db.get_workflow_thread_data("thread-1", fields=["usage_stats"])
+
+    assert _select_count(client) == 1
+    # Writes in this process are applied to the cached row
+    assert thread_data["usage_stats"] == {"total_cost_usd": 0.5}
+
+
+def test_process_cache_expires() -> None:
+    """Test the short-TTL process cache outside a run scope."""
+    client = _mock_client({"workflow_thread_id": "thread-2", "checkpoint_id": "c1"})
+    hits_before = workflow_thread_cache_lookups.get("process")
+
+    with patch.object(db, "get_supabase_client", return_value=client):
+        db.get_workflow_thread_data("thread-2", fields=["checkpoint_id"])
+        db.get_workflow_thread_data("thread-2", fields=["checkpoint_id"])
+        assert _select_count(client) == 1
+
+        with patch.object(workflow_thread_cache.time, "monotonic", return_value=1e12):
+            db.get_workflow_thread_data("thread-2", fields=["checkpoint_id"])
+
+    assert _select_count(client) == 2
+    assert workflow_thread_cache_lookups.get("process") == hits_before + 1
+
+
+def test_projected_row_does_not_satisfy_full_read() -> None:
+    """Test that a full read isn't served from a row cached with fewer columns."""
+    client = _mock_client({"workflow_thread_id": "thread-3", "checkpoint_id": "c1"})
+
+    with (
+        patch.object(db, "get_supabase_client", return_value=client),
+        workflow_thread_cache_scope(),
+    ):
+        db.get_workflow_thread_data("thread-3", fields=["checkpoint_id"])
+        db.get_workflow_thread_data("thread-3")
+
+    assert _select_count(client) == 2
+
+
+def test_failed_write_drops_cached_row() -> None:
+    """Test that a write error invalidates the row instead of keeping a guess."""
+    client = _mock_client({"workflow_thread_id": "thread-4", "checkpoint_id": "c1"})
+
+    with patch.object(db, "get_supabase_client", return_value=client):
+        db.get_workflow_thread_data("thread-4", fields=["checkpoint_id"])
+        client.table.return_value.update.side_effect = RuntimeError("boom")
+        assert not db.update_workflow_thread_fields("thread-4", {"checkpoint_id": "c2"})
+        db.get_workflow_thread_data("thread-4", fields=["checkpoint_id"])
+
+    assert _select_count(client) == 2
+
+
+def test_fresh_read_sees_writes_from_other_processes() -> None:
+    """Test that a read-modify-write re-read isn't served from the run scope."""
+    client = _mock_client({"workflow_thread_id": "thread-5", "bot_duration": None})
+
+    with (
+        patch.object(db, "get_supabase_client", return_value=client),
+        workflow_thread_cache_scope(),
+    ):
+        db.get_workflow_thread_data("thread-5", fields=["bot_duration"])
+        # Another process saves bot_duration
+        select = client.table.return_value.select.return_value
+        select.eq.return_value.execute.return_value.data = [
+            {"workflow_thread_id": "thread-5", "bot_duration": 321}
+        ]
+        thread_data = db.get_workflow_thread_data(
+            "thread-5", fields=["bot_duration"], fresh=True
+        )
+        cached = db.get_workflow_thread_data("thread-5", fields=["bot_duration"])
+
+    assert thread_data["bot_duration"] == 321
+    # The fresh row also replaces the stale one in the cache
+    assert cached["bot_duration"] == 321
+    assert _select_count(client) == 2
+
+
+def test_nested_values_are_not_shared() -> None:
+    """Test that changing a returned usage_stats doesn't change the cached row."""
+    client = _mock_client(
+        {"workflow_thread_id": "thread-6", "usage_stats": {"total_cost_usd": 0.1}}
+    )
+
+    with patch.object(db, "get_supabase_client", return_value=client):
+        first = db.get_workflow_thread_data("thread-6", fields=["usage_stats"])
+        first["usage_stats"]["total_cost_usd"] = 9.9
+        second = db.get_workflow_thread_data("thread-6", fields=["usage_stats"])
+        second["usage_stats"]["total_cost_usd"] = 9.9
+        third = db.get_workflow_thread_data("thread-6", fields=["usage_stats"])
+
+    assert _select_count(client) == 1
+    assert third["usage_stats"] == {"total_cost_usd": 0.1}
@@ -0,0 +1,390 @@
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Bot Event Stream
+
+Publish/subscribe for live bot events, used by GET /v1/api/bot/{bot_id}/events.
+
+**Simple Explanation:**
+While a bot is in a call, it produces events:
+
+- "transcript": a new transcript line (from TranscriptHandler)
+- "speaker": the speaker changed (from TranscriptHandler)
+- "cost": LLM usage and cost so far (from UsageMetricsProcessor)
+- "status": the bot session status changed (from save_bot_session)
+
+Events are published to a topic (the Daily room name). Every subscriber gets its
+own bounded buffer (BOT_EVENTS_BUFFER_SIZE). A slow client never blocks the bot:
+when its buffer is full the oldest event is dropped and counted.
+
+Bots often run in another process (Modal, Fly) than the API server holding the
+stream open. With BOT_EVENTS_PG_NOTIFY=true, events are also sent through
+Postgres NOTIFY on the "bot_events" channel, and each API process LISTENs on that
+channel and hands the events to its local subscribers.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import queue
+import threading
+import uuid
+from collections import deque
+from typing import Any, Dict, Set
+
+from flow.utils.metrics import get_counter
+
+logger = logging.getLogger(__name__)
+
+# Postgres channel used to fan events out across processes
+BOT_EVENTS_CHANNEL = "bot_events"
+
+# Events kept per subscriber before the oldest are dropped
+BOT_EVENTS_BUFFER_SIZE = int(os.getenv("BOT_EVENTS_BUFFER_SIZE", "256"))
+
+# Postgres limits NOTIFY payloads to 8000 bytes; larger events stay local
+MAX_NOTIFY_PAYLOAD_BYTES = 7900
+
+# Identifies this process, so it can skip its own events coming back via LISTEN
+PROCESS_ID = uuid.uuid4().hex
+
+bot_events_published = get_counter(
+    "bot_events_published_total", "Bot events published by event type"
+)
+bot_events_dropped = get_counter(
+    "bot_events_dropped_total",
+    "Bot events not delivered (subscriber_overflow/notify_too_large/notify_queue_full/notify_error)",
+)
+
+
+def is_pg_notify_enabled() -> bool:
+    """
+    Check whether bot events should fan out across processes via Postgres.
+
+    **Simple Explanation:**
+    Set BOT_EVENTS_PG_NOTIFY=true when bots run in a different process than the
+    API server (Modal, Fly, several API instances). Requires SUPABASE_DB_URL or
+    SUPABASE_DB_PASSWORD, like the job queue.
+    """
+    return os.getenv("BOT_EVENTS_PG_NOTIFY", "false").lower() == "true"
+
+
+class BotEventSubscription:
+    """
+    One subscriber's bounded event buffer.
+
+    Example:
+        ```python
+        subscription = bot_event_broker.subscribe(room_name)
+        try:
+            event = await subscription.get(timeout=15)
+        finally:
+            bot_event_broker.unsubscribe(subscription)
+        ```
+    """
+
+    def __init__(
+        self, topic: str, loop: asyncio.AbstractEventLoop, maxsize: int
+    ) -> None:
+        self.topic = topic
+        self.loop = loop
+        self.dropped = 0
+        self._buffer: deque = deque(maxlen=maxsize)
+        self._ready = asyncio.Event()
+
+    def _deliver(self, event: Dict[str, Any]) -> None:
+        """Add an event to the buffer (runs on the subscriber's event loop)."""
+        if len(self._buffer) == self._buffer.maxlen:
+            # deque(maxlen) drops the oldest event on append
+            self.dropped += 1
+            bot_events_dropped.inc("subscriber_overflow")
+        self._buffer.append(event)
+        self._ready.set()
+
+    async def get(self, timeout: float | None = None) -> Dict[str, Any] | None:
+        """
+        Wait for the next event.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits forever)
+
+        Returns:
+            The event, or None on timeout
+        """
+        if not self._buffer:
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        return self._buffer.popleft()
+
+
+class BotEventBroker:
+    """
+    In-process pub/sub of bot events, keyed by topic (room name).
+
+    **Simple Explanation:**
+    `deliver` can be called from any thread or event loop. Each subscriber's
+    buffer is only touched on the subscriber's own event loop.
+    """
+
+    def __init__(self, buffer_size: int = BOT_EVENTS_BUFFER_SIZE) -> None:
+        self.buffer_size = buffer_size
+        self._subscribers: Dict[str, Set[BotEventSubscription]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, topic: str) -> BotEventSubscription:
+        """Subscribe to a topic on the current event loop."""
+        subscription = BotEventSubscription(
+            topic, asyncio.get_running_loop(), self.buffer_size
+        )
+        with self._lock:
+            self._subscribers.setdefault(topic, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: BotEventSubscription) -> None:
+        """Remove a subscription (safe to call more than once)."""
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.topic)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.topic]
+
+    def has_subscribers(self, topic: str) -> bool:
+        """Check whether anyone in this process is subscribed to a topic."""
+        with self._lock:
+            return topic in self._subscribers
+
+    def deliver(self, topic: str, event: Dict[str, Any]) -> int:
+        """
+        Hand an event to this process's subscribers of a topic.
+
+        Returns:
+            Number of subscribers the event was handed to
+        """
+        with self._lock:
+            subscribers = list(self._subscribers.get(topic, ()))
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._deliver, event)
+            except RuntimeError:
+                # The subscriber's event loop has already closed
+                self.unsubscribe(subscription)
+        return len(subscribers)
+
+
+bot_event_broker = BotEventBroker()
+
+
+def publish_bot_event(
+    room_name: str | None, event_type: str, data: Dict[str, Any]
+) -> None:
+    """
+    Publish a bot event to local subscribers and, if enabled, to other processes.
+
+    **Simple Explanation:**
+    Never blocks and never raises: events are best-effort, the transcript and
+    costs are still saved to the database as before.
+
+    Args:
+        room_name: Daily room name the bot is in (the topic)
+        event_type: "transcript", "speaker", "cost" or "status"
+        data: JSON-serializable event data
+    """
+    if not room_name:
+        return
+
+    event = {"event": event_type, "data": data}
+    try:
+        bot_events_published.inc(event_type)
+        bot_event_broker.deliver(room_name, event)
+        if is_pg_notify_enabled():
+            _get_notify_sender().send(room_name, event)
+    except Exception as e:
+        logger.debug(f"Could not publish bot event {event_type} for {room_name}: {e}")
+
+
+class _NotifySender:
+    """
+    Background thread that sends events with Postgres NOTIFY.
+
+    **Simple Explanation:**
+    Publishing happens inside the bot's audio pipeline, so the database round
+    trip runs on its own thread with its own connection. If the queue fills up
+    (database slow or down), new events are dropped instead of piling up.
+    """
+
+    def __init__(self, maxsize: int = 1000) -> None:
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(
+            target=self._run, name="bot-events-notify", daemon=True
+        )
+        self._thread.start()
+
+    def send(self, topic: str, event: Dict[str, Any]) -> None:
+        """Queue an event for NOTIFY (drops it if too large or the queue is full)."""
+        payload = json.dumps(
+            {"origin": PROCESS_ID, "topic": topic, **event},
+            separators=(",", ":"),
+            default=str,
+        )
+        if len(payload.encode("utf-8")) > MAX_NOTIFY_PAYLOAD_BYTES:
+            bot_events_dropped.inc("notify_too_large")
+            return
+        try:
+            self._queue.put_nowait(payload)
+        except queue.Full:
+            bot_events_dropped.inc("notify_queue_full")
+
+    def _run(self) -> None:
+        conn = None
+        while True:
+            payload = self._queue.get()
+            try:
+                if conn is None or conn.closed:
+                    conn = _connect_sync()
+                if conn is None:
+                    bot_events_dropped.inc("notify_error")
+                    continue
+                conn.execute("SELECT pg_notify(%s, %s)", (BOT_EVENTS_CHANNEL, payload))
+            except Exception as e:
+                logger.warning(f"⚠️ Could not NOTIFY bot event: {e}")
+                bot_events_dropped.inc("notify_error")
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+                conn = None
+
+
+_notify_sender: _NotifySender | None = None
+_notify_sender_lock = threading.Lock()
+
+
+def _get_notify_sender() -> _NotifySender:
+    """Get the process-wide NOTIFY sender thread, starting it if needed."""
+    global _notify_sender
+
+    with _notify_sender_lock:
+        if _notify_sender is None:
+            _notify_sender = _NotifySender()
+    return _notify_sender
+
+
+def _connect_sync():
+    """Open an autocommit psycopg connection, or None if not configured."""
+    try:
+        import psycopg
+    except ImportError:
+        logger.error("❌ psycopg not available. Install with: pip install psycopg")
+        return None
+
+    from flow.db import _get_db_connection_string
+
+    db_url = _get_db_connection_string()
+    if not db_url:
+        return None
+    return psycopg.connect(db_url, autocommit=True, prepare_threshold=None)
+
+
+# Simple Explanation: One LISTEN task per API process, started when the first
+# client subscribes and kept running for the process lifetime.
+_listener_task: asyncio.Task | None = None
+
+# Seconds to wait before reconnecting after the LISTEN connection fails
+LISTEN_RECONNECT_DELAY_SECONDS = 5.0
+
+
+def ensure_bot_event_listener() -> None:
+    """
+    Start the Postgres LISTEN task on the current event loop, if enabled.
+
+    **Simple Explanation:**
+    Called by the events endpoint before it subscribes. Does nothing when
+    BOT_EVENTS_PG_NOTIFY is off or the listener is already running.
+    """
+    global _listener_task
+
+    if not is_pg_notify_enabled():
+        return
+    if _listener_task is not None and not _listener_task.done():
+        return
+    _listener_task = asyncio.get_running_loop().create_task(_listen_for_bot_events())
+
+
+async def stop_bot_event_listener() -> None:
+    """Stop the Postgres LISTEN task (called on API shutdown)."""
+    global _listener_task
+
+    if _listener_task is not None:
+        _listener_task.cancel()
+        try:
+            await _listener_task
+        except (asyncio.CancelledError, Exception):
+            pass
+        _listener_task = None
+
+
+def handle_bot_event_notification(payload: str) -> None:
+    """
+    Deliver an event received via LISTEN to this process's subscribers.
+
+    Events this process published itself were already delivered locally and are
+    skipped. "status" events also drop the bot's cached status response, since
+    the save that sent them happened in another process.
+    """
+    try:
+        message = json.loads(payload)
+    except ValueError:
+        logger.warning("⚠️ Ignoring malformed bot event notification")
+        return
+
+    if message.get("origin") == PROCESS_ID:
+        return
+    topic = message.get("topic")
+    if not topic:
+        return
+    data = message.get("data") or {}
+    if message.get("event") == "status" and data.get("bot_id"):
+        from flow.utils.bot_status_cache import invalidate_bot_status
+
+        invalidate_bot_status(data["bot_id"])
+    bot_event_broker.deliver(topic, {"event": message.get("event"), "data": data})
+
+
+async def _listen_for_bot_events() -> None:
+    """LISTEN on the bot events channel and deliver notifications, reconnecting on errors."""
+    try:
+        import psycopg
+    except ImportError:
+        logger.error("❌ psycopg not available. Install with: pip install psycopg")
+        return
+
+    from flow.db import _get_db_connection_string
+
+    db_url = _get_db_connection_string()
+    if not db_url:
+        return
+
+    while True:
+        try:
+            async with await psycopg.AsyncConnection.connect(
+                db_url, autocommit=True, prepare_threshold=None
+            ) as conn:
+                await conn.execute(f"LISTEN {BOT_EVENTS_CHANNEL}")
+                logger.info(f"👂 Listening for bot events on '{BOT_EVENTS_CHANNEL}'")
+                async for notify in conn.notifies():
+                    handle_bot_event_notification(notify.payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(
+                f"⚠️ Bot event listener disconnected: {e} - "
+                f"reconnecting in {LISTEN_RECONNECT_DELAY_SECONDS:.0f}s"
+            )
+        await asyncio.sleep(LISTEN_RECONNECT_DELAY_SECONDS)
@@ -0,0 +1,207 @@
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Bot Status Cache
+
+Server-side cache and change notifications for GET /v1/api/bot/{bot_id}/status.
+
+**Simple Explanation:**
+Clients poll the status endpoint in tight loops. Every poll used to read (and
+decrypt) the bot session from the database and check whether the bot is still
+running. This module keeps the latest status response in memory:
+
+- Finished bots are cached for a long time once their response no longer
+  changes (BOT_STATUS_TERMINAL_TTL_SECONDS): failed bots, and completed bots
+  whose transcript and Q&A pairs have been saved
+- Running bots, and completed bots still waiting for their results (the bot's
+  own process saves them a little later), are cached for a couple of seconds,
+  so many clients polling the same bot share one database read
+  (BOT_STATUS_RUNNING_TTL_SECONDS)
+- Each response gets an ETag, so an unchanged poll can be answered with 304
+- `wait_for_bot_status_change` lets a request wait (long-poll) until the bot
+  session is saved again, instead of the client polling
+
+`save_bot_session` calls `invalidate_bot_status`, which drops the cached entry
+and wakes up any waiting requests in this process. Saves in other processes
+(bots on Modal or Fly) reach this one as "status" bot events when
+BOT_EVENTS_PG_NOTIFY is on (see flow/utils/bot_events.py).
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+from flow.utils.metrics import get_counter
+
+logger = logging.getLogger(__name__)
+
+# Statuses that don't change any more once reached
+TERMINAL_BOT_STATUSES = frozenset({"completed", "failed"})
+
+BOT_STATUS_TERMINAL_TTL_SECONDS = float(
+    os.getenv("BOT_STATUS_TERMINAL_TTL_SECONDS", "3600")
+)
+BOT_STATUS_RUNNING_TTL_SECONDS = float(os.getenv("BOT_STATUS_RUNNING_TTL_SECONDS", "2"))
+BOT_STATUS_CACHE_SIZE = int(os.getenv("BOT_STATUS_CACHE_SIZE", "1024"))
+
+bot_status_cache_lookups = get_counter(
+    "bot_status_cache_lookups_total", "Bot status cache lookups by result (hit/miss)"
+)
+
+
+class CachedBotStatus(NamedTuple):
+    """
+    One cached status response.
+
+    Attributes:
+        body: JSON-serializable response body
+        etag: Strong ETag of the body (quoted)
+        terminal: Whether the status is final (completed/failed)
+        expires_at: time.monotonic() after which the entry is stale
+    """
+
+    body: Dict[str, Any]
+    etag: str
+    terminal: bool
+    expires_at: float
+
+
+_cache: "OrderedDict[str, CachedBotStatus]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+# bot_id -> waiting long-poll requests (their event loop and event)
+_waiters: Dict[str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+_waiters_lock = threading.Lock()
+
+
+def compute_status_etag(body: Dict[str, Any]) -> str:
+    """Compute a strong ETag for a status response body."""
+    payload = json.dumps(body, sort_keys=True, separators=(",", ":"), default=str)
+    return '"' + hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def get_cached_bot_status(bot_id: str) -> CachedBotStatus | None:
+    """
+    Get the cached status response for a bot, if it is still fresh.
+
+    Args:
+        bot_id: Bot session ID
+
+    Returns:
+        CachedBotStatus, or None if not cached or expired
+    """
+    with _cache_lock:
+        entry = _cache.get(bot_id)
+        if entry is not None and entry.expires_at > time.monotonic():
+            _cache.move_to_end(bot_id)
+            bot_status_cache_lookups.inc("hit")
+            return entry
+        if entry is not None:
+            del _cache[bot_id]
+    bot_status_cache_lookups.inc("miss")
+    return None
+
+
+def _is_final_body(body: Dict[str, Any]) -> bool:
+    """Check whether a status response won't change any more."""
+    if body.get("status") == "failed":
+        return True
+    return body.get("status") == "completed" and (
+        body.get("transcript") is not None or body.get("qa_pairs") is not None
+    )
+
+
+def store_bot_status(bot_id: str, body: Dict[str, Any]) -> CachedBotStatus:
+    """
+    Cache a status response body.
+
+    Args:
+        bot_id: Bot session ID
+        body: Response body (must include "status")
+
+    Returns:
+        The cached entry (with its ETag)
+    """
+    terminal = body.get("status") in TERMINAL_BOT_STATUSES
+    ttl = (
+        BOT_STATUS_TERMINAL_TTL_SECONDS
+        if _is_final_body(body)
+        else BOT_STATUS_RUNNING_TTL_SECONDS
+    )
+    entry = CachedBotStatus(
+        body=body,
+        etag=compute_status_etag(body),
+        terminal=terminal,
+        expires_at=time.monotonic() + ttl,
+    )
+    with _cache_lock:
+        _cache[bot_id] = entry
+        _cache.move_to_end(bot_id)
+        while len(_cache) > BOT_STATUS_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return entry
+
+
+def invalidate_bot_status(bot_id: str) -> None:
+    """
+    Drop the cached status for a bot and wake up long-poll requests waiting on it.
+
+    **Simple Explanation:**
+    Called whenever a bot session is saved. Safe to call from any thread.
+    """
+    with _cache_lock:
+        _cache.pop(bot_id, None)
+
+    with _waiters_lock:
+        waiters = _waiters.pop(bot_id, [])
+    for loop, event in waiters:
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:
+            # The waiting request's event loop has already closed
+            pass
+
+
+async def wait_for_bot_status_change(bot_id: str, timeout: float) -> bool:
+    """
+    Wait until the bot session is saved again in this process, or the timeout passes.
+
+    Args:
+        bot_id: Bot session ID
+        timeout: Maximum seconds to wait
+
+    Returns:
+        True if a change was signalled, False on timeout
+    """
+    if timeout <= 0:
+        return False
+
+    waiter = (asyncio.get_running_loop(), asyncio.Event())
+    with _waiters_lock:
+        _waiters.setdefault(bot_id, []).append(waiter)
+
+    try:
+        await asyncio.wait_for(waiter[1].wait(), timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
+    finally:
+        with _waiters_lock:
+            waiters = _waiters.get(bot_id)
+            if waiters and waiter in waiters:
+                waiters.remove(waiter)
+                if not waiters:
+                    del _waiters[bot_id]
+
+
+def clear_bot_status_cache() -> None:
+    """Clear all cached status responses (for tests)."""
+    with _cache_lock:
+        _cache.clear()
@@ -0,0 +1,260 @@
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Idempotency Keys
+
+Makes retried requests safe: a request sent again with the same `Idempotency-Key`
+header gets the original response instead of running a second time.
+
+**Simple Explanation:**
+Clients retry POST /v1/api/bot/join when a request times out. Without this, every
+retry would start another bot (and bill for it). With an Idempotency-Key:
+
+- The first request claims the key in the `idempotency_keys` table, runs, and
+  stores its response there (for IDEMPOTENCY_KEY_TTL_SECONDS)
+- Later requests with the same key get the stored response back
+- Requests with the same key that arrive while the first one is still running
+  in this process wait for it and share its result; if it is running in another
+  process, they poll the table for a few seconds and then get 409
+- Reusing a key with a different request body is rejected (422)
+- Failed requests release the key, so the client can retry
+
+Keys are scoped per API key. Completed responses are also kept in a small
+in-process LRU so most replays don't touch the database.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+from flow.utils.metrics import get_counter
+
+logger = logging.getLogger(__name__)
+
+# How long completed responses are replayed
+IDEMPOTENCY_KEY_TTL_SECONDS = int(os.getenv("IDEMPOTENCY_KEY_TTL_SECONDS", "86400"))
+
+# How long an in-progress claim blocks other requests before it can be taken over
+# (covers a process that died mid-request)
+IDEMPOTENCY_LOCK_SECONDS = int(os.getenv("IDEMPOTENCY_LOCK_SECONDS", "120"))
+
+# How long a duplicate waits for a request running in another process
+IDEMPOTENCY_WAIT_SECONDS = float(os.getenv("IDEMPOTENCY_WAIT_SECONDS", "10"))
+IDEMPOTENCY_POLL_INTERVAL_SECONDS = 0.5
+
+IDEMPOTENCY_CACHE_SIZE = int(os.getenv("IDEMPOTENCY_CACHE_SIZE", "1024"))
+
+# Longest accepted Idempotency-Key header value
+MAX_IDEMPOTENCY_KEY_LENGTH = 255
+
+idempotency_requests = get_counter(
+    "idempotency_requests_total",
+    "Idempotent requests by outcome (executed/replayed_memory/replayed_db/coalesced/conflict/mismatch)",
+)
+
+
+class IdempotencyKeyReusedError(Exception):
+    """The Idempotency-Key was already used with a different request body."""
+
+
+class IdempotencyConflictError(Exception):
+    """A request with the same Idempotency-Key is still running elsewhere."""
+
+
+# key_hash -> (request_hash, response body, time.monotonic() expiry)
+_completed: "OrderedDict[str, Tuple[str, Dict[str, Any], float]]" = OrderedDict()
+_completed_lock = threading.Lock()
+
+# key_hash -> (request_hash, future shared by concurrent duplicates in this process)
+_in_flight: Dict[str, Tuple[str, asyncio.Future]] = {}
+
+
+def hash_idempotency_key(scope: str, key: str) -> str:
+    """Hash an Idempotency-Key together with its scope (the API key ID)."""
+    return hashlib.sha256(f"{scope}:{key}".encode()).hexdigest()
+
+
+def hash_request_body(body: str | bytes) -> str:
+    """Hash a request body, to detect a key reused with different parameters."""
+    if isinstance(body, str):
+        body = body.encode()
+    return hashlib.sha256(body).hexdigest()
+
+
+def _remember(key_hash: str, request_hash: str, body: Dict[str, Any]) -> None:
+    """Keep a completed response in the in-process LRU."""
+    with _completed_lock:
+        _completed[key_hash] = (
+            request_hash,
+            body,
+            time.monotonic() + IDEMPOTENCY_KEY_TTL_SECONDS,
+        )
+        _completed.move_to_end(key_hash)
+        while len(_completed) > IDEMPOTENCY_CACHE_SIZE:
+            _completed.popitem(last=False)
+
+
+def _recall(key_hash: str) -> Tuple[str, Dict[str, Any]] | None:
+    """Get a completed response from the in-process LRU, if not expired."""
+    with _completed_lock:
+        entry = _completed.get(key_hash)
+        if entry is None:
+            return None
+        if entry[2] <= time.monotonic():
+            del _completed[key_hash]
+            return None
+        _completed.move_to_end(key_hash)
+        return entry[0], entry[1]
+
+
+def _check_request_hash(stored_hash: str | None, request_hash: str) -> None:
+    """Reject a key that was used with a different request body."""
+    if stored_hash and stored_hash != request_hash:
+        idempotency_requests.inc("mismatch")
+        raise IdempotencyKeyReusedError(
+            "Idempotency-Key was already used with a different request body."
+        )
+
+
+async def run_idempotent(
+    scope: str,
+    key: str,
+    request_hash: str,
+    operation: Callable[[], Awaitable[Tuple[Any, Dict[str, Any] | None]]],
+) -> Tuple[Any, bool]:
+    """
+    Run `operation` at most once per (scope, key).
+
+    Args:
+        scope: Who owns the key (API key ID), so clients can't collide
+        key: Idempotency-Key header value
+        request_hash: hash_request_body() of the request
+        operation: Coroutine function returning (result, body). `body` is the
+            JSON-serializable response to replay later, or None if the request
+            failed and the key should be released.
+
+    Returns:
+        (result, replayed). For a fresh run, result is what `operation` returned.
+        A replay returns the stored body (dict); a concurrent duplicate in this
+        process returns the same result as the request it waited for.
+
+    Raises:
+        IdempotencyKeyReusedError: Same key, different request body
+        IdempotencyConflictError: Same key still running in another process
+    """
+    key_hash = hash_idempotency_key(scope, key)
+
+    remembered = _recall(key_hash)
+    if remembered is not None:
+        _check_request_hash(remembered[0], request_hash)
+        idempotency_requests.inc("replayed_memory")
+        return remembered[1], True
+
+    in_flight = _in_flight.get(key_hash)
+    if in_flight is not None:
+        _check_request_hash(in_flight[0], request_hash)
+        idempotency_requests.inc("coalesced")
+        result = await asyncio.shield(in_flight[1])
+        return result, True
+
+    future = asyncio.get_running_loop().create_future()
+    _in_flight[key_hash] = (request_hash, future)
+    claim = None
+    claimed = False
+    try:
+        from flow.db import claim_idempotency_key
+
+        claim = claim_idempotency_key(key_hash, request_hash, IDEMPOTENCY_LOCK_SECONDS)
+        # No database: still coalesce duplicates within this process
+        claimed = claim is None or claim["claimed"]
+
+        if not claimed:
+            body = await _wait_for_other_process(key_hash, request_hash, claim)
+            _remember(key_hash, request_hash, body)
+            idempotency_requests.inc("replayed_db")
+            future.set_result(body)
+            return body, True
+
+        result, body = await operation()
+
+        if body is None:
+            _release(key_hash, claim)
+        else:
+            _remember(key_hash, request_hash, body)
+            if claim is not None:
+                from flow.db import complete_idempotency_key
+
+                complete_idempotency_key(key_hash, body, IDEMPOTENCY_KEY_TTL_SECONDS)
+        idempotency_requests.inc("executed")
+        future.set_result(result)
+        return result, False
+
+    except BaseException as e:
+        if claimed:
+            _release(key_hash, claim)
+        if isinstance(e, Exception):
+            future.set_exception(e)
+            # Mark the exception as retrieved when nobody else is waiting on it
+            future.exception()
+        else:
+            future.cancel()
+        raise
+    finally:
+        _in_flight.pop(key_hash, None)
+
+
+def _release(key_hash: str, claim: Dict[str, Any] | None) -> None:
+    """Release a claimed key so the client can retry."""
+    if claim is None:
+        return
+    from flow.db import release_idempotency_key
+
+    release_idempotency_key(key_hash)
+
+
+async def _wait_for_other_process(
+    key_hash: str, request_hash: str, row: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Wait for a request with the same key running in another process to finish.
+
+    Returns:
+        The stored response body
+
+    Raises:
+        IdempotencyKeyReusedError, IdempotencyConflictError
+    """
+    from flow.db import get_idempotency_key
+
+    deadline = time.monotonic() + IDEMPOTENCY_WAIT_SECONDS
+    while True:
+        _check_request_hash(row.get("request_hash"), request_hash)
+        if row.get("status") == "completed" and row.get("response") is not None:
+            return row["response"]
+
+        if time.monotonic() >= deadline:
+            idempotency_requests.inc("conflict")
+            raise IdempotencyConflictError(
+                "A request with this Idempotency-Key is still being processed."
+            )
+        await asyncio.sleep(IDEMPOTENCY_POLL_INTERVAL_SECONDS)
+
+        row = get_idempotency_key(key_hash)
+        if row is None:
+            # The other request failed and released the key
+            idempotency_requests.inc("conflict")
+            raise IdempotencyConflictError(
+                "The earlier request with this Idempotency-Key failed. Retry the request."
+            )
+
+
+def clear_idempotency_cache() -> None:
+    """Clear the in-process response cache (for tests)."""
+    with _completed_lock:
+        _completed.clear()
@@ -0,0 +1,166 @@
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Insight Cache
+
+Content-addressed cache for insight extraction results.
+
+**Simple Explanation:**
+The same transcript analyzed with the same model and prompts always gets the same
+cache key (a SHA-256 hash of those inputs). When a thread is reprocessed (webhook
+retried, resume after a crash, ...), ExtractInsightsStep finds the earlier result
+here instead of calling the LLM again, so retries cost zero tokens.
+
+Lookups check a small in-process LRU first, then the `insight_cache` table in
+Postgres (where results are stored encrypted, like other transcript-derived data).
+
+Set INSIGHT_CACHE_ENABLED=false to turn caching off.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict
+
+from flow.utils.metrics import get_counter
+
+logger = logging.getLogger(__name__)
+
+INSIGHT_CACHE_LRU_SIZE = int(os.getenv("INSIGHT_CACHE_LRU_SIZE", "256"))
+
+cache_lookups = get_counter(
+    "insight_cache_lookups_total", "Insight cache lookups by result (memory, db, miss)"
+)
+
+# Simple Explanation: Most recently used entries live at the end of the OrderedDict;
+# when it's full, the oldest entry at the front is dropped.
+_lru: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_lru_lock = threading.Lock()
+
+
+def is_insight_cache_enabled() -> bool:
+    """Check if the insight cache is enabled (INSIGHT_CACHE_ENABLED, default true)."""
+    return os.getenv("INSIGHT_CACHE_ENABLED", "true").lower() == "true"
+
+
+def compute_insight_cache_key(
+    model: str, prompt_template: str, analysis_prompt: str | None, qa_text: str
+) -> str:
+    """
+    Compute the cache key for an insight extraction.
+
+    Args:
+        model: Model name (e.g. "gpt-4o")
+        prompt_template: Built-in prompt text (system prompt and default template),
+            so changing the prompts in code invalidates old entries
+        analysis_prompt: Custom analysis prompt, or None
+        qa_text: Formatted Q&A transcript text
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    material = json.dumps(
+        {
+            "model": model,
+            "prompt_template": prompt_template,
+            "analysis_prompt": analysis_prompt or "",
+            "qa_text": qa_text,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+def _remember(cache_key: str, entry: Dict[str, Any]) -> None:
+    """Put an entry in the in-process LRU."""
+    with _lru_lock:
+        _lru[cache_key] = entry
+        _lru.move_to_end(cache_key)
+        while len(_lru) > INSIGHT_CACHE_LRU_SIZE:
+            _lru.popitem(last=False)
+
+
+def get_cached_insights(cache_key: str) -> Dict[str, Any] | None:
+    """
+    Look up cached insights (in-process LRU first, then Postgres).
+
+    Args:
+        cache_key: Key from compute_insight_cache_key()
+
+    Returns:
+        Entry dict with "insights", "model", "prompt_tokens", "completion_tokens"
+        and "cost_usd", or None on a miss. The entry is a copy, so callers may
+        modify it.
+    """
+    if not is_insight_cache_enabled():
+        return None
+
+    with _lru_lock:
+        entry = _lru.get(cache_key)
+        if entry is not None:
+            _lru.move_to_end(cache_key)
+
+    if entry is not None:
+        cache_lookups.inc("memory")
+        return copy.deepcopy(entry)
+
+    from flow.db import get_insight_cache_entry
+
+    entry = get_insight_cache_entry(cache_key)
+    if entry is None:
+        cache_lookups.inc("miss")
+        return None
+
+    cache_lookups.inc("db")
+    _remember(cache_key, entry)
+    return copy.deepcopy(entry)
+
+
+def store_cached_insights(
+    cache_key: str,
+    model: str,
+    insights: Dict[str, Any],
+    prompt_tokens: int = 0,
+    completion_tokens: int = 0,
+    cost_usd: float = 0.0,
+) -> bool:
+    """
+    Store insights in the cache (in-process LRU and Postgres).
+
+    Args:
+        cache_key: Key from compute_insight_cache_key()
+        model: Model that produced the insights
+        insights: Validated insights dictionary
+        prompt_tokens: Tokens used to produce the insights (reported as saved on hits)
+        completion_tokens: Tokens used to produce the insights
+        cost_usd: Cost of producing the insights
+
+    Returns:
+        True if stored in Postgres, False otherwise (the LRU is always updated)
+    """
+    if not is_insight_cache_enabled():
+        return False
+
+    entry = {
+        "insights": copy.deepcopy(insights),
+        "model": model,
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "cost_usd": cost_usd,
+    }
+    _remember(cache_key, entry)
+
+    from flow.db import save_insight_cache_entry
+
+    return save_insight_cache_entry(cache_key, entry)
+
+
+def clear_insight_cache_memory() -> None:
+    """Clear the in-process LRU (the Postgres table is left as is)."""
+    with _lru_lock:
+        _lru.clear()
@@ -0,0 +1,394 @@
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+LLM Rate Limiter
+
+Process-wide concurrency and rate governor for post-call LLM analysis.
+
+**Simple Explanation:**
+When many meetings end at once, every one of them wants to call OpenAI right away.
+Without a limit we get 429 (rate limit) errors and timeouts. This module gives each
+model one shared limiter that:
+- Caps how many calls run at the same time (LLM_MAX_CONCURRENCY)
+- Keeps us under requests per minute (LLM_REQUESTS_PER_MINUTE) and tokens per
+  minute (LLM_TOKENS_PER_MINUTE) using token buckets
+- Lets important calls go first (lower priority number = sooner)
+- Pauses all calls when OpenAI answers 429 with a Retry-After header, then retries
+
+Queue wait time and throttle counts are exposed on /metrics.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import os
+import random
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Tuple, TypeVar
+
+from flow.utils.metrics import get_counter, get_histogram
+
+logger = logging.getLogger(__name__)
+
+# Limits (0 disables the requests/tokens per minute limits)
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "4"))
+LLM_REQUESTS_PER_MINUTE = int(os.getenv("LLM_REQUESTS_PER_MINUTE", "500"))
+LLM_TOKENS_PER_MINUTE = int(os.getenv("LLM_TOKENS_PER_MINUTE", "200000"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "3"))
+
+# Priorities (lower runs first)
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 10
+PRIORITY_LOW = 20
+
+# Backoff for retryable errors without a Retry-After header
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+
+# Metrics
+queue_wait = get_histogram(
+    "llm_queue_wait_seconds", "Time LLM calls waited in the rate limiter queue"
+)
+throttle_events = get_counter(
+    "llm_throttled_total",
+    "Times the LLM limiter held back calls, by reason",
+)
+retries = get_counter("llm_retries_total", "LLM calls retried, by status")
+
+T = TypeVar("T")
+
+
+@dataclass
+class LLMPermit:
+    """
+    Permission to make one LLM call.
+
+    Set actual_tokens after the call so the tokens-per-minute bucket is corrected
+    for the difference between the estimate and what was really used.
+    """
+
+    reserved_tokens: int
+    actual_tokens: int | None = None
+
+
+class LLMRateLimiter:
+    """
+    Token-bucket rate limiter with a priority queue.
+
+    **Simple Explanation:**
+    Two buckets refill continuously: one holds request "tokens" (refilled at
+    requests_per_minute), the other holds LLM tokens (refilled at tokens_per_minute).
+    A call may start when there's a free concurrency slot and both buckets have
+    enough. Waiting calls are served strictly in priority order (then arrival
+    order), so a low-priority flood can't starve important calls.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: int = LLM_REQUESTS_PER_MINUTE,
+        tokens_per_minute: int = LLM_TOKENS_PER_MINUTE,
+        max_concurrency: int = LLM_MAX_CONCURRENCY,
+    ):
+        self.name = name
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_concurrency = max(1, max_concurrency)
+
+        self._request_bucket = float(requests_per_minute)
+        self._token_bucket = float(tokens_per_minute)
+        self._last_refill = time.monotonic()
+        self._in_flight = 0
+        self._blocked_until = 0.0
+
+        # Heap of (priority, sequence, tokens, future)
+        self._waiters: List[Tuple[int, int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._wakeup: asyncio.TimerHandle | None = None
+
+    @property
+    def queued(self) -> int:
+        """Number of calls waiting for a permit."""
+        return sum(1 for *_, future in self._waiters if not future.done())
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently running."""
+        return self._in_flight
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        if self.requests_per_minute:
+            self._request_bucket = min(
+                float(self.requests_per_minute),
+                self._request_bucket + elapsed * self.requests_per_minute / 60,
+            )
+        if self.tokens_per_minute:
+            self._token_bucket = min(
+                float(self.tokens_per_minute),
+                self._token_bucket + elapsed * self.tokens_per_minute / 60,
+            )
+
+    def _schedule_wakeup(self, delay: float) -> None:
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+        loop = asyncio.get_running_loop()
+        self._wakeup = loop.call_later(delay, self._dispatch)
+
+    def _dispatch(self) -> None:
+        """Grant permits to waiting calls, in priority order, while limits allow."""
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+
+        while self._waiters:
+            _, _, tokens, future = self._waiters[0]
+            if future.done():
+                # Caller gave up (cancelled) while waiting
+                heapq.heappop(self._waiters)
+                continue
+
+            if self._in_flight >= self.max_concurrency:
+                # A finishing call will dispatch again
+                return
+
+            self._refill()
+            now = time.monotonic()
+            delay = 0.0
+            reason = None
+            if now < self._blocked_until:
+                delay = self._blocked_until - now
+                reason = "retry_after"
+            elif self.requests_per_minute and self._request_bucket < 1:
+                delay = (1 - self._request_bucket) * 60 / self.requests_per_minute
+                reason = "requests_per_minute"
+            elif self.tokens_per_minute and self._token_bucket < tokens:
+                delay = (tokens - self._token_bucket) * 60 / self.tokens_per_minute
+                reason = "tokens_per_minute"
+
+            if reason:
+                throttle_events.inc(reason)
+                self._schedule_wakeup(delay)
+                return
+
+            heapq.heappop(self._waiters)
+            if self.requests_per_minute:
+                self._request_bucket -= 1
+            if self.tokens_per_minute:
+                self._token_bucket -= tokens
+            self._in_flight += 1
+            future.set_result(None)
+
+    def _release(self, permit: LLMPermit) -> None:
+        if self.tokens_per_minute and permit.actual_tokens is not None:
+            # Correct the estimate; the bucket may go negative (borrowing from the next minute)
+            self._token_bucket -= permit.actual_tokens - permit.reserved_tokens
+        self._in_flight -= 1
+        self._dispatch()
+
+    def throttle(self, seconds: float) -> None:
+        """
+        Pause all new calls for a number of seconds (e.g. after a 429 Retry-After).
+
+        Args:
+            seconds: How long to pause
+        """
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+        logger.warning(
+            f"⚠️ LLM limiter '{self.name}' paused for {seconds:.1f}s (rate limited)"
+        )
+
+    @asynccontextmanager
+    async def acquire(
+        self, estimated_tokens: int = 0, priority: int = PRIORITY_NORMAL
+    ) -> AsyncIterator[LLMPermit]:
+        """
+        Wait for permission to make one LLM call.
+
+        Args:
+            estimated_tokens: Expected prompt + completion tokens
+            priority: Lower numbers are served first (PRIORITY_HIGH, PRIORITY_NORMAL, ...)
+
+        Yields:
+            LLMPermit (set actual_tokens on it after the call, if known)
+        """
+        # Never ask for more than a full bucket, or the call could wait forever
+        tokens = (
+            min(estimated_tokens, self.tokens_per_minute)
+            if self.tokens_per_minute
+            else 0
+        )
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), tokens, future))
+
+        start = time.monotonic()
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Permit was granted just as we were cancelled - give it back
+                self._release(LLMPermit(tokens))
+            raise
+        queue_wait.observe(time.monotonic() - start)
+
+        permit = LLMPermit(tokens)
+        try:
+            yield permit
+        finally:
+            self._release(permit)
+
+    async def call(
+        self,
+        fn: Callable[[], Awaitable[T]],
+        estimated_tokens: int = 0,
+        priority: int = PRIORITY_NORMAL,
+        usage: Callable[[T], int] | None = None,
+        max_retries: int = LLM_MAX_RETRIES,
+    ) -> T:
+        """
+        Run an LLM call under the limiter, retrying rate limits and transient errors.
+
+        **Simple Explanation:**
+        On a 429, the Retry-After header pauses the whole limiter (every caller
+        backs off, not just this one) before this call is retried. Server errors
+        and connection errors are retried with exponential backoff.
+
+        Args:
+            fn: Function that starts the call (called again on each retry)
+            estimated_tokens: Expected prompt + completion tokens
+            priority: Lower numbers are served first
+            usage: Optional function returning the tokens actually used by a result
+            max_retries: Retries before the error is raised
+
+        Returns:
+            The result of fn()
+        """
+        attempt = 0
+        while True:
+            delay = 0.0
+            async with self.acquire(estimated_tokens, priority) as permit:
+                try:
+                    result = await fn()
+                except Exception as e:
+                    status_code = getattr(e, "status_code", None)
+                    if attempt >= max_retries or not _is_retryable(e):
+                        raise
+
+                    retry_after = _retry_after_seconds(e)
+                    backoff = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2**attempt))
+                    backoff *= random.uniform(0.8, 1.2)
+                    if status_code == 429:
+                        # Pause everyone - the limit is shared by the whole process
+                        self.throttle(retry_after or backoff)
+                    else:
+                        delay = retry_after or backoff
+
+                    retries.inc(str(status_code or type(e).__name__))
+                    logger.warning(
+                        f"⚠️ LLM call failed ({status_code or type(e).__name__}), "
+                        f"retry {attempt + 1}/{max_retries}"
+                    )
+                else:
+                    if usage is not None:
+                        try:
+                            permit.actual_tokens = usage(result)
+                        except Exception:
+                            pass
+                    return result
+
+            attempt += 1
+            if delay:
+                await asyncio.sleep(delay)
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Rate limits, server errors and connection errors are worth retrying."""
+    status_code = getattr(error, "status_code", None)
+    if status_code is not None:
+        return status_code == 429 or status_code >= 500
+
+    try:
+        import openai
+
+        return isinstance(error, openai.APIConnectionError)
+    except ImportError:
+        return False
+
+
+def _retry_after_seconds(error: Exception) -> float | None:
+    """
+    Read the retry delay from an error's response headers.
+
+    Supports retry-after-ms (OpenAI), and Retry-After in seconds or as an HTTP date.
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return max(0.0, float(retry_after_ms) / 1000)
+        except ValueError:
+            pass
+
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+# Simple Explanation: One limiter per model for the running event loop (the
+# limiter's queue and timers belong to a loop, so a new loop gets new limiters).
+_limiters: Dict[str, LLMRateLimiter] = {}
+_limiters_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_llm_limiter(model: str) -> LLMRateLimiter:
+    """
+    Get the shared limiter for a model.
+
+    Args:
+        model: Model name (OpenAI limits are per model)
+
+    Returns:
+        LLMRateLimiter shared by every caller in this process
+    """
+    global _limiters_loop
+
+    loop = asyncio.get_running_loop()
+    if _limiters_loop is not loop:
+        _limiters.clear()
+        _limiters_loop = loop
+
+    limiter = _limiters.get(model)
+    if limiter is None:
+        limiter = LLMRateLimiter(model)
+        _limiters[model] = limiter
+    return limiter
+
+
+def llm_limiter_status() -> Dict[str, Dict[str, Any]]:
+    """Current queue length and in-flight calls for each limiter."""
+    return {
+        model: {"queued": limiter.queued, "in_flight": limiter.in_flight}
+        for model, limiter in _limiters.items()
+    }
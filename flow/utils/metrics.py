@@ -0,0 +1,148 @@
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+In-Process Metrics
+
+Lightweight counters and histograms for operational metrics (latencies, outcomes).
+
+**Simple Explanation:**
+Each process keeps its own metrics in memory. The API server exposes a snapshot
+at GET /metrics so you can see, for example, how long webhook deliveries take.
+There is no external metrics backend - values reset when the process restarts.
+"""
+
+import threading
+from typing import Any, Dict
+
+# Default latency buckets in seconds (upper bounds)
+DEFAULT_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class Counter:
+    """
+    A counter with optional string labels.
+
+    Example:
+        ```python
+        deliveries = get_counter("webhook_deliveries_total")
+        deliveries.inc("delivered")
+        ```
+    """
+
+    def __init__(self, name: str, description: str = ""):
+        self.name = name
+        self.description = description
+        self._values: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, label: str = "total", amount: float = 1.0) -> None:
+        """Increase the counter for `label` by `amount`."""
+        with self._lock:
+            self._values[label] = self._values.get(label, 0.0) + amount
+
+    def get(self, label: str = "total") -> float:
+        """Get the current value for `label`."""
+        with self._lock:
+            return self._values.get(label, 0.0)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get a JSON-serializable copy of the counter."""
+        with self._lock:
+            return {
+                "type": "counter",
+                "description": self.description,
+                "values": dict(self._values),
+            }
+
+
+class Histogram:
+    """
+    A histogram with fixed bucket upper bounds (cumulative, like Prometheus).
+
+    Example:
+        ```python
+        latency = get_histogram("webhook_delivery_latency_seconds")
+        latency.observe(0.42)
+        ```
+    """
+
+    def __init__(
+        self,
+        name: str,
+        description: str = "",
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.description = description
+        self.buckets = tuple(sorted(buckets))
+        self._counts = [0] * len(self.buckets)
+        self._count = 0
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        with self._lock:
+            self._count += 1
+            self._sum += value
+            for i, upper_bound in enumerate(self.buckets):
+                if value <= upper_bound:
+                    self._counts[i] += 1
+                    break
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get a JSON-serializable copy of the histogram (cumulative buckets)."""
+        with self._lock:
+            cumulative = 0
+            buckets: Dict[str, int] = {}
+            for upper_bound, count in zip(self.buckets, self._counts):
+                cumulative += count
+                buckets[str(upper_bound)] = cumulative
+            buckets["+Inf"] = self._count
+            return {
+                "type": "histogram",
+                "description": self.description,
+                "count": self._count,
+                "sum": round(self._sum, 6),
+                "buckets": buckets,
+            }
+
+
+_registry: Dict[str, Counter | Histogram] = {}
+_registry_lock = threading.Lock()
+
+
+def get_counter(name: str, description: str = "") -> Counter:
+    """Get (or create) the process-wide counter called `name`."""
+    with _registry_lock:
+        metric = _registry.get(name)
+        if metric is None:
+            metric = Counter(name, description)
+            _registry[name] = metric
+    if not isinstance(metric, Counter):
+        raise TypeError(f"Metric {name} is not a counter")
+    return metric
+
+
+def get_histogram(
+    name: str,
+    description: str = "",
+    buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+) -> Histogram:
+    """Get (or create) the process-wide histogram called `name`."""
+    with _registry_lock:
+        metric = _registry.get(name)
+        if metric is None:
+            metric = Histogram(name, description, buckets)
+            _registry[name] = metric
+    if not isinstance(metric, Histogram):
+        raise TypeError(f"Metric {name} is not a histogram")
+    return metric
+
+
+def metrics_snapshot() -> Dict[str, Any]:
+    """Get a snapshot of every registered metric, keyed by name."""
+    with _registry_lock:
+        metrics = list(_registry.values())
+    return {metric.name: metric.snapshot() for metric in metrics}
@@ -0,0 +1,251 @@
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Static Page Cache
+
+In-memory cache for rendered HTML pages served by the API (like /meet/{room}).
+
+**Simple Explanation:**
+The hosted meeting page is the same HTML for every room (the room name and
+branding are read from the URL by JavaScript). Instead of reading the file and
+replacing placeholders on every request, the page is rendered once, compressed
+once (gzip, and brotli when the `brotli` package is installed), and served from
+memory. The file's modification time is checked on each request, so editing the
+file reloads the page without a restart.
+
+Responses carry a strong ETag, Last-Modified and Cache-Control, so browsers and
+CDNs can revalidate with If-None-Match / If-Modified-Since and get a 304 (no
+body) when nothing changed.
+"""
+
+import gzip
+import hashlib
+import logging
+import os
+import threading
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Callable, Dict, Tuple
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from flow.utils.metrics import get_counter
+
+logger = logging.getLogger(__name__)
+
+try:
+    import brotli
+
+    BROTLI_AVAILABLE = True
+except ImportError:
+    brotli = None
+    BROTLI_AVAILABLE = False
+
+# Encodings in order of preference when the client accepts several equally
+_ENCODING_PREFERENCE = ("br", "gzip")
+
+page_cache_responses = get_counter(
+    "page_cache_responses_total",
+    "Cached page responses by result (200 per encoding, or 304)",
+)
+
+
+class CachedPage:
+    """
+    One rendered page and its precompressed variants.
+
+    Attributes:
+        mtime_ns: Modification time of the source file when it was rendered
+        variants: Body bytes by content encoding ("identity", "gzip", "br")
+        etag: Strong ETag of the uncompressed body (quoted)
+        last_modified: Source file modification time as an HTTP date
+    """
+
+    __slots__ = ("mtime_ns", "variants", "etag", "last_modified")
+
+    def __init__(self, body: bytes, mtime_ns: int):
+        self.mtime_ns = mtime_ns
+        self.variants: Dict[str, bytes] = {"identity": body}
+        # mtime=0 keeps the gzip bytes (and so the ETag) identical across restarts
+        self.variants["gzip"] = gzip.compress(body, compresslevel=9, mtime=0)
+        if BROTLI_AVAILABLE:
+            self.variants["br"] = brotli.compress(body, mode=brotli.MODE_TEXT)
+
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        self.etag = f'"{digest}"'
+        self.last_modified = formatdate(mtime_ns / 1e9, usegmt=True)
+
+    def etag_for(self, encoding: str) -> str:
+        """
+        Get the ETag for one encoding.
+
+        Each encoding is a different representation, so strong ETags must differ:
+        "abc" for identity, "abc-gzip" and "abc-br" for the compressed bodies.
+        """
+        if encoding == "identity":
+            return self.etag
+        return f'{self.etag[:-1]}-{encoding}"'
+
+
+def choose_encoding(accept_encoding: str, available: Tuple[str, ...]) -> str:
+    """
+    Pick the content encoding to send based on the Accept-Encoding header.
+
+    **Simple Explanation:**
+    Picks the encoding the client likes most (highest q value), preferring
+    brotli over gzip when they are equal, and falls back to no compression.
+
+    Args:
+        accept_encoding: Accept-Encoding request header value
+        available: Encodings we have a precompressed body for
+
+    Returns:
+        "br", "gzip" or "identity"
+    """
+    if not accept_encoding:
+        return "identity"
+
+    quality: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if name:
+            quality[name] = q
+
+    wildcard = quality.get("*", 0.0)
+    best, best_q = "identity", 0.0
+    for encoding in _ENCODING_PREFERENCE:
+        if encoding not in available:
+            continue
+        q = quality.get(encoding, wildcard)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+class StaticPageCache:
+    """
+    Serves one rendered file from memory with conditional request support.
+
+    **Simple Explanation:**
+    `render` turns the file text into the final HTML (for example to inject the
+    Daily.co domain). It runs once per file change, not once per request.
+
+    Example:
+        ```python
+        meeting_page = StaticPageCache(Path("hosting/meeting.html"), render_fn)
+        return meeting_page.respond(request)
+        ```
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        render: Callable[[str], str],
+        cache_control: str = "public, max-age=300",
+    ):
+        self.path = path
+        self.render = render
+        self.cache_control = cache_control
+        self._page: CachedPage | None = None
+        self._lock = threading.Lock()
+
+    def get(self) -> CachedPage:
+        """
+        Get the rendered page, reloading it if the file changed.
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        mtime_ns = os.stat(self.path).st_mtime_ns
+        page = self._page
+        if page is not None and page.mtime_ns == mtime_ns:
+            return page
+
+        with self._lock:
+            page = self._page
+            if page is None or page.mtime_ns != mtime_ns:
+                text = self.path.read_text(encoding="utf-8")
+                page = CachedPage(self.render(text).encode("utf-8"), mtime_ns)
+                self._page = page
+                logger.info(
+                    f"📄 Cached {self.path.name} ({len(page.variants['identity'])} bytes, "
+                    f"encodings: {', '.join(page.variants)})"
+                )
+        return page
+
+    def respond(self, request: Request) -> Response:
+        """
+        Build the response for a request (200 with the best encoding, or 304).
+
+        Args:
+            request: Incoming request (Accept-Encoding and conditional headers)
+
+        Returns:
+            Response with ETag, Last-Modified, Cache-Control and Vary headers
+        """
+        page = self.get()
+        encoding = choose_encoding(
+            request.headers.get("accept-encoding", ""), tuple(page.variants)
+        )
+        headers = {
+            "ETag": page.etag_for(encoding),
+            "Last-Modified": page.last_modified,
+            "Cache-Control": self.cache_control,
+            "Vary": "Accept-Encoding",
+        }
+
+        if _is_not_modified(request, page):
+            page_cache_responses.inc("304")
+            return Response(status_code=304, headers=headers)
+
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        page_cache_responses.inc(encoding)
+        return Response(
+            content=page.variants[encoding],
+            media_type="text/html; charset=utf-8",
+            headers=headers,
+        )
+
+
+def _is_not_modified(request: Request, page: CachedPage) -> bool:
+    """
+    Check the conditional request headers against the cached page.
+
+    If-None-Match wins over If-Modified-Since when both are sent (RFC 9110).
+    Any encoding's ETag for the current body counts as a match.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        current = page.etag[1:-1]
+        for tag in if_none_match.split(","):
+            tag = tag.strip()
+            if tag.startswith("W/"):
+                tag = tag[2:]
+            tag = tag.strip('"')
+            if tag == current or tag.startswith(f"{current}-"):
+                return True
+        return False
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        # HTTP dates have one-second resolution
+        return int(page.mtime_ns // 1_000_000_000) <= since
+
+    return False
@@ -8,15 +8,28 @@ Provides PostHog client initialization and helper functions for LLM analytics tr
 Handles graceful degradation when PostHog is not configured (dev/local environments).
 """
 
+import asyncio
 import logging
 import os
-from typing import Any, Optional, Tuple
+import threading
+from typing import Any, Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 # Global PostHog client instance (singleton)
 _posthog_client: Optional[Any] = None
 
+# Shared OpenAI clients, keyed by (API key, event loop)
+# Simple Explanation: Creating an AsyncOpenAI client creates a new HTTP connection pool.
+# We create one per API key and reuse it for every call in the process. The pool
+# belongs to an event loop, so a different loop gets its own client.
+_llm_clients: Dict[Tuple[str, int], Tuple[Any, bool]] = {}
+_llm_clients_lock = threading.Lock()
+
+# Retries are handled by flow.utils.llm_limiter (which respects 429 Retry-After
+# for every caller), so the SDK's own retries are turned off.
+OPENAI_CLIENT_KWARGS: Dict[str, Any] = {"max_retries": 0}
+
 
 def get_posthog_client() -> Optional[Any]:
     """
@@ -139,6 +152,9 @@ def get_posthog_llm_client(
     """
     Get a PostHog-wrapped OpenAI client for automatic LLM usage tracking.
 
+    Clients are created once per API key (and event loop) and shared by every
+    caller in the process.
+
     **Simple Explanation:**
     This function returns an OpenAI client that automatically tracks all LLM calls
     to PostHog. If PostHog is not configured, it returns a regular OpenAI client
@@ -195,6 +211,36 @@ def get_posthog_llm_client(
         # Return None client and False for tracking
         return None, False
 
+    try:
+        loop_id = id(asyncio.get_running_loop())
+    except RuntimeError:
+        loop_id = 0
+
+    cache_key = (openai_api_key, loop_id)
+    with _llm_clients_lock:
+        cached = _llm_clients.get(cache_key)
+        if cached is not None and not getattr(cached[0], "is_closed", lambda: False)():
+            return cached
+
+        client, is_posthog_enabled = _create_llm_client(openai_api_key)
+        if client is not None:
+            # Drop clients for other loops (they can't be used from this loop anyway)
+            for key in [k for k in _llm_clients if k[0] == openai_api_key]:
+                del _llm_clients[key]
+            _llm_clients[cache_key] = (client, is_posthog_enabled)
+        return client, is_posthog_enabled
+
+
+def _create_llm_client(openai_api_key: str) -> Tuple[Any, bool]:
+    """
+    Create a new OpenAI client, PostHog-wrapped if PostHog is configured.
+
+    Args:
+        openai_api_key: OpenAI API key
+
+    Returns:
+        Tuple of (client, is_posthog_enabled). client is None if OpenAI isn't installed.
+    """
     # Try to get PostHog client
     posthog_client = get_posthog_client()
 
@@ -206,7 +252,7 @@ def get_posthog_llm_client(
         try:
             from openai import AsyncOpenAI
 
-            client = AsyncOpenAI(api_key=openai_api_key)
+            client = AsyncOpenAI(api_key=openai_api_key, **OPENAI_CLIENT_KWARGS)
             return client, False
         except ImportError:
             logger.error(
@@ -224,6 +270,7 @@ def get_posthog_llm_client(
         client = AsyncOpenAI(
             api_key=openai_api_key,
             posthog_client=posthog_client,
+            **OPENAI_CLIENT_KWARGS,
         )
 
         logger.debug("✅ PostHog-wrapped OpenAI client created (LLM tracking enabled)")
@@ -238,7 +285,7 @@ def get_posthog_llm_client(
         try:
             from openai import AsyncOpenAI
 
-            client = AsyncOpenAI(api_key=openai_api_key)
+            client = AsyncOpenAI(api_key=openai_api_key, **OPENAI_CLIENT_KWARGS)
             return client, False
         except ImportError:
             logger.error(
@@ -254,7 +301,7 @@ def get_posthog_llm_client(
         try:
             from openai import AsyncOpenAI
 
-            client = AsyncOpenAI(api_key=openai_api_key)
+            client = AsyncOpenAI(api_key=openai_api_key, **OPENAI_CLIENT_KWARGS)
             logger.debug("✅ Fallback to regular AsyncOpenAI client")
             return client, False
         except ImportError:
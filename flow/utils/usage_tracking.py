@@ -13,7 +13,7 @@ from typing import Dict, Any
 
 from flow.db import (
     get_workflow_thread_data,
-    save_workflow_thread_data,
+    update_workflow_thread_fields,
 )
 
 logger = logging.getLogger(__name__)
@@ -62,9 +62,11 @@ def update_workflow_usage_cost(
         return False
 
     try:
-        # Get current workflow thread data
-        thread_data = get_workflow_thread_data(workflow_thread_id)
-        if not thread_data:
+        # Get current usage_stats (only that column - not the transcript)
+        thread_data = get_workflow_thread_data(
+            workflow_thread_id, fields=["usage_stats"], fresh=True
+        )
+        if thread_data is None:
             logger.warning(
                 f"⚠️ Workflow thread not found: {workflow_thread_id} - cannot update usage cost"
             )
@@ -104,8 +106,9 @@ def update_workflow_usage_cost(
             usage_stats["posthog_trace_id"] = posthog_trace_id
 
         # Save updated usage_stats back to database
-        thread_data["usage_stats"] = usage_stats
-        success = save_workflow_thread_data(workflow_thread_id, thread_data)
+        success = update_workflow_thread_fields(
+            workflow_thread_id, {"usage_stats": usage_stats}
+        )
 
         if success:
             category_info = f" ({cost_category})" if cost_category else ""
@@ -126,3 +129,78 @@ def update_workflow_usage_cost(
             exc_info=True,
         )
         return False
+
+
+def record_cache_hit(
+    workflow_thread_id: str,
+    cost_category: str,
+    saved_cost_usd: float = 0.0,
+    saved_tokens: int = 0,
+) -> bool:
+    """
+    Record that a cached result was used instead of a new LLM call.
+
+    **Simple Explanation:**
+    Cache hits cost nothing, so total_cost_usd is unchanged. Instead we count the
+    hit and what it saved, in `{cost_category}_cache_hits`,
+    `{cost_category}_cache_saved_usd` and `{cost_category}_cache_saved_tokens`.
+
+    Args:
+        workflow_thread_id: Unique identifier for the workflow run
+        cost_category: Category of the cached call (e.g., "insights")
+        saved_cost_usd: Cost of the original call that produced the cached result
+        saved_tokens: Tokens of the original call (prompt + completion)
+
+    Returns:
+        True if updated successfully, False otherwise
+    """
+    if not workflow_thread_id:
+        logger.warning("⚠️ Cannot record cache hit: workflow_thread_id is required")
+        return False
+
+    try:
+        thread_data = get_workflow_thread_data(
+            workflow_thread_id, fields=["usage_stats"], fresh=True
+        )
+        if thread_data is None:
+            logger.warning(
+                f"⚠️ Workflow thread not found: {workflow_thread_id} - cannot record cache hit"
+            )
+            return False
+
+        usage_stats: Dict[str, Any] = thread_data.get("usage_stats") or {
+            "total_cost_usd": 0.0,
+            "posthog_trace_id": None,
+        }
+
+        hits_key = f"{cost_category}_cache_hits"
+        saved_usd_key = f"{cost_category}_cache_saved_usd"
+        saved_tokens_key = f"{cost_category}_cache_saved_tokens"
+        usage_stats[hits_key] = usage_stats.get(hits_key, 0) + 1
+        usage_stats[saved_usd_key] = (
+            usage_stats.get(saved_usd_key, 0.0) + saved_cost_usd
+        )
+        usage_stats[saved_tokens_key] = (
+            usage_stats.get(saved_tokens_key, 0) + saved_tokens
+        )
+
+        success = update_workflow_thread_fields(
+            workflow_thread_id, {"usage_stats": usage_stats}
+        )
+
+        if success:
+            logger.debug(
+                f"✅ Recorded {cost_category} cache hit for {workflow_thread_id} "
+                f"(saved ${saved_cost_usd:.6f}, {saved_tokens} tokens)"
+            )
+        else:
+            logger.warning(f"⚠️ Failed to save cache hit for {workflow_thread_id}")
+
+        return success
+
+    except Exception as e:
+        logger.error(
+            f"❌ Error recording cache hit for {workflow_thread_id}: {e}",
+            exc_info=True,
+        )
+        return False
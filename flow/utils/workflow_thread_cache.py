@@ -0,0 +1,225 @@
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Workflow Thread Cache
+
+Read-through cache for workflow_threads rows, used by get_workflow_thread_data.
+
+**Simple Explanation:**
+One post-call run (ProcessTranscriptStep, ExtractInsightsStep, usage tracking)
+reads the same workflow_threads row many times. This module remembers rows in
+two places:
+
+- A run scope (`workflow_thread_cache_scope()`): while a job or pipeline runs,
+  each row is read from the database once and reused for the rest of the run
+- A small process-wide LRU with a short TTL (WORKFLOW_THREAD_CACHE_TTL_SECONDS),
+  for reads outside a scope, e.g. several API requests for the same thread
+
+Rows are kept as stored (sensitive fields still encrypted) and per column, so a
+projected read (`fields=[...]`) only hits when every requested column has been
+read before. Writes in this process (save_workflow_thread_data,
+update_workflow_thread_fields) update cached rows in place (write-through).
+Writes from other processes show up once the process TTL passes; a run scope
+keeps what it read until the run ends. Reads that are changed and saved back
+use `get_workflow_thread_data(..., fresh=True)`, which skips the cache, so a
+stale copy never overwrites someone else's write.
+
+Lookups are counted in `workflow_thread_cache_lookups_total` (scope, process,
+miss); GET /metrics also reports the hit rate.
+"""
+
+import contextvars
+import copy
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, Tuple
+
+from flow.utils.metrics import get_counter
+
+logger = logging.getLogger(__name__)
+
+# How long a row read outside a run scope is reused (0 disables the process cache)
+WORKFLOW_THREAD_CACHE_TTL_SECONDS = float(
+    os.getenv("WORKFLOW_THREAD_CACHE_TTL_SECONDS", "5")
+)
+WORKFLOW_THREAD_CACHE_SIZE = int(os.getenv("WORKFLOW_THREAD_CACHE_SIZE", "256"))
+
+workflow_thread_cache_lookups = get_counter(
+    "workflow_thread_cache_lookups_total",
+    "Workflow thread row lookups by result (scope, process, miss)",
+)
+
+# workflow_thread_id -> (stored column values, time.monotonic() expiry)
+_process_cache: "OrderedDict[str, Tuple[Dict[str, Any], float]]" = OrderedDict()
+_lock = threading.Lock()
+
+# Rows read during the current run (None outside a scope)
+_run_scope: contextvars.ContextVar[Dict[str, Dict[str, Any]] | None] = (
+    contextvars.ContextVar("workflow_thread_run_scope", default=None)
+)
+
+
+@contextmanager
+def workflow_thread_cache_scope() -> Iterator[None]:
+    """
+    Reuse workflow thread rows for the duration of a run.
+
+    **Simple Explanation:**
+    Wrap a job or pipeline in `with workflow_thread_cache_scope():` and every
+    get_workflow_thread_data call inside it (including in tasks it starts)
+    reads each row from the database at most once. Nested scopes share the
+    outer one.
+    """
+    if _run_scope.get() is not None:
+        yield
+        return
+
+    token = _run_scope.set({})
+    try:
+        yield
+    finally:
+        _run_scope.reset(token)
+
+
+def _has_columns(row: Dict[str, Any], columns: Iterable[str]) -> bool:
+    """Check whether a cached row includes every requested column."""
+    return all(column in row for column in columns)
+
+
+def get_cached_workflow_thread(
+    workflow_thread_id: str, columns: Iterable[str]
+) -> Dict[str, Any] | None:
+    """
+    Get a cached workflow_threads row, if it has all the requested columns.
+
+    Args:
+        workflow_thread_id: Workflow thread ID
+        columns: Columns the caller needs
+
+    Returns:
+        Deep copy of the stored row (sensitive fields encrypted), so callers
+        can change nested values (usage_stats, bot_config, ...) freely, or None
+        on a miss
+    """
+    columns = tuple(columns)
+    scope = _run_scope.get()
+
+    with _lock:
+        if scope is not None:
+            row = scope.get(workflow_thread_id)
+            if row is not None and _has_columns(row, columns):
+                workflow_thread_cache_lookups.inc("scope")
+                return copy.deepcopy(row)
+
+        entry = _process_cache.get(workflow_thread_id)
+        if entry is not None and entry[1] <= time.monotonic():
+            del _process_cache[workflow_thread_id]
+            entry = None
+        if entry is not None and _has_columns(entry[0], columns):
+            _process_cache.move_to_end(workflow_thread_id)
+            if scope is not None:
+                scope[workflow_thread_id] = {
+                    **scope.get(workflow_thread_id, {}),
+                    **entry[0],
+                }
+            workflow_thread_cache_lookups.inc("process")
+            return copy.deepcopy(entry[0])
+
+    workflow_thread_cache_lookups.inc("miss")
+    return None
+
+
+def store_workflow_thread(workflow_thread_id: str, row: Dict[str, Any]) -> None:
+    """
+    Remember columns just read from the database.
+
+    Args:
+        workflow_thread_id: Workflow thread ID
+        row: Column values as stored (sensitive fields encrypted)
+    """
+    # Callers keep (and may change) the values they passed in
+    row = copy.deepcopy(row)
+    scope = _run_scope.get()
+
+    with _lock:
+        if scope is not None:
+            scope[workflow_thread_id] = {**scope.get(workflow_thread_id, {}), **row}
+
+        if WORKFLOW_THREAD_CACHE_TTL_SECONDS <= 0:
+            return
+
+        now = time.monotonic()
+        entry = _process_cache.get(workflow_thread_id)
+        if entry is not None and entry[1] > now:
+            # Keep the older expiry: the columns already cached are that old
+            _process_cache[workflow_thread_id] = ({**entry[0], **row}, entry[1])
+        else:
+            _process_cache[workflow_thread_id] = (
+                row,
+                now + WORKFLOW_THREAD_CACHE_TTL_SECONDS,
+            )
+        _process_cache.move_to_end(workflow_thread_id)
+        while len(_process_cache) > WORKFLOW_THREAD_CACHE_SIZE:
+            _process_cache.popitem(last=False)
+
+
+def update_cached_workflow_thread(
+    workflow_thread_id: str, values: Dict[str, Any]
+) -> None:
+    """
+    Apply a write from this process to cached rows (write-through).
+
+    **Simple Explanation:**
+    Only rows that are already cached are updated; a write doesn't add a row,
+    since it may not include every column.
+
+    Args:
+        workflow_thread_id: Workflow thread ID
+        values: Column values written (sensitive fields encrypted)
+    """
+    values = copy.deepcopy(values)
+    scope = _run_scope.get()
+
+    with _lock:
+        if scope is not None and workflow_thread_id in scope:
+            scope[workflow_thread_id] = {**scope[workflow_thread_id], **values}
+
+        entry = _process_cache.get(workflow_thread_id)
+        if entry is not None:
+            _process_cache[workflow_thread_id] = ({**entry[0], **values}, entry[1])
+
+
+def invalidate_workflow_thread(workflow_thread_id: str) -> None:
+    """Forget a cached row (e.g. after a write that may or may not have happened)."""
+    scope = _run_scope.get()
+
+    with _lock:
+        if scope is not None:
+            scope.pop(workflow_thread_id, None)
+        _process_cache.pop(workflow_thread_id, None)
+
+
+def workflow_thread_cache_status() -> Dict[str, Any]:
+    """Get the process cache size and hit rate (for GET /metrics)."""
+    hits = workflow_thread_cache_lookups.get(
+        "scope"
+    ) + workflow_thread_cache_lookups.get("process")
+    lookups = hits + workflow_thread_cache_lookups.get("miss")
+    with _lock:
+        size = len(_process_cache)
+    return {
+        "size": size,
+        "ttl_seconds": WORKFLOW_THREAD_CACHE_TTL_SECONDS,
+        "hit_rate": round(hits / lookups, 4) if lookups else None,
+    }
+
+
+def clear_workflow_thread_cache() -> None:
+    """Clear the process cache (for tests)."""
+    with _lock:
+        _process_cache.clear()
@@ -0,0 +1,253 @@
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+PailFlow job worker.
+
+**Simple Explanation:**
+A long-running process that claims jobs from the Postgres job queue and runs
+them with a bounded number of concurrent jobs. Run one or more workers next to
+the API server:
+
+    python -m flow.worker                          # all queues
+    python -m flow.worker --queue transcripts -c 8 # only transcript processing
+
+Each worker subscribes to a set of queues, so different kinds of work can be
+scaled on separate processes.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+import sys
+import uuid
+from pathlib import Path
+
+# Add project root directory to Python path (same as flow/main.py)
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+from dotenv import load_dotenv  # noqa: E402
+
+from flow.jobs import queue as job_queue  # noqa: E402
+from flow.jobs.handlers import JOB_HANDLERS  # noqa: E402
+from flow.utils.workflow_thread_cache import workflow_thread_cache_scope  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+
+class JobWorker:
+    """
+    Claims and runs jobs from one or more queues.
+
+    **Simple Explanation:**
+    The worker keeps at most `concurrency` jobs running. Whenever a slot is free
+    it claims more jobs; while a job runs, its lease is extended so other workers
+    don't pick it up. On shutdown it stops claiming and waits for running jobs.
+    """
+
+    def __init__(
+        self,
+        queues: list[str],
+        concurrency: int = 4,
+        visibility_timeout: int = job_queue.DEFAULT_VISIBILITY_TIMEOUT,
+        poll_interval: float = 1.0,
+    ):
+        """
+        Initialize the worker.
+
+        Args:
+            queues: Queue names to claim jobs from
+            concurrency: Maximum number of jobs running at the same time
+            visibility_timeout: Lease length in seconds for claimed jobs
+            poll_interval: Seconds to wait when no jobs are ready
+        """
+        self.queues = queues
+        self.concurrency = max(1, concurrency)
+        self.visibility_timeout = visibility_timeout
+        self.poll_interval = poll_interval
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._running: set[asyncio.Task] = set()
+        self._stopping = asyncio.Event()
+
+    def stop(self) -> None:
+        """Ask the worker to stop claiming new jobs."""
+        if not self._stopping.is_set():
+            logger.info("🛑 Worker stopping - waiting for running jobs to finish")
+            self._stopping.set()
+
+    async def run(self) -> None:
+        """Main loop: claim jobs while there is free capacity."""
+        logger.info(
+            f"✅ Worker {self.worker_id} started (queues: {', '.join(self.queues)}, concurrency: {self.concurrency})"
+        )
+
+        while not self._stopping.is_set():
+            free_slots = self.concurrency - len(self._running)
+            jobs: list[job_queue.Job] = []
+
+            if free_slots > 0:
+                try:
+                    jobs = await job_queue.claim(
+                        self.queues,
+                        free_slots,
+                        self.worker_id,
+                        visibility_timeout=self.visibility_timeout,
+                    )
+                except Exception as e:
+                    logger.error(f"❌ Error claiming jobs: {e}", exc_info=True)
+
+            for job in jobs:
+                task = asyncio.create_task(self.run_job(job))
+                self._running.add(task)
+                task.add_done_callback(self._running.discard)
+
+            # Only sleep when there's nothing to do (or no capacity)
+            if not jobs:
+                try:
+                    await asyncio.wait_for(
+                        self._stopping.wait(), timeout=self.poll_interval
+                    )
+                except asyncio.TimeoutError:
+                    pass
+
+        if self._running:
+            await asyncio.gather(*self._running, return_exceptions=True)
+        logger.info(f"✅ Worker {self.worker_id} stopped")
+
+    async def run_job(self, job: job_queue.Job) -> None:
+        """
+        Run a single claimed job and record the outcome.
+
+        **Simple Explanation:**
+        Unknown job types and handler exceptions are recorded as failed attempts,
+        which schedules a retry with backoff until max_attempts is reached.
+        """
+        registered = JOB_HANDLERS.get(job.job_type)
+        if registered is None:
+            await job_queue.fail(
+                job, f"Unknown job type: {job.job_type}", self.worker_id
+            )
+            return
+
+        logger.info(
+            f"🔄 Running job {job.id} ({job.job_type}, attempt {job.attempts}/{job.max_attempts})"
+        )
+        heartbeat = asyncio.create_task(self._keep_lease(job))
+        try:
+            # Each job reads a workflow thread row from the database once
+            with workflow_thread_cache_scope():
+                await registered.handler(job.payload)
+        except Exception as e:
+            logger.error(f"❌ Job {job.id} ({job.job_type}) error: {e}", exc_info=True)
+            await job_queue.fail(job, str(e), self.worker_id)
+        else:
+            if await job_queue.complete(job.id, self.worker_id):
+                logger.info(f"✅ Job {job.id} ({job.job_type}) completed")
+        finally:
+            heartbeat.cancel()
+
+    async def _keep_lease(self, job: job_queue.Job) -> None:
+        """Extend the job's lease periodically while it runs."""
+        interval = max(self.visibility_timeout / 3, 1)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if not await job_queue.extend_lease(
+                    job.id, self.worker_id, self.visibility_timeout
+                ):
+                    logger.warning(f"⚠️ Lost lease on job {job.id}")
+                    return
+            except Exception as e:
+                logger.warning(f"⚠️ Could not extend lease on job {job.id}: {e}")
+
+
+async def run_worker(
+    queues: list[str],
+    concurrency: int,
+    visibility_timeout: int,
+    poll_interval: float,
+) -> None:
+    """Run a worker until SIGINT/SIGTERM, then shut down cleanly."""
+    worker = JobWorker(
+        queues,
+        concurrency=concurrency,
+        visibility_timeout=visibility_timeout,
+        poll_interval=poll_interval,
+    )
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, worker.stop)
+        except NotImplementedError:
+            # Signal handlers aren't available on every platform (e.g. Windows)
+            pass
+
+    try:
+        await worker.run()
+    finally:
+        await job_queue.close_job_pool()
+
+
+def main():
+    """Command-line entry point for `python -m flow.worker`."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+    env_path = Path(__file__).parent / ".env"  # flow/.env
+    if env_path.exists():
+        load_dotenv(env_path)
+    else:
+        load_dotenv()
+
+    all_queues = sorted({handler.queue for handler in JOB_HANDLERS.values()})
+
+    parser = argparse.ArgumentParser(description="Run a PailFlow job worker")
+    parser.add_argument(
+        "-q",
+        "--queue",
+        dest="queues",
+        action="append",
+        choices=all_queues,
+        help="Queue to process (repeatable). Defaults to all queues.",
+    )
+    parser.add_argument(
+        "-c",
+        "--concurrency",
+        type=int,
+        default=int(os.getenv("FLOW_WORKER_CONCURRENCY", "4")),
+        help="Maximum number of jobs to run at the same time",
+    )
+    parser.add_argument(
+        "--visibility-timeout",
+        type=int,
+        default=job_queue.DEFAULT_VISIBILITY_TIMEOUT,
+        help="Seconds a claimed job stays leased before another worker may retry it",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=1.0,
+        help="Seconds to wait between polls when no jobs are ready",
+    )
+    args = parser.parse_args()
+
+    asyncio.run(
+        run_worker(
+            queues=args.queues or all_queues,
+            concurrency=args.concurrency,
+            visibility_timeout=args.visibility_timeout,
+            poll_interval=args.poll_interval,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
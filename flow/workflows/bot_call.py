@@ -268,26 +268,27 @@ class BotCallWorkflow:
             # with all the candidate/interview configuration. We just need to update it with
             # the bot configuration (bot_config, bot_id) and mark it as paused.
             from flow.db import (
-                get_workflow_thread_data,
                 save_workflow_thread_data,
+                update_workflow_thread_fields,
             )
 
             room_name = state.get("room_name")
             if room_name:
-                # Get existing workflow_thread_data (created by API endpoint)
-                workflow_thread_data = get_workflow_thread_data(thread_id) or {}
-
-                # Update with bot configuration
-                workflow_thread_data["workflow_thread_id"] = thread_id
-                workflow_thread_data["room_name"] = room_name
-                workflow_thread_data["room_url"] = state.get("room_url")
-                workflow_thread_data["bot_id"] = state.get("bot_id")
-                workflow_thread_data["bot_config"] = state.get("bot_config")
-                workflow_thread_data["workflow_paused"] = True
-                workflow_thread_data["meeting_status"] = "in_progress"
-
-                # Save updated workflow_thread_data
-                save_workflow_thread_data(thread_id, workflow_thread_data)
+                bot_fields = {
+                    "room_name": room_name,
+                    "room_url": state.get("room_url"),
+                    "bot_id": state.get("bot_id"),
+                    "bot_config": state.get("bot_config"),
+                    "workflow_paused": True,
+                    "meeting_status": "in_progress",
+                }
+
+                # Update the existing row (created by the API endpoint) in one write;
+                # create it if it doesn't exist yet
+                if not update_workflow_thread_fields(thread_id, bot_fields):
+                    save_workflow_thread_data(
+                        thread_id, {"workflow_thread_id": thread_id, **bot_fields}
+                    )
                 logger.info(
                     f"   ✅ Updated workflow_thread_data with bot configuration (workflow_thread_id: {thread_id})"
                 )
@@ -396,13 +397,12 @@ class BotCallWorkflow:
             # Clear workflow_paused flag in workflow_threads
             workflow_thread_id = state.get("workflow_thread_id")
             if workflow_thread_id:
-                from flow.db import get_workflow_thread_data, save_workflow_thread_data
+                from flow.db import update_workflow_thread_fields
 
-                workflow_thread_data = (
-                    get_workflow_thread_data(workflow_thread_id) or {}
+                # Only the flag changes, so don't read (and decrypt) the whole row
+                update_workflow_thread_fields(
+                    workflow_thread_id, {"workflow_paused": False}
                 )
-                workflow_thread_data["workflow_paused"] = False
-                save_workflow_thread_data(workflow_thread_id, workflow_thread_data)
 
             return state
 
@@ -522,19 +522,23 @@ class BotCallWorkflow:
                     # Simple Explanation: We save the checkpoint_id to workflow_threads table
                     # so when the bot finishes, we can resume from the exact checkpoint.
                     from flow.db import (
-                        get_workflow_thread_data,
                         save_workflow_thread_data,
+                        update_workflow_thread_fields,
                     )
 
-                    # Get existing workflow thread data or create new dict
-                    workflow_thread_data = get_workflow_thread_data(thread_id) or {}
-                    workflow_thread_data["workflow_thread_id"] = thread_id
-                    workflow_thread_data["checkpoint_id"] = checkpoint_id
-                    # Ensure room_name is set if not already present
-                    if not workflow_thread_data.get("room_name"):
-                        workflow_thread_data["room_name"] = room_name
-
-                    save_workflow_thread_data(thread_id, workflow_thread_data)
+                    # Only checkpoint_id changes, so update it without reading the row;
+                    # create the row if it doesn't exist yet
+                    if not update_workflow_thread_fields(
+                        thread_id, {"checkpoint_id": checkpoint_id}
+                    ):
+                        save_workflow_thread_data(
+                            thread_id,
+                            {
+                                "workflow_thread_id": thread_id,
+                                "checkpoint_id": checkpoint_id,
+                                "room_name": room_name,
+                            },
+                        )
                     logger.info("   ✅ Saved checkpoint_id to workflow_threads")
                 else:
                     logger.warning(
@@ -0,0 +1,189 @@
+# Copyright 2025 Lunch Pail Labs, LLC
+# Licensed under the Apache License, Version 2.0
+
+"""
+Per-API-key token-bucket rate limiting.
+
+Each API key gets a bucket that holds up to `burst` tokens and refills at
+`requests_per_minute`. Every request spends tokens (most routes cost 1, some
+expensive routes cost more); when the bucket is empty the request is rejected
+with 429 and a Retry-After telling the client when enough tokens are back.
+
+Buckets live in process memory in an LRU map capped at `max_keys`, so each
+check is O(1) and memory stays bounded. Limits are per instance: with several
+API instances a key's effective limit is multiplied by the instance count.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import time
+from collections import OrderedDict
+from typing import NamedTuple
+
+# Per-route costs as (method, path prefix, cost). First match wins; other
+# authenticated requests cost 1 token.
+ROUTE_COSTS: tuple[tuple[str, str, int], ...] = (
+    # Starts a bot (Daily, Modal/Fly, database writes)
+    ("POST", "/v1/api/bot/join", 10),
+    ("POST", "/api/bot/join", 10),
+    # Lists or cleans up every bot
+    ("GET", "/v1/bots/status", 2),
+    ("POST", "/v1/bots/cleanup", 5),
+    # Looks up to 100 bots in one request
+    ("POST", "/v1/api/bots/status:batch", 5),
+    # Looks up workflow threads by email
+    ("POST", "/v1/api/workflow-threads:search", 2),
+)
+
+
+class RateLimitResult(NamedTuple):
+    """
+    Outcome of one rate limit check.
+
+    Attributes:
+        allowed: Whether the request may proceed
+        limit: Bucket size (maximum burst) in tokens
+        remaining: Whole tokens left after this request
+        reset_seconds: Seconds until the bucket is full again
+        retry_after_seconds: Seconds until the request would be allowed (0 if allowed)
+    """
+
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_seconds: float
+    retry_after_seconds: float
+
+
+class TokenBucketRateLimiter:
+    """
+    In-process token buckets keyed by API key, with LRU eviction.
+
+    Example:
+        ```python
+        limiter = TokenBucketRateLimiter(requests_per_minute=600, burst=120)
+        result = limiter.acquire("key_123", cost=1)
+        if not result.allowed:
+            ...  # respond 429, Retry-After: result.retry_after_seconds
+        ```
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float,
+        burst: int | None = None,
+        max_keys: int = 10000,
+    ) -> None:
+        self.requests_per_minute = requests_per_minute
+        self.rate_per_second = requests_per_minute / 60.0
+        self.burst = int(burst if burst is not None else requests_per_minute)
+        self.max_keys = max_keys
+        # RateLimit-Policy header value: quota per 60 second window, plus burst
+        self.policy = f"{requests_per_minute:g};w=60;burst={self.burst}"
+        # key -> [tokens, last refill time], most recently used last
+        self._buckets: OrderedDict[str, list[float]] = OrderedDict()
+
+    def acquire(
+        self, key: str, cost: int = 1, now: float | None = None
+    ) -> RateLimitResult:
+        """
+        Spend `cost` tokens from the key's bucket if it has enough.
+
+        Args:
+            key: API key identifier
+            cost: Tokens this request costs (capped at the bucket size)
+            now: Current monotonic time (for tests)
+
+        Returns:
+            RateLimitResult with the decision and header values
+        """
+        if now is None:
+            now = time.monotonic()
+        burst = self.burst
+        rate = self.rate_per_second
+        cost = min(cost, burst)
+
+        buckets = self._buckets
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = [float(burst), now]
+            buckets[key] = bucket
+            if len(buckets) > self.max_keys:
+                buckets.popitem(last=False)
+        else:
+            buckets.move_to_end(key)
+            bucket[0] = min(burst, bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+
+        tokens = bucket[0]
+        if tokens >= cost:
+            tokens -= cost
+            bucket[0] = tokens
+            retry_after = 0.0
+            allowed = True
+        else:
+            retry_after = (cost - tokens) / rate
+            allowed = False
+
+        return RateLimitResult(
+            allowed=allowed,
+            limit=burst,
+            remaining=int(tokens),
+            reset_seconds=(burst - tokens) / rate,
+            retry_after_seconds=retry_after,
+        )
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+def route_cost(method: str, path: str) -> int:
+    """Get the token cost for a request (see ROUTE_COSTS)."""
+    for route_method, prefix, cost in ROUTE_COSTS:
+        if method == route_method and path.startswith(prefix):
+            return cost
+    return 1
+
+
+def rate_limit_headers(
+    result: RateLimitResult, policy: str
+) -> list[tuple[bytes, bytes]]:
+    """
+    Build RateLimit response headers (IETF RateLimit header fields draft).
+
+    Returns RateLimit-Limit/-Remaining/-Reset and RateLimit-Policy (the
+    limiter's `policy`), plus Retry-After when the request was rejected.
+    """
+    headers = [
+        (b"ratelimit-limit", str(result.limit).encode()),
+        (b"ratelimit-remaining", str(result.remaining).encode()),
+        (b"ratelimit-reset", str(math.ceil(result.reset_seconds)).encode()),
+        (b"ratelimit-policy", policy.encode()),
+    ]
+    if not result.allowed:
+        headers.append(
+            (
+                b"retry-after",
+                str(max(1, math.ceil(result.retry_after_seconds))).encode(),
+            )
+        )
+    return headers
+
+
+def create_rate_limiter_from_env() -> TokenBucketRateLimiter | None:
+    """
+    Create the limiter from environment variables.
+
+    RATE_LIMIT_REQUESTS_PER_MINUTE (default 600, 0 disables rate limiting),
+    RATE_LIMIT_BURST (default 120) and RATE_LIMIT_MAX_KEYS (default 10000).
+    """
+    requests_per_minute = float(os.getenv("RATE_LIMIT_REQUESTS_PER_MINUTE", "600"))
+    if requests_per_minute <= 0:
+        return None
+    return TokenBucketRateLimiter(
+        requests_per_minute=requests_per_minute,
+        burst=int(os.getenv("RATE_LIMIT_BURST", "120")),
+        max_keys=int(os.getenv("RATE_LIMIT_MAX_KEYS", "10000")),
+    )
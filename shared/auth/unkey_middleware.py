@@ -9,10 +9,14 @@ Requires an `Authorization: Bearer <key>` header on all requests.
 When Unkey credentials are provided via environment variables, the presented
 key is verified against Unkey. In local/dev without Unkey configured, the
 middleware only enforces the presence of the header.
+
+Authenticated requests are then rate limited per API key (see rate_limit.py).
+Requests over the limit get a 429 with Retry-After and RateLimit headers.
 """
 
 from __future__ import annotations
 
+import hashlib
 import os
 from collections.abc import Callable
 from types import ModuleType
@@ -20,6 +24,21 @@ from types import ModuleType
 from fastapi import Request
 from fastapi.responses import JSONResponse
 
+from .rate_limit import create_rate_limiter_from_env, rate_limit_headers, route_cost
+
+
+# Public routes (no API key needed), matched against the path without a trailing slash
+_PUBLIC_PATHS = frozenset({"/favicon.ico", "/health", "/embed.js", "/test-embed"})
+_PUBLIC_PREFIXES = ("/meet/", "/webhooks/", "/api/rooms/")
+
+
+def _get_header(scope: dict, name: bytes) -> str:
+    """Get a request header from the ASGI scope (`name` must be lowercase bytes)."""
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return ""
+
 
 class UnkeyAuthMiddleware:
     """ASGI middleware that enforces Unkey-style API keys globally."""
@@ -43,30 +62,25 @@ class UnkeyAuthMiddleware:
         except Exception:
             self._unkey_sdk = None
 
+        # Per-key rate limiting (None when RATE_LIMIT_REQUESTS_PER_MINUTE=0)
+        self.rate_limiter = create_rate_limiter_from_env()
+
     async def __call__(self, scope, receive, send):  # type: ignore[no-untyped-def]
         if scope["type"] != "http":
             await self.app(scope, receive, send)
             return
 
-        request = Request(scope, receive=receive)
-
         # Skip authentication for public routes (e.g., hosted meeting pages, favicon, webhooks, API for frontend)
-        path = request.url.path.rstrip("/")  # Remove trailing slash for consistent matching
-        if (
-            path.startswith("/meet/")
-            or path.startswith("/webhooks/")
-            or path.startswith("/api/rooms/")
-            or path == "/favicon.ico"
-            or path == "/health"
-            or path == "/embed.js"
-            or path == "/test-embed"
-        ):
+        # Simple Explanation: Path and headers are read straight from the ASGI scope,
+        # so public requests never build a Request object.
+        path = scope["path"].rstrip("/")  # Remove trailing slash for consistent matching
+        if path in _PUBLIC_PATHS or path.startswith(_PUBLIC_PREFIXES):
             # Public route - allow access without authentication
             await self.app(scope, receive, send)
             return
 
         # Require Authorization header
-        auth_header = request.headers.get("authorization", "").strip()
+        auth_header = _get_header(scope, b"authorization").strip()
         if not auth_header or not auth_header.lower().startswith("bearer "):
             response = JSONResponse(
                 status_code=401,
@@ -90,6 +104,8 @@ class UnkeyAuthMiddleware:
             await response(scope, receive, send)
             return
 
+        key_id = None
+
         # If Unkey credentials are available, verify the key via Unkey's API.
         if self.unkey_root_key:
             try:
@@ -130,6 +146,7 @@ class UnkeyAuthMiddleware:
                 key_id = data.get("keyId")
                 if key_id:
                     # Store in request.state for access in route handlers
+                    request = Request(scope, receive=receive)
                     if not hasattr(request.state, "unkey_key_id"):
                         request.state.unkey_key_id = key_id
             except Exception:
@@ -141,4 +158,31 @@ class UnkeyAuthMiddleware:
                 await response(scope, receive, send)
                 return
 
-        await self.app(scope, receive, send)
+        if self.rate_limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        # Rate limit by Unkey key id, or by a hash of the token when Unkey isn't configured
+        rate_limit_key = key_id or hashlib.sha256(token.encode()).hexdigest()[:32]
+        result = self.rate_limiter.acquire(
+            rate_limit_key, route_cost(scope["method"], path)
+        )
+        headers = rate_limit_headers(result, self.rate_limiter.policy)
+
+        if not result.allowed:
+            response = JSONResponse(
+                status_code=429,
+                content={
+                    "detail": "Rate limit exceeded for this API key. Retry after the number of seconds in the Retry-After header."
+                },
+            )
+            response.raw_headers.extend(headers)
+            await response(scope, receive, send)
+            return
+
+        async def send_with_rate_limit_headers(message):  # type: ignore[no-untyped-def]
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *headers]
+            await send(message)
+
+        await self.app(scope, receive, send_with_rate_limit_headers)
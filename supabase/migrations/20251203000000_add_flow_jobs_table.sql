@@ -0,0 +1,56 @@
+-- Copyright 2025 Lunch Pail Labs, LLC
+-- Licensed under the Apache License, Version 2.0
+--
+-- Migration: Create flow_jobs table
+-- Durable job queue for post-call processing (workflow resume, transcript processing).
+-- Workers claim jobs with SELECT ... FOR UPDATE SKIP LOCKED (see flow/jobs/queue.py)
+
+CREATE TABLE IF NOT EXISTS flow_jobs (
+    id BIGSERIAL PRIMARY KEY,
+    queue TEXT NOT NULL,
+    job_type TEXT NOT NULL,
+    payload JSONB NOT NULL DEFAULT '{}'::jsonb,
+
+    -- Lifecycle: queued -> running -> succeeded | failed (queued again on retry)
+    status TEXT NOT NULL DEFAULT 'queued'
+        CHECK (status IN ('queued', 'running', 'succeeded', 'failed')),
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 5,
+    run_at TIMESTAMPTZ NOT NULL DEFAULT NOW(), -- Earliest time the job may run (used for backoff)
+
+    -- Lease (visibility timeout): a running job whose lease expired can be reclaimed
+    locked_by TEXT,
+    locked_until TIMESTAMPTZ,
+
+    last_error TEXT,
+    dedupe_key TEXT, -- Prevents duplicate active jobs (e.g. repeated meeting.ended webhooks)
+
+    created_at TIMESTAMPTZ DEFAULT NOW() NOT NULL,
+    updated_at TIMESTAMPTZ DEFAULT NOW() NOT NULL,
+    completed_at TIMESTAMPTZ
+);
+
+-- Index for claiming ready jobs (only active rows are indexed)
+CREATE INDEX IF NOT EXISTS idx_flow_jobs_ready
+    ON flow_jobs(queue, run_at)
+    WHERE status IN ('queued', 'running');
+
+-- Only one active job per dedupe key
+CREATE UNIQUE INDEX IF NOT EXISTS idx_flow_jobs_dedupe_key_active
+    ON flow_jobs(dedupe_key)
+    WHERE dedupe_key IS NOT NULL AND status IN ('queued', 'running');
+
+CREATE INDEX IF NOT EXISTS idx_flow_jobs_created_at ON flow_jobs(created_at DESC);
+
+-- Enable Row Level Security
+ALTER TABLE flow_jobs ENABLE ROW LEVEL SECURITY;
+
+-- Policy: Allow service role full access
+CREATE POLICY "Service role can manage all flow_jobs"
+    ON flow_jobs
+    FOR ALL
+    USING (true)
+    WITH CHECK (true);
+
+COMMENT ON TABLE flow_jobs IS 'Durable background job queue processed by flow worker processes';
+COMMENT ON COLUMN flow_jobs.locked_until IS 'Lease expiry for running jobs; expired jobs are reclaimed by other workers';
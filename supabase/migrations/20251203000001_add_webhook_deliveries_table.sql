@@ -0,0 +1,52 @@
+-- Copyright 2025 Lunch Pail Labs, LLC
+-- Licensed under the Apache License, Version 2.0
+--
+-- Migration: Create webhook_deliveries table (webhook outbox)
+-- Every customer webhook is recorded here before it is sent. Delivery runs
+-- separately with retries (see flow/jobs/webhook_outbox.py).
+
+CREATE TABLE IF NOT EXISTS webhook_deliveries (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    idempotency_key TEXT NOT NULL UNIQUE, -- Sent as Idempotency-Key header; one row per event
+    workflow_thread_id TEXT,
+
+    -- Destination and body (encrypted)
+    url TEXT NOT NULL,
+    payload TEXT NOT NULL,
+
+    -- Delivery state: pending -> delivered | retrying -> ... -> delivered | failed
+    status TEXT NOT NULL DEFAULT 'pending'
+        CHECK (status IN ('pending', 'retrying', 'delivered', 'failed')),
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_status_code INTEGER,
+    last_error TEXT,
+    delivered_at TIMESTAMPTZ,
+
+    created_at TIMESTAMPTZ DEFAULT NOW() NOT NULL,
+    updated_at TIMESTAMPTZ DEFAULT NOW() NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_webhook_deliveries_workflow_thread_id
+    ON webhook_deliveries(workflow_thread_id);
+CREATE INDEX IF NOT EXISTS idx_webhook_deliveries_status
+    ON webhook_deliveries(status)
+    WHERE status IN ('pending', 'retrying');
+
+-- Auto-update updated_at (function defined in 20251202170734_add_all_tables.sql)
+CREATE TRIGGER update_webhook_deliveries_updated_at
+    BEFORE UPDATE ON webhook_deliveries
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+-- Enable Row Level Security
+ALTER TABLE webhook_deliveries ENABLE ROW LEVEL SECURITY;
+
+-- Policy: Allow service role full access
+CREATE POLICY "Service role can manage all webhook_deliveries"
+    ON webhook_deliveries
+    FOR ALL
+    USING (true)
+    WITH CHECK (true);
+
+COMMENT ON TABLE webhook_deliveries IS 'Webhook outbox: one row per customer webhook event, with delivery status';
+COMMENT ON COLUMN webhook_deliveries.payload IS 'Encrypted JSON webhook body';
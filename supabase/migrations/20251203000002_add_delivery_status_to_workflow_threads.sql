@@ -0,0 +1,17 @@
+-- Copyright 2025 Lunch Pail Labs, LLC
+-- Licensed under the Apache License, Version 2.0
+--
+-- Migration: Add delivery_status column to workflow_threads table
+-- Stores per-sink delivery results (webhook, email, ...) from ProcessTranscriptStep:
+-- {"webhook": {"status": "sent", "sent": true, "duration_ms": 42.1}, "email": {...}}
+
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM information_schema.columns
+                   WHERE table_name = 'workflow_threads' AND column_name = 'delivery_status') THEN
+        ALTER TABLE workflow_threads
+        ADD COLUMN delivery_status JSONB;
+    END IF;
+END $$;
+
+COMMENT ON COLUMN workflow_threads.delivery_status IS 'Per-sink delivery status and timing for session results (webhook, email, ...)';
@@ -0,0 +1,34 @@
+-- Copyright 2025 Lunch Pail Labs, LLC
+-- Licensed under the Apache License, Version 2.0
+--
+-- Migration: Create insight_cache table
+-- Content-addressed cache of insight extraction results, keyed by a SHA-256 hash
+-- of model, prompts and Q&A text (see flow/utils/insight_cache.py).
+
+CREATE TABLE IF NOT EXISTS insight_cache (
+    cache_key TEXT PRIMARY KEY,
+    model TEXT,
+    insights TEXT NOT NULL, -- Encrypted JSON insights
+
+    -- Usage of the original LLM call(s), reported as saved on cache hits
+    prompt_tokens INTEGER NOT NULL DEFAULT 0,
+    completion_tokens INTEGER NOT NULL DEFAULT 0,
+    cost_usd NUMERIC(12, 6) NOT NULL DEFAULT 0,
+
+    created_at TIMESTAMPTZ DEFAULT NOW() NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_insight_cache_created_at ON insight_cache(created_at);
+
+-- Enable Row Level Security
+ALTER TABLE insight_cache ENABLE ROW LEVEL SECURITY;
+
+-- Policy: Allow service role full access
+CREATE POLICY "Service role can manage all insight_cache"
+    ON insight_cache
+    FOR ALL
+    USING (true)
+    WITH CHECK (true);
+
+COMMENT ON TABLE insight_cache IS 'Content-addressed cache of insight extraction results (encrypted)';
+COMMENT ON COLUMN insight_cache.insights IS 'Encrypted JSON insights';
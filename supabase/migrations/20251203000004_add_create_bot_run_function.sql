@@ -0,0 +1,107 @@
+-- Copyright 2025 Lunch Pail Labs, LLC
+-- Licensed under the Apache License, Version 2.0
+--
+-- Migration: Create create_bot_run function
+-- Creates the workflow_threads and bot_sessions rows for POST /v1/api/bot/join in
+-- one transaction (one database round trip), optionally checking the caller's
+-- credits first (see flow.db.create_bot_run).
+--
+-- Returns a JSON object with "status":
+--   'created'              - both rows were inserted (includes the IDs and balance)
+--   'conflict'             - an ID already exists (primary key); nothing was inserted
+--   'user_not_found'       - no user (or no credit balance) for the API key
+--   'insufficient_credits' - balance below the required credits (includes balance)
+
+CREATE OR REPLACE FUNCTION create_bot_run(
+    p_workflow_thread JSONB,
+    p_bot_session JSONB,
+    p_unkey_key_id TEXT DEFAULT NULL,
+    p_required_credits NUMERIC DEFAULT NULL
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_balance NUMERIC;
+BEGIN
+    IF p_required_credits IS NOT NULL THEN
+        SELECT credit_balance INTO v_balance
+        FROM users
+        WHERE "unkeyId" = p_unkey_key_id;
+
+        IF NOT FOUND OR v_balance IS NULL THEN
+            RETURN jsonb_build_object('status', 'user_not_found');
+        END IF;
+
+        IF v_balance < p_required_credits THEN
+            RETURN jsonb_build_object('status', 'insufficient_credits', 'balance', v_balance);
+        END IF;
+    END IF;
+
+    -- Sensitive fields (email, email_results_to, webhook_callback_url) arrive encrypted
+    INSERT INTO workflow_threads (
+        workflow_thread_id,
+        room_name,
+        room_url,
+        bot_id,
+        bot_config,
+        unkey_key_id,
+        provider,
+        email,
+        email_results_to,
+        analysis_prompt,
+        summary_format_prompt,
+        webhook_callback_url,
+        meeting_status
+    ) VALUES (
+        p_workflow_thread->>'workflow_thread_id',
+        p_workflow_thread->>'room_name',
+        p_workflow_thread->>'room_url',
+        p_workflow_thread->>'bot_id',
+        p_workflow_thread->'bot_config',
+        p_workflow_thread->>'unkey_key_id',
+        COALESCE(p_workflow_thread->>'provider', 'daily'),
+        p_workflow_thread->>'email',
+        p_workflow_thread->>'email_results_to',
+        p_workflow_thread->>'analysis_prompt',
+        p_workflow_thread->>'summary_format_prompt',
+        p_workflow_thread->>'webhook_callback_url',
+        COALESCE(p_workflow_thread->>'meeting_status', 'in_progress')
+    );
+
+    INSERT INTO bot_sessions (
+        bot_id,
+        room_url,
+        room_name,
+        status,
+        started_at,
+        process_insights,
+        bot_config
+    ) VALUES (
+        (p_bot_session->>'bot_id')::UUID,
+        p_bot_session->>'room_url',
+        p_bot_session->>'room_name',
+        COALESCE(p_bot_session->>'status', 'running'),
+        COALESCE((p_bot_session->>'started_at')::TIMESTAMPTZ, NOW()),
+        COALESCE((p_bot_session->>'process_insights')::BOOLEAN, TRUE),
+        p_bot_session->'bot_config'
+    );
+
+    RETURN jsonb_build_object(
+        'status', 'created',
+        'workflow_thread_id', p_workflow_thread->>'workflow_thread_id',
+        'bot_id', p_bot_session->>'bot_id',
+        'balance', v_balance
+    );
+EXCEPTION
+    -- Both inserts are rolled back; the caller retries with new IDs
+    WHEN unique_violation THEN
+        RETURN jsonb_build_object('status', 'conflict');
+END;
+$$;
+
+-- Only the backend (service role) may create bot runs
+REVOKE ALL ON FUNCTION create_bot_run(JSONB, JSONB, TEXT, NUMERIC) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION create_bot_run(JSONB, JSONB, TEXT, NUMERIC) TO service_role;
+
+COMMENT ON FUNCTION create_bot_run(JSONB, JSONB, TEXT, NUMERIC) IS 'Atomically creates the workflow_threads and bot_sessions rows for a bot join, optionally checking credits';
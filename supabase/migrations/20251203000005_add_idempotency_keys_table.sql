@@ -0,0 +1,45 @@
+-- Copyright 2025 Lunch Pail Labs, LLC
+-- Licensed under the Apache License, Version 2.0
+--
+-- Migration: Create idempotency_keys table
+-- Stores Idempotency-Key claims and responses for POST /v1/api/bot/join, so a
+-- retried request replays the original response instead of starting another bot
+-- (see flow/utils/idempotency.py).
+
+CREATE TABLE IF NOT EXISTS idempotency_keys (
+    key_hash TEXT PRIMARY KEY, -- SHA-256 of API key ID + Idempotency-Key header
+    request_hash TEXT NOT NULL, -- SHA-256 of the request body (detects reuse with different parameters)
+
+    -- in_progress -> completed (in_progress rows are deleted if the request fails)
+    status TEXT NOT NULL DEFAULT 'in_progress'
+        CHECK (status IN ('in_progress', 'completed')),
+    response JSONB, -- Response body to replay (bot_id, status, room_url)
+
+    -- in_progress: when a stuck claim may be taken over; completed: end of replay window
+    expires_at TIMESTAMPTZ NOT NULL,
+
+    created_at TIMESTAMPTZ DEFAULT NOW() NOT NULL,
+    updated_at TIMESTAMPTZ DEFAULT NOW() NOT NULL
+);
+
+-- For purging expired rows: DELETE FROM idempotency_keys WHERE expires_at < NOW();
+CREATE INDEX IF NOT EXISTS idx_idempotency_keys_expires_at ON idempotency_keys(expires_at);
+
+-- Auto-update updated_at (function defined in 20251202170734_add_all_tables.sql)
+CREATE TRIGGER update_idempotency_keys_updated_at
+    BEFORE UPDATE ON idempotency_keys
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+-- Enable Row Level Security
+ALTER TABLE idempotency_keys ENABLE ROW LEVEL SECURITY;
+
+-- Policy: Allow service role full access
+CREATE POLICY "Service role can manage all idempotency_keys"
+    ON idempotency_keys
+    FOR ALL
+    USING (true)
+    WITH CHECK (true);
+
+COMMENT ON TABLE idempotency_keys IS 'Idempotency-Key claims and stored responses for retried API requests';
+COMMENT ON COLUMN idempotency_keys.key_hash IS 'SHA-256 of the API key ID and Idempotency-Key header value';
@@ -0,0 +1,16 @@
+-- Copyright 2025 Lunch Pail Labs, LLC
+-- Licensed under the Apache License, Version 2.0
+--
+-- Migration: Add partial index for finding the paused workflow thread of a room
+-- Backs flow.db.get_paused_workflow_thread_id:
+--   SELECT workflow_thread_id FROM workflow_threads
+--   WHERE room_name = $1 AND workflow_paused
+--   ORDER BY created_at DESC LIMIT 1
+-- Only paused threads are indexed, so the lookup stays a single index probe no
+-- matter how many finished threads a reused room accumulates.
+
+CREATE INDEX IF NOT EXISTS idx_workflow_threads_paused_room_name
+    ON workflow_threads(room_name, created_at DESC)
+    WHERE workflow_paused;
+
+COMMENT ON INDEX idx_workflow_threads_paused_room_name IS 'Most recent paused workflow thread per room (partial index on workflow_paused)';
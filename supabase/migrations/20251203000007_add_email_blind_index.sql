@@ -0,0 +1,137 @@
+-- Copyright 2025 Lunch Pail Labs, LLC
+-- Licensed under the Apache License, Version 2.0
+--
+-- Migration: Add blind index columns for encrypted email lookups
+-- email and email_results_to are encrypted with a random nonce, so equal
+-- addresses don't produce equal ciphertexts and can't be searched. The *_bidx
+-- columns hold a deterministic HMAC-SHA256 of the normalized address (trimmed,
+-- lowercased), keyed from ENCRYPTION_KEY (see flow.db.email_blind_index), so
+-- a recipient's rows are found with an index lookup instead of decrypting
+-- every row. Existing rows are backfilled by
+-- flow/scripts/reencrypt_legacy_fields.py.
+
+ALTER TABLE workflow_threads
+    ADD COLUMN IF NOT EXISTS email_bidx TEXT,
+    ADD COLUMN IF NOT EXISTS email_results_to_bidx TEXT;
+
+ALTER TABLE rooms
+    ADD COLUMN IF NOT EXISTS email_bidx TEXT,
+    ADD COLUMN IF NOT EXISTS email_results_to_bidx TEXT;
+
+-- Backs flow.db.get_workflow_threads_by_email:
+--   SELECT ... FROM workflow_threads
+--   WHERE email_bidx = $1 OR email_results_to_bidx = $1
+--   ORDER BY created_at DESC LIMIT $2
+CREATE INDEX IF NOT EXISTS idx_workflow_threads_email_bidx
+    ON workflow_threads(email_bidx, created_at DESC)
+    WHERE email_bidx IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_workflow_threads_email_results_to_bidx
+    ON workflow_threads(email_results_to_bidx, created_at DESC)
+    WHERE email_results_to_bidx IS NOT NULL;
+
+-- Backs flow.db.get_room_sessions with an email (flow/scripts/view_database.py --email)
+CREATE INDEX IF NOT EXISTS idx_rooms_email_bidx
+    ON rooms(email_bidx, created_at DESC)
+    WHERE email_bidx IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_rooms_email_results_to_bidx
+    ON rooms(email_results_to_bidx, created_at DESC)
+    WHERE email_results_to_bidx IS NOT NULL;
+
+COMMENT ON COLUMN workflow_threads.email_bidx IS 'Blind index of email: HMAC-SHA256 of the normalized address';
+COMMENT ON COLUMN workflow_threads.email_results_to_bidx IS 'Blind index of email_results_to: HMAC-SHA256 of the normalized address';
+COMMENT ON COLUMN rooms.email_bidx IS 'Blind index of email: HMAC-SHA256 of the normalized address';
+COMMENT ON COLUMN rooms.email_results_to_bidx IS 'Blind index of email_results_to: HMAC-SHA256 of the normalized address';
+
+-- Same as in 20251203000004_add_create_bot_run_function.sql, plus the blind indexes
+CREATE OR REPLACE FUNCTION create_bot_run(
+    p_workflow_thread JSONB,
+    p_bot_session JSONB,
+    p_unkey_key_id TEXT DEFAULT NULL,
+    p_required_credits NUMERIC DEFAULT NULL
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_balance NUMERIC;
+BEGIN
+    IF p_required_credits IS NOT NULL THEN
+        SELECT credit_balance INTO v_balance
+        FROM users
+        WHERE "unkeyId" = p_unkey_key_id;
+
+        IF NOT FOUND OR v_balance IS NULL THEN
+            RETURN jsonb_build_object('status', 'user_not_found');
+        END IF;
+
+        IF v_balance < p_required_credits THEN
+            RETURN jsonb_build_object('status', 'insufficient_credits', 'balance', v_balance);
+        END IF;
+    END IF;
+
+    -- Sensitive fields (email, email_results_to, webhook_callback_url) arrive encrypted,
+    -- with the blind indexes of the email fields alongside
+    INSERT INTO workflow_threads (
+        workflow_thread_id,
+        room_name,
+        room_url,
+        bot_id,
+        bot_config,
+        unkey_key_id,
+        provider,
+        email,
+        email_results_to,
+        email_bidx,
+        email_results_to_bidx,
+        analysis_prompt,
+        summary_format_prompt,
+        webhook_callback_url,
+        meeting_status
+    ) VALUES (
+        p_workflow_thread->>'workflow_thread_id',
+        p_workflow_thread->>'room_name',
+        p_workflow_thread->>'room_url',
+        p_workflow_thread->>'bot_id',
+        p_workflow_thread->'bot_config',
+        p_workflow_thread->>'unkey_key_id',
+        COALESCE(p_workflow_thread->>'provider', 'daily'),
+        p_workflow_thread->>'email',
+        p_workflow_thread->>'email_results_to',
+        p_workflow_thread->>'email_bidx',
+        p_workflow_thread->>'email_results_to_bidx',
+        p_workflow_thread->>'analysis_prompt',
+        p_workflow_thread->>'summary_format_prompt',
+        p_workflow_thread->>'webhook_callback_url',
+        COALESCE(p_workflow_thread->>'meeting_status', 'in_progress')
+    );
+
+    INSERT INTO bot_sessions (
+        bot_id,
+        room_url,
+        room_name,
+        status,
+        started_at,
+        process_insights,
+        bot_config
+    ) VALUES (
+        (p_bot_session->>'bot_id')::UUID,
+        p_bot_session->>'room_url',
+        p_bot_session->>'room_name',
+        COALESCE(p_bot_session->>'status', 'running'),
+        COALESCE((p_bot_session->>'started_at')::TIMESTAMPTZ, NOW()),
+        COALESCE((p_bot_session->>'process_insights')::BOOLEAN, TRUE),
+        p_bot_session->'bot_config'
+    );
+
+    RETURN jsonb_build_object(
+        'status', 'created',
+        'workflow_thread_id', p_workflow_thread->>'workflow_thread_id',
+        'bot_id', p_bot_session->>'bot_id',
+        'balance', v_balance
+    );
+EXCEPTION
+    -- Both inserts are rolled back; the caller retries with new IDs
+    WHEN unique_violation THEN
+        RETURN jsonb_build_object('status', 'conflict');
+END;
+$$;